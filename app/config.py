@@ -41,6 +41,11 @@ class Settings(BaseSettings):
     # ★ 활성화 게이트(기본 False): subject 클라 EffectiveSubject 매칭 확인(V-SVF-05) +
     #    발행 ACL(FR-SVF-08) 적용 후에만 True 로. False면 force_logout 은 블랙리스트만 수행.
     NATS_REVOKE_ENABLED: bool = False
+    # user-002 공용 NATS 연결(app/services/nats_client.py) — 게이트 on 일 때 lifespan 에서 1회 연결.
+    # 버퍼 full 이면 drop-and-count. 배치는 크기 or 시간창 중 먼저 도달 시 flush 1회.
+    NATS_PUBLISH_BUFFER_SIZE: int = 10000
+    NATS_FLUSH_BATCH_SIZE: int = 200
+    NATS_FLUSH_INTERVAL_MS: int = 20
 
     # Grant sweep 주기(분) — FR-08(grant-enforcement-hardening). 만료 grant 의 is_active 정리(표시/통지 백스톱용).
     # ★ 보안 비의존: 요청시점 계산(_active_grants)이 인가 권위. 본 값은 표시 최신성·자연만료 통지 지연 상한만 좌우.
@@ -50,6 +55,14 @@ class Settings(BaseSettings):
     # FR-09 default-deny 모드: off(현행 default-allow) / observe(미분류 로그만·통과) / enforce(미등록 비allowlist 403).
     # ★ enforce 활성은 observe 로 미분류 0 확인 + 배포 게이트 후에만. 기본 off = 현행 동작 100% 보존.
     MATRIX_DENY_MODE: str = "off"
+    # user-001 인가 결정 캐시(app/security/authz_cache.py) — enforce_matrix hit 시 DB 무접촉.
+    # 쓰기 무효화는 ORM 커밋 이벤트가 담당. TTL 은 프로세스 밖 쓰기(수동 SQL·타 워커) 반영 지연 상한.
+    AUTHZ_CACHE_ENABLED: bool = True
+    AUTHZ_CACHE_TTL_SECONDS: int = 60
+    AUTHZ_CACHE_MAX_ENTRIES: int = 10000
+    # user-016 함체별 최신 메트릭 캐시(app/services/enclosure_latest_cache.py) — 쓰기는 write-through,
+    # TTL 은 프로세스 밖 쓰기 반영 지연 상한(만료 시 단일 쿼리로 재적재).
+    ENCLOSURE_LATEST_CACHE_TTL_SECONDS: int = 60
 
     # SSO(OIDC) 연동 예약 (FR-SSO-04) — 현 차수 미사용, 기본 off/빈값. 실제 배선은 후속 SSO PRD.
     SSO_ENABLED: bool = False
@@ -61,6 +74,38 @@ class Settings(BaseSettings):
     # 이벤트 억제 스케줄 sweep 주기(분) — event-suppression PRD FR-06. 만료 창 is_active 정리(비권위 백스톱).
     # ★ 억제 판정 비의존: 억제는 요청시점 계산(is_suppressed)이 권위. 본 값은 표시 최신성·통지 지연 상한만 좌우.
     SUPPRESSION_SWEEP_INTERVAL_MINUTES: int = 5
+    # user-021 억제 게이트 메모리 인덱스(app/services/suppression_index.py) — 억제/그룹 쓰기는 ORM 커밋 이벤트로
+    # 즉시 무효화. TTL 은 프로세스 밖 쓰기(수동 SQL·타 워커) 반영 지연 상한.
+    SUPPRESSION_INDEX_TTL_SECONDS: int = 60
+    # user-004 track_points 일별 파티션(v72): 사전 생성 지평(일) + 보존기간(일, 경과 파티션 DROP).
+    TRACK_POINTS_PARTITION_DAYS_AHEAD: int = 7
+    TRACK_POINTS_RETENTION_DAYS: int = 7
+    # user-005 /api/tracking/points 다운샘플 모드(resolution/max_points): 경량 스캔 청크(행)와
+    # 한 요청 구간 원본 상한(행, 초과 시 400 — 트랙별 다운샘플은 구간 전체에 한 번),
+    # 한 응답 반환 점 상한(다운샘플 후 전 트랙 합계, 초과 시 400 — resolution 만 준 요청도 응답 크기 유계).
+    TRACKING_DOWNSAMPLE_SCAN_LIMIT: int = 100000
+    TRACKING_DOWNSAMPLE_MAX_SCAN: int = 2000000
+    TRACKING_DOWNSAMPLE_MAX_RETURN: int = 50000
+    # user-010 이벤트 롤업(event_rollup_hourly/daily): 증분 잡 주기, 닫힌 정시 판정 지연(초), 재계산 겹침(시간).
+    EVENT_ROLLUP_INTERVAL_MINUTES: int = 5
+    EVENT_ROLLUP_SETTLE_SECONDS: int = 120
+    EVENT_ROLLUP_RECOMPUTE_HOURS: int = 1
+    # user-024 이벤트 통계 응답 단기 캐시(app/services/event_stats_cache.py) — (엔드포인트, 구간, 단위) 키.
+    # 이벤트 쓰기로 무효화하지 않으므로 TTL 이 최신 이벤트 반영 지연 상한. 0 = 비활성.
+    EVENT_STATS_CACHE_TTL_SECONDS: int = 10
+    # user-025 저변경 마스터 데이터 GET 응답 캐시(app/services/response_cache.py) — ETag/304.
+    # 무효화는 ORM 커밋 + LISTEN gop_sync(PostgreSQL). TTL 은 그 둘이 놓친 외부 쓰기의 반영 지연 상한.
+    RESPONSE_CACHE_ENABLED: bool = True
+    RESPONSE_CACHE_TTL_SECONDS: int = 300
+    # user-017 메트릭 롤업(metric_rollup_hourly): 증분 잡 주기, 닫힌 정시 판정 지연(초), 재계산 겹침(시간).
+    METRIC_ROLLUP_INTERVAL_MINUTES: int = 5
+    METRIC_ROLLUP_SETTLE_SECONDS: int = 120
+    METRIC_ROLLUP_RECOMPUTE_HOURS: int = 1
+    # user-018 enclosure_metrics/server_metrics 계층화: 일별 파티션 사전 생성(일), 원본 보존(일 — 파티션 DROP),
+    # 1시간 롤업 보존(개월).
+    METRICS_PARTITION_DAYS_AHEAD: int = 7
+    METRICS_RAW_RETENTION_DAYS: int = 30
+    METRICS_ROLLUP_RETENTION_MONTHS: int = 12
 
     @field_validator("JWT_SECRET_KEY")
     @classmethod
@@ -126,6 +171,15 @@ class Settings(BaseSettings):
 
     # Logging
     LOG_LEVEL: str = "INFO"
+    # user-012: api_logs 큐 overflow/저장 실패분 spill 파일(append-only NDJSON) — 큐 한산 시 재생
+    API_LOG_SPILL_PATH: str = "data/api_logs_spill.ndjson"
+    API_LOG_SPILL_MAX_MB: int = 64  # 초과분은 drop(카운트)
+    # user-013: api_logs 일별 파티션 사전 생성 범위 / 보존기간(만료 파티션 DETACH + DROP)
+    API_LOGS_PARTITION_DAYS_AHEAD: int = 14
+    API_LOGS_RETENTION_DAYS: int = 30
+    # user-023: ConfigChangeLog 큐 배치 writer(app/services/config_log_writer.py) — 변경 응답이 감사 로그
+    # 저장을 기다리지 않는다(최대 ~0.5s 뒤 반영, shutdown 시 drain). 기본 off = 종전 인라인 commit.
+    CONFIG_LOG_ASYNC_WRITER: bool = False
 
     # Initialization
     INIT_SAMPLE_DATA: bool = False
@@ -155,6 +209,11 @@ class Settings(BaseSettings):
     REPORTS_DIR: str = "/app/reports"  # PDF 저장 디렉터리 (docker-compose named volume 마운트)
     # v6.0-report_date_range (FR-RCD-03): 커스텀 날짜 범위 상한 (기본 366일 = 1년+윤년 여유)
     REPORT_MAX_RANGE_DAYS: int = 366
+    # user-008: 상주 Chromium 풀 — 슬롯 수 = 동시 PDF 렌더 상한, N회 렌더마다 브라우저 재시작
+    PDF_RENDER_POOL_SIZE: int = 2
+    PDF_RENDER_RECYCLE_AFTER: int = 50
+    # user-009: 보고서 마스터 데이터 집계/상세 쿼리 동시 실행 커넥션 상한 (DB 풀 10+20 중 일부만 점유)
+    REPORT_QUERY_CONCURRENCY: int = 6
 
     # Thumbnail Storage
     THUMBNAIL_STORAGE_PATH: str = "data/thumbnails"
@@ -516,6 +516,43 @@ GET_TRIGGER_SQLS = [
         AFTER INSERT ON system_events
         FOR EACH ROW EXECUTE FUNCTION fn_notify_system_event();
     """,
+    # ENCLOSURE_METRICS (user-019): enclosure_metrics AFTER INSERT → 채널 gop_metrics 로 함체별 최신 행 NOTIFY.
+    #   db_monitor 가 주기 전수 조회 대신 이 NOTIFY 를 디바운스해 **바뀐 함체만** 발행(저빈도 스냅샷은 안전망).
+    #   문장 단위 + transition table — 배치 INSERT 도 함체당 1건. 파티션 테이블(v79) 루트에 걸면 전 파티션 적용.
+    #   트리거 실패가 메트릭 INSERT 를 롤백하지 않도록 EXCEPTION WHEN OTHERS 방어(best-effort).
+    """
+    CREATE OR REPLACE FUNCTION fn_notify_enclosure_metrics_stmt()
+    RETURNS trigger AS $$
+    DECLARE
+        r record;
+    BEGIN
+        FOR r IN
+            SELECT DISTINCT ON (enclosure_id) enclosure_id, temperature, humidity, voltage, current, created_at
+            FROM new_rows
+            ORDER BY enclosure_id, created_at DESC, id DESC
+        LOOP
+            PERFORM pg_notify('gop_metrics', jsonb_build_object(
+                'cmd', 'ENCLOSURE_METRICS',
+                'enclosure_id', r.enclosure_id,
+                'temperature', r.temperature,
+                'humidity', r.humidity,
+                'voltage', r.voltage,
+                'current', r.current,
+                'created_at', r.created_at
+            )::text);
+        END LOOP;
+        RETURN NULL;
+    EXCEPTION WHEN OTHERS THEN
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+
+    DROP TRIGGER IF EXISTS trg_notify_enclosure_metrics ON enclosure_metrics;
+    CREATE TRIGGER trg_notify_enclosure_metrics
+        AFTER INSERT ON enclosure_metrics
+        REFERENCING NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION fn_notify_enclosure_metrics_stmt();
+    """,
     # SYNC_DETECTION (detection-sync-message FR-01/02): detection_events AFTER UPDATE OR DELETE →
     #   gop_sync 채널 '알림만' NOTIFY {cmd, action, resource_id}. **INSERT 미발행**(필드 DETECT 중복/이중연동 방지).
     #   목적: PTZ 회전 후 detail(썸네일) 갱신을 GIS 가 재조회하도록 통지. from=DBApi·subject=all.sync.detection
@@ -36,6 +36,9 @@ from app.database import engine
 from app.db_triggers import apply_triggers
 from app.middleware.request_id import RequestIDMiddleware
 from app.middleware.logging import APILoggingMiddleware
+from app.middleware.charset import UTF8CharsetMiddleware
+from app.middleware.latency import LatencyHistogramMiddleware
+from app.middleware.response_cache import ResponseCacheMiddleware
 from app.routers import auth, logs, controllers, sensors, cameras, speakers, enclosures, lamps, detections, malfunctions, connections, actions, detection_logs, event_mappings, server_categories, servers, server_metrics, proxy_settings, camera_settings, system_events, device_groups, camera_presets, rois, xypoints, event_mapping_cameras, event_mapping_speakers, event_mapping_lamps, file_groups, enclosure_metrics, users, user_groups, grants, user_sessions, audit_logs, config_change_logs, reports, thumbnails, event_statistics, tracking, event_suppression_schedules, settings as settings_router
 from app.models.report import ReportGeneration
 from app.dependencies import get_db
@@ -249,15 +252,32 @@ async def lifespan(app: FastAPI):
     await async_engine.dispose()
     print("[OK] async engine pool disposed post-migration (prepared-cache reset)")
 
-    # DB-02 (2026-07-09): api_logs 월별 파티션 사전 보장 (당월+6개월).
+    # DB-02 (2026-07-09): api_logs 파티션 사전 보장. user-013: 일별(오늘+API_LOGS_PARTITION_DAYS_AHEAD).
     # v60 파티셔닝은 2026-10 까지만 생성 → 경계 초과 시 INSERT 실패. 여기서 멱등 확장.
     # 방어적: 실패해도 당월 파티션은 이미 있어 기동 계속 (스케줄러가 재보장).
     try:
         from app.services.api_logs_partition_service import ensure_api_log_partitions
         _ensured = await ensure_api_log_partitions()
-        print(f"api_logs partitions ensured: {_ensured[0]}..{_ensured[-1]}")
+        if _ensured:
+            print(f"api_logs partitions ensured: {_ensured[0]}..{_ensured[-1]}")
     except Exception as e:
         print(f"[WARN] api_logs partition ensure failed: {e}")
+    # user-004: track_points 일별 파티션 사전 생성(비파티션 DB 면 no-op)
+    try:
+        from app.services.track_points_partition_service import ensure_track_point_partitions
+        _tp = await ensure_track_point_partitions()
+        if _tp:
+            print(f"track_points partitions ensured: {_tp[0]}..{_tp[-1]}")
+    except Exception as e:
+        print(f"[WARN] track_points partition ensure failed: {e}")
+    # user-018: enclosure_metrics/server_metrics 일별 파티션 사전 생성(비파티션 DB 면 no-op)
+    try:
+        from app.services.metrics_retention_service import ensure_metric_partitions
+        _mp = await ensure_metric_partitions()
+        if _mp:
+            print(f"metrics partitions ensured: {len(_mp)} created")
+    except Exception as e:
+        print(f"[WARN] metrics partition ensure failed: {e}")
 
     # v6.0-default_profile_image (2026-07-07): 사진 없는 계정용 default 이미지 보장.
     # data/profiles/default.png 는 gitignore 라 clone 배포엔 없음 → 없으면 Pillow 로 자동 생성.
@@ -313,6 +333,12 @@ async def lifespan(app: FastAPI):
         from app.services.api_logs_sweep_service import run_api_logs_sweep
         from app.services.api_logs_partition_service import ensure_api_log_partitions
         from app.services.token_blacklist_service import run_blacklist_cleanup
+        from app.services.track_points_partition_service import (
+            ensure_track_point_partitions, run_track_points_retention,
+        )
+        from app.services.event_rollup_service import run_event_rollup
+        from app.services.metric_series_service import run_metric_rollup
+        from app.services.metrics_retention_service import ensure_metric_partitions, run_metrics_tiering
 
         scheduler = AsyncIOScheduler(timezone=settings.tz)
         scheduler.add_job(run_grant_sweep, "interval", minutes=settings.GRANT_SWEEP_INTERVAL_MINUTES,
@@ -322,15 +348,33 @@ async def lifespan(app: FastAPI):
                           id="suppression_sweep", coalesce=True, max_instances=1)
         scheduler.add_job(run_session_sweep, "interval", minutes=5, id="session_sweep",
                           coalesce=True, max_instances=1)
-        # v5.4 후속 (문서 A-7 #6): api_logs 무제한 성장 방지 — 일 1회(정오) 30일 이상 삭제
+        # v5.4 후속 (문서 A-7 #6): api_logs 무제한 성장 방지 — 일 1회(정오).
+        # user-013: 보존기간 경과 파티션 DETACH + DROP(비파티션 DB 는 DELETE 폴백).
         scheduler.add_job(run_api_logs_sweep, "cron", hour=12, minute=0, id="api_logs_sweep",
                           coalesce=True, max_instances=1)
-        # DB-02: api_logs 미래 파티션 사전 보장 — 일 1회(00:05) 당월+6개월 멱등 생성.
+        # DB-02: api_logs 미래 파티션 사전 보장 — 일 1회(00:05) 일별 파티션 멱등 생성(user-013).
         scheduler.add_job(ensure_api_log_partitions, "cron", hour=0, minute=5, id="api_logs_partition",
                           coalesce=True, max_instances=1)
+        # user-004: track_points 일별 파티션 사전 보장(00:10) + 보존기간 경과 파티션 DROP(00:20).
+        scheduler.add_job(ensure_track_point_partitions, "cron", hour=0, minute=10, id="track_points_partition",
+                          coalesce=True, max_instances=1)
+        scheduler.add_job(run_track_points_retention, "cron", hour=0, minute=20, id="track_points_retention",
+                          coalesce=True, max_instances=1)
         # ACC-P1-05: token_blacklist 만료 row 정리 — 1시간 주기(주석에 명시됐으나 미등록이던 것 연결).
         scheduler.add_job(run_blacklist_cleanup, "interval", hours=1, id="blacklist_cleanup",
                           coalesce=True, max_instances=1)
+        # user-010: 이벤트 시간/일 롤업 증분 — 첫 회차(최초 백필 포함)는 부팅 후 한 주기 뒤.
+        # 롤업 전이라도 조회는 원본으로 폴백해 결과가 같으므로 startup 을 DB 작업으로 붙잡지 않는다.
+        scheduler.add_job(run_event_rollup, "interval", minutes=settings.EVENT_ROLLUP_INTERVAL_MINUTES,
+                          id="event_rollup", coalesce=True, max_instances=1)
+        # user-017: 함체/서버 메트릭 1시간 롤업 증분 — event_rollup 과 같은 워터마크 방식, 첫 회차는 한 주기 뒤.
+        scheduler.add_job(run_metric_rollup, "interval", minutes=settings.METRIC_ROLLUP_INTERVAL_MINUTES,
+                          id="metric_rollup", coalesce=True, max_instances=1)
+        # user-018: 메트릭 일별 파티션 사전 보장(00:15) + 계층화(00:30 — 롤업 따라잡기 → 원본 파티션 DROP → 롤업 만료).
+        scheduler.add_job(ensure_metric_partitions, "cron", hour=0, minute=15, id="metrics_partition",
+                          coalesce=True, max_instances=1)
+        scheduler.add_job(run_metrics_tiering, "cron", hour=0, minute=30, id="metrics_tiering",
+                          coalesce=True, max_instances=1)
         scheduler.start()
         # FR-07: per-grant 만료 실시간 통지 스케줄러 주입 + 부팅 복원(미래 만료분 재등록, NFR-05)
         from app.services import grant_scheduler
@@ -345,15 +389,22 @@ async def lifespan(app: FastAPI):
         print(f"Grant sweep scheduler started (interval {settings.GRANT_SWEEP_INTERVAL_MINUTES}m)")
         print(f"Suppression sweep scheduler started (interval {settings.SUPPRESSION_SWEEP_INTERVAL_MINUTES}m)")
         print("Session sweep scheduler started (interval 5m)")
-        print("API logs sweep scheduler started (cron 12:00 daily, retention 30d)")
-        print("API logs partition scheduler started (cron 00:05 daily, +6 months)")
+        print(f"API logs sweep scheduler started (cron 12:00 daily, partition DROP, retention {settings.API_LOGS_RETENTION_DAYS}d)")
+        print(f"API logs partition scheduler started (cron 00:05 daily, daily +{settings.API_LOGS_PARTITION_DAYS_AHEAD}d)")
+        print(f"track_points partition scheduler started (cron 00:10 +{settings.TRACK_POINTS_PARTITION_DAYS_AHEAD}d, "
+              f"retention 00:20 {settings.TRACK_POINTS_RETENTION_DAYS}d)")
         print("Token blacklist cleanup scheduler started (interval 1h)")
+        print(f"Event rollup scheduler started (interval {settings.EVENT_ROLLUP_INTERVAL_MINUTES}m)")
+        print(f"Metric rollup scheduler started (interval {settings.METRIC_ROLLUP_INTERVAL_MINUTES}m)")
+        print(f"Metrics tiering scheduler started (partition 00:15 +{settings.METRICS_PARTITION_DAYS_AHEAD}d, "
+              f"tiering 00:30 raw {settings.METRICS_RAW_RETENTION_DAYS}d / hourly {settings.METRICS_ROLLUP_RETENTION_MONTHS}mo)")
     except Exception as e:  # 미설치/시작실패 → 휴면 표시만, 인가는 요청시점 계산이 담당
         print(f"[WARN] sweep schedulers not started: {e}")
 
     # v6.0 Phase 4 (A-7 #1) — API log 배치 consumer 기동.
     # 미들웨어(APILoggingMiddleware) 는 요청마다 asyncio.Queue 에 payload 를 enqueue 만 수행하고,
     # 실제 INSERT 는 이 consumer 태스크가 배치(100건 or 500ms) 로 flush 한다.
+    # user-012: PostgreSQL 은 월 파티션 COPY + 적체 시 배치 확대, overflow 는 spill 파일 → 재생.
     # 실패해도 앱 기동은 계속 진행 (로그 손실은 있으나 서비스 자체는 유지).
     try:
         from app.middleware.logging import start_log_consumer
@@ -362,6 +413,40 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         print(f"[WARN] log consumer not started: {e}")
 
+    # user-023 — ConfigChangeLog 큐 배치 writer. 미기동 시 log_config_change_async 는 종전 인라인 저장.
+    if settings.CONFIG_LOG_ASYNC_WRITER:
+        try:
+            from app.services.config_log_writer import start_config_log_writer
+            await start_config_log_writer()
+            print("ConfigChangeLog batch writer started")
+        except Exception as e:
+            print(f"[WARN] config log writer not started: {e}")
+
+    # user-025 — 응답 캐시 외부 쓰기 무효화(LISTEN gop_sync). PostgreSQL 외 방언은 무동작(ORM 커밋 + TTL).
+    try:
+        from app.services.response_cache import start_response_cache_listener
+        await start_response_cache_listener()
+    except Exception as e:
+        print(f"[WARN] response cache listener not started: {e}")
+
+    # user-002 — 공용 NATS 발행 연결(revoke / permissions_changed). 게이트 off 면 기동 안 함(발행 자체가 무동작).
+    # 초기 연결 실패는 백그라운드 재시도 — 기동을 막지 않는다.
+    if settings.NATS_REVOKE_ENABLED:
+        try:
+            from app.services.nats_client import start_nats_client
+            await start_nats_client()
+            print("NATS publisher started")
+        except Exception as e:
+            print(f"[WARN] NATS publisher not started: {e}")
+
+    # user-008 — 보고서 PDF 상주 Chromium 풀. 브라우저는 첫 렌더 시 launch(미설치 환경도 기동 유지).
+    try:
+        from app.services.pdf_render_pool import start_pdf_render_pool
+        await start_pdf_render_pool()
+        print(f"PDF render pool started (size={settings.PDF_RENDER_POOL_SIZE})")
+    except Exception as e:
+        print(f"[WARN] PDF render pool not started: {e}")
+
     yield
 
     # Shutdown
@@ -377,6 +462,30 @@ async def lifespan(app: FastAPI):
         print("API log batch consumer stopped")
     except Exception:
         pass
+    # user-023 — 감사 로그 큐 drain 후 종료(유실 방지).
+    try:
+        from app.services.config_log_writer import stop_config_log_writer
+        await stop_config_log_writer()
+    except Exception:
+        pass
+    # user-025 — gop_sync LISTEN 연결 반납.
+    try:
+        from app.services.response_cache import stop_response_cache_listener
+        await stop_response_cache_listener()
+    except Exception:
+        pass
+    # user-002 — NATS 발행 버퍼 잔여 방출 후 연결 종료.
+    try:
+        from app.services.nats_client import stop_nats_client
+        await stop_nats_client()
+    except Exception:
+        pass
+    # user-008 — 상주 브라우저 종료.
+    try:
+        from app.services.pdf_render_pool import stop_pdf_render_pool
+        await stop_pdf_render_pool()
+    except Exception:
+        pass
     print("GOP API Server Shutting down...")
 
 
@@ -723,18 +832,12 @@ app.add_middleware(
 )
 
 # Custom middlewares (order matters - applied in reverse)
-app.add_middleware(APILoggingMiddleware)  # Applied second
-app.add_middleware(RequestIDMiddleware)   # Applied first
-
-
-@app.middleware("http")
-async def add_utf8_charset(request: Request, call_next):
-    """JSON 응답에 charset=utf-8 명시 — 클라이언트 한글 인코딩 보장"""
-    response = await call_next(request)
-    ct = response.headers.get("content-type", "")
-    if "application/json" in ct and "charset" not in ct:
-        response.headers["content-type"] = ct + "; charset=utf-8"
-    return response
+# user-011: 전부 순수 ASGI(BaseHTTPMiddleware/@app.middleware("http") 미사용) — 요청당 태스크·스트림 홉 제거
+app.add_middleware(ResponseCacheMiddleware)      # Applied fifth — @cached 미스 응답 적재 + ETag (user-025)
+app.add_middleware(APILoggingMiddleware)         # Applied fourth
+app.add_middleware(RequestIDMiddleware)          # Applied third
+app.add_middleware(UTF8CharsetMiddleware)        # Applied second — JSON 응답 charset=utf-8 명시
+app.add_middleware(LatencyHistogramMiddleware)   # Applied first — 스택 전체 포함 요청 지연 히스토그램
 
 # Include routers
 app.include_router(auth.router, prefix="/api/auth", tags=["Authentication"])
@@ -840,6 +943,48 @@ async def health_check(response: Response):
         }
 
 
+@app.get("/health/metrics", tags=["Health"])
+async def health_metrics():
+    """
+    인프로세스 성능 카운터 스냅샷 — DB 무접촉(프로세스 재시작 시 리셋).
+
+    - **authz_cache**: enforce_matrix 인가 결정 캐시 hit/miss/무효화 (user-001)
+    - **nats**: 공용 NATS 발행 연결 — published/failed/dropped, 버퍼 깊이, flush 지연 (user-002)
+    - **pdf_render**: 보고서 PDF 상주 Chromium 풀 — 렌더/launch/재활용/크래시, 유휴 슬롯 (user-008)
+    - **http_latency**: 요청 지연 히스토그램(ms 버킷) + p50/p95/p99 근사 (user-011)
+    - **api_logs**: api_logs 배치 writer — 큐 깊이, flush 지연, written/spilled/replayed/dropped (user-012)
+    - **enclosure_latest**: 함체별 최신 메트릭 캐시 — hit/miss/적재/write-through/무효화 (user-016)
+    - **suppression_index**: 억제 게이트 메모리 구간 인덱스 — hit/miss/적재/무효화 (user-021)
+    - **config_log_writer**: ConfigChangeLog 큐 배치 writer — 큐 깊이, flush 지연, written/failed (user-023)
+    - **event_stats_cache**: 이벤트 통계 응답 단기 캐시 — hit/miss/합류, 항목 수 (user-024)
+    - **response_cache**: 마스터 데이터 GET 응답 캐시 — hit/304/miss/무효화, LISTEN 상태 (user-025)
+    """
+    from app.middleware import latency
+    from app.middleware import logging as api_logging
+    from app.security import authz_cache
+    from app.services import (
+        config_log_writer,
+        enclosure_latest_cache,
+        event_stats_cache,
+        nats_client,
+        pdf_render_pool,
+        response_cache,
+        suppression_index,
+    )
+    return {
+        "authz_cache": authz_cache.get_stats(),
+        "nats": nats_client.get_stats(),
+        "pdf_render": pdf_render_pool.get_stats(),
+        "http_latency": latency.get_stats(),
+        "api_logs": api_logging.get_stats(),
+        "enclosure_latest": enclosure_latest_cache.get_stats(),
+        "suppression_index": suppression_index.get_stats(),
+        "config_log_writer": config_log_writer.get_stats(),
+        "event_stats_cache": event_stats_cache.get_stats(),
+        "response_cache": response_cache.get_stats(),
+    }
+
+
 # ==============================================================================
 # Report Preview Page → v5.4 P0-1: /api/reports/preview/{id} 로 이관 (인증 강제)
 # 이전 무인증 @app.get 엔드포인트는 삭제됨. routers/reports.py::report_preview_page 참조.
@@ -0,0 +1,29 @@
+"""
+UTF-8 Charset Middleware
+JSON 응답에 charset=utf-8 명시 — 클라이언트 한글 인코딩 보장
+
+user-011: main.py 의 `@app.middleware("http") add_utf8_charset`(BaseHTTPMiddleware) 를 순수 ASGI 로 이관.
+http.response.start 의 content-type 헤더만 고쳐 쓰고 body 스트림은 그대로 통과시킨다.
+"""
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+class UTF8CharsetMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                ct = headers.get("content-type", "")
+                if "application/json" in ct and "charset" not in ct:
+                    headers["content-type"] = ct + "; charset=utf-8"
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
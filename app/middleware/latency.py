@@ -0,0 +1,101 @@
+"""
+HTTP Latency Histogram Middleware (user-011)
+
+요청 진입 ~ 마지막 응답 바이트 송신까지의 지연을 고정 버킷 히스토그램으로 누적한다.
+미들웨어 스택 최외곽(ASGI)에 두어 내부 미들웨어 비용까지 포함해 측정 — 스택 교체 전후 비교용.
+
+- 순수 ASGI: receive/send 를 감싸지 않고 send 만 관찰(추가 태스크·스트림 없음).
+- 버킷 상한(ms) `BUCKETS_MS` + 초과(+Inf). 누적 카운트가 아닌 구간 카운트로 보관하고
+  스냅샷에서 p50/p95/p99 를 버킷 상한으로 근사한다(Prometheus histogram_quantile 과 같은 보수적 추정).
+- 카운터는 프로세스 메모리(재시작 시 리셋) — `/health/metrics` 의 `http_latency` 로 노출.
+"""
+from __future__ import annotations
+
+import bisect
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+BUCKETS_MS: tuple[float, ...] = (1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+_counts: list[int] = [0] * (len(BUCKETS_MS) + 1)
+_stats: dict[str, float] = {
+    "count": 0,
+    "sum_ms": 0.0,
+    "max_ms": 0.0,
+}
+
+
+def observe(elapsed_ms: float) -> None:
+    _counts[bisect.bisect_left(BUCKETS_MS, elapsed_ms)] += 1
+    _stats["count"] += 1
+    _stats["sum_ms"] += elapsed_ms
+    if elapsed_ms > _stats["max_ms"]:
+        _stats["max_ms"] = elapsed_ms
+
+
+def _quantile(q: float) -> float | None:
+    total = _stats["count"]
+    if not total:
+        return None
+    rank, seen = q * total, 0
+    for i, n in enumerate(_counts):
+        seen += n
+        if seen >= rank:
+            return BUCKETS_MS[i] if i < len(BUCKETS_MS) else _stats["max_ms"]
+    return _stats["max_ms"]
+
+
+def get_stats() -> dict:
+    """히스토그램 스냅샷 — buckets 는 {상한 ms 문자열 | "+Inf": 구간 건수}."""
+    count = _stats["count"]
+    buckets = {f"{b:g}": n for b, n in zip(BUCKETS_MS, _counts)}
+    buckets["+Inf"] = _counts[-1]
+    return {
+        "count": count,
+        "sum_ms": round(_stats["sum_ms"], 3),
+        "avg_ms": round(_stats["sum_ms"] / count, 3) if count else None,
+        "max_ms": round(_stats["max_ms"], 3),
+        "p50_ms": _quantile(0.50),
+        "p95_ms": _quantile(0.95),
+        "p99_ms": _quantile(0.99),
+        "buckets": buckets,
+    }
+
+
+def reset_stats() -> None:
+    for i in range(len(_counts)):
+        _counts[i] = 0
+    _stats["count"] = 0
+    _stats["sum_ms"] = 0.0
+    _stats["max_ms"] = 0.0
+
+
+class LatencyHistogramMiddleware:
+    """HTTP 요청당 지연(첫 바이트 수신 ~ 마지막 body 송신)을 히스토그램에 누적."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        done = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal done
+            await send(message)
+            if message["type"] == "http.response.body" and not message.get("more_body", False) and not done:
+                done = True
+                observe((time.perf_counter() - started) * 1000)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            # 응답 없이 예외/취소로 끝난 요청도 소요 시간은 남긴다(상위 500 처리 전 시점)
+            if not done:
+                done = True
+                observe((time.perf_counter() - started) * 1000)
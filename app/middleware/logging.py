@@ -25,35 +25,91 @@ v6.0 Phase 4 (2026-07-03) — 문서 A-7 #1 후속:
 - 라이프사이클:
   * `start_log_consumer()` — FastAPI startup 훅에서 호출 (main.py).
   * `stop_log_consumer()` — shutdown 훅에서 호출, 큐 drain 후 종료.
+
+user-012 — 고처리량 writer + 유실 방지:
+- PostgreSQL(asyncpg) 는 배치를 월 파티션(`api_logs_YYYY_MM`, timestamp 기준)에 직접 COPY
+  (`copy_records_to_table`) — 파티션 라우팅·executemany 왕복 제거. 파티션 부재 시 부모 테이블로
+  COPY, COPY 실패 시 ORM INSERT 로 폴백(배치 COPY 는 트랜잭션 1개 — 부분 커밋 후 폴백 중복 없음).
+  그 외 방언(SQLite 등)은 종전 INSERT.
+- 배치 크기 적응: 큐에 이미 쌓인 만큼 대기 없이 한 번에(_BATCH_SIZE ~ _BATCH_MAX).
+- 큐 full / 배치 저장 실패분은 버리지 않고 로컬 append-only NDJSON(`API_LOG_SPILL_PATH`)에 spill,
+  큐가 한산해지면 consumer 가 재생(replay). 파일 상한(`API_LOG_SPILL_MAX_MB`) 초과분만 drop.
+  파일 IO 는 이벤트루프 밖에서 — 큐 full spill 은 전용 writer 스레드(_spill_later), 저장 실패 spill 은
+  to_thread. 파일 핸들·회전은 _spill_lock 으로 직렬화.
+- 큐는 start_log_consumer 가 실행 중인 루프에서 새로 만든다(모듈 import 시 만든 큐는 처음 대기한 루프에
+  묶여, 루프가 바뀌는 재기동·테스트에서 consumer 가 "bound to a different event loop" 로 돈다).
+- 큐 깊이·flush 지연·written/spilled/replayed/dropped 카운터 → `get_stats()` (`/health/metrics` api_logs).
 """
 from __future__ import annotations
 
 import asyncio
 import json
+import os
+import queue
+import threading
+import time
+from collections import defaultdict
 from datetime import datetime
 from typing import Any, Optional
 
 from sqlalchemy import insert
 from sqlalchemy.orm import Session
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.config import settings
 from app.utils.datetime import utc_now  # datetime-unification: api_logs naive-UTC 저장
-from app.database import AsyncSessionLocal, SessionLocal
+from app.database import AsyncSessionLocal, SessionLocal, async_engine
 from app.models.log import ApiLog
 
 
 # ─── 모듈 스코프 큐 / consumer 태스크 ────────────────────────────
 _LOG_QUEUE_MAXSIZE = 10000
 _BATCH_SIZE = 100
+_BATCH_MAX = 5000     # user-012: 적체 시 한 번에 꺼내는 상한 (COPY 1회 분량)
 _BATCH_TIMEOUT = 0.5  # seconds — 첫 아이템 수신 후 최대 대기 시간
+_SPILL_RETRY_SECONDS = 30.0  # spill 재생 실패 후 재시도 간격
 
+# start_log_consumer 가 실행 중인 루프용으로 교체한다 — 그 전(lifespan 없는 앱/테스트)엔 put_nowait 만 쓰인다.
 _log_queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue(maxsize=_LOG_QUEUE_MAXSIZE)
 _consumer_task: Optional[asyncio.Task[None]] = None
 
-# 큐 full 상황 관측용 카운터 (프로세스 재시작 시 리셋). 진단/모니터링 용도.
-_dropped_count: int = 0
+# user-011: 미들웨어 body 버퍼 상한 — 요청은 마스킹(JSON 파싱)에 필요한 만큼, 오류 응답은 message/detail 추출용
+_BODY_CAPTURE_BYTES = 64 * 1024
+_ERROR_CAPTURE_BYTES = 4096
+
+# Skip logging for non-API routes (docs, openapi, static, health)
+# v5.4 P0-1: /reports/preview 제외 제거 — 인증 필요 엔드포인트는 감사 로그에 남긴다.
+_SKIP_PATHS = frozenset({"/docs", "/redoc", "/openapi.json", "/health", "/health/metrics", "/", "/favicon.ico"})
+
+# 관측용 카운터 (프로세스 재시작 시 리셋). 진단/모니터링 용도 — get_stats().
+_stats: dict[str, int] = {
+    "enqueued": 0,        # 큐 투입
+    "overflowed": 0,      # 큐 full 로 spill writer 스레드에 넘긴 행
+    "written": 0,         # 큐 경로로 DB 저장 완료한 행
+    "batches": 0,         # 저장 완료 배치
+    "copy_batches": 0,    # 그중 COPY 경로
+    "failed_batches": 0,  # COPY/INSERT 모두 실패 → spill 로 넘긴 배치
+    "spilled": 0,         # spill 파일에 기록한 행
+    "replayed": 0,        # spill 파일에서 재생해 저장한 행
+    "dropped": 0,         # spill 도 불가(상한 초과/IO 오류)해 유실된 행
+}
+_last_flush_ms: Optional[float] = None
+_max_flush_ms: float = 0.0
+_last_batch_size: int = 0
+
+# COPY 열 순서 — payload 키와 동일(id/user_id 는 DB default/NULL)
+_COPY_COLUMNS = (
+    "timestamp", "resource", "method", "client_uuid", "request_id",
+    "description", "status_code", "body", "param", "error_message",
+)
+
+_spill_fp = None
+_spill_lock = threading.Lock()  # _spill_fp 쓰기 ↔ 닫기/회전 직렬화(writer 스레드·to_thread·루프)
+_spill_queue: queue.Queue[Optional[list[dict[str, Any]]]] = queue.Queue(maxsize=_LOG_QUEUE_MAXSIZE)
+_spill_thread: Optional[threading.Thread] = None
+_spill_pending: bool = False
+_spill_retry_at: float = 0.0
 
 
 # ─── SEC-01: 민감 요청 본문 마스킹 ──────────────────────────────
@@ -125,46 +181,312 @@ def _persist_api_log_sync(
         db.close()
 
 
-async def _enqueue_log(payload: dict[str, Any]) -> None:
+def get_stats() -> dict:
+    """큐 깊이 + 저장/spill 카운터 + flush 지연(진단/모니터링 용도, 프로세스 재시작 시 리셋)."""
+    return {
+        **_stats,
+        "running": _consumer_task is not None and not _consumer_task.done(),
+        "queue_depth": _log_queue.qsize(),
+        "queue_max": _LOG_QUEUE_MAXSIZE,
+        "writer": "copy" if _copy_supported() else "insert",
+        "last_batch_size": _last_batch_size,
+        "last_flush_ms": _last_flush_ms,
+        "max_flush_ms": round(_max_flush_ms, 2),
+        "spill_bytes": _spill_size(),
+    }
+
+
+def reset_stats() -> None:
+    global _last_flush_ms, _max_flush_ms, _last_batch_size
+    for key in _stats:
+        _stats[key] = 0
+    _last_flush_ms = None
+    _max_flush_ms = 0.0
+    _last_batch_size = 0
+
+
+def _put_log(payload: dict[str, Any]) -> None:
     """
-    미들웨어 dispatch 에서 호출하는 enqueue 훅.
-    - 큐 full 시 drop-and-log 로 처리 → 요청 응답 방해 금지 (계약 유지).
-    - put_nowait 라 코루틴 실행 시간은 O(1).
+    미들웨어에서 호출하는 enqueue 훅.
+    - 큐 full 시 spill 파일로 넘김 → 요청 응답 방해 금지 (계약 유지, user-012: drop 대신 spill).
+      파일 쓰기는 writer 스레드 몫 — 여기선 스레드 큐에 넣기만 한다.
+    - put_nowait 라 실행 시간은 O(1) (user-011: 코루틴 → 동기 함수, await 홉 제거).
     """
-    global _dropped_count
     try:
         _log_queue.put_nowait(payload)
+        _stats["enqueued"] += 1
     except asyncio.QueueFull:
-        _dropped_count += 1
-        # 과도한 로그 방지: 128건 단위로만 경고 출력
-        if _dropped_count % 128 == 1:
+        _spill_later([payload])
+        _stats["overflowed"] += 1
+        # 과도한 로그 방지: 1024건 단위로만 경고 출력
+        if _stats["overflowed"] % 1024 == 1:
             print(
-                f"[log_consumer] queue full — drop-and-log "
-                f"(total dropped={_dropped_count}, qsize={_log_queue.qsize()})"
+                f"[log_consumer] queue full — spill to {settings.API_LOG_SPILL_PATH} "
+                f"(total overflowed={_stats['overflowed']}, qsize={_log_queue.qsize()})"
             )
 
 
-async def _flush_batch(batch: list[dict[str, Any]]) -> None:
-    """배치를 AsyncSession 기반 executemany INSERT 로 저장."""
+# ─── user-012: spill 파일 (append-only NDJSON) ──────────────────
+
+def _replay_path() -> str:
+    return settings.API_LOG_SPILL_PATH + ".replay"
+
+
+def _spill_size() -> int:
+    total = 0
+    for path in (settings.API_LOG_SPILL_PATH, _replay_path()):
+        try:
+            total += os.path.getsize(path)
+        except OSError:
+            pass
+    return total
+
+
+def _close_spill() -> None:
+    global _spill_fp
+    with _spill_lock:
+        if _spill_fp is not None:
+            try:
+                _spill_fp.close()
+            except Exception:
+                pass
+            _spill_fp = None
+
+
+def _rotate_spill(spill: str, replay: str) -> None:
+    """현재 spill 파일을 replay 로 넘긴다(이후 spill 은 새 파일). writer 스레드 쓰기와 겹치지 않게 잠금."""
+    global _spill_fp
+    with _spill_lock:
+        if _spill_fp is not None:
+            try:
+                _spill_fp.close()
+            except Exception:
+                pass
+            _spill_fp = None
+        os.replace(spill, replay)
+
+
+def _spill_later(batch: list[dict[str, Any]]) -> None:
+    """이벤트루프에서 부르는 spill — writer 스레드 큐에 넘기고 즉시 반환(O(1)). 적체 상한 초과분은 drop."""
+    global _spill_thread
+    if _spill_thread is None or not _spill_thread.is_alive():
+        _spill_thread = threading.Thread(target=_spill_writer, name="api_log_spill", daemon=True)
+        _spill_thread.start()
+    try:
+        _spill_queue.put_nowait(batch)
+    except queue.Full:
+        _stats["dropped"] += len(batch)
+
+
+def _spill_writer() -> None:
+    """전용 writer 스레드 — 쌓인 만큼 모아 1회 write/flush. None 을 받으면 종료."""
+    while True:
+        batch = _spill_queue.get()
+        taken, stop = 1, batch is None
+        rows = list(batch or [])
+        while not stop and len(rows) < _BATCH_MAX:
+            try:
+                more = _spill_queue.get_nowait()
+            except queue.Empty:
+                break
+            taken += 1
+            if more is None:
+                stop = True
+            else:
+                rows.extend(more)
+        try:
+            _spill(rows)
+        finally:
+            for _ in range(taken):
+                _spill_queue.task_done()
+        if stop:
+            return
+
+
+def _join_spill_writer() -> None:
+    """writer 스레드에 넘긴 spill 이 모두 파일에 쓰일 때까지 대기(블로킹 — 루프에선 to_thread 로)."""
+    _spill_queue.join()
+
+
+def _stop_spill_writer() -> None:
+    global _spill_thread
+    thread, _spill_thread = _spill_thread, None
+    if thread is not None and thread.is_alive():
+        _spill_queue.put(None)
+        thread.join()
+
+
+def _spill(batch: list[dict[str, Any]]) -> None:
+    """행들을 spill 파일 끝에 1행 1 JSON 으로 추가. 상한 초과/IO 오류면 drop 카운트.
+    블로킹 파일 IO — writer 스레드/to_thread 에서 부른다."""
+    global _spill_fp, _spill_pending
+    if not batch:
+        return
+    lines = "".join(
+        json.dumps({**p, "timestamp": p["timestamp"].isoformat()}, ensure_ascii=False) + "\n"
+        for p in batch
+    )
+    with _spill_lock:
+        try:
+            if _spill_fp is None:
+                os.makedirs(os.path.dirname(settings.API_LOG_SPILL_PATH) or ".", exist_ok=True)
+                _spill_fp = open(settings.API_LOG_SPILL_PATH, "a", encoding="utf-8")
+            if _spill_fp.tell() + len(lines) > settings.API_LOG_SPILL_MAX_MB * 1024 * 1024:
+                _stats["dropped"] += len(batch)
+                return
+            _spill_fp.write(lines)
+            _spill_fp.flush()
+        except Exception as e:
+            _stats["dropped"] += len(batch)
+            if _stats["dropped"] % 1024 == 1:
+                print(f"[log_consumer] spill failed — drop (total dropped={_stats['dropped']}): {e}")
+            return
+        _stats["spilled"] += len(batch)
+        _spill_pending = True
+
+
+def _load_spill(path: str) -> list[str]:
+    with open(path, encoding="utf-8") as fp:
+        return [line for line in fp.read().splitlines() if line.strip()]
+
+
+def _save_spill(path: str, lines: list[str]) -> None:
+    with open(path, "w", encoding="utf-8") as fp:
+        fp.write("".join(line + "\n" for line in lines))
+
+
+def _parse_spilled(line: str) -> Optional[dict[str, Any]]:
+    try:
+        item = json.loads(line)
+        item["timestamp"] = datetime.fromisoformat(item["timestamp"])
+        return item
+    except (ValueError, KeyError, TypeError):
+        return None  # 기록 도중 중단된 마지막 행 등 — 버린다
+
+
+async def _replay_spill() -> None:
+    """spill 파일 → DB 재생. 현재 파일을 .replay 로 돌려놓고(신규 spill 은 새 파일) _BATCH_MAX 씩 저장.
+    실패 시 남은 행을 .replay 에 되써 두고 _SPILL_RETRY_SECONDS 뒤 재시도."""
+    global _spill_pending, _spill_retry_at
+    spill, replay = settings.API_LOG_SPILL_PATH, _replay_path()
+    if not os.path.exists(replay):
+        if not os.path.exists(spill):
+            _spill_pending = False
+            return
+        await asyncio.to_thread(_rotate_spill, spill, replay)
+    lines = await asyncio.to_thread(_load_spill, replay)
+    for i in range(0, len(lines), _BATCH_MAX):
+        batch = [item for item in map(_parse_spilled, lines[i:i + _BATCH_MAX]) if item is not None]
+        try:
+            await _write_batch(batch)
+        except Exception as e:
+            print(f"[log_consumer] spill replay failed ({len(lines) - i} rows left): {e}")
+            await asyncio.to_thread(_save_spill, replay, lines[i:])
+            _spill_retry_at = time.monotonic() + _SPILL_RETRY_SECONDS
+            return
+        _stats["replayed"] += len(batch)
+    os.remove(replay)
+    _spill_pending = os.path.exists(spill)
+    if lines:
+        print(f"[log_consumer] replayed {len(lines)} spilled api_logs rows")
+
+
+# ─── 배치 저장 ───────────────────────────────────────────────────
+
+def _copy_supported() -> bool:
+    dialect = async_engine.dialect
+    return dialect.name == "postgresql" and dialect.driver == "asyncpg"
+
+
+# user-013: 일(UTC) → COPY 대상 테이블 캐시(일별 → 월별 → 부모 순으로 처음 성공한 것)
+_copy_targets: dict[Any, str] = {}
+
+
+def _copy_candidates(day) -> list[str]:
+    return [f"api_logs_{day:%Y_%m_%d}", f"api_logs_{day:%Y_%m}", "api_logs"]
+
+
+async def _copy_batch(batch: list[dict[str, Any]]) -> None:
+    """일 단위 파티션 COPY. 대상은 일별(user-013) → 월별(v60) → 부모 api_logs 순으로
+    없는 테이블(42P01)을 건너뛰며 결정하고 일별로 캐시한다(부모 = 파티션 라우팅/비파티션 DB).
+
+    배치 전체 COPY 는 트랜잭션 1개 — 어느 일자든 실패하면 앞 일자까지 롤백되어 INSERT 대체·spill 이
+    같은 행을 중복 저장하지 않는다. 후보 시도는 savepoint(중첩 transaction)라 42P01 건너뛰기가
+    바깥 트랜잭션을 중단시키지 않는다."""
+    by_day: dict[Any, list[tuple]] = defaultdict(list)
+    for p in batch:
+        by_day[p["timestamp"].date()].append(tuple(p[c] for c in _COPY_COLUMNS))
+    async with async_engine.connect() as conn:
+        raw = await conn.get_raw_connection()
+        driver = raw.driver_connection  # asyncpg.Connection
+        async with driver.transaction():
+            for day, records in by_day.items():
+                candidates = _copy_candidates(day)
+                cached = _copy_targets.pop(day, None)  # 보존 DROP 등으로 사라졌으면 후보부터 재해석
+                if cached:
+                    candidates = [cached] + [t for t in candidates if t != cached]
+                for table in candidates:
+                    try:
+                        async with driver.transaction():  # savepoint
+                            await driver.copy_records_to_table(table, records=records, columns=_COPY_COLUMNS)
+                    except Exception as e:
+                        if getattr(e, "sqlstate", None) != "42P01" or table == "api_logs":  # undefined_table
+                            raise
+                        continue
+                    if len(_copy_targets) > 64:
+                        _copy_targets.clear()
+                    _copy_targets[day] = table
+                    break
+
+
+async def _write_batch(batch: list[dict[str, Any]]) -> None:
+    """COPY(PostgreSQL) → 실패 시 executemany INSERT. 둘 다 실패하면 예외 전파."""
     if not batch:
         return
+    if _copy_supported():
+        try:
+            await _copy_batch(batch)
+            _stats["copy_batches"] += 1
+            return
+        except Exception as e:
+            print(f"[log_consumer] COPY failed ({len(batch)} rows) — fallback to INSERT: {e}")
     async with AsyncSessionLocal() as db:
         try:
             await db.execute(insert(ApiLog), batch)
             await db.commit()
-        except Exception as e:
-            print(f"[log_consumer] batch INSERT failed ({len(batch)} rows): {e}")
-            try:
-                await db.rollback()
-            except Exception:
-                pass
+        except Exception:
+            await db.rollback()
+            raise
+
+
+async def _flush_batch(batch: list[dict[str, Any]]) -> None:
+    """배치 저장 + 지연/카운터 갱신. 저장 실패분은 spill 파일로(유실 방지)."""
+    global _last_flush_ms, _max_flush_ms, _last_batch_size
+    if not batch:
+        return
+    started = time.perf_counter()
+    try:
+        await _write_batch(batch)
+    except Exception as e:
+        print(f"[log_consumer] batch write failed ({len(batch)} rows) — spill: {e}")
+        _stats["failed_batches"] += 1
+        await asyncio.to_thread(_spill, batch)
+        return
+    elapsed = (time.perf_counter() - started) * 1000
+    _last_flush_ms = round(elapsed, 2)
+    _max_flush_ms = max(_max_flush_ms, elapsed)
+    _last_batch_size = len(batch)
+    _stats["written"] += len(batch)
+    _stats["batches"] += 1
 
 
 async def _log_consumer() -> None:
     """
     단일 consumer 코루틴 — 배치 flush.
     - 첫 아이템은 blocking get (이벤트루프 슬립).
-    - 첫 아이템 수신 후 최대 _BATCH_TIMEOUT 동안 _BATCH_SIZE-1 개까지 추가 수집.
+    - user-012: 큐에 이미 쌓인 아이템은 대기 없이 _BATCH_MAX 까지 즉시 수집(적체 시 배치 확대).
+    - 그래도 _BATCH_SIZE 미만이면 첫 아이템 수신 후 최대 _BATCH_TIMEOUT 동안 추가 수집.
+    - 큐가 한산(< _BATCH_SIZE)하면 spill 파일 재생.
     - 셧다운 시 CancelledError 를 잡아 남은 큐 drain 후 종료.
     """
     loop = asyncio.get_event_loop()
@@ -172,12 +494,22 @@ async def _log_consumer() -> None:
     while True:
         batch: list[dict[str, Any]] = []
         try:
+            if _spill_pending and _log_queue.qsize() < _BATCH_SIZE and time.monotonic() >= _spill_retry_at:
+                await _replay_spill()
+
             # 첫 아이템 대기 — 큐 비어있으면 코루틴 sleep, CPU/DB 부하 0.
             first = await _log_queue.get()
             batch.append(first)
 
+            # 적체분 즉시 수집 — 배치 크기가 큐 깊이에 비례(상한 _BATCH_MAX)
+            while len(batch) < _BATCH_MAX:
+                try:
+                    batch.append(_log_queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+
             # 배치 창(window): 첫 아이템 수신 시각 기준으로 _BATCH_TIMEOUT 안에
-            # _BATCH_SIZE-1 개까지 추가 수집. 이 창이 지나면 즉시 flush → 지연 상한 보장.
+            # _BATCH_SIZE 개까지 추가 수집. 이 창이 지나면 즉시 flush → 지연 상한 보장.
             deadline = loop.time() + _BATCH_TIMEOUT
             while len(batch) < _BATCH_SIZE:
                 remaining = deadline - loop.time()
@@ -215,18 +547,28 @@ async def _log_consumer() -> None:
 async def start_log_consumer() -> None:
     """
     FastAPI startup 훅에서 호출.
-    - 이미 실행 중이면 무시(idempotent).
+    - 이미 실행 중이면 무시(idempotent). 다른(닫힌) 루프의 태스크는 버리고 새로 띄운다.
+    - 큐를 현재 루프용으로 새로 만들고, 기동 전 put_nowait 로 쌓인 항목은 옮겨 담는다.
+    - 이전 프로세스가 남긴 spill 파일이 있으면 consumer 가 재생하도록 표시.
     """
-    global _consumer_task
-    if _consumer_task is not None and not _consumer_task.done():
+    global _consumer_task, _spill_pending, _log_queue
+    loop = asyncio.get_running_loop()
+    if _consumer_task is not None and not _consumer_task.done() and _consumer_task.get_loop() is loop:
         return
+    pending, _log_queue = _log_queue, asyncio.Queue(maxsize=_LOG_QUEUE_MAXSIZE)
+    while True:
+        try:
+            _log_queue.put_nowait(pending.get_nowait())
+        except asyncio.QueueEmpty:
+            break
+    _spill_pending = _spill_size() > 0
     _consumer_task = asyncio.create_task(_log_consumer(), name="api_log_consumer")
 
 
 async def stop_log_consumer() -> None:
     """
     FastAPI shutdown 훅에서 호출.
-    - consumer 태스크 cancel → drain → 종료 대기.
+    - consumer 태스크 cancel → drain → 종료 대기. 저장 못 한 분은 spill 파일에 남는다.
     """
     global _consumer_task
     if _consumer_task is None:
@@ -240,16 +582,25 @@ async def stop_log_consumer() -> None:
         print(f"[log_consumer] stop error: {e}")
     finally:
         _consumer_task = None
+        await asyncio.to_thread(_stop_spill_writer)
+        _close_spill()
 
 
-class APILoggingMiddleware(BaseHTTPMiddleware):
+class APILoggingMiddleware:
     """
     Middleware to log all API requests to database
     - Captures Request ID and Client UUID from headers
     - Records resource, method, description, and status code
     - Stores timestamp in ISO 8601 format
+
+    user-011: 순수 ASGI — receive/send 채널을 직접 관찰(BaseHTTPMiddleware 의 call_next 태스크·
+    메모리 스트림 홉 제거). 요청 body 는 앞 _BODY_CAPTURE_BYTES, 오류 응답 body 는 앞
+    _ERROR_CAPTURE_BYTES 까지만 버퍼링한다.
     """
 
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
     def get_description(self, method: str, path: str, status_code: int) -> str:
         """Generate description based on method and path"""
         resource_map = {
@@ -292,68 +643,118 @@ class APILoggingMiddleware(BaseHTTPMiddleware):
                 return f"{resource_name} 목록 {action}"
             return f"{resource_name} {action}"
 
-    async def dispatch(self, request: Request, call_next):
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        path = scope["path"]
+        # user-011: 로그 제외 경로는 receive/send 를 감싸지 않고 바로 통과
+        if path in _SKIP_PATHS:
+            await self.app(scope, receive, send)
+            return
+
         # Get headers
-        client_uuid = request.headers.get("X-Client-UUID")
-        request_id = getattr(request.state, "request_id", None) or request.headers.get("X-Request-ID")
+        headers = Headers(scope=scope)
+        client_uuid = headers.get("X-Client-UUID")
+        request_id = scope.get("state", {}).get("request_id") or headers.get("X-Request-ID")
 
         # Get resource path (remove /api prefix)
-        path = request.url.path
         resource = path.replace("/api/", "").strip("/")
 
         # Capture URL query parameters
         query_params = None
-        if request.url.query:
-            query_params = str(request.url.query)
+        if scope.get("query_string"):
+            query_params = scope["query_string"].decode("latin-1")
             # Limit param length to prevent database overflow
             if len(query_params) > 1000:
                 query_params = query_params[:997] + "..."
 
+        # user-011: 요청 body 는 앱이 읽는 http.request 메시지를 관찰하며 앞 _BODY_CAPTURE_BYTES 까지만
+        # 누적(전량 선읽기 + request._receive 교체 제거). 상한 초과분은 버리고 truncated 표시.
+        capture_body = method in ("POST", "PUT", "PATCH")
+        req_buf = bytearray()
+        req_truncated = False
+
+        async def receive_wrapper() -> Message:
+            nonlocal req_truncated
+            message = await receive()
+            if capture_body and message["type"] == "http.request":
+                chunk = message.get("body", b"")
+                room = _BODY_CAPTURE_BYTES - len(req_buf)
+                if len(chunk) > room:
+                    req_truncated = True
+                if room > 0 and chunk:
+                    req_buf.extend(chunk[:room])
+            return message
+
+        # 응답: 상태코드 + (>= 400 일 때만) 앞 _ERROR_CAPTURE_BYTES 바이트
+        status_code = 500
+        resp_buf = bytearray()
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            elif message["type"] == "http.response.body" and status_code >= 400:
+                room = _ERROR_CAPTURE_BYTES - len(resp_buf)
+                if room > 0:
+                    resp_buf.extend(message.get("body", b"")[:room])
+            await send(message)
+
+        try:
+            await self.app(scope, receive_wrapper, send_wrapper)
+        finally:
+            # 예외로 응답 없이 빠져도(상위 ServerErrorMiddleware 가 500 처리) 로그는 남긴다
+            self._enqueue(
+                method=method, path=path, resource=resource, client_uuid=client_uuid,
+                request_id=request_id, query_params=query_params, status_code=status_code,
+                req_body=bytes(req_buf) if capture_body else None, req_truncated=req_truncated,
+                resp_body=bytes(resp_buf),
+            )
+
+    def _enqueue(
+        self, *, method, path, resource, client_uuid, request_id, query_params,
+        status_code, req_body, req_truncated, resp_body,
+    ) -> None:
         # Capture request body for POST, PUT, PATCH methods
         body = None
-        if request.method in ["POST", "PUT", "PATCH"]:
-            try:
-                body_bytes = await request.body()
-                if body_bytes:
+        if req_body:
+            if req_truncated:
+                # SEC-01: 잘린 JSON 은 마스킹을 보장할 수 없으므로 원문 대신 크기 표시만 남긴다
+                body = f"<body exceeds {_BODY_CAPTURE_BYTES} bytes — not captured>"
+            else:
+                try:
                     # SEC-01: 원문 전체를 먼저 마스킹한 뒤 길이 제한
                     # (truncate 후 JSON 파싱 실패로 마스킹이 무력화되는 것 방지)
-                    body = redact_request_body(body_bytes.decode('utf-8', errors='replace'))
+                    body = redact_request_body(req_body.decode('utf-8', errors='replace'))
                     if body and len(body) > 2000:
                         body = body[:1997] + "..."
-                # Re-create request with body (since body() consumes the stream)
-                async def receive():
-                    return {"type": "http.request", "body": body_bytes}
-                request._receive = receive
-            except Exception as e:
-                print(f"Error capturing request body: {e}")
-
-        # Call next middleware/endpoint
-        response = await call_next(request)
+                except Exception as e:
+                    print(f"Error capturing request body: {e}")
 
         # Capture error message from response if status >= 400
         error_message = None
-        if response.status_code >= 400:
+        if status_code >= 400 and resp_body:
             try:
-                # For responses with body, try to extract error message
-                # (SEC-01: 별도 지역변수 사용 — 마스킹된 요청 body 를 덮어쓰지 않도록)
-                if hasattr(response, 'body'):
-                    resp_body = response.body
-                    if resp_body:
-                        response_data = json.loads(resp_body.decode('utf-8'))
-                        error_message = response_data.get('message') or response_data.get('detail')
-                        # Limit error message length
-                        if error_message and len(error_message) > 1000:
-                            error_message = error_message[:997] + "..."
+                response_data = json.loads(resp_body.decode('utf-8'))
+                if isinstance(response_data, dict):
+                    error = response_data.get('error')
+                    error_message = (response_data.get('message') or response_data.get('detail')
+                                     or (error.get('message') if isinstance(error, dict) else None))
+                    if error_message is not None and not isinstance(error_message, str):
+                        error_message = json.dumps(error_message, ensure_ascii=False)
+                    # Limit error message length
+                    if error_message and len(error_message) > 1000:
+                        error_message = error_message[:997] + "..."
+            except ValueError:
+                pass  # 비JSON 또는 _ERROR_CAPTURE_BYTES 에서 잘린 body
             except Exception as e:
                 print(f"Error extracting error message: {e}")
 
         # Generate description
-        description = self.get_description(request.method, path, response.status_code)
-
-        # Skip logging for non-API routes (docs, openapi, static, health)
-        # v5.4 P0-1: /reports/preview 제외 제거 — 인증 필요 엔드포인트는 감사 로그에 남긴다.
-        if path in ("/docs", "/redoc", "/openapi.json", "/health", "/", "/favicon.ico"):
-            return response
+        description = self.get_description(method, path, status_code)
 
         # v6.0 Phase 4 (A-7 #1): asyncio.Queue → 배치 consumer 로 이관.
         # - 응답 지연 0 원칙 유지: put_nowait 만 수행, 큐 full 시 drop-and-log.
@@ -361,11 +762,11 @@ class APILoggingMiddleware(BaseHTTPMiddleware):
         try:
             payload: dict[str, Any] = {
                 "resource": resource,
-                "method": request.method,
+                "method": method,
                 "client_uuid": client_uuid,
                 "request_id": request_id,
                 "description": description,
-                "status_code": response.status_code,
+                "status_code": status_code,
                 "body": body,
                 "param": query_params,
                 "error_message": error_message,
@@ -373,8 +774,6 @@ class APILoggingMiddleware(BaseHTTPMiddleware):
                 # 전역 serializer(naive=UTC) 규약과 정합되도록 naive-UTC 벽시계로 저장. sweep cutoff(utcnow)와도 일치.
                 "timestamp": utc_now().replace(tzinfo=None),
             }
-            await _enqueue_log(payload)
+            _put_log(payload)
         except Exception as e:
             print(f"Log enqueue error: {e}")
-
-        return response
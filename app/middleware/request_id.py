@@ -1,14 +1,17 @@
 """
 Request ID Middleware
 Generates or preserves X-Request-ID header for request tracking
+
+user-011: BaseHTTPMiddleware → 순수 ASGI. call_next 의 태스크/메모리 스트림 홉 없이
+scope["state"] 에 request_id 를 싣고 http.response.start 헤더에 직접 추가한다.
 """
 import uuid
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import Response
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 
-class RequestIDMiddleware(BaseHTTPMiddleware):
+class RequestIDMiddleware:
     """
     Middleware to handle X-Request-ID header
     - Auto-generates UUID if not provided
@@ -16,21 +19,24 @@ class RequestIDMiddleware(BaseHTTPMiddleware):
     - Adds X-Request-ID to response headers
     """
 
-    async def dispatch(self, request: Request, call_next):
-        # Get or generate request ID
-        request_id = request.headers.get("X-Request-ID")
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
 
-        if not request_id:
-            # Generate new UUID if not provided
-            request_id = str(uuid.uuid4())
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-        # Store request_id in request state for access in endpoints
-        request.state.request_id = request_id
+        # Get or generate request ID
+        request_id = Headers(scope=scope).get("X-Request-ID") or str(uuid.uuid4())
 
-        # Call the next middleware/endpoint
-        response = await call_next(request)
+        # Store request_id in request state for access in endpoints (request.state.request_id)
+        scope.setdefault("state", {})["request_id"] = request_id
 
-        # Add X-Request-ID to response headers
-        response.headers["X-Request-ID"] = request_id
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # Add X-Request-ID to response headers
+                MutableHeaders(scope=message)["X-Request-ID"] = request_id
+            await send(message)
 
-        return response
+        await self.app(scope, receive, send_wrapper)
@@ -0,0 +1,59 @@
+"""
+Response Cache Middleware
+`@cached` 라우트 미스 응답을 잡아 응답 캐시에 적재 + 강한 ETag 부여 (user-025)
+
+핸들러가 scope["gop.response_cache"] 를 남긴 요청의 200 응답만 본문을 버퍼링한다(대상은 소형 JSON 목록).
+그 외 요청은 send 를 그대로 통과시킨다. If-None-Match 가 새 ETag 와 일치하면 본문 대신 304.
+적중 응답은 `cached` 데코레이터가 직접 만들므로 여기서는 건드리지 않는다.
+"""
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.services import response_cache
+
+
+class ResponseCacheMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] != "GET":
+            await self.app(scope, receive, send)
+            return
+
+        start: Message | None = None
+        chunks: list[bytes] = []
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start
+            marker = scope.get(response_cache.SCOPE_KEY)
+            if message["type"] == "http.response.start":
+                if marker is None or message["status"] != 200:
+                    scope.pop(response_cache.SCOPE_KEY, None)
+                    await send(message)
+                    return
+                start = message
+                return
+            if start is None or message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            chunks.append(message.get("body", b""))
+            if message.get("more_body", False):
+                return
+
+            body = b"".join(chunks)
+            key, tags, seq = marker
+            headers = MutableHeaders(scope=start)
+            etag = response_cache.store(key, tags, seq, body, headers.get("content-type", "application/json"))
+            headers["ETag"] = etag
+            headers["Cache-Control"] = "no-cache"
+            if response_cache.etag_matches(Headers(scope=scope).get("if-none-match"), etag):
+                start["status"] = 304
+                del headers["content-length"]
+                del headers["content-type"]
+                body = b""
+            await send(start)
+            await send({"type": "http.response.body", "body": body, "more_body": False})
+
+        await self.app(scope, receive, send_wrapper)
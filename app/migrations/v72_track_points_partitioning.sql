@@ -0,0 +1,128 @@
+-- v72_track_points_partitioning.sql
+-- user-004 — track_points 일별 RANGE 파티셔닝 전환 (observed_at)
+--
+-- 실행: docker exec api-test-postgres psql -U gop_user -d gop -f /app/migrations/v72_track_points_partitioning.sql
+--
+-- 배경:
+--   track_points 는 1Hz × 카메라 수십 대 × 타겟 다수의 고볼륨 시계열인데 단일 테이블 + b-tree 3개였다.
+--   `GET /api/tracking/points` keyset 스캔은 테이블 성장에 따라 느려지고, 보존정책 purge_track_points()
+--   의 대량 DELETE 는 테이블/인덱스 팽창과 vacuum 부하를 남긴다.
+--
+-- 전략 (v60 api_logs 파티셔닝과 동일 절차):
+--   - PARTITION BY RANGE (observed_at), **일별** 파티션 — 하루 재생 조회가 파티션 1개만 접근(pruning).
+--   - 일 경계 = 표시 타임존(DISPLAY_TIMEZONE, 기본 Asia/Seoul) 자정. 앱의
+--     app/services/track_points_partition_service.py 와 동일 규약(파티션명 track_points_YYYY_MM_DD).
+--     ★ DISPLAY_TIMEZONE 이 다른 사이트는 아래 v_tz 를 맞춰 실행할 것.
+--   - 기존 track_points → track_points_v71 rename → 파티션 부모 생성 →
+--     기존 데이터의 (최소 관측일 ~ 오늘+7일) 일별 파티션 생성 후 이관.
+--   - PK 는 (id, observed_at) 복합 — 파티션 키가 PK/UNIQUE 에 포함되어야 함(PostgreSQL 제약).
+--     uq_track_points_track_observed(track_id, observed_at) 는 파티션 키 포함이라 그대로 유지
+--     → gis-ingest ON CONFLICT (track_id, observed_at) 멱등 병합 불변.
+--   - track_points_default: 범위 밖(사전 생성 지평 초과 미래 / DROP 된 과거) 관측 흡수 — 인제스트 배치가
+--     잘못된 시각 1건 때문에 통째로 실패하지 않도록. observed_at 은 클라이언트 시각이라 api_logs(v75)와 달리
+--     DEFAULT 를 둔다. 사전 생성 시 default 에 그 날 행이 있으면 앱이 새 일 파티션으로 옮긴다.
+--   - 이후 파티션 사전 생성/보존 DROP 은 앱 스케줄러가 담당(track_points_partition_service).
+--
+-- 유의:
+--   - 트랜잭션 단위 실행 — 도중 실패 시 자동 롤백.
+--   - ORM 모델(app/models/tracking.py)은 단일 PK(id) 유지(api_logs 와 동일) — id 는 시퀀스로 유일.
+--
+-- ROLLBACK 절차(수동) — 마이그레이션은 단일 트랜잭션이라 도중 실패는 자동 롤백되고 부분 상태가 없다.
+--   커밋 후 되돌리기는 8단계 DROP 을 주석 처리해 track_points_v71 을 남겨 둔 배포에서만 가능:
+--   BEGIN;
+--     ALTER TABLE track_points RENAME TO track_points_v72_partitioned;
+--     ALTER TABLE track_points_v71 RENAME TO track_points;
+--   COMMIT;
+
+BEGIN;
+
+-- 1. 기존 테이블 백업 이름 변경 + 인덱스/제약 이름 충돌 방지 rename
+ALTER TABLE track_points RENAME TO track_points_v71;
+ALTER INDEX IF EXISTS track_points_pkey                     RENAME TO track_points_v71_pkey;
+ALTER INDEX IF EXISTS ix_track_points_id                    RENAME TO ix_track_points_v71_id;
+ALTER INDEX IF EXISTS ix_track_points_camera_id             RENAME TO ix_track_points_v71_camera_id;
+ALTER INDEX IF EXISTS ix_track_points_track_id              RENAME TO ix_track_points_v71_track_id;
+ALTER INDEX IF EXISTS ix_track_points_observed_at           RENAME TO ix_track_points_v71_observed_at;
+ALTER INDEX IF EXISTS idx_track_points_observed_at          RENAME TO idx_track_points_v71_observed_at;
+ALTER INDEX IF EXISTS idx_track_points_camera_observed      RENAME TO idx_track_points_v71_camera_observed;
+ALTER TABLE track_points_v71
+    RENAME CONSTRAINT uq_track_points_track_observed TO uq_track_points_v71_track_observed;
+
+-- 2. 파티션 부모 (동일 컬럼)
+CREATE TABLE track_points (
+    id             BIGSERIAL,
+    camera_id      INTEGER          NOT NULL,
+    track_id       VARCHAR(64)      NOT NULL,
+    label          VARCHAR(32),
+    threat_level   VARCHAR(16),
+    latitude       DOUBLE PRECISION NOT NULL,
+    longitude      DOUBLE PRECISION NOT NULL,
+    distance_m     DOUBLE PRECISION,
+    confidence     DOUBLE PRECISION,
+    observed_at    TIMESTAMPTZ      NOT NULL,
+    tracking_state VARCHAR(16),
+    speed_mps      DOUBLE PRECISION,
+    session_seq    INTEGER,
+    created_at     TIMESTAMPTZ      NOT NULL DEFAULT now(),
+    PRIMARY KEY (id, observed_at),
+    CONSTRAINT uq_track_points_track_observed UNIQUE (track_id, observed_at)
+) PARTITION BY RANGE (observed_at);
+
+-- 3. 일별 파티션: 기존 최소 관측일 ~ 오늘 + 7일 (표시 tz 자정 경계)
+DO $$
+DECLARE
+    v_tz    TEXT := 'Asia/Seoul';
+    v_day   DATE;
+    v_last  DATE;
+    v_from  TIMESTAMPTZ;
+    v_to    TIMESTAMPTZ;
+BEGIN
+    v_last := (now() AT TIME ZONE v_tz)::date + 7;
+    SELECT COALESCE(MIN((observed_at AT TIME ZONE v_tz)::date), (now() AT TIME ZONE v_tz)::date)
+      INTO v_day FROM track_points_v71;
+    WHILE v_day <= v_last LOOP
+        v_from := v_day::timestamp AT TIME ZONE v_tz;
+        v_to   := (v_day + 1)::timestamp AT TIME ZONE v_tz;
+        EXECUTE format(
+            'CREATE TABLE IF NOT EXISTS %I PARTITION OF track_points FOR VALUES FROM (%L) TO (%L)',
+            'track_points_' || to_char(v_day, 'YYYY_MM_DD'), v_from, v_to
+        );
+        v_day := v_day + 1;
+    END LOOP;
+END $$;
+
+-- 4. 범위 밖 관측 흡수용 default 파티션
+CREATE TABLE track_points_default PARTITION OF track_points DEFAULT;
+
+-- 5. 기존 데이터 이관 (부모 INSERT → 각 일 파티션으로 자동 라우팅)
+INSERT INTO track_points (id, camera_id, track_id, label, threat_level, latitude, longitude,
+                          distance_m, confidence, observed_at, tracking_state, speed_mps,
+                          session_seq, created_at)
+SELECT id, camera_id, track_id, label, threat_level, latitude, longitude,
+       distance_m, confidence, observed_at, tracking_state, speed_mps,
+       session_seq, created_at
+FROM track_points_v71;
+
+-- 6. sequence 재정합
+SELECT setval(
+    pg_get_serial_sequence('track_points', 'id'),
+    COALESCE((SELECT MAX(id) FROM track_points), 1),
+    true
+);
+
+-- 7. 인덱스 (부모에 생성 → 파티션 자동 상속). ORM index=True(id/camera_id/track_id) 와 동일 이름.
+--    ix_track_points_observed_at 은 idx_track_points_observed_at 와 같은 키라 생략.
+CREATE INDEX idx_track_points_observed_at     ON track_points (observed_at);
+CREATE INDEX idx_track_points_camera_observed ON track_points (camera_id, observed_at);
+CREATE INDEX ix_track_points_id               ON track_points (id);
+CREATE INDEX ix_track_points_camera_id        ON track_points (camera_id);
+CREATE INDEX ix_track_points_track_id         ON track_points (track_id);
+
+-- 8. 이전 테이블 삭제
+--    NOTE: 롤백 여지를 원할 경우 아래 DROP 라인을 주석 처리하여
+--          track_points_v71 을 배포 후 N일간 유지 후 별도 정리 가능.
+DROP TABLE track_points_v71;
+
+-- 9. purge_track_points() — 파티션 DROP 으로 대체(앱 스케줄러). 수동 호출 호환을 위해 DELETE 본문 유지.
+
+COMMIT;
@@ -0,0 +1,63 @@
+-- v73_track_sessions.sql
+-- user-006 — 추적 세션 요약 테이블(track_sessions) 신설 + 기존 track_points 로 백필
+--
+-- 실행: docker exec api-test-postgres psql -U gop_user -d gop -f /app/migrations/v73_track_sessions.sql
+--
+-- 배경:
+--   `GET /api/tracking/sessions` 는 호출마다 track_points 구간 전체를 GROUP BY(track_id, camera_id) 해
+--   MIN/MAX/COUNT 를 계산했다 — 이력이 쌓일수록 타임라인 로드가 선형으로 느려진다.
+--
+-- 전략:
+--   - track_id(+camera_id) 당 1행 요약: start_at/end_at/point_count/label/bbox.
+--   - gis-ingest 가 배치 병합 문장(CTE)에서 **실제 삽입된 행만** 집계해 UPSERT(증분) — 중복 관측 미반영.
+--   - 보존: track_points 파티션 DROP 시 end_at 경과 세션도 삭제(track_points_partition_service).
+--   - 앱 startup create_all(ORM app/models/tracking.py::TrackSession)도 테이블을 생성한다 — 본 SQL 은
+--     IF NOT EXISTS 로 멱등, 백필은 ON CONFLICT 로 재실행 안전(재실행 시 현재 원본으로 덮어씀).
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS track_sessions (
+    id             BIGSERIAL PRIMARY KEY,
+    track_id       VARCHAR(64)      NOT NULL,
+    camera_id      INTEGER          NOT NULL,
+    label          VARCHAR(32),
+    start_at       TIMESTAMPTZ      NOT NULL,
+    end_at         TIMESTAMPTZ      NOT NULL,
+    point_count    BIGINT           NOT NULL DEFAULT 0,
+    min_latitude   DOUBLE PRECISION,
+    max_latitude   DOUBLE PRECISION,
+    min_longitude  DOUBLE PRECISION,
+    max_longitude  DOUBLE PRECISION,
+    session_seq    INTEGER,
+    updated_at     TIMESTAMPTZ      NOT NULL DEFAULT now(),
+    CONSTRAINT uq_track_sessions_track_camera UNIQUE (track_id, camera_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_track_sessions_start_at      ON track_sessions (start_at);
+CREATE INDEX IF NOT EXISTS idx_track_sessions_camera_start  ON track_sessions (camera_id, start_at);
+
+-- 백필 (1회성 풀스캔 — 이후 증분)
+INSERT INTO track_sessions (track_id, camera_id, label, start_at, end_at, point_count,
+                            min_latitude, max_latitude, min_longitude, max_longitude,
+                            session_seq, updated_at)
+SELECT track_id, camera_id, MAX(label), MIN(observed_at), MAX(observed_at), COUNT(*),
+       MIN(latitude), MAX(latitude), MIN(longitude), MAX(longitude),
+       MAX(session_seq), now()
+FROM track_points
+GROUP BY track_id, camera_id
+ON CONFLICT (track_id, camera_id) DO UPDATE SET
+    label         = EXCLUDED.label,
+    start_at      = EXCLUDED.start_at,
+    end_at        = EXCLUDED.end_at,
+    point_count   = EXCLUDED.point_count,
+    min_latitude  = EXCLUDED.min_latitude,
+    max_latitude  = EXCLUDED.max_latitude,
+    min_longitude = EXCLUDED.min_longitude,
+    max_longitude = EXCLUDED.max_longitude,
+    session_seq   = EXCLUDED.session_seq,
+    updated_at    = now();
+
+-- 검증
+SELECT 'track_sessions 백필 완료' AS status, COUNT(*) AS sessions FROM track_sessions;
+
+COMMIT;
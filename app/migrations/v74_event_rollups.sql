@@ -0,0 +1,62 @@
+-- v74_event_rollups.sql
+-- user-010 — 이벤트 시간/일 단위 롤업 테이블(event_rollup_hourly/daily) + 잡 워터마크(event_rollup_state) 신설
+--
+-- 실행: docker exec api-test-postgres psql -U gop_user -d gop -f /app/migrations/v74_event_rollups.sql
+--
+-- 배경:
+--   이벤트 통계 API(`/api/event-statistics/*`)와 보고서 마스터 빌더가 호출마다 events ⋈ detection_events/
+--   malfunction_events/action_events/devices/sensors 원본을 재집계했다 — 1년 범위 보고서는 원본 전량 스캔.
+--
+-- 전략:
+--   - 스케줄러 잡(run_event_rollup, EVENT_ROLLUP_INTERVAL_MINUTES 주기)이 워터마크 이후 닫힌 정시/날짜를
+--     원본에서 재계산(DELETE + INSERT)해 채운다 — 삽입 트리거 없이 멱등, 늦게 커밋된 이벤트는 겹침 재계산으로 흡수.
+--   - 조회는 닫힌 버킷 = 롤업, 가장자리·워터마크 이후 = 원본 합산(app/services/event_rollup_service.py).
+--   - 백필은 별도 SQL 없이 잡 최초 실행(부팅 직후)이 가장 오래된 이벤트부터 24시간 창 단위로 수행.
+--   - 닫힌 구간의 이벤트 삭제/변경/소급 삽입은 ORM flush 훅이 같은 트랜잭션에서 event_rollup_dirty 에 UTC 정시를
+--     남기고, 다음 잡 회차가 그 시간·날짜 버킷을 원본에서 재계산한다.
+--   - 앱 startup create_all(ORM app/models/event_rollup.py)도 테이블을 생성한다 — 본 SQL 은 IF NOT EXISTS 로 멱등.
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS event_rollup_hourly (
+    id               BIGSERIAL PRIMARY KEY,
+    bucket_start     TIMESTAMPTZ  NOT NULL,
+    category         VARCHAR(16)  NOT NULL,
+    kind             VARCHAR(64),
+    device_category  VARCHAR(32),
+    zone             VARCHAR(64),
+    event_count      INTEGER      NOT NULL DEFAULT 0
+);
+
+CREATE INDEX IF NOT EXISTS idx_event_rollup_hourly_bucket ON event_rollup_hourly (bucket_start);
+
+CREATE TABLE IF NOT EXISTS event_rollup_daily (
+    id               BIGSERIAL PRIMARY KEY,
+    bucket_day       DATE         NOT NULL,
+    category         VARCHAR(16)  NOT NULL,
+    kind             VARCHAR(64),
+    device_category  VARCHAR(32),
+    device_id        INTEGER,
+    zone             VARCHAR(64),
+    event_count      INTEGER      NOT NULL DEFAULT 0
+);
+
+CREATE INDEX IF NOT EXISTS idx_event_rollup_daily_day ON event_rollup_daily (bucket_day);
+
+CREATE TABLE IF NOT EXISTS event_rollup_dirty (
+    id            BIGSERIAL PRIMARY KEY,
+    bucket_start  TIMESTAMPTZ  NOT NULL,
+    created_at    TIMESTAMPTZ  NOT NULL DEFAULT now()
+);
+
+CREATE TABLE IF NOT EXISTS event_rollup_state (
+    name        VARCHAR(32)  PRIMARY KEY,
+    watermark   TIMESTAMPTZ  NOT NULL,
+    updated_at  TIMESTAMPTZ  NOT NULL DEFAULT now()
+);
+
+-- 검증
+SELECT 'event_rollup 테이블 준비 완료' AS status,
+       (SELECT COUNT(*) FROM event_rollup_state) AS watermarks;
+
+COMMIT;
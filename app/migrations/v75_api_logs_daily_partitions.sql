@@ -0,0 +1,52 @@
+-- v75_api_logs_daily_partitions.sql
+-- user-013 — api_logs 월별 → 일별 파티션 전환(신규분) + 보존을 파티션 DROP 으로
+--
+-- 실행: docker exec api-test-postgres psql -U gop_user -d gop -f /app/migrations/v75_api_logs_daily_partitions.sql
+--
+-- 배경:
+--   api_logs 보존(30일)이 `DELETE ... WHERE "timestamp" < cutoff` 행 삭제라 매일 수십만 행의 WAL,
+--   테이블/인덱스 팽창, autovacuum 부하를 만들었다. 파티션(v60, 월별)은 있었지만 보존에 쓰이지 않았다.
+--   DB-02(api_logs_partition_service)는 당월+6개월 월 파티션을 미리 만들어 두었다.
+--
+-- 전략:
+--   - 앞으로의 파티션은 일별(`api_logs_YYYY_MM_DD`, UTC 자정 경계) — 앱 startup·일 1회 cron 이
+--     오늘+API_LOGS_PARTITION_DAYS_AHEAD 일을 멱등 생성(app/services/api_logs_partition_service.py).
+--   - 본 SQL 은 **다음 달 이후의 빈 월 파티션**만 DETACH + DROP 해 일별 파티션이 그 범위를 차지하게 한다.
+--     당월·과거 월 파티션과 api_logs_before_partition(MINVALUE~) 은 그대로 — 보존기간 경과 시
+--     run_api_logs_sweep 가 파티션째 DROP 한다(이후 일별만 남음).
+--   - 행이 있는 미래 월 파티션은 건드리지 않는다(NOTICE 만) — 그 범위는 기존 월 파티션이 계속 덮는다.
+--   - DEFAULT 파티션은 만들지 않는다 — 범위 밖 INSERT 는 사전 생성으로 방지, DEFAULT 가 있으면
+--     새 파티션 생성 시 DEFAULT 전체 스캔이 필요하다.
+--   - 이 SQL 적용 직후 앱을 재기동(또는 ensure_api_log_partitions 1회 실행)해 일별 파티션을 채울 것.
+--     재기동 전 다음 달 1일 00:00 UTC 를 넘기면 해당 INSERT 는 실패 → spill 파일(user-012)로 보존 후 재생.
+--   - 비파티션 api_logs(v60 미적용)면 no-op.
+
+BEGIN;
+
+DO $$
+DECLARE
+    next_month timestamp := date_trunc('month', now() AT TIME ZONE 'UTC') + interval '1 month';
+    part record;
+    has_rows boolean;
+BEGIN
+    FOR part IN
+        SELECT c.relname AS name
+        FROM pg_inherits i
+        JOIN pg_class c ON c.oid = i.inhrelid
+        JOIN pg_class p ON p.oid = i.inhparent
+        WHERE p.relname = 'api_logs'
+          AND c.relname ~ '^api_logs_[0-9]{4}_[0-9]{2}$'
+          AND to_timestamp(substr(c.relname, 10), 'YYYY_MM')::timestamp >= next_month
+    LOOP
+        EXECUTE format('SELECT EXISTS (SELECT 1 FROM %I)', part.name) INTO has_rows;
+        IF has_rows THEN
+            RAISE NOTICE 'v75: % has rows — kept', part.name;
+            CONTINUE;
+        END IF;
+        EXECUTE format('ALTER TABLE api_logs DETACH PARTITION %I', part.name);
+        EXECUTE format('DROP TABLE %I', part.name);
+        RAISE NOTICE 'v75: dropped empty future partition %', part.name;
+    END LOOP;
+END $$;
+
+COMMIT;
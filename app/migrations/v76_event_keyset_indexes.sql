@@ -0,0 +1,21 @@
+-- v76_event_keyset_indexes.sql
+-- user-014 — 이벤트 목록 keyset(커서) 페이지네이션용 복합 인덱스
+--
+-- 실행: docker exec api-test-postgres psql -U gop_user -d gop -f /app/migrations/v76_event_keyset_indexes.sql
+--
+-- 배경:
+--   탐지/장애/연결/조치 이벤트 목록이 `ORDER BY created_at DESC, id DESC OFFSET n` + 매 호출 count(*) 라
+--   깊은 페이지일수록 건너뛸 행을 모두 읽었다. `paging=cursor` 는 `(created_at, id) < (:ts, :id)` 로
+--   직전 페이지 이후만 읽는다(app/utils/event_pagination.py).
+--
+-- 전략:
+--   - events: 카테고리(discriminator) 선두 + (created_at, id) — 카테고리별 목록이 인덱스 역방향 범위 스캔 + LIMIT.
+--   - action_events: (created_at, id).
+--   - 운영 중 테이블 잠금을 피하려 CONCURRENTLY — 트랜잭션 블록(BEGIN/COMMIT) 밖에서 실행한다.
+--   - 앱 startup create_all(ORM __table_args__)은 신규 DB 에만 생성 — 기존 DB 는 본 SQL 로. IF NOT EXISTS 로 멱등.
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_events_category_created_id
+    ON events (category_event, created_at, id);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_action_events_created_id
+    ON action_events (created_at, id);
@@ -0,0 +1,18 @@
+-- v77_enclosure_metrics_latest_index.sql
+-- user-016 — 함체별 최신 메트릭 조회용 복합 인덱스
+--
+-- 실행: docker exec api-test-postgres psql -U gop_user -d gop -f /app/migrations/v77_enclosure_metrics_latest_index.sql
+--
+-- 배경:
+--   GET /api/enclosure-metrics 가 함체마다 `WHERE enclosure_id = :id ORDER BY created_at DESC` 를 따로 실행했다(N+1).
+--   enclosure_id 단일 인덱스라 함체별 이력 전체를 읽고 정렬한 뒤 첫 행만 썼다.
+--
+-- 전략:
+--   - 단일 쿼리: enclosures ⟕ enclosure_metrics ON id = (함체별 상관 서브쿼리 ORDER BY created_at DESC, id DESC LIMIT 1).
+--     본 인덱스 역방향 스캔으로 함체당 1행만 읽는다(LATERAL 과 같은 실행형).
+--   - 결과는 프로세스 캐시(app/services/enclosure_latest_cache.py)에 두고 POST 시 write-through.
+--   - 운영 중 테이블 잠금을 피하려 CONCURRENTLY — 트랜잭션 블록(BEGIN/COMMIT) 밖에서 실행한다.
+--   - 앱 startup create_all(ORM __table_args__)은 신규 DB 에만 생성 — 기존 DB 는 본 SQL 로. IF NOT EXISTS 로 멱등.
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_enclosure_metrics_enclosure_created_id
+    ON enclosure_metrics (enclosure_id, created_at, id);
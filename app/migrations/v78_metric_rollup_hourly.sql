@@ -0,0 +1,43 @@
+-- v78_metric_rollup_hourly.sql
+-- user-017 — 함체/서버 메트릭 1시간 롤업 테이블(metric_rollup_hourly) 신설
+--
+-- 실행: docker exec api-test-postgres psql -U gop_user -d gop -f /app/migrations/v78_metric_rollup_hourly.sql
+--
+-- 배경:
+--   GET /api/devices/enclosures/{id}/metrics · GET /api/servers/{id}/metrics 가 원본 행만 반환해
+--   10초 주기 텔레메트리 1주 차트가 수만 포인트를 내려받았다. `bucket=1m|5m|1h` 는 date_bin 으로
+--   버킷별 min/avg/max/last 를 SQL 집계한다(app/services/metric_series_service.py).
+--
+-- 전략:
+--   - 세로 형식 1테이블: (source, entity_id, metric, bucket_start) 행 — 함체/서버 공용. avg 는 sum/count 로 복원.
+--   - 스케줄러 잡(run_metric_rollup, METRIC_ROLLUP_INTERVAL_MINUTES 주기)이 워터마크 이후 닫힌 정시를
+--     원본에서 재계산(DELETE + INSERT)한다 — 멱등, 늦은 수집분은 겹침 재계산으로 흡수.
+--     워터마크는 event_rollup_state(v74) 에 name='enclosure_metrics' / 'server_metrics' 행으로 공유.
+--   - `bucket=1h` 조회는 닫힌 정시 = 롤업, 가장자리·워터마크 이후 = 원본.
+--   - 백필은 별도 SQL 없이 잡 최초 실행이 가장 오래된 메트릭부터 24시간 창 단위로 수행.
+--   - 앱 startup create_all(ORM app/models/metric_rollup.py)도 테이블을 생성한다 — 본 SQL 은 IF NOT EXISTS 로 멱등.
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS metric_rollup_hourly (
+    id            BIGSERIAL PRIMARY KEY,
+    source        VARCHAR(16)  NOT NULL,
+    entity_id     INTEGER      NOT NULL,
+    metric        VARCHAR(32)  NOT NULL,
+    bucket_start  TIMESTAMPTZ  NOT NULL,
+    sample_count  INTEGER      NOT NULL DEFAULT 0,
+    min_value     DOUBLE PRECISION,
+    max_value     DOUBLE PRECISION,
+    sum_value     DOUBLE PRECISION,
+    last_value    DOUBLE PRECISION
+);
+
+CREATE INDEX IF NOT EXISTS idx_metric_rollup_hourly_entity_bucket
+    ON metric_rollup_hourly (source, entity_id, bucket_start);
+CREATE INDEX IF NOT EXISTS idx_metric_rollup_hourly_bucket ON metric_rollup_hourly (bucket_start);
+
+-- 검증
+SELECT 'metric_rollup_hourly 준비 완료' AS status,
+       (SELECT COUNT(*) FROM event_rollup_state WHERE name IN ('enclosure_metrics', 'server_metrics')) AS watermarks;
+
+COMMIT;
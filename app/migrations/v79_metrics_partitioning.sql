@@ -0,0 +1,138 @@
+-- v79_metrics_partitioning.sql
+-- user-018 — enclosure_metrics / server_metrics 일별 RANGE 파티셔닝 전환 (created_at)
+--
+-- 실행: docker exec api-test-postgres psql -U gop_user -d gop -f /app/migrations/v79_metrics_partitioning.sql
+--
+-- 배경:
+--   두 메트릭 테이블은 무제한 성장했다 — 정리는 수동 DELETE 엔드포인트뿐이고, db_monitor ENCLOSURE_METRICS
+--   주기 조회는 전 이력을 훑었다. 보존을 행 DELETE 로 하면 WAL·팽창·vacuum 부하가 남는다.
+--
+-- 전략 (v72 track_points 파티셔닝과 동일 절차):
+--   - PARTITION BY RANGE (created_at), **일별** 파티션, 경계 = UTC 자정(metric_rollup_hourly 정시와 정렬).
+--     파티션명 <table>_YYYY_MM_DD — app/services/metrics_retention_service.py 와 동일 규약.
+--   - 기존 테이블 → <table>_v78 rename → 파티션 부모 생성 → (최소 created_at 일 ~ 오늘+7일) 파티션 생성 후 이관.
+--   - PK 는 (id, created_at) 복합 — 파티션 키가 PK 에 포함되어야 함. ORM 모델은 단일 PK(id) 유지(id 는 시퀀스로 유일).
+--   - DEFAULT 파티션은 두지 않는다(v75 api_logs 와 동일 정책). created_at 은 서버 시각(now())이라 범위 밖 행이
+--     생길 일이 없고, 앱이 오늘+METRICS_PARTITION_DAYS_AHEAD 일을 미리 만든다. DEFAULT 에 행이 쌓이면 그 범위의
+--     새 파티션 CREATE 가 거부되어 사전 생성이 막힌다.
+--   - 이후 파티션 사전 생성 / 원본 보존 DROP(METRICS_RAW_RETENTION_DAYS) / 롤업 보존(METRICS_ROLLUP_RETENTION_MONTHS)은
+--     앱 스케줄러(metrics_partition 00:15, metrics_tiering 00:30). 보존 밖 기존 이력은 첫 tiering 회차가
+--     1시간 롤업(v78)으로 접은 뒤 DROP 한다 — 여기서는 전량 이관.
+--
+-- 유의:
+--   - 트랜잭션 단위 실행 — 도중 실패 시 자동 롤백. 이관 중 두 테이블 쓰기가 잠긴다(유지보수 창에서 실행).
+--
+-- ROLLBACK 절차(수동) — 마이그레이션은 단일 트랜잭션이라 도중 실패는 자동 롤백되고 부분 상태가 없다.
+--   커밋 후 되돌리기는 7단계 DROP 을 주석 처리해 *_v78 을 남겨 둔 배포에서만 가능:
+--   BEGIN;
+--     ALTER TABLE enclosure_metrics RENAME TO enclosure_metrics_v79_partitioned;
+--     ALTER TABLE enclosure_metrics_v78 RENAME TO enclosure_metrics;
+--     ALTER TABLE server_metrics RENAME TO server_metrics_v79_partitioned;
+--     ALTER TABLE server_metrics_v78 RENAME TO server_metrics;
+--   COMMIT;
+
+BEGIN;
+
+-- 1. 기존 테이블 백업 이름 변경 + 인덱스 이름 충돌 방지 rename
+ALTER TABLE enclosure_metrics RENAME TO enclosure_metrics_v78;
+ALTER INDEX IF EXISTS enclosure_metrics_pkey                      RENAME TO enclosure_metrics_v78_pkey;
+ALTER INDEX IF EXISTS ix_enclosure_metrics_id                     RENAME TO ix_enclosure_metrics_v78_id;
+ALTER INDEX IF EXISTS ix_enclosure_metrics_enclosure_id           RENAME TO ix_enclosure_metrics_v78_enclosure_id;
+ALTER INDEX IF EXISTS idx_enclosure_metrics_enclosure_created_id  RENAME TO idx_enclosure_metrics_v78_enclosure_created_id;
+
+ALTER TABLE server_metrics RENAME TO server_metrics_v78;
+ALTER INDEX IF EXISTS server_metrics_pkey         RENAME TO server_metrics_v78_pkey;
+ALTER INDEX IF EXISTS ix_server_metrics_id        RENAME TO ix_server_metrics_v78_id;
+ALTER INDEX IF EXISTS ix_server_metrics_server_id RENAME TO ix_server_metrics_v78_server_id;
+
+-- 2. 파티션 부모 (동일 컬럼)
+CREATE TABLE enclosure_metrics (
+    id                 SERIAL,
+    enclosure_id       INTEGER      NOT NULL REFERENCES enclosures(id) ON DELETE CASCADE,
+    temperature        VARCHAR(10),
+    humidity           VARCHAR(10),
+    current            VARCHAR(10),
+    voltage            VARCHAR(10),
+    vibration          INTEGER,
+    ups_battery_level  INTEGER,
+    ups_charging       BOOLEAN,
+    detail             JSONB,
+    created_at         TIMESTAMPTZ  NOT NULL DEFAULT now(),
+    PRIMARY KEY (id, created_at)
+) PARTITION BY RANGE (created_at);
+
+CREATE TABLE server_metrics (
+    id                SERIAL,
+    server_id         INTEGER      NOT NULL REFERENCES servers(id) ON DELETE CASCADE,
+    cpu_usage         DOUBLE PRECISION,
+    ram_usage         DOUBLE PRECISION,
+    ram_total_gb      DOUBLE PRECISION,
+    ram_used_gb       DOUBLE PRECISION,
+    disk_usage        DOUBLE PRECISION,
+    disk_total_gb     DOUBLE PRECISION,
+    disk_used_gb      DOUBLE PRECISION,
+    network_in_mbps   DOUBLE PRECISION,
+    network_out_mbps  DOUBLE PRECISION,
+    process_count     INTEGER,
+    detail            JSONB,
+    collected_at      TIMESTAMPTZ,
+    created_at        TIMESTAMPTZ  NOT NULL DEFAULT now(),
+    PRIMARY KEY (id, created_at)
+) PARTITION BY RANGE (created_at);
+
+-- 3. 일별 파티션: 기존 최소 created_at 일 ~ 오늘 + 7일 (UTC 자정 경계)
+DO $$
+DECLARE
+    v_table TEXT;
+    v_day   DATE;
+    v_last  DATE := (now() AT TIME ZONE 'UTC')::date + 7;
+BEGIN
+    FOREACH v_table IN ARRAY ARRAY['enclosure_metrics', 'server_metrics'] LOOP
+        EXECUTE format(
+            'SELECT COALESCE(MIN((created_at AT TIME ZONE ''UTC'')::date), (now() AT TIME ZONE ''UTC'')::date) FROM %I',
+            v_table || '_v78'
+        ) INTO v_day;
+        WHILE v_day <= v_last LOOP
+            EXECUTE format(
+                'CREATE TABLE IF NOT EXISTS %I PARTITION OF %I FOR VALUES FROM (%L) TO (%L)',
+                v_table || '_' || to_char(v_day, 'YYYY_MM_DD'), v_table,
+                v_day::timestamp AT TIME ZONE 'UTC', (v_day + 1)::timestamp AT TIME ZONE 'UTC'
+            );
+            v_day := v_day + 1;
+        END LOOP;
+    END LOOP;
+END $$;
+
+-- 4. 기존 데이터 이관 (부모 INSERT → 각 일 파티션으로 자동 라우팅)
+INSERT INTO enclosure_metrics (id, enclosure_id, temperature, humidity, current, voltage, vibration,
+                               ups_battery_level, ups_charging, detail, created_at)
+SELECT id, enclosure_id, temperature, humidity, current, voltage, vibration,
+       ups_battery_level, ups_charging, detail, created_at
+FROM enclosure_metrics_v78;
+
+INSERT INTO server_metrics (id, server_id, cpu_usage, ram_usage, ram_total_gb, ram_used_gb, disk_usage,
+                            disk_total_gb, disk_used_gb, network_in_mbps, network_out_mbps, process_count,
+                            detail, collected_at, created_at)
+SELECT id, server_id, cpu_usage, ram_usage, ram_total_gb, ram_used_gb, disk_usage,
+       disk_total_gb, disk_used_gb, network_in_mbps, network_out_mbps, process_count,
+       detail, collected_at, created_at
+FROM server_metrics_v78;
+
+-- 5. sequence 재정합
+SELECT setval(pg_get_serial_sequence('enclosure_metrics', 'id'),
+              COALESCE((SELECT MAX(id) FROM enclosure_metrics), 1), true);
+SELECT setval(pg_get_serial_sequence('server_metrics', 'id'),
+              COALESCE((SELECT MAX(id) FROM server_metrics), 1), true);
+
+-- 6. 인덱스 (부모에 생성 → 파티션 자동 상속). v77 최신값 인덱스 포함.
+CREATE INDEX ix_enclosure_metrics_enclosure_id          ON enclosure_metrics (enclosure_id);
+CREATE INDEX idx_enclosure_metrics_enclosure_created_id ON enclosure_metrics (enclosure_id, created_at, id);
+CREATE INDEX ix_server_metrics_server_id                ON server_metrics (server_id);
+CREATE INDEX idx_server_metrics_server_created_id       ON server_metrics (server_id, created_at, id);
+
+-- 7. 이전 테이블 삭제
+--    NOTE: 롤백 여지를 원할 경우 아래 DROP 라인을 주석 처리하여 *_v78 을 배포 후 N일간 유지 후 별도 정리 가능.
+DROP TABLE enclosure_metrics_v78;
+DROP TABLE server_metrics_v78;
+
+COMMIT;
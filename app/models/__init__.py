@@ -12,7 +12,9 @@ from app.models.file_group import FileGroup
 from app.models.audit_log import AuditLog
 from app.models.device_setting import ProxySetting, CameraSetting
 from app.models.thumbnail import Thumbnail
-from app.models.tracking import TrackPoint
+from app.models.tracking import TrackPoint, TrackSession
+from app.models.event_rollup import EventRollupHourly, EventRollupDaily, EventRollupDirty, EventRollupState
+from app.models.metric_rollup import MetricRollupHourly
 from app.models.event_suppression import (
     EventSuppressionSchedule, EventSuppressionTargetDevice, EventSuppressionTargetGroup,
 )
@@ -58,6 +60,14 @@ __all__ = [
     "Thumbnail",
     # Tracking models
     "TrackPoint",
+    "TrackSession",
+    # Event rollup models
+    "EventRollupHourly",
+    "EventRollupDaily",
+    "EventRollupDirty",
+    "EventRollupState",
+    # Metric rollup models
+    "MetricRollupHourly",
     # Event Suppression Schedule models
     "EventSuppressionSchedule",
     "EventSuppressionTargetDevice",
@@ -8,7 +8,7 @@ Polymorphic Inheritance using Joined Table strategy.
 - Device: Base table with common fields + category_device discriminator
 - Controller, Sensor, Camera, Speaker, Enclosure, Lamp: Child tables with specific fields
 """
-from sqlalchemy import Column, Integer, String, DateTime, Enum as SQLEnum, ForeignKey, Boolean, JSON
+from sqlalchemy import Column, Integer, String, DateTime, Enum as SQLEnum, ForeignKey, Boolean, JSON, Index
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -372,9 +372,16 @@ class EnclosureMetric(Base):
         ups_charging: UPS 충전 중 여부
         detail: 추가 상세 정보 (JSONB)
         created_at: 레코드 생성 시각
+
+    user-018: PostgreSQL 은 created_at 일별 RANGE 파티션(v79, PK (id, created_at)) — ORM 은 단일 PK(id) 유지.
     """
     __tablename__ = "enclosure_metrics"
 
+    # user-016: 함체별 최신 1행 `(enclosure_id, created_at DESC, id DESC) LIMIT 1`
+    __table_args__ = (
+        Index("idx_enclosure_metrics_enclosure_created_id", "enclosure_id", "created_at", "id"),
+    )
+
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     enclosure_id = Column(
         Integer,
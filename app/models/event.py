@@ -7,7 +7,7 @@ PRD: PRD_Event_ActionEvent_Refactoring.md v2.1
 - device_description: Device 정보 스냅샷 (Device 삭제 후에도 유지)
 - group_event 필드 제거됨
 """
-from sqlalchemy import Column, Integer, String, DateTime, Enum as SQLEnum, ForeignKey, JSON
+from sqlalchemy import Column, Integer, String, DateTime, Enum as SQLEnum, ForeignKey, JSON, Index
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 from datetime import datetime as dt
@@ -87,6 +87,11 @@ class Event(Base):
         doc="이 이벤트에 대한 조치 목록"
     )
 
+    # user-014: 목록 keyset 커서 `(created_at, id) DESC` — 카테고리별 인덱스 범위 스캔
+    __table_args__ = (
+        Index("idx_events_category_created_id", "category_event", "created_at", "id"),
+    )
+
     # ===== Polymorphic Configuration =====
     __mapper_args__ = {
         "polymorphic_on": category_event,
@@ -271,6 +276,11 @@ class ActionEvent(Base):
     created_at = Column(UtcDateTime, default=utc_now, nullable=False, index=True)
     updated_at = Column(UtcDateTime, default=utc_now, onupdate=utc_now, nullable=False)
 
+    # user-014: 목록 keyset 커서 `(created_at, id) DESC`
+    __table_args__ = (
+        Index("idx_action_events_created_id", "created_at", "id"),
+    )
+
     # ===== Relationship =====
     source_event = relationship(
         "Event",
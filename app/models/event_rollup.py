@@ -0,0 +1,87 @@
+"""
+Event rollup models — 이벤트 시간/일 단위 사전 집계 (user-010)
+
+이벤트 통계(`/api/event-statistics/*`)와 보고서 마스터 빌더가 호출마다 events 원본 조인을
+재집계하던 것을, 닫힌 시간 버킷은 이 테이블에서 읽고 열린 구간(워터마크 이후)과 시간 경계에
+걸친 가장자리만 원본에서 읽도록 바꾼다. 집계/갱신 로직은 app/services/event_rollup_service.py.
+
+- EventRollupHourly: 시(UTC 정시) × (category, kind, device_category, zone) — 장비 축 없음
+  (시간대 추이/시각 분포 전용, 행 수 억제).
+- EventRollupDaily: 일(표시 tz 자정) × (category, kind, device_category, device_id, zone)
+  — 장비/제어기별·활성 장비 집계까지 커버.
+- EventRollupState: 증분 잡 워터마크 — 이 시각 이전 버킷은 "닫힘"(롤업이 권위).
+- EventRollupDirty: 닫힌 구간을 건드린 이벤트 삭제/변경/소급 삽입의 UTC 정시 — 변경과 같은 트랜잭션에
+  적재되고 다음 잡 회차가 그 시간·날짜 버킷을 원본에서 재계산한 뒤 지운다.
+
+category = DETECTION/MALFUNCTION/CONNECTION/ACTION, kind = 탐지 result / 장애 reason /
+조치 type_event 이름(연결 이벤트는 NULL), zone = 센서 geolocation.location 의 '-' 앞(없으면 '미지정').
+zone 열은 롤업 시점 스냅샷 — 조회는 일 롤업 device_id 로 현재 위치에서 다시 유도한다(원본 조회와 동일).
+조치(ACTION)의 장비 축은 원 이벤트(from_event)의 장비.
+"""
+from sqlalchemy import Column, Date, Index, Integer, BigInteger, String
+
+from app.database import Base
+from app.models.types import UtcDateTime
+from app.utils.datetime import utc_now
+
+
+class EventRollupHourly(Base):
+    """시간 버킷 롤업 — bucket_start = UTC 정시(포함), 1시간 반열림."""
+    __tablename__ = "event_rollup_hourly"
+
+    id = Column(BigInteger().with_variant(Integer(), "sqlite"), primary_key=True, autoincrement=True)
+    bucket_start = Column(UtcDateTime, nullable=False)
+    category = Column(String(16), nullable=False)
+    kind = Column(String(64))
+    device_category = Column(String(32))
+    zone = Column(String(64))
+    event_count = Column(Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        Index("idx_event_rollup_hourly_bucket", "bucket_start"),
+    )
+
+    def __repr__(self):
+        return f"<EventRollupHourly {self.bucket_start} {self.category}/{self.kind} n={self.event_count}>"
+
+
+class EventRollupDaily(Base):
+    """일 버킷 롤업 — bucket_day = 표시 tz 날짜([자정, 다음 자정))."""
+    __tablename__ = "event_rollup_daily"
+
+    id = Column(BigInteger().with_variant(Integer(), "sqlite"), primary_key=True, autoincrement=True)
+    bucket_day = Column(Date, nullable=False)
+    category = Column(String(16), nullable=False)
+    kind = Column(String(64))
+    device_category = Column(String(32))
+    device_id = Column(Integer)  # 비-FK: 장비 삭제 후에도 이력 집계 유지(events.device_id SET NULL 과 동일 취지)
+    zone = Column(String(64))
+    event_count = Column(Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        Index("idx_event_rollup_daily_day", "bucket_day"),
+    )
+
+    def __repr__(self):
+        return f"<EventRollupDaily {self.bucket_day} {self.category}/{self.kind} dev={self.device_id} n={self.event_count}>"
+
+
+class EventRollupDirty(Base):
+    """재계산 대기 시간 버킷 — bucket_start = UTC 정시. 중복 허용(잡이 모아서 처리 후 id 로 삭제)."""
+    __tablename__ = "event_rollup_dirty"
+
+    id = Column(BigInteger().with_variant(Integer(), "sqlite"), primary_key=True, autoincrement=True)
+    bucket_start = Column(UtcDateTime, nullable=False)
+    created_at = Column(UtcDateTime, default=utc_now, nullable=False)
+
+    def __repr__(self):
+        return f"<EventRollupDirty {self.bucket_start}>"
+
+
+class EventRollupState(Base):
+    """롤업 잡 진행 상태 — name 별 워터마크('events', user-017 메트릭 롤업 'enclosure_metrics'/'server_metrics')."""
+    __tablename__ = "event_rollup_state"
+
+    name = Column(String(32), primary_key=True)
+    watermark = Column(UtcDateTime, nullable=False)
+    updated_at = Column(UtcDateTime, default=utc_now, onupdate=utc_now, nullable=False)
@@ -0,0 +1,42 @@
+"""
+Metric rollup model — 함체/서버 메트릭 1시간 사전 집계 (user-017)
+
+`GET /api/devices/enclosures/{id}/metrics?bucket=1h` / `GET /api/servers/{id}/metrics?bucket=1h` 의
+닫힌 시간 버킷은 이 테이블에서, 워터마크 이후 열린 구간과 범위 가장자리만 원본에서 읽는다.
+집계/갱신 로직은 app/services/metric_series_service.py.
+
+- 세로(long) 형식: 행 = (source, entity_id, metric, bucket_start). source 는 'enclosure' | 'server',
+  metric 은 원본 컬럼명(temperature, cpu_usage, ...). 함체·서버가 같은 테이블/같은 조회 경로를 쓴다.
+- avg 는 저장하지 않고 sum_value / sample_count 로 — 더 큰 버킷으로 재집계해도 정확.
+- last_value 는 버킷 안 마지막 샘플(created_at, id 최대)의 값.
+- 워터마크는 EventRollupState(name='enclosure_metrics' | 'server_metrics') 를 공유한다.
+"""
+from sqlalchemy import BigInteger, Column, Float, Index, Integer, String
+
+from app.database import Base
+from app.models.types import UtcDateTime
+
+
+class MetricRollupHourly(Base):
+    """메트릭 시간 버킷 롤업 — bucket_start = UTC 정시(포함), 1시간 반열림."""
+    __tablename__ = "metric_rollup_hourly"
+
+    id = Column(BigInteger().with_variant(Integer(), "sqlite"), primary_key=True, autoincrement=True)
+    source = Column(String(16), nullable=False)
+    entity_id = Column(Integer, nullable=False)  # 비-FK: 함체/서버 삭제 후 잔여 행은 보존 정리(user-018) 대상
+    metric = Column(String(32), nullable=False)
+    bucket_start = Column(UtcDateTime, nullable=False)
+    sample_count = Column(Integer, nullable=False, default=0)
+    min_value = Column(Float)
+    max_value = Column(Float)
+    sum_value = Column(Float)
+    last_value = Column(Float)
+
+    __table_args__ = (
+        Index("idx_metric_rollup_hourly_entity_bucket", "source", "entity_id", "bucket_start"),
+        Index("idx_metric_rollup_hourly_bucket", "bucket_start"),
+    )
+
+    def __repr__(self):
+        return (f"<MetricRollupHourly {self.source}:{self.entity_id} {self.metric} "
+                f"{self.bucket_start} n={self.sample_count}>")
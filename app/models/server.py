@@ -2,7 +2,7 @@
 Server models: ServerCategory, Server
 Based on GOP_서버모니터링_스키마.md
 """
-from sqlalchemy import Column, Integer, String, Float, DateTime, Enum as SQLEnum, ForeignKey, JSON
+from sqlalchemy import Column, Integer, String, Float, DateTime, Enum as SQLEnum, ForeignKey, JSON, Index
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -128,9 +128,16 @@ class ServerMetrics(Base):
         created_at: 생성 시간
 
     PRD Reference: PRD_System_Event.md Section 2.4
+
+    user-018: PostgreSQL 은 created_at 일별 RANGE 파티션(v79, PK (id, created_at)) — ORM 은 단일 PK(id) 유지.
     """
     __tablename__ = "server_metrics"
 
+    # user-017/018: 서버별 시간 범위 집계·최신 1행
+    __table_args__ = (
+        Index("idx_server_metrics_server_created_id", "server_id", "created_at", "id"),
+    )
+
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     server_id = Column(Integer, ForeignKey("servers.id", ondelete="CASCADE"), nullable=False, index=True)
 
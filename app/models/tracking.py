@@ -5,6 +5,9 @@ PRD: PRD_Tracking_History_API.md v1.0
 NATS `sensorway.{부대ID}.gis.tracking-status`(TRACKING_STATUS, 신버전 targets[])로
 수집된 추적 타겟의 위치 이력을 영속한다. 저장은 독립 워커 `gis-ingest`가 수행하고,
 이 모델은 read-only 조회(`/api/tracking/points`·`/sessions`)에 사용된다.
+
+TrackSession 은 track_id(+camera_id) 단위 요약 — gis-ingest 가 배치 적재와 같은 문장에서
+증분 갱신한다(user-006). `/sessions` 는 원본 GROUP BY 대신 이 테이블만 읽는다.
 """
 from sqlalchemy import (
     Column, Integer, BigInteger, String, Float, DateTime, Index, UniqueConstraint
@@ -24,6 +27,10 @@ class TrackPoint(Base):
     멱등 인제스트: UNIQUE(track_id, observed_at) — 재전송/다중 인제스트 안전.
     keyset 페이지네이션: (observed_at, id) 단조 정렬.
 
+    PostgreSQL 은 v72 부터 observed_at 일별 RANGE 파티션(PK (id, observed_at), 표시 tz 자정 경계).
+    ORM 은 단일 PK(id) 유지 — create_all(SQLite/신규 DB) 호환, api_logs 와 동일. 파티션 생성/보존은
+    app/services/track_points_partition_service.py.
+
     PRD: PRD_Tracking_History_API.md Section 4.1
     """
     __tablename__ = "track_points"
@@ -65,3 +72,42 @@ class TrackPoint(Base):
 
     def __repr__(self):
         return f"<TrackPoint {self.id}: cam{self.camera_id}/{self.track_id} @ {self.observed_at}>"
+
+
+class TrackSession(Base):
+    """
+    추적 세션 요약 — track_id(+camera_id) 당 1행, 인제스트 배치마다 증분 갱신(user-006).
+
+    start_at/end_at = MIN/MAX(observed_at), point_count = 적재된 추적점 수,
+    bbox = 위경도 MIN/MAX. 중복 관측(ON CONFLICT 로 버려진 점)은 집계에 반영되지 않는다.
+    보존: track_points 파티션 DROP 과 함께 end_at 경과분 삭제, 보존 기준에 걸친 세션은 남은 점으로
+    재계산(track_points_partition_service).
+    """
+    __tablename__ = "track_sessions"
+
+    id = Column(
+        BigInteger().with_variant(Integer(), "sqlite"),
+        primary_key=True,
+        autoincrement=True,
+    )
+    track_id = Column(String(64), nullable=False)
+    camera_id = Column(Integer, nullable=False)
+    label = Column(String(32))
+    start_at = Column(UtcDateTime, nullable=False)
+    end_at = Column(UtcDateTime, nullable=False)
+    point_count = Column(BigInteger().with_variant(Integer(), "sqlite"), nullable=False, default=0)
+    min_latitude = Column(Float)
+    max_latitude = Column(Float)
+    min_longitude = Column(Float)
+    max_longitude = Column(Float)
+    session_seq = Column(Integer)
+    updated_at = Column(UtcDateTime, default=utc_now, onupdate=utc_now, nullable=False)
+
+    __table_args__ = (
+        UniqueConstraint("track_id", "camera_id", name="uq_track_sessions_track_camera"),
+        Index("idx_track_sessions_start_at", "start_at"),
+        Index("idx_track_sessions_camera_start", "camera_id", "start_at"),
+    )
+
+    def __repr__(self):
+        return f"<TrackSession cam{self.camera_id}/{self.track_id} {self.start_at}~{self.end_at} n={self.point_count}>"
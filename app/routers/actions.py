@@ -36,16 +36,16 @@ def _to_kst_naive(dt_val: datetime | None) -> datetime | None:
 
 from app.dependencies import get_async_db
 from app.routers.auth import get_current_account_user_optional_async, require_perm_optional_async
+from app.services.device_nested_service import build_flat_device_nested_response, device_group_loader
 from app.models.event import ActionEvent, Event, DetectionEvent, MalfunctionEvent, ConnectionEvent
 from app.models.device import Device, Controller, Sensor, Camera, Speaker, Enclosure, Lamp
-from app.models.device_group import DeviceGroupMapping
 from app.schemas.event import (
     ActionEventCreate, ActionEventReplace, ActionEventResponse, ActionEventUpdate,
     DetectionEventResponse, MalfunctionEventResponse, ConnectionEventResponse
 )
-from app.schemas.device import DeviceNestedResponse, DeviceGroupNestedResponse
-from app.schemas.common import ApiResponse, ApiSingleResponse, PaginationMeta
+from app.schemas.common import ApiCursorResponse, ApiSingleResponse
 from app.utils.enums import EnumTrueFalse, EnumConfigResourceType, EnumConfigActionType, EnumDeviceStatus
+from app.utils.event_pagination import fetch_event_page
 from app.services.config_log_service import log_config_change_async, get_changed_fields, model_to_dict
 
 router = APIRouter(tags=[])
@@ -74,62 +74,6 @@ async def _load_source_event(db: AsyncSession, event_id: int) -> Optional[Event]
     return (await db.execute(stmt)).scalars().first()
 
 
-async def _build_device_nested_response(device: Optional[Device], db: AsyncSession) -> Optional[DeviceNestedResponse]:
-    """
-    Device 객체를 DeviceNestedResponse로 변환
-
-    PRD v1.3: from_event 내 device nested 포함
-
-    v6.0 P1 (Tidy First): lazy='dynamic' `device.group_mappings.all()` 제거 →
-    명시적 `DeviceGroupMapping` 쿼리로 교체 (async 안전)
-
-    v6.0 P8 (async): `db.execute(select(...))` 로 재작성 + mapping.group 은
-    selectinload 로 pre-fetch (lazy-load 회피)
-    """
-    if device is None:
-        return None
-
-    # Build device_groups from group_mappings (async — selectinload group)
-    device_groups = []
-    mappings = (await db.execute(
-        select(DeviceGroupMapping)
-        .options(selectinload(DeviceGroupMapping.group))
-        .where(DeviceGroupMapping.device_id == device.id)
-    )).scalars().all()
-    for mapping in mappings:
-        if mapping.group:
-            device_groups.append(DeviceGroupNestedResponse(
-                id=mapping.group.id,
-                name=mapping.group.name
-            ))
-
-    # PRD_Camera_Urls_JsonB.md: urls JSONB 통합 (rtsp_uri/rtsp_port 제거)
-    from app.schemas.device import CameraUrls
-    urls_data = None
-    raw_urls = getattr(device, 'urls', None)
-    if raw_urls:
-        urls_data = CameraUrls.model_validate(raw_urls) if isinstance(raw_urls, dict) else raw_urls
-
-    return DeviceNestedResponse(
-        id=device.id,
-        number_device=device.number_device,
-        group_device=device.group_device,
-        name_device=device.name_device,
-        type_device=device.type_device.value,
-        status=device.status.value,
-        is_enable=device.is_enable,
-        version=device.version,
-        ip_address=getattr(device, 'ip_address', None),
-        ip_port=getattr(device, 'ip_port', None),
-        controller_id=getattr(device, 'controller_id', None),
-        mode=getattr(device, 'mode', None).value if hasattr(device, 'mode') and getattr(device, 'mode', None) else None,
-        category=getattr(device, 'category', None).value if hasattr(device, 'category') and getattr(device, 'category', None) else None,
-        is_record=getattr(device, 'is_record', None),
-        urls=urls_data,
-        device_groups=device_groups
-    )
-
-
 # Helper function to update source event action_reported
 async def update_source_action_reported(db: AsyncSession, source_event: Event) -> None:
     """
@@ -197,7 +141,7 @@ async def build_source_event_response(event: Event, db: AsyncSession) -> Union[D
     PRD v1.4: category_event 필드 제거
     PRD v1.5: polymorphic relationship을 통해 이벤트 타입 자동 확인
 
-    v6.0 P1 (Tidy First): `db` 인자 추가 — 하위 `_build_device_nested_response`
+    v6.0 P1 (Tidy First): `db` 인자 추가 — 하위 `build_flat_device_nested_response`
     가 명시적 DeviceGroupMapping 쿼리를 수행하기 위함
     v6.0 P8 (async): async 함수화 — 내부 device nested 도 await
 
@@ -209,7 +153,7 @@ async def build_source_event_response(event: Event, db: AsyncSession) -> Union[D
         DetectionEventResponse, MalfunctionEventResponse, 또는 ConnectionEventResponse
     """
     if isinstance(event, DetectionEvent):
-        device_nested = await _build_device_nested_response(event.device, db)
+        device_nested = await build_flat_device_nested_response(event.device, db)
         return DetectionEventResponse(
             id=event.id,
             type_event=event.type_event,
@@ -222,7 +166,7 @@ async def build_source_event_response(event: Event, db: AsyncSession) -> Union[D
             updated_at=event.updated_at
         )
     elif isinstance(event, MalfunctionEvent):
-        device_nested = await _build_device_nested_response(event.device, db)
+        device_nested = await build_flat_device_nested_response(event.device, db)
         return MalfunctionEventResponse(
             id=event.id,
             type_event=event.type_event,
@@ -235,7 +179,7 @@ async def build_source_event_response(event: Event, db: AsyncSession) -> Union[D
             updated_at=event.updated_at
         )
     elif isinstance(event, ConnectionEvent):
-        device_nested = await _build_device_nested_response(event.device, db)
+        device_nested = await build_flat_device_nested_response(event.device, db)
         return ConnectionEventResponse(
             id=event.id,
             type_event=event.type_event,
@@ -249,10 +193,13 @@ async def build_source_event_response(event: Event, db: AsyncSession) -> Union[D
         raise ValueError(f"Unknown event type: {type(event).__name__}")
 
 
-@router.get("", response_model=ApiResponse[list[ActionEventResponse]])
+@router.get("", response_model=ApiCursorResponse[list[ActionEventResponse]])
 async def get_action_events(
     page: int = Query(1, ge=1, description="페이지 번호 (기본값: 1)"),
     limit: int = Query(20, ge=1, le=100, description="페이지당 항목 수 (기본값: 20, 최대: 100)"),
+    paging: str = Query("offset", pattern="^(offset|cursor)$", description="페이지네이션 방식 — offset(기본, page 사용) / cursor(keyset, 깊은 페이지도 일정 시간)"),
+    cursor: Optional[str] = Query(None, description="cursor 모드 다음 페이지 — 직전 응답의 cursor.next_cursor (지정 시 cursor 모드)"),
+    total: str = Query("none", pattern="^(none|estimate|exact)$", description="cursor 모드 전체 건수 — none(기본) / estimate(pg_class.reltuples 추정) / exact"),
     user: Optional[str] = Query(None, description="사용자로 필터링"),
     from_event_id: Optional[int] = Query(None, description="원본 이벤트 ID로 필터링"),
     start_date: Optional[datetime] = Query(None, description="시작 날짜로 필터링 (이벤트 생성일 >= start_date)"),
@@ -274,6 +221,9 @@ async def get_action_events(
     **파라미터**:
     - **page**: 페이지 번호 (기본값: 1)
     - **limit**: 페이지당 항목 수 (기본값: 20, 최대: 100)
+    - **paging**: `offset`(기본) / `cursor` — keyset `(created_at, id)` 커서 (user-014)
+    - **cursor**: 직전 응답의 `cursor.next_cursor` (null 이 될 때까지 반복)
+    - **total**: cursor 모드 전체 건수 — `none`(기본) / `estimate` / `exact`
     - **user**: 조치를 수행한 사용자로 필터링
     - **from_event_id**: 원본 이벤트 ID로 필터링
     - **start_date**: 시작 날짜로 필터링
@@ -292,27 +242,24 @@ async def get_action_events(
     if end_date is not None:
         filters.append(ActionEvent.created_at <= end_date)
 
-    # Get total count
+    # Build statements (count/list 동일 필터)
     count_stmt = select(func.count()).select_from(ActionEvent)
-    if filters:
-        count_stmt = count_stmt.where(*filters)
-    total = (await db.execute(count_stmt)).scalar() or 0
-
-    # Calculate pagination
-    skip = (page - 1) * limit
-    total_pages = math.ceil(total / limit) if total > 0 else 1
-
-    # Get paginated results (order by created_at desc)
     events_stmt = select(ActionEvent)
     if filters:
+        count_stmt = count_stmt.where(*filters)
         events_stmt = events_stmt.where(*filters)
-    events_stmt = (
-        events_stmt
-        .order_by(ActionEvent.created_at.desc(), ActionEvent.id.desc())
-        .offset(skip)
-        .limit(limit)
-    )
-    events = (await db.execute(events_stmt)).scalars().all()
+
+    # user-014: offset(종전) / keyset cursor 공용 페이지 조회
+    try:
+        events, pagination, cursor_meta = await fetch_event_page(
+            db, events_stmt, count_stmt, ActionEvent, page=page, limit=limit,
+            paging=paging, cursor=cursor, total=total,
+        )
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        )
 
     # Batch load source events to avoid N+1 query problem
     # PRD v1.5: Polymorphic relationship을 통해 단일 쿼리로 원본 이벤트 로드
@@ -327,6 +274,8 @@ async def get_action_events(
             .where(Event.id.in_(source_event_ids))
         )
         source_events = (await db.execute(source_stmt)).scalars().all()
+        # user-015: 원본 이벤트 device_groups 를 IN 1쿼리로 선적재
+        await device_group_loader(db).prime(se.device_id for se in source_events)
         for source_event in source_events:
             event_map[source_event.id] = await build_source_event_response(source_event, db)
 
@@ -351,24 +300,18 @@ async def get_action_events(
         )
 
     # Update total based on actual returned events
-    # (events with missing source are skipped, so recalculate)
+    # (events with missing source are skipped, so recalculate) — offset 모드만(cursor 는 원본 행 기준 진행)
     skipped_count = len(events) - len(event_responses)
-    if skipped_count > 0:
-        total = total - skipped_count
-        total_pages = math.ceil(total / limit) if total > 0 else 1
-
-    pagination = PaginationMeta(
-        page=page,
-        limit=limit,
-        total=total,
-        total_pages=total_pages
-    )
+    if skipped_count > 0 and pagination is not None:
+        pagination.total = pagination.total - skipped_count
+        pagination.total_pages = math.ceil(pagination.total / limit) if pagination.total > 0 else 1
 
-    return ApiResponse(
+    return ApiCursorResponse(
         success=True,
         message="Action events retrieved successfully",
         data=event_responses,
-        pagination=pagination
+        pagination=pagination,
+        cursor=cursor_meta,
     )
 
 
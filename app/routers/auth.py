@@ -1042,6 +1042,53 @@ async def _effective_allows_async(db: AsyncSession, user: AccountUser, module: s
     return False
 
 
+async def effective_allow_set_async(db: AsyncSession, user: AccountUser, now=None) -> tuple[frozenset, datetime | None]:
+    """enforce_matrix 결정 캐시용 — 유효권한 (module, verb) 집합 + 다음 grant 경계 시각 (user-001).
+
+    판정은 _effective_allows_async 와 동치(비활성 그룹 제외, 등급 매트릭스 ∪ 유효 grant)이나 모든 verb 를
+    한 번에 집합으로 굳힌다. 미래 grant 도 함께 읽어 경계 = min(활성 grant valid_until, 미래 grant valid_from).
+    그 시각 이후엔 집합이 달라질 수 있으므로 캐시 만료시각으로 쓴다(None = grant 경계 없음).
+    """
+    from app.security.authz_cache import _epoch
+
+    if now is None:
+        now = _kst_now()
+    merged: dict = {"modules": {}}
+    role_group = await _resolve_role_group_async(db, user)
+    if role_group and role_group.is_active:
+        _merge_modules(merged, role_group.permissions)
+
+    stmt = (
+        select(UserGroupGrant)
+        .where(
+            UserGroupGrant.user_id == user.id,
+            UserGroupGrant.revoked_at.is_(None),
+            or_(UserGroupGrant.valid_until.is_(None), UserGroupGrant.valid_until > now),
+        )
+        .options(selectinload(UserGroupGrant.group))
+    )
+    grants = (await db.execute(stmt)).scalars().all()
+    now_ts = now.timestamp()
+    boundary = None
+    for grant in grants:
+        if _epoch(grant.valid_from) > now_ts:
+            candidate = grant.valid_from  # 미래 grant — 시작 시점에 권한 추가
+        else:
+            grp = grant.group
+            if grp and grp.is_active:
+                _merge_modules(merged, grp.permissions)
+            candidate = grant.valid_until  # 활성 grant — 만료 시점에 권한 회수
+        if candidate is not None and (boundary is None or _epoch(candidate) < _epoch(boundary)):
+            boundary = candidate
+
+    allows = frozenset(
+        (module, verb)
+        for module, verbs in merged["modules"].items()
+        for verb in verbs
+    )
+    return allows, boundary
+
+
 async def get_current_account_user_async(
     credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
     db: AsyncSession = Depends(get_async_db),
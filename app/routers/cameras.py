@@ -18,6 +18,7 @@ from app.schemas.common import ApiResponse, ApiSingleResponse, PaginationMeta
 from app.schemas.camera_preset import CameraPresetNestedResponse, ROIListNestedResponse
 from app.models.camera_preset import CameraPreset, ROI
 from app.services.config_log_service import log_config_change_async, get_identifier, get_changed_fields, model_to_dict
+from app.services.response_cache import cached
 
 router = APIRouter()
 
@@ -188,6 +189,7 @@ async def _camera_to_response(camera: Camera, db: AsyncSession) -> CameraRespons
 
 
 @router.get("", response_model=ApiResponse[list[CameraResponse]])
+@cached("SYNC_DEVICE", "SYNC_DEVICE_GROUP")
 async def get_cameras(
     page: int = Query(1, ge=1, description="페이지 번호 (기본값: 1)"),
     limit: int = Query(20, ge=1, le=100, description="페이지당 항목 수 (기본값: 20, 최대: 100)"),
@@ -289,6 +291,7 @@ async def get_cameras(
 
 
 @router.get("/{camera_id}")
+@cached("SYNC_DEVICE", "SYNC_DEVICE_GROUP", "SYNC_PRESET")
 async def get_camera(
     camera_id: int,
     include_presets: bool = Query(False, description="프리셋 정보 포함 여부 (기본값: false)"),
@@ -21,28 +21,19 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload, selectin_polymorphic
 from typing import Optional
 from datetime import datetime
-import math
 
 from app.dependencies import get_async_db
 from app.routers.auth import get_current_account_user_optional_async, require_perm_optional_async
+from app.services.device_nested_service import build_device_nested_response, device_group_loader
 from app.services.event_suppression_service import is_suppressed, record_suppression, suppressed_response
+from app.services.event_bulk_service import ingest_events_bulk
 from app.models.event import ConnectionEvent
 from app.models.device import Device, Sensor, Controller, Camera, Speaker, Enclosure, Lamp
-from app.models.device_group import DeviceGroupMapping
-from app.schemas.event import ConnectionEventCreate, ConnectionEventReplace, ConnectionEventResponse, ConnectionEventUpdate
-from app.schemas.device import (
-    DeviceGroupNestedResponse,
-    DeviceNestedResponse,
-    SensorNestedResponse,
-    ControllerNestedResponse,
-    CameraNestedResponse,
-    SpeakerNestedResponse,
-    LampNestedResponse,
-)
-from app.schemas.common import ApiResponse, ApiSingleResponse, PaginationMeta
+from app.schemas.event import ConnectionEventCreate, ConnectionEventBulkCreate, EventBulkResult, ConnectionEventReplace, ConnectionEventResponse, ConnectionEventUpdate
+from app.schemas.common import ApiCursorResponse, ApiSingleResponse
 from app.utils.enums import EnumDeviceType, EnumConfigResourceType, EnumConfigActionType
+from app.utils.event_pagination import fetch_event_page
 from app.services.config_log_service import log_config_change_async, get_changed_fields, model_to_dict
-from typing import Union
 
 router = APIRouter(tags=[])
 
@@ -55,155 +46,13 @@ def _generate_device_description(device: Device) -> str:
     return f"[{device.type_device.value}] {device.name_device} (number: {device.number_device}, id: {device.id})"
 
 
-async def _build_device_nested_response(device: Optional[Device], db: AsyncSession) -> Optional[Union[SensorNestedResponse, ControllerNestedResponse, CameraNestedResponse, SpeakerNestedResponse, LampNestedResponse, DeviceNestedResponse]]:
-    """
-    Device 객체를 타입에 맞는 Nested Response로 변환 (Polymorphic)
-
-    PRD v1.1: Device 삭제 시 None 반환
-    PRD v1.2: device_groups 필드 추가 (EventMapping 연동 필수)
-    PRD v2.7: Device 타입별 Polymorphic Response 반환
-    - Sensor → SensorNestedResponse
-    - Controller → ControllerNestedResponse
-    - Camera → CameraNestedResponse
-    - Speaker → SpeakerNestedResponse
-    - Enclosure → DeviceNestedResponse (전용 NestedResponse 없음)
-    - Lamp → LampNestedResponse
-
-    v6.0 P1 (Tidy First): lazy='dynamic' 접근을 명시적 db.query()로 교체
-    (동작 불변, sync/async 양쪽 안전).
-    v6.0 P8: AsyncSession 기반 select() + await 로 전환.
-    """
-    if device is None:
-        return None
-
-    # PRD v1.2: Build device_groups from group_mappings relationship
-    # v6.0 P8: 명시적 select 쿼리 (AsyncSession)
-    device_groups = []
-    # v6.0-clone_deploy_bugfix (#3): async 세션에서 mapping.group lazy-load 는
-    # greenlet_spawn 오류를 낸다. selectinload 로 eager 로딩 (detection_logs/malfunctions 패턴 동일).
-    mappings_result = await db.execute(
-        select(DeviceGroupMapping)
-        .options(selectinload(DeviceGroupMapping.group))
-        .where(DeviceGroupMapping.device_id == device.id)
-    )
-    mappings = mappings_result.scalars().all()
-    for mapping in mappings:
-        if mapping.group:
-            device_groups.append(DeviceGroupNestedResponse(
-                id=mapping.group.id,
-                name=mapping.group.name
-            ))
-
-    # PRD v2.7: Polymorphic Response - Device 타입에 따라 적절한 스키마 반환
-    if isinstance(device, Sensor):
-        return SensorNestedResponse(
-            id=device.id,
-            number_device=device.number_device,
-            group_device=device.group_device,
-            name_device=device.name_device,
-            type_device=device.type_device.value,
-            version=device.version,
-            status=device.status.value,
-            is_enable=device.is_enable,
-            controller_id=device.controller_id,
-            device_groups=device_groups
-        )
-    elif isinstance(device, Camera):
-        # PRD_Camera_Urls_JsonB.md: urls JSONB 통합 (rtsp_uri/rtsp_port 제거)
-        from app.schemas.device import CameraUrls
-        urls_data = None
-        if device.urls:
-            urls_data = CameraUrls.model_validate(device.urls) if isinstance(device.urls, dict) else device.urls
-        return CameraNestedResponse(
-            id=device.id,
-            number_device=device.number_device,
-            group_device=device.group_device,
-            name_device=device.name_device,
-            type_device=device.type_device.value,
-            version=device.version,
-            status=device.status.value,
-            is_enable=device.is_enable,
-            ip_address=device.ip_address,
-            ip_port=device.ip_port,
-            mode=device.mode.value if device.mode else "NONE",
-            category=device.category.value if device.category else "NONE",
-            is_record=device.is_record,
-            urls=urls_data,
-            device_groups=device_groups
-        )
-    elif isinstance(device, Controller):
-        return ControllerNestedResponse(
-            id=device.id,
-            number_device=device.number_device,
-            group_device=device.group_device,
-            name_device=device.name_device,
-            type_device=device.type_device.value,
-            version=device.version,
-            status=device.status.value,
-            is_enable=device.is_enable,
-            ip_address=device.ip_address,
-            ip_port=device.ip_port,
-            device_groups=device_groups
-        )
-    elif isinstance(device, Speaker):
-        return SpeakerNestedResponse(
-            id=device.id,
-            category_device=device.category_device.value,
-            number_device=device.number_device,
-            name_device=device.name_device,
-            type_device=device.type_device.value,
-            status=device.status.value,
-            is_enable=device.is_enable,
-            speaker_type=device.speaker_type.value if device.speaker_type else "NORMAL",
-            geolocation=device.geolocation,
-        )
-    elif isinstance(device, Lamp):
-        return LampNestedResponse(
-            id=device.id,
-            number_device=device.number_device,
-            group_device=device.group_device,
-            name_device=device.name_device,
-            type_device=device.type_device.value,
-            version=device.version,
-            status=device.status.value,
-            is_enable=device.is_enable,
-            ip_address=device.ip_address,
-            ip_port=device.ip_port,
-            user_name=device.user_name,
-            description=device.description,
-            geolocation=device.geolocation,
-        )
-    elif isinstance(device, Enclosure):
-        return DeviceNestedResponse(
-            id=device.id,
-            number_device=device.number_device,
-            group_device=device.group_device,
-            name_device=device.name_device,
-            type_device=device.type_device.value,
-            status=device.status.value,
-            is_enable=device.is_enable,
-            version=device.version,
-            device_groups=device_groups
-        )
-    else:
-        # Fallback: 알 수 없는 Device 타입
-        return DeviceNestedResponse(
-            id=device.id,
-            number_device=device.number_device,
-            group_device=device.group_device,
-            name_device=device.name_device,
-            type_device=device.type_device.value,
-            status=device.status.value,
-            is_enable=device.is_enable,
-            version=device.version,
-            device_groups=device_groups
-        )
-
-
-@router.get("", response_model=ApiResponse[list[ConnectionEventResponse]])
+@router.get("", response_model=ApiCursorResponse[list[ConnectionEventResponse]])
 async def get_connection_events(
     page: int = Query(1, ge=1, description="페이지 번호 (기본값: 1)"),
     limit: int = Query(20, ge=1, le=100, description="페이지당 항목 수 (기본값: 20, 최대: 100)"),
+    paging: str = Query("offset", pattern="^(offset|cursor)$", description="페이지네이션 방식 — offset(기본, page 사용) / cursor(keyset, 깊은 페이지도 일정 시간)"),
+    cursor: Optional[str] = Query(None, description="cursor 모드 다음 페이지 — 직전 응답의 cursor.next_cursor (지정 시 cursor 모드)"),
+    total: str = Query("none", pattern="^(none|estimate|exact)$", description="cursor 모드 전체 건수 — none(기본) / estimate(pg_class.reltuples 추정) / exact"),
     device_id: Optional[int] = Query(None, description="장치 ID로 필터링"),
     start_date: Optional[datetime] = Query(None, description="시작 날짜로 필터링 (이벤트 생성일 >= start_date)"),
     end_date: Optional[datetime] = Query(None, description="종료 날짜로 필터링 (이벤트 생성일 <= end_date)"),
@@ -220,6 +69,9 @@ async def get_connection_events(
     **파라미터**:
     - **page**: 페이지 번호 (기본값: 1)
     - **limit**: 페이지당 항목 수 (기본값: 20, 최대: 100)
+    - **paging**: `offset`(기본) / `cursor` — keyset `(created_at, id)` 커서 (user-014)
+    - **cursor**: 직전 응답의 `cursor.next_cursor` (null 이 될 때까지 반복)
+    - **total**: cursor 모드 전체 건수 — `none`(기본) / `estimate` / `exact`
     - **device_id**: 장치 ID로 필터링
     - **start_date**: 시작 날짜로 필터링
     - **end_date**: 종료 날짜로 필터링
@@ -241,18 +93,20 @@ async def get_connection_events(
         stmt = stmt.where(ConnectionEvent.created_at <= end_date)
         count_stmt = count_stmt.where(ConnectionEvent.created_at <= end_date)
 
-    # Get total count
-    total = (await db.execute(count_stmt)).scalar() or 0
-
-    # Calculate pagination
-    skip = (page - 1) * limit
-    total_pages = math.ceil(total / limit) if total > 0 else 1
+    # user-014: offset(종전) / keyset cursor 공용 페이지 조회
+    try:
+        events, pagination, cursor_meta = await fetch_event_page(
+            db, stmt, count_stmt, ConnectionEvent, page=page, limit=limit,
+            paging=paging, cursor=cursor, total=total,
+        )
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        )
 
-    # Get paginated results (order by created_at desc)
-    events_result = await db.execute(
-        stmt.order_by(ConnectionEvent.created_at.desc(), ConnectionEvent.id.desc()).offset(skip).limit(limit)
-    )
-    events = events_result.scalars().all()
+    # user-015: 페이지 전체 device_groups 를 IN 1쿼리로 선적재(이후 조립은 캐시 적중)
+    await device_group_loader(db).prime(e.device_id for e in events)
 
     # PRD v2.1: Response uses device_id (no group_event, controller, sensor, type_device)
     # PRD v1.3: device_id, sequence 필드 제거 (device.id에 포함, sequence는 Request 전용)
@@ -261,7 +115,7 @@ async def get_connection_events(
         ConnectionEventResponse(
             id=e.id,
             type_event=e.type_event,
-            device=await _build_device_nested_response(e.device, db),
+            device=await build_device_nested_response(e.device, db),
             device_description=e.device_description,
             created_at=e.created_at,
             updated_at=e.updated_at
@@ -269,18 +123,12 @@ async def get_connection_events(
         for e in events
     ]
 
-    pagination = PaginationMeta(
-        page=page,
-        limit=limit,
-        total=total,
-        total_pages=total_pages
-    )
-
-    return ApiResponse(
+    return ApiCursorResponse(
         success=True,
         message="Connection events retrieved successfully",
         data=event_responses,
-        pagination=pagination
+        pagination=pagination,
+        cursor=cursor_meta,
     )
 
 
@@ -322,7 +170,7 @@ async def get_connection_event(
     event_response = ConnectionEventResponse(
         id=event.id,
         type_event=event.type_event,
-        device=await _build_device_nested_response(event.device, db),
+        device=await build_device_nested_response(event.device, db),
         device_description=event.device_description,
         created_at=event.created_at,
         updated_at=event.updated_at
@@ -406,7 +254,7 @@ async def create_connection_event(
     )
 
     # Build device nested response
-    device_nested = await _build_device_nested_response(device, db)
+    device_nested = await build_device_nested_response(device, db)
 
     # PRD v2.1: Response uses device_id (no group_event, controller, sensor, type_device)
     # PRD v1.3: device_id, sequence 필드 제거
@@ -427,6 +275,32 @@ async def create_connection_event(
     )
 
 
+@router.post("/bulk", response_model=ApiSingleResponse[EventBulkResult], dependencies=[Depends(require_perm_optional_async("events", "edit"))])
+async def create_connection_events_bulk(
+    bulk_data: ConnectionEventBulkCreate,
+    current_user = Depends(get_current_account_user_optional_async),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    연결 이벤트 일괄 생성 (user-022 — 탐지 서버 고빈도 수신)
+
+    단건 `POST` 와 같은 저장·억제·장비 상태·ConfigChangeLog 규칙을 N건 한 트랜잭션으로 처리합니다.
+
+    **Request Body**:
+    - **items**: 단건 생성 요청 배열 (1~500건)
+
+    **Response**: 항목별 결과(요청 순서) — `created`(id) / `suppressed`(schedule_id) / `failed`(error).
+    부분 성공(HTTP 200). device nested 는 포함하지 않습니다(필요 시 단건 GET).
+    """
+    result = await ingest_events_bulk(db, "connection", bulk_data.items)
+    return ApiSingleResponse(
+        success=True,
+        message=f"Connection events bulk processed: {result.created} created, "
+                f"{result.suppressed} suppressed, {result.failed} failed",
+        data=result
+    )
+
+
 @router.patch("/{event_id}", response_model=ApiSingleResponse[ConnectionEventResponse])
 async def update_connection_event(
     event_id: int,
@@ -500,7 +374,7 @@ async def update_connection_event(
     event_response = ConnectionEventResponse(
         id=event.id,
         type_event=event.type_event,
-        device=await _build_device_nested_response(event.device, db),
+        device=await build_device_nested_response(event.device, db),
         device_description=event.device_description,
         created_at=event.created_at,
         updated_at=event.updated_at
@@ -572,7 +446,7 @@ async def replace_connection_event(
     event_response = ConnectionEventResponse(
         id=event.id,
         type_event=event.type_event,
-        device=await _build_device_nested_response(event.device, db),
+        device=await build_device_nested_response(event.device, db),
         device_description=event.device_description,
         created_at=event.created_at,
         updated_at=event.updated_at
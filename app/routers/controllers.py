@@ -18,6 +18,7 @@ from app.schemas.device_group import DeviceGroupResponse
 from app.schemas.common import ApiResponse, ApiSingleResponse, PaginationMeta
 from app.services.config_log_service import log_config_change_async, get_identifier, get_changed_fields, model_to_dict
 from app.utils.enums import EnumConfigResourceType, EnumConfigActionType
+from app.services.response_cache import cached
 
 router = APIRouter()
 
@@ -181,6 +182,7 @@ async def _controller_to_response(controller: Controller, db: AsyncSession, incl
 
 
 @router.get("", response_model=ApiResponse[list[ControllerResponse]])
+@cached("SYNC_DEVICE", "SYNC_DEVICE_GROUP")
 async def get_controllers(
     page: int = Query(1, ge=1, description="페이지 번호 (기본값: 1)"),
     limit: int = Query(20, ge=1, le=100, description="페이지당 항목 수 (기본값: 20, 최대: 100)"),
@@ -260,6 +262,7 @@ async def get_controllers(
 
 
 @router.get("/{controller_id}", response_model=ApiSingleResponse[ControllerResponse])
+@cached("SYNC_DEVICE", "SYNC_DEVICE_GROUP")
 async def get_controller(
     controller_id: int,
     include_sensors: bool = Query(False, description="센서 정보 포함 여부 (기본값: false)"),
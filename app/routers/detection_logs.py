@@ -9,159 +9,27 @@ v6.0 P8: Async router conversion
 - AsyncSession + get_async_db
 - get_current_account_user_optional_async
 - select() + await db.execute() 패턴
-- Helper _build_device_nested_response_async: AsyncSession 기반 group_mappings 조회
+- device nested 조립: app/services/device_nested_service (user-015 — device_groups 배치 로더)
 """
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload, joinedload, selectin_polymorphic
+from sqlalchemy.orm import selectinload, selectin_polymorphic
 from typing import Optional
 from datetime import datetime
 import math
 
 from app.dependencies import get_async_db
 from app.routers.auth import get_current_account_user_optional_async
+from app.services.device_nested_service import build_device_nested_response, device_group_loader
 from app.models.event import DetectionEvent, ActionEvent
-from app.models.device import Device, Sensor, Controller, Camera, Speaker, Enclosure, Lamp
-from app.models.device_group import DeviceGroupMapping
+from app.models.device import Sensor, Controller, Camera, Speaker, Enclosure, Lamp
 from app.schemas.event import DetectionLogResponse, ActionNested
-from app.schemas.device import (
-    DeviceGroupNestedResponse,
-    DeviceNestedResponse,
-    SensorNestedResponse,
-    ControllerNestedResponse,
-    CameraNestedResponse,
-    SpeakerNestedResponse,
-    LampNestedResponse,
-)
 from app.schemas.common import ApiResponse, ApiSingleResponse, PaginationMeta
-from typing import Union
 
 router = APIRouter(tags=[])
 
 
-async def _build_device_nested_response_async(device: Optional[Device], db: AsyncSession) -> Optional[Union[SensorNestedResponse, ControllerNestedResponse, CameraNestedResponse, SpeakerNestedResponse, LampNestedResponse, DeviceNestedResponse]]:
-    """Device 객체를 타입에 맞는 Nested Response로 변환 (Polymorphic) — Async 버전"""
-    if device is None:
-        return None
-
-    device_groups = []
-    mapping_stmt = (
-        select(DeviceGroupMapping)
-        .options(joinedload(DeviceGroupMapping.group))
-        .where(DeviceGroupMapping.device_id == device.id)
-    )
-    mappings = (await db.execute(mapping_stmt)).scalars().all()
-    for mapping in mappings:
-        if mapping.group:
-            device_groups.append(DeviceGroupNestedResponse(
-                id=mapping.group.id,
-                name=mapping.group.name
-            ))
-
-    if isinstance(device, Sensor):
-        return SensorNestedResponse(
-            id=device.id,
-            number_device=device.number_device,
-            group_device=device.group_device,
-            name_device=device.name_device,
-            type_device=device.type_device.value,
-            version=device.version,
-            status=device.status.value,
-            is_enable=device.is_enable,
-            controller_id=device.controller_id,
-            device_groups=device_groups
-        )
-    elif isinstance(device, Camera):
-        from app.schemas.device import CameraUrls
-        urls_data = None
-        if device.urls:
-            urls_data = CameraUrls.model_validate(device.urls) if isinstance(device.urls, dict) else device.urls
-        return CameraNestedResponse(
-            id=device.id,
-            number_device=device.number_device,
-            group_device=device.group_device,
-            name_device=device.name_device,
-            type_device=device.type_device.value,
-            version=device.version,
-            status=device.status.value,
-            is_enable=device.is_enable,
-            ip_address=device.ip_address,
-            ip_port=device.ip_port,
-            mode=device.mode.value if device.mode else "NONE",
-            category=device.category.value if device.category else "NONE",
-            is_record=device.is_record,
-            urls=urls_data,
-            device_groups=device_groups
-        )
-    elif isinstance(device, Controller):
-        return ControllerNestedResponse(
-            id=device.id,
-            number_device=device.number_device,
-            group_device=device.group_device,
-            name_device=device.name_device,
-            type_device=device.type_device.value,
-            version=device.version,
-            status=device.status.value,
-            is_enable=device.is_enable,
-            ip_address=device.ip_address,
-            ip_port=device.ip_port,
-            device_groups=device_groups
-        )
-    elif isinstance(device, Speaker):
-        return SpeakerNestedResponse(
-            id=device.id,
-            category_device=device.category_device.value,
-            number_device=device.number_device,
-            name_device=device.name_device,
-            type_device=device.type_device.value,
-            status=device.status.value,
-            is_enable=device.is_enable,
-            speaker_type=device.speaker_type.value if device.speaker_type else "NORMAL",
-            geolocation=device.geolocation,
-        )
-    elif isinstance(device, Lamp):
-        return LampNestedResponse(
-            id=device.id,
-            number_device=device.number_device,
-            group_device=device.group_device,
-            name_device=device.name_device,
-            type_device=device.type_device.value,
-            version=device.version,
-            status=device.status.value,
-            is_enable=device.is_enable,
-            ip_address=device.ip_address,
-            ip_port=device.ip_port,
-            user_name=device.user_name,
-            description=device.description,
-            geolocation=device.geolocation,
-        )
-    elif isinstance(device, Enclosure):
-        return DeviceNestedResponse(
-            id=device.id,
-            number_device=device.number_device,
-            group_device=device.group_device,
-            name_device=device.name_device,
-            type_device=device.type_device.value,
-            status=device.status.value,
-            is_enable=device.is_enable,
-            version=device.version,
-            device_groups=device_groups
-        )
-    else:
-        return DeviceNestedResponse(
-            id=device.id,
-            number_device=device.number_device,
-            group_device=device.group_device,
-            name_device=device.name_device,
-            type_device=device.type_device.value,
-            status=device.status.value,
-            is_enable=device.is_enable,
-            version=device.version,
-            device_groups=device_groups
-        )
-
-
 def _build_actions_nested(actions) -> list[ActionNested]:
     """Event.actions 리스트를 ActionNested 리스트로 변환 (PRD_ActionEvent_1N v2.0)"""
     if not actions:
@@ -246,10 +114,13 @@ async def get_detection_logs(
     )
     events = (await db.execute(data_stmt)).scalars().all()
 
+    # user-015: 페이지 전체 device_groups 를 IN 1쿼리로 선적재(이후 조립은 캐시 적중)
+    await device_group_loader(db).prime(e.device_id for e in events)
+
     # Convert to response
     log_responses = []
     for e in events:
-        device_nested = await _build_device_nested_response_async(e.device, db)
+        device_nested = await build_device_nested_response(e.device, db)
         log_responses.append(
             DetectionLogResponse(
                 id=e.id,
@@ -313,7 +184,7 @@ async def get_detection_log(
             detail=f"Detection log with id {event_id} not found"
         )
 
-    device_nested = await _build_device_nested_response_async(event.device, db)
+    device_nested = await build_device_nested_response(event.device, db)
 
     log_response = DetectionLogResponse(
         id=event.id,
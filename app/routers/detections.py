@@ -20,27 +20,18 @@ from sqlalchemy.orm import selectinload, selectin_polymorphic
 from app.models.device import Sensor, Camera, Controller, Speaker, Enclosure, Lamp
 from typing import Optional
 from datetime import datetime
-import math
 
 from app.dependencies import get_async_db
 from app.routers.auth import get_current_account_user_optional_async, require_perm_optional_async
+from app.services.device_nested_service import build_device_nested_response, device_group_loader
 from app.services.event_suppression_service import is_suppressed, record_suppression, suppressed_response
+from app.services.event_bulk_service import ingest_events_bulk
 from app.models.event import DetectionEvent, ActionEvent, EnumTrueFalse, EnumDetectionType
 from app.models.device import Device, Sensor, Controller, Camera, Speaker, Enclosure, Lamp
-from app.models.device_group import DeviceGroupMapping
-from app.schemas.event import DetectionEventCreate, DetectionEventReplace, DetectionEventResponse, DetectionEventUpdate, ActionEventResponse
-from app.schemas.device import (
-    DeviceGroupNestedResponse,
-    DeviceNestedResponse,
-    SensorNestedResponse,
-    ControllerNestedResponse,
-    CameraNestedResponse,
-    SpeakerNestedResponse,
-    LampNestedResponse,
-)
-from app.schemas.common import ApiResponse, ApiSingleResponse, PaginationMeta
-from typing import Union
+from app.schemas.event import DetectionEventCreate, DetectionEventBulkCreate, EventBulkResult, DetectionEventReplace, DetectionEventResponse, DetectionEventUpdate, ActionEventResponse
+from app.schemas.common import ApiCursorResponse, ApiResponse, ApiSingleResponse
 from app.utils.enums import EnumDeviceStatus, EnumConfigResourceType, EnumConfigActionType
+from app.utils.event_pagination import fetch_event_page
 from app.services.config_log_service import log_config_change_async, get_changed_fields, model_to_dict
 
 router = APIRouter(tags=[])
@@ -56,149 +47,13 @@ def _generate_device_description(device: Device) -> str:
     return f"[{device.type_device.value}] {device.name_device} (number: {device.number_device}, id: {device.id})"
 
 
-async def _build_device_nested_response(device: Optional[Device], db: AsyncSession) -> Optional[Union[SensorNestedResponse, ControllerNestedResponse, CameraNestedResponse, SpeakerNestedResponse, LampNestedResponse, DeviceNestedResponse]]:
-    """
-    Device 객체를 타입에 맞는 Nested Response로 변환 (Polymorphic)
-
-    PRD v1.1: Device 삭제 시 None 반환
-    PRD v1.2: device_groups 필드 추가 (EventMapping 연동 필수)
-    PRD v2.7: Device 타입별 Polymorphic Response 반환
-    - Sensor → SensorNestedResponse
-    - Controller → ControllerNestedResponse
-    - Camera → CameraNestedResponse
-    - Speaker → SpeakerNestedResponse
-    - Enclosure → DeviceNestedResponse (전용 NestedResponse 없음)
-    - Lamp → LampNestedResponse
-
-    v6.0 P8: async 전환 — group_mappings 명시 쿼리 유지
-    """
-    if device is None:
-        return None
-
-    # PRD v1.2: Build device_groups from group_mappings (v6.0 P1: explicit query for async safety)
-    device_groups = []
-    mappings = (await db.execute(
-        select(DeviceGroupMapping).where(
-            DeviceGroupMapping.device_id == device.id
-        ).options(selectinload(DeviceGroupMapping.group))
-    )).scalars().all()
-    for mapping in mappings:
-        if mapping.group:
-            device_groups.append(DeviceGroupNestedResponse(
-                id=mapping.group.id,
-                name=mapping.group.name
-            ))
-
-    # PRD v2.7: Polymorphic Response - Device 타입에 따라 적절한 스키마 반환
-    if isinstance(device, Sensor):
-        return SensorNestedResponse(
-            id=device.id,
-            number_device=device.number_device,
-            group_device=device.group_device,
-            name_device=device.name_device,
-            type_device=device.type_device.value,
-            version=device.version,
-            status=device.status.value,
-            is_enable=device.is_enable,
-            controller_id=device.controller_id,
-            device_groups=device_groups
-        )
-    elif isinstance(device, Camera):
-        # PRD_Camera_Urls_JsonB.md: urls JSONB 통합 (rtsp_uri/rtsp_port 제거)
-        from app.schemas.device import CameraUrls
-        urls_data = None
-        if device.urls:
-            urls_data = CameraUrls.model_validate(device.urls) if isinstance(device.urls, dict) else device.urls
-        return CameraNestedResponse(
-            id=device.id,
-            number_device=device.number_device,
-            group_device=device.group_device,
-            name_device=device.name_device,
-            type_device=device.type_device.value,
-            version=device.version,
-            status=device.status.value,
-            is_enable=device.is_enable,
-            ip_address=device.ip_address,
-            ip_port=device.ip_port,
-            mode=device.mode.value if device.mode else "NONE",
-            category=device.category.value if device.category else "NONE",
-            is_record=device.is_record,
-            urls=urls_data,
-            device_groups=device_groups
-        )
-    elif isinstance(device, Controller):
-        return ControllerNestedResponse(
-            id=device.id,
-            number_device=device.number_device,
-            group_device=device.group_device,
-            name_device=device.name_device,
-            type_device=device.type_device.value,
-            version=device.version,
-            status=device.status.value,
-            is_enable=device.is_enable,
-            ip_address=device.ip_address,
-            ip_port=device.ip_port,
-            device_groups=device_groups
-        )
-    elif isinstance(device, Speaker):
-        return SpeakerNestedResponse(
-            id=device.id,
-            category_device=device.category_device.value,
-            number_device=device.number_device,
-            name_device=device.name_device,
-            type_device=device.type_device.value,
-            status=device.status.value,
-            is_enable=device.is_enable,
-            speaker_type=device.speaker_type.value if device.speaker_type else "NORMAL",
-            geolocation=device.geolocation,
-        )
-    elif isinstance(device, Lamp):
-        return LampNestedResponse(
-            id=device.id,
-            number_device=device.number_device,
-            group_device=device.group_device,
-            name_device=device.name_device,
-            type_device=device.type_device.value,
-            version=device.version,
-            status=device.status.value,
-            is_enable=device.is_enable,
-            ip_address=device.ip_address,
-            ip_port=device.ip_port,
-            user_name=device.user_name,
-            description=device.description,
-            geolocation=device.geolocation,
-        )
-    elif isinstance(device, Enclosure):
-        return DeviceNestedResponse(
-            id=device.id,
-            number_device=device.number_device,
-            group_device=device.group_device,
-            name_device=device.name_device,
-            type_device=device.type_device.value,
-            status=device.status.value,
-            is_enable=device.is_enable,
-            version=device.version,
-            device_groups=device_groups
-        )
-    else:
-        # Fallback: 알 수 없는 Device 타입
-        return DeviceNestedResponse(
-            id=device.id,
-            number_device=device.number_device,
-            group_device=device.group_device,
-            name_device=device.name_device,
-            type_device=device.type_device.value,
-            status=device.status.value,
-            is_enable=device.is_enable,
-            version=device.version,
-            device_groups=device_groups
-        )
-
-
-@router.get("", response_model=ApiResponse[list[DetectionEventResponse]])
+@router.get("", response_model=ApiCursorResponse[list[DetectionEventResponse]])
 async def get_detection_events(
     page: int = Query(1, ge=1, description="페이지 번호 (기본값: 1)"),
     limit: int = Query(20, ge=1, le=100, description="페이지당 항목 수 (기본값: 20, 최대: 100)"),
+    paging: str = Query("offset", pattern="^(offset|cursor)$", description="페이지네이션 방식 — offset(기본, page 사용) / cursor(keyset, 깊은 페이지도 일정 시간)"),
+    cursor: Optional[str] = Query(None, description="cursor 모드 다음 페이지 — 직전 응답의 cursor.next_cursor (지정 시 cursor 모드)"),
+    total: str = Query("none", pattern="^(none|estimate|exact)$", description="cursor 모드 전체 건수 — none(기본) / estimate(pg_class.reltuples 추정) / exact"),
     device_id: Optional[int] = Query(None, description="장치 ID로 필터링"),
     action_reported: Optional[str] = Query(None, description="조치보고 여부로 필터링"),
     result: Optional[str] = Query(None, description="결과 유형으로 필터링"),
@@ -217,6 +72,9 @@ async def get_detection_events(
     **파라미터**:
     - **page**: 페이지 번호 (기본값: 1)
     - **limit**: 페이지당 항목 수 (기본값: 20, 최대: 100)
+    - **paging**: `offset`(기본) / `cursor` — keyset `(created_at, id)` 커서 (user-014)
+    - **cursor**: 직전 응답의 `cursor.next_cursor` (null 이 될 때까지 반복)
+    - **total**: cursor 모드 전체 건수 — `none`(기본) / `estimate` / `exact`
     - **device_id**: 장치 ID로 필터링
     - **action_reported**: 조치보고 여부로 필터링
     - **result**: 결과 유형으로 필터링
@@ -246,19 +104,20 @@ async def get_detection_events(
         stmt = stmt.where(DetectionEvent.created_at <= end_date)
         count_stmt = count_stmt.where(DetectionEvent.created_at <= end_date)
 
-    # Get total count
-    total = (await db.execute(count_stmt)).scalar() or 0
+    # user-014: offset(종전) / keyset cursor 공용 페이지 조회
+    try:
+        events, pagination, cursor_meta = await fetch_event_page(
+            db, stmt, count_stmt, DetectionEvent, page=page, limit=limit,
+            paging=paging, cursor=cursor, total=total,
+        )
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        )
 
-    # Calculate pagination
-    skip = (page - 1) * limit
-    total_pages = math.ceil(total / limit) if total > 0 else 1
-
-    # Get paginated results (order by created_at desc)
-    events = (await db.execute(
-        stmt.order_by(DetectionEvent.created_at.desc(), DetectionEvent.id.desc())
-            .offset(skip)
-            .limit(limit)
-    )).scalars().all()
+    # user-015: 페이지 전체 device_groups 를 IN 1쿼리로 선적재(이후 조립은 캐시 적중)
+    await device_group_loader(db).prime(e.device_id for e in events)
 
     # Convert to response format (PRD v2.1: group_event 제거됨, device nested and device_description 포함)
     # PRD v1.3: device_id, sequence 필드 제거 (device.id에 포함, sequence는 Request 전용)
@@ -269,7 +128,7 @@ async def get_detection_events(
             type_event=e.type_event,
             action_reported=e.action_reported.value if hasattr(e.action_reported, 'value') else e.action_reported,
             result=e.result.value,
-            device=await _build_device_nested_response(e.device, db),
+            device=await build_device_nested_response(e.device, db),
             device_description=e.device_description,
             detail=e.detail,
             created_at=e.created_at,
@@ -278,18 +137,12 @@ async def get_detection_events(
         for e in events
     ]
 
-    pagination = PaginationMeta(
-        page=page,
-        limit=limit,
-        total=total,
-        total_pages=total_pages
-    )
-
-    return ApiResponse(
+    return ApiCursorResponse(
         success=True,
         message="Detection events retrieved successfully",
         data=event_responses,
-        pagination=pagination
+        pagination=pagination,
+        cursor=cursor_meta,
     )
 
 
@@ -334,7 +187,7 @@ async def get_detection_event(
         type_event=event.type_event,
         action_reported=event.action_reported.value if hasattr(event.action_reported, 'value') else event.action_reported,
         result=event.result.value,
-        device=await _build_device_nested_response(event.device, db),
+        device=await build_device_nested_response(event.device, db),
         device_description=event.device_description,
         detail=event.detail,  # PRD_Event_Detail_JsonB.md v1.0
         created_at=event.created_at,
@@ -445,7 +298,7 @@ async def create_detection_event(
         type_event=new_event.type_event,
         action_reported=new_event.action_reported.value if hasattr(new_event.action_reported, 'value') else new_event.action_reported,
         result=new_event.result.value,
-        device=await _build_device_nested_response(device, db),
+        device=await build_device_nested_response(device, db),
         device_description=new_event.device_description,
         detail=new_event.detail,  # PRD_Event_Detail_JsonB.md v1.0
         created_at=new_event.created_at,
@@ -459,6 +312,32 @@ async def create_detection_event(
     )
 
 
+@router.post("/bulk", response_model=ApiSingleResponse[EventBulkResult], dependencies=[Depends(require_perm_optional_async("events", "edit"))])
+async def create_detection_events_bulk(
+    bulk_data: DetectionEventBulkCreate,
+    current_user = Depends(get_current_account_user_optional_async),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    탐지 이벤트 일괄 생성 (user-022 — 탐지 서버 고빈도 수신)
+
+    단건 `POST` 와 같은 저장·억제·장비 상태·ConfigChangeLog 규칙을 N건 한 트랜잭션으로 처리합니다.
+
+    **Request Body**:
+    - **items**: 단건 생성 요청 배열 (1~500건)
+
+    **Response**: 항목별 결과(요청 순서) — `created`(id) / `suppressed`(schedule_id) / `failed`(error).
+    부분 성공(HTTP 200). device nested 는 포함하지 않습니다(필요 시 단건 GET).
+    """
+    result = await ingest_events_bulk(db, "detection", bulk_data.items)
+    return ApiSingleResponse(
+        success=True,
+        message=f"Detection events bulk processed: {result.created} created, "
+                f"{result.suppressed} suppressed, {result.failed} failed",
+        data=result
+    )
+
+
 @router.patch("/{event_id}", response_model=ApiSingleResponse[DetectionEventResponse], dependencies=[Depends(require_perm_optional_async("events", "edit"))])
 async def update_detection_event(
     event_id: int,
@@ -551,7 +430,7 @@ async def update_detection_event(
         type_event=event.type_event,
         action_reported=event.action_reported.value if hasattr(event.action_reported, 'value') else event.action_reported,
         result=event.result.value,
-        device=await _build_device_nested_response(event.device, db),
+        device=await build_device_nested_response(event.device, db),
         device_description=event.device_description,
         detail=event.detail,
         created_at=event.created_at,
@@ -600,7 +479,7 @@ async def replace_detection_event(
     - 404: 탐지 이벤트를 찾을 수 없음
     - 422: 유효하지 않은 enum 값 / device_id/device_description 등 금지 필드 전송
     """
-    # v6.3-event_put_lazyload_fix: PUT 응답 조립에서 event.device 접근(_build_device_nested_response) →
+    # v6.3-event_put_lazyload_fix: PUT 응답 조립에서 event.device 접근(build_device_nested_response) →
     #   refresh 후 async lazy-load(MissingGreenlet) 500 방지. 목록/단건/PATCH/malfunctions PUT 과 동일 패턴.
     event = (await db.execute(
         select(DetectionEvent)
@@ -640,7 +519,7 @@ async def replace_detection_event(
         type_event=event.type_event,
         action_reported=event.action_reported.value if hasattr(event.action_reported, 'value') else event.action_reported,
         result=event.result.value,
-        device=await _build_device_nested_response(event.device, db),
+        device=await build_device_nested_response(event.device, db),
         device_description=event.device_description,
         detail=event.detail,
         created_at=event.created_at,
@@ -762,7 +641,7 @@ async def get_action_events_for_detection(
         type_event=detection.type_event,
         action_reported=detection.action_reported.value if hasattr(detection.action_reported, 'value') else detection.action_reported,
         result=detection.result.value,
-        device=await _build_device_nested_response(detection.device, db),
+        device=await build_device_nested_response(detection.device, db),
         device_description=detection.device_description,
         detail=detection.detail,
         created_at=detection.created_at,
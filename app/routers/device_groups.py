@@ -34,6 +34,7 @@ from app.schemas.device_group import (
 )
 from app.schemas.common import ApiResponse, ApiSingleResponse, PaginationMeta, ValidationErrorResponse
 from app.services.config_log_service import log_config_change_async, get_identifier, get_changed_fields, model_to_dict
+from app.services.response_cache import cached
 
 router = APIRouter(prefix="/devices/groups")
 
@@ -80,6 +81,7 @@ router = APIRouter(prefix="/devices/groups")
         }
     }
 )
+@cached("SYNC_DEVICE_GROUP", "SYNC_DEVICE")
 async def get_device_groups(
     page: int = Query(1, ge=1, description="페이지 번호 (기본값: 1)"),
     limit: int = Query(20, ge=1, le=100, description="페이지당 항목 수 (기본값: 20, 최대: 100)"),
@@ -279,6 +281,7 @@ async def get_device_groups(
         }
     }
 )
+@cached("SYNC_DEVICE_GROUP", "SYNC_DEVICE")
 async def get_device_group(
     group_id: int,
     include_devices: bool = Query(True, description="디바이스 목록 포함 여부 (기본값: true)"),
@@ -15,6 +15,8 @@ from app.dependencies import get_async_db
 from app.utils.datetime import to_display
 from app.routers.auth import get_current_account_user_optional_async
 from app.models.device import Enclosure, EnclosureMetric
+from app.services import enclosure_latest_cache
+from app.services.metric_series_service import BUCKET_PATTERN, metric_series
 from app.schemas.device import EnclosureMetricCreate, EnclosureMetricResponse, EnclosureMetricLatestResponse
 
 router = APIRouter()
@@ -88,6 +90,8 @@ async def create_enclosure_metric(
     db.add(metric)
     await db.commit()
     await db.refresh(metric)
+    # user-016: 최신 메트릭 캐시 write-through
+    enclosure_latest_cache.record(enclosure_id, metric.created_at, _metric_to_response(metric))
 
     # Check thresholds
     threshold_exceeded = _check_thresholds(enclosure, metric_data)
@@ -184,6 +188,10 @@ async def get_enclosure_metrics(
     limit: int = Query(100, ge=1, le=1000, description="조회할 최대 개수"),
     start_time: Optional[datetime] = Query(None, description="시작 시간 필터"),
     end_time: Optional[datetime] = Query(None, description="종료 시간 필터"),
+    bucket: Optional[str] = Query(
+        None, pattern=BUCKET_PATTERN,
+        description="다운샘플 버킷(1m|5m|1h) — 지정 시 버킷별 min/avg/max/last 반환"
+    ),
     db: AsyncSession = Depends(get_async_db),
     current_user=Depends(get_current_account_user_optional_async)
 ):
@@ -194,12 +202,13 @@ async def get_enclosure_metrics(
 
     **파라미터**:
     - **enclosure_id**: Enclosure ID (path parameter)
-    - **limit**: 조회할 최대 개수 (기본: 100)
+    - **limit**: 조회할 최대 개수 (기본: 100). bucket 지정 시 최대 버킷 수
     - **start_time**: 시작 시간 필터 (선택)
     - **end_time**: 종료 시간 필터 (선택)
+    - **bucket**: 1m|5m|1h (선택, user-017). start_time 미지정 시 최근 limit 버킷
 
     **반환**:
-    - 메트릭 목록
+    - 메트릭 목록 (최신순). bucket 지정 시 버킷 목록(시간 오름차순)
     """
     # Enclosure 존재 확인
     enclosure = (await db.execute(select(Enclosure).where(Enclosure.id == enclosure_id))).scalars().first()
@@ -209,6 +218,15 @@ async def get_enclosure_metrics(
             detail=f"Enclosure with id {enclosure_id} not found"
         )
 
+    if bucket:
+        return {
+            "success": True,
+            "message": "Enclosure metrics retrieved successfully (downsampled)",
+            "data": await metric_series(
+                db, "enclosure", enclosure_id, bucket, start=start_time, end=end_time, limit=limit,
+            )
+        }
+
     # Query metrics
     stmt = select(EnclosureMetric).where(EnclosureMetric.enclosure_id == enclosure_id)
 
@@ -256,14 +274,18 @@ async def get_enclosure_metrics_latest(
             detail=f"Enclosure with id {enclosure_id} not found"
         )
 
-    # Get latest metric
-    metric = (await db.execute(
-        select(EnclosureMetric)
-        .where(EnclosureMetric.enclosure_id == enclosure_id)
-        .order_by(EnclosureMetric.created_at.desc())
-    )).scalars().first()
+    # Get latest metric — user-016: 캐시 적중 시 이력 테이블 무접촉
+    hit, data = enclosure_latest_cache.get(enclosure_id)
+    if not hit:
+        metric = (await db.execute(
+            select(EnclosureMetric)
+            .where(EnclosureMetric.enclosure_id == enclosure_id)
+            .order_by(EnclosureMetric.created_at.desc(), EnclosureMetric.id.desc())
+            .limit(1)
+        )).scalars().first()
+        data = _metric_to_response(metric) if metric else None
 
-    if not metric:
+    if data is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"No metrics found for enclosure {enclosure_id}"
@@ -272,7 +294,7 @@ async def get_enclosure_metrics_latest(
     return {
         "success": True,
         "message": "Latest enclosure metric retrieved successfully",
-        "data": _metric_to_response(metric)
+        "data": data
     }
 
 
@@ -317,6 +339,8 @@ async def delete_enclosure_metrics(
     result = await db.execute(delete_stmt)
     deleted_count = result.rowcount
     await db.commit()
+    # user-016: 최신값이 무엇으로 바뀌었는지 모르므로 통째 무효화 → 다음 조회가 재적재
+    enclosure_latest_cache.invalidate()
 
     return {
         "success": True,
@@ -348,27 +372,54 @@ async def get_all_enclosure_metrics(
     - 모든 함체의 최신 메트릭 데이터 목록
     - 메트릭이 없는 함체는 latest_metrics가 null
     """
-    # Get all enclosures
-    enclosures = (await db.execute(select(Enclosure).order_by(Enclosure.id))).scalars().all()
-
-    result = []
-    for enclosure in enclosures:
-        # Get latest metric for this enclosure
-        latest_metric = (await db.execute(
-            select(EnclosureMetric)
-            .where(EnclosureMetric.enclosure_id == enclosure.id)
-            .order_by(EnclosureMetric.created_at.desc())
-        )).scalars().first()
-
-        item = {
-            "enclosure_id": enclosure.id,
-            "enclosure_name": enclosure.name_device,
-            "latest_metrics": _metric_to_response(latest_metric) if latest_metric else None
+    # user-016: 종전 함체당 1쿼리(N+1) → 캐시 적중 시 enclosures 만, miss 면 최신 행까지 단일 쿼리
+    latest = enclosure_latest_cache.snapshot()
+    if latest is None:
+        seq = enclosure_latest_cache.write_seq()
+        rows = (await db.execute(_latest_metrics_stmt())).all()
+        loaded = {m.enclosure_id: (m.created_at, _metric_to_response(m)) for _, _, m in rows if m is not None}
+        enclosure_latest_cache.store_all(loaded, seq)
+        enclosures = [(enc_id, name) for enc_id, name, _ in rows]
+        latest = {k: v[1] for k, v in loaded.items()}
+    else:
+        enclosures = (await db.execute(
+            select(Enclosure.id, Enclosure.name_device).order_by(Enclosure.id)
+        )).all()
+
+    result = [
+        {
+            "enclosure_id": enc_id,
+            "enclosure_name": name,
+            "latest_metrics": latest.get(enc_id),
         }
-        result.append(item)
+        for enc_id, name in enclosures
+    ]
 
     return {
         "success": True,
         "message": "All enclosure metrics retrieved successfully",
         "data": result
     }
+
+
+def _latest_metrics_stmt():
+    """
+    (enclosure_id, name_device, 최신 EnclosureMetric | None) — 전체 함체 단일 쿼리 (user-016)
+
+    함체별 상관 서브쿼리 `ORDER BY created_at DESC, id DESC LIMIT 1` 로 최신 id 를 고르고 outer join.
+    PostgreSQL 에서는 idx_enclosure_metrics_enclosure_created_id 역방향 스캔으로 함체당 1행만 읽는다
+    (LATERAL 과 같은 실행형, SQLite 테스트 DB 에서도 동작).
+    """
+    newest_id = (
+        select(EnclosureMetric.id)
+        .where(EnclosureMetric.enclosure_id == Enclosure.id)
+        .order_by(EnclosureMetric.created_at.desc(), EnclosureMetric.id.desc())
+        .limit(1)
+        .correlate(Enclosure)
+        .scalar_subquery()
+    )
+    return (
+        select(Enclosure.id, Enclosure.name_device, EnclosureMetric)
+        .outerjoin(EnclosureMetric, EnclosureMetric.id == newest_id)
+        .order_by(Enclosure.id)
+    )
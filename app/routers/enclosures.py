@@ -27,6 +27,7 @@ from app.schemas.device import (
 # EnclosureDetailInfo 제거됨 (PRD_Enclosure_Metrics_Separation.md v1.0)
 from app.schemas.common import ApiResponse, ApiSingleResponse, PaginationMeta
 from app.services.config_log_service import log_config_change, get_identifier, get_changed_fields, model_to_dict
+from app.services.response_cache import cached
 
 router = APIRouter()
 
@@ -130,6 +131,7 @@ async def _enclosure_to_response(enclosure: Enclosure, db: AsyncSession) -> Encl
 
 
 @router.get("", response_model=ApiResponse[list[EnclosureResponse]])
+@cached("SYNC_DEVICE", "SYNC_DEVICE_GROUP")
 async def get_enclosures(
     page: int = Query(1, ge=1, description="페이지 번호 (기본값: 1)"),
     limit: int = Query(20, ge=1, le=100, description="페이지당 항목 수 (기본값: 20, 최대: 100)"),
@@ -198,6 +200,7 @@ async def get_enclosures(
 
 
 @router.get("/{enclosure_id}", response_model=ApiSingleResponse[EnclosureResponse])
+@cached("SYNC_DEVICE", "SYNC_DEVICE_GROUP")
 async def get_enclosure(
     enclosure_id: int,
     current_user=Depends(get_current_account_user_optional_async),
@@ -17,11 +17,13 @@ from app.schemas.integration import EventMappingCreate, EventMappingResponse, Ev
 from app.schemas.common import ApiResponse, ApiSingleResponse, PaginationMeta
 from app.utils.enums import EnumMappingEventCategory, EnumConfigResourceType, EnumConfigActionType
 from app.services.config_log_service import log_config_change, get_changed_fields, model_to_dict
+from app.services.response_cache import cached
 
 router = APIRouter(tags=[])
 
 
 @router.get("", response_model=ApiResponse[list[EventMappingResponse]])
+@cached("SYNC_EVENT_MAPPING")
 async def get_event_mappings(
     page: int = Query(1, ge=1, description="페이지 번호 (기본값: 1)"),
     limit: int = Query(20, ge=1, le=100, description="페이지당 항목 수 (기본값: 20, 최대: 100)"),
@@ -111,6 +113,7 @@ async def get_event_mappings(
 
 
 @router.get("/{mapping_id}", response_model=ApiSingleResponse[EventMappingResponse])
+@cached("SYNC_EVENT_MAPPING")
 async def get_event_mapping(
     mapping_id: int,
     current_user = Depends(get_current_account_user_optional_async),
@@ -3,20 +3,30 @@ Event Statistics API endpoints
 
 PRD: PRD_EventStatistics_Api.md v2.1
 이벤트 통계 집계 API — 대시보드 차트용 경량 응답
+
+user-010: 건수는 사전 집계 롤업(event_rollup_hourly/daily)에서 닫힌 버킷을 읽고, 정시/자정 경계
+가장자리와 워터마크 이후 열린 구간만 원본에서 센다(app/services/event_rollup_service.py).
+
+user-024: 장비 축 집계(category, device_category, device_id) 1회를 요약·장비별이 공유하고, 대시보드는
+독립 집계(장비 축 / 추이 버킷, 이어서 요약 / 장비별 조회)를 동시에 실행한다(PostgreSQL — 작업별 세션).
+응답 data 는 (엔드포인트, 구간, 단위) 키로 단기 캐시(app/services/event_stats_cache.py).
 """
+import asyncio
+
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import aliased
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, case
+from sqlalchemy import select, func
 from datetime import datetime
-from app.utils.datetime import to_utc, utc_now
-from collections import defaultdict
+from app.utils.datetime import to_display, to_utc, utc_now
+from collections import Counter, defaultdict
 
 from app.dependencies import get_async_db
 # P0-01 (2026-07-10): 이벤트 통계(감시장비/이벤트 집계) 무인증 노출 차단 — token 모드 events:view 강제.
 from app.routers.auth import require_perm_optional_async
-from app.models.event import Event, DetectionEvent, MalfunctionEvent, ConnectionEvent, ActionEvent
-from app.models.device import Device, Sensor, Controller, Camera
+from app.models.device import Device, Sensor, Controller
+from app.services import event_stats_cache
+from app.services.event_rollup_service import rollup_counts
 from app.utils.enums import EnumDeviceCategory, EnumEventCategory
 from app.schemas.event_statistics import (
     EventSummaryResponse,
@@ -47,19 +57,13 @@ def _naive_kst(dt: datetime) -> datetime:
     return to_utc(dt)
 
 
-async def _count_detections_by_device_category(db: AsyncSession, category: EnumDeviceCategory, start_date, end_date) -> int:
-    """DetectionEvent를 Device category_device 기준으로 카운트"""
-    stmt = (
-        select(func.count(DetectionEvent.id))
-        .select_from(DetectionEvent)
-        .join(Device, Event.device_id == Device.id)
-        .where(
-            Device.category_device == category,
-            Event.created_at >= start_date,
-            Event.created_at <= end_date,
-        )
-    )
-    return (await db.execute(stmt)).scalar() or 0
+_DET = EnumEventCategory.DETECTION.name
+_MAL = EnumEventCategory.MALFUNCTION.name
+_CON = EnumEventCategory.CONNECTION.name
+_ACT = "ACTION"
+_SENSOR = EnumDeviceCategory.SENSOR.name
+_CAMERA = EnumDeviceCategory.CAMERA.name
+_DEVICE_DIMS = ("category", "device_category", "device_id")
 
 
 @router.get(
@@ -74,39 +78,41 @@ async def get_event_summary(
     db: AsyncSession = Depends(get_async_db),
 ):
     start_date, end_date = _naive_kst(start_date), _naive_kst(end_date)  # #4 tz 정규화
-    # 1. 기본 건수 집계
-    sensor_count = await _count_detections_by_device_category(db, EnumDeviceCategory.SENSOR, start_date, end_date)
-    camera_count = await _count_detections_by_device_category(db, EnumDeviceCategory.CAMERA, start_date, end_date)
-
-    malfunction_stmt = (
-        select(func.count(MalfunctionEvent.id))
-        .select_from(MalfunctionEvent)
-        .where(
-            Event.created_at >= start_date,
-            Event.created_at <= end_date,
-        )
-    )
-    malfunction_count = (await db.execute(malfunction_stmt)).scalar() or 0
-
-    connection_stmt = (
-        select(func.count(ConnectionEvent.id))
-        .select_from(ConnectionEvent)
-        .where(
-            Event.created_at >= start_date,
-            Event.created_at <= end_date,
-        )
-    )
-    connection_count = (await db.execute(connection_stmt)).scalar() or 0
-
-    action_stmt = (
-        select(func.count(ActionEvent.id))
-        .select_from(ActionEvent)
-        .where(
-            ActionEvent.created_at >= start_date,
-            ActionEvent.created_at <= end_date,
-        )
-    )
-    action_count = (await db.execute(action_stmt)).scalar() or 0
+
+    async def _compute():
+        return await _summary_data(db, start_date, end_date, await _device_counts(db, start_date, end_date))
+
+    data = await event_stats_cache.get_or_compute(("summary", start_date, end_date), _compute)
+    return ApiSingleResponse(message="Event summary statistics retrieved", data=data)
+
+
+async def _device_counts(db: AsyncSession, start_date, end_date) -> Counter:
+    """장비 축 건수 — user-010: 닫힌 버킷은 event_rollup_daily, 가장자리/열린 구간만 원본.
+    user-024: 요약·장비별이 같은 집계를 쓰므로 대시보드는 1회만 계산해 공유한다."""
+    return await rollup_counts(db, start_date, end_date, _DEVICE_DIMS, end_inclusive=True)
+
+
+async def _summary_data(db: AsyncSession, start_date, end_date, counts: Counter) -> EventSummaryResponse:
+    # 1. 기본 건수 집계 (장비 축 건수에서)
+    sensor_count = camera_count = malfunction_count = connection_count = action_count = 0
+    active_ids = {_SENSOR: set(), _CAMERA: set()}
+    event_device_ids = set()
+    for (cat, devcat, device_id), n in counts.items():
+        if cat == _DET:
+            if devcat == _SENSOR:
+                sensor_count += n
+            elif devcat == _CAMERA:
+                camera_count += n
+        elif cat == _MAL:
+            malfunction_count += n
+        elif cat == _CON:
+            connection_count += n
+        elif cat == _ACT:
+            action_count += n
+        if cat != _ACT and device_id is not None:
+            event_device_ids.add(device_id)
+            if devcat in active_ids:
+                active_ids[devcat].add(device_id)
 
     total = sensor_count + camera_count + malfunction_count + connection_count + action_count
 
@@ -121,155 +127,70 @@ async def get_event_summary(
         action=round(action_count / days, 1),
     )
 
-    # 3. Active devices
-    active_sensors_stmt = (
-        select(func.count(func.distinct(Event.device_id)))
-        .select_from(Event)
-        .join(Device, Event.device_id == Device.id)
-        .where(
-            Device.category_device == EnumDeviceCategory.SENSOR,
-            Event.created_at >= start_date,
-            Event.created_at <= end_date,
-        )
-    )
-    active_sensors = (await db.execute(active_sensors_stmt)).scalar() or 0
-
-    active_cameras_stmt = (
-        select(func.count(func.distinct(Event.device_id)))
-        .select_from(Event)
-        .join(Device, Event.device_id == Device.id)
-        .where(
-            Device.category_device == EnumDeviceCategory.CAMERA,
-            Event.created_at >= start_date,
-            Event.created_at <= end_date,
-        )
-    )
-    active_cameras = (await db.execute(active_cameras_stmt)).scalar() or 0
-
-    active_controllers_stmt = (
-        select(func.count(func.distinct(Sensor.controller_id)))
-        .select_from(Sensor)
-        .join(Event, Event.device_id == Sensor.id)
-        .where(
-            Event.created_at >= start_date,
-            Event.created_at <= end_date,
+    # 3. Active devices — 이벤트(조치 제외)가 있었던 장비, 제어기는 그 센서들의 소속 제어기
+    active_sensors = len(active_ids[_SENSOR])
+    active_cameras = len(active_ids[_CAMERA])
+    active_controllers = 0
+    if event_device_ids:
+        active_controllers_stmt = (
+            select(func.count(func.distinct(Sensor.controller_id)))
+            .where(Sensor.id.in_(sorted(event_device_ids)))
         )
-    )
-    active_controllers = (await db.execute(active_controllers_stmt)).scalar() or 0
-
-    return ApiSingleResponse(
-        message="Event summary statistics retrieved",
-        data=EventSummaryResponse(
-            start_date=start_date,
-            end_date=end_date,
-            days_in_range=days,
-            total=total,
-            sensor_detection=sensor_count,
-            camera_detection=camera_count,
-            malfunction=malfunction_count,
-            connection=connection_count,
-            action=action_count,
-            daily_averages=daily_averages,
-            active_devices=ActiveDevices(
-                sensors=active_sensors,
-                cameras=active_cameras,
-                controllers=active_controllers,
-            ),
+        active_controllers = (await db.execute(active_controllers_stmt)).scalar() or 0
+
+    return EventSummaryResponse(
+        start_date=start_date,
+        end_date=end_date,
+        days_in_range=days,
+        total=total,
+        sensor_detection=sensor_count,
+        camera_detection=camera_count,
+        malfunction=malfunction_count,
+        connection=connection_count,
+        action=action_count,
+        daily_averages=daily_averages,
+        active_devices=ActiveDevices(
+            sensors=active_sensors,
+            cameras=active_cameras,
+            controllers=active_controllers,
         ),
     )
 
 
-def _time_bucket_expr(col, interval: str, db: AsyncSession):
-    """DB 방언에 따른 시간 버킷 SQL 표현식 반환 (SQLite: strftime, PostgreSQL: to_char)"""
-    dialect = db.get_bind().dialect.name
-    if dialect == "postgresql":
-        fmt = "YYYY-MM-DD" if interval == "day" else "YYYY-MM-DD HH24"
-        return func.to_char(col, fmt)
-    else:
-        fmt = "%Y-%m-%d" if interval == "day" else "%Y-%m-%d %H"
-        return func.strftime(fmt, col)
-
-
 async def _build_trend_series(db: AsyncSession, start_date, end_date, interval: str) -> list[EventTrendItem]:
-    """시간대별 이벤트 건수 집계"""
-    time_fn = _time_bucket_expr(Event.created_at, interval, db)
-
-    # Detection (sensor/camera 분리)
-    det_stmt = (
-        select(
-            time_fn.label("bucket"),
-            Device.category_device,
-            func.count(DetectionEvent.id).label("cnt"),
-        )
-        .select_from(DetectionEvent)
-        .join(Device, Event.device_id == Device.id)
-        .where(
-            Event.created_at >= start_date,
-            Event.created_at <= end_date,
-        )
-        .group_by("bucket", Device.category_device)
-    )
-    det_rows = (await db.execute(det_stmt)).all()
+    """시간대별 이벤트 건수 집계 — user-010: 닫힌 시간은 event_rollup_hourly, 나머지 원본.
 
-    # Malfunction
-    mal_stmt = (
-        select(
-            _time_bucket_expr(Event.created_at, interval, db).label("bucket"),
-            func.count(MalfunctionEvent.id).label("cnt"),
-        )
-        .select_from(MalfunctionEvent)
-        .where(
-            Event.created_at >= start_date,
-            Event.created_at <= end_date,
-        )
-        .group_by("bucket")
-    )
-    mal_rows = (await db.execute(mal_stmt)).all()
+    버킷 라벨은 표시 타임존(DISPLAY_TZ) 기준 `YYYY-MM-DD HH` / `YYYY-MM-DD`.
+    """
+    return _trend_series(await _trend_counts(db, start_date, end_date, interval), interval)
 
-    # Connection
-    con_stmt = (
-        select(
-            _time_bucket_expr(Event.created_at, interval, db).label("bucket"),
-            func.count(ConnectionEvent.id).label("cnt"),
-        )
-        .select_from(ConnectionEvent)
-        .where(
-            Event.created_at >= start_date,
-            Event.created_at <= end_date,
-        )
-        .group_by("bucket")
-    )
-    con_rows = (await db.execute(con_stmt)).all()
 
-    # Action (별도 테이블)
-    act_stmt = (
-        select(
-            _time_bucket_expr(ActionEvent.created_at, interval, db).label("bucket"),
-            func.count(ActionEvent.id).label("cnt"),
-        )
-        .select_from(ActionEvent)
-        .where(
-            ActionEvent.created_at >= start_date,
-            ActionEvent.created_at <= end_date,
-        )
-        .group_by("bucket")
+async def _trend_counts(db: AsyncSession, start_date, end_date, interval: str) -> Counter:
+    return await rollup_counts(
+        db, start_date, end_date, ("category", "device_category"),
+        bucket="day" if interval == "day" else "hour", end_inclusive=True,
     )
-    act_rows = (await db.execute(act_stmt)).all()
 
-    # 합산
-    buckets = defaultdict(lambda: {"sensor_detection": 0, "camera_detection": 0, "malfunction": 0, "connection": 0, "action": 0})
 
-    for row in det_rows:
-        cat = row.category_device
-        key = "camera_detection" if cat == EnumDeviceCategory.CAMERA else "sensor_detection"
-        buckets[row.bucket][key] += row.cnt
+def _trend_series(counts: Counter, interval: str) -> list[EventTrendItem]:
+    by_day = interval == "day"
+    buckets = defaultdict(lambda: {"sensor_detection": 0, "camera_detection": 0, "malfunction": 0, "connection": 0, "action": 0})
 
-    for row in mal_rows:
-        buckets[row.bucket]["malfunction"] += row.cnt
-    for row in con_rows:
-        buckets[row.bucket]["connection"] += row.cnt
-    for row in act_rows:
-        buckets[row.bucket]["action"] += row.cnt
+    for (bucket, cat, devcat), n in counts.items():
+        label = bucket.isoformat() if by_day else to_display(bucket).strftime("%Y-%m-%d %H")
+        if cat == _DET:
+            if devcat is None:
+                continue  # 장비 미연결 탐지는 센서/카메라 어느 쪽에도 집계하지 않음(종전 inner join 과 동일)
+            key = "camera_detection" if devcat == _CAMERA else "sensor_detection"
+        elif cat == _MAL:
+            key = "malfunction"
+        elif cat == _CON:
+            key = "connection"
+        elif cat == _ACT:
+            key = "action"
+        else:
+            continue
+        buckets[label][key] += n
 
     series = []
     for bucket_key in sorted(buckets.keys()):
@@ -291,99 +212,85 @@ async def get_event_by_device(
     db: AsyncSession = Depends(get_async_db),
 ):
     start_date, end_date = _naive_kst(start_date), _naive_kst(end_date)  # #4 tz 정규화
-    # Part 1: 제어기별 센서 이벤트 집계
+
+    async def _compute():
+        return await _by_device_data(db, start_date, end_date, await _device_counts(db, start_date, end_date))
+
+    data = await event_stats_cache.get_or_compute(("by-device", start_date, end_date), _compute)
+    return ApiSingleResponse(message="Event statistics by device retrieved", data=data)
+
+
+async def _by_device_data(db: AsyncSession, start_date, end_date, counts: Counter) -> EventByDeviceResponse:
+    # user-010: 장비별 건수는 event_rollup_daily(닫힌 날짜) + 원본(가장자리/열린 구간)
+    device_ids = sorted({device_id for (_, _, device_id) in counts if device_id is not None})
+
+    # Part 1: 제어기별 센서 이벤트 집계 (조치는 원 이벤트 장비의 제어기로)
     # Sensor, Controller 모두 Device JTI 상속 → devices 테이블 충돌 방지용 alias
     CtrlAlias = aliased(Controller, flat=True)
-    ctrl_stmt = (
-        select(
-            Sensor.controller_id,
-            CtrlAlias.name_device.label("controller_name"),
-            CtrlAlias.number_device.label("controller_number"),
-            func.sum(case((Event.category_event == EnumEventCategory.DETECTION, 1), else_=0)).label("sensor_detection"),
-            func.sum(case((Event.category_event == EnumEventCategory.MALFUNCTION, 1), else_=0)).label("malfunction"),
-            func.sum(case((Event.category_event == EnumEventCategory.CONNECTION, 1), else_=0)).label("connection"),
-        )
-        .select_from(Event)
-        .join(Sensor, Event.device_id == Sensor.id)
-        .join(CtrlAlias, Sensor.controller_id == CtrlAlias.id)
-        .where(
-            Event.created_at >= start_date,
-            Event.created_at <= end_date,
-        )
-        .group_by(Sensor.controller_id, CtrlAlias.name_device, CtrlAlias.number_device)
-    )
-    ctrl_rows = (await db.execute(ctrl_stmt)).all()
-
-    # Part 1b: 제어기별 action 집계
-    # ActionEvent.from_event_id → Event.device_id → Sensor.controller_id
-    action_stmt = (
-        select(
-            Sensor.controller_id,
-            func.count(ActionEvent.id).label("action_count"),
-        )
-        .select_from(ActionEvent)
-        .join(Event, ActionEvent.from_event_id == Event.id)
-        .join(Sensor, Event.device_id == Sensor.id)
-        .where(
-            ActionEvent.created_at >= start_date,
-            ActionEvent.created_at <= end_date,
+    sensor_ctrl = {}
+    if device_ids:
+        ctrl_stmt = (
+            select(
+                Sensor.id,
+                Sensor.controller_id,
+                CtrlAlias.name_device.label("controller_name"),
+                CtrlAlias.number_device.label("controller_number"),
+            )
+            .join(CtrlAlias, Sensor.controller_id == CtrlAlias.id)
+            .where(Sensor.id.in_(device_ids))
         )
-        .group_by(Sensor.controller_id)
-    )
-    action_rows = (await db.execute(action_stmt)).all()
-
-    action_by_ctrl = {row.controller_id: row.action_count for row in action_rows}
+        sensor_ctrl = {row.id: row for row in (await db.execute(ctrl_stmt)).all()}
+
+    ctrl_counts = defaultdict(lambda: {"sensor_detection": 0, "malfunction": 0, "connection": 0, "action": 0})
+    ctrl_info = {}
+    for (cat, _devcat, device_id), n in counts.items():
+        row = sensor_ctrl.get(device_id)
+        if row is None:
+            continue
+        key = {_DET: "sensor_detection", _MAL: "malfunction", _CON: "connection", _ACT: "action"}.get(cat)
+        if key is None:
+            continue
+        ctrl_counts[row.controller_id][key] += n
+        if cat != _ACT:
+            ctrl_info[row.controller_id] = row
 
     controllers = [
         ControllerStats(
-            controller_id=row.controller_id,
+            controller_id=ctrl_id,
             controller_name=row.controller_name,
             controller_number=row.controller_number,
-            sensor_detection=row.sensor_detection,
-            malfunction=row.malfunction,
-            connection=row.connection,
-            action=action_by_ctrl.get(row.controller_id, 0),
+            **ctrl_counts[ctrl_id],
         )
-        for row in ctrl_rows
+        for ctrl_id, row in sorted(ctrl_info.items())
     ]
 
     # Part 2: 카메라별 AI 탐지 집계
-    cam_stmt = (
-        select(
-            Device.id.label("camera_id"),
-            Device.name_device.label("camera_name"),
-            Device.number_device.label("camera_number"),
-            func.count(DetectionEvent.id).label("camera_detection"),
-        )
-        .select_from(DetectionEvent)
-        .join(Device, Event.device_id == Device.id)
-        .where(
-            Device.category_device == EnumDeviceCategory.CAMERA,
-            Event.created_at >= start_date,
-            Event.created_at <= end_date,
-        )
-        .group_by(Device.id, Device.name_device, Device.number_device)
-    )
-    cam_rows = (await db.execute(cam_stmt)).all()
-
-    cameras = [
-        CameraStats(
-            camera_id=row.camera_id,
-            camera_name=row.camera_name,
-            camera_number=row.camera_number,
-            camera_detection=row.camera_detection,
+    cam_counts = Counter()
+    for (cat, devcat, device_id), n in counts.items():
+        if cat == _DET and devcat == _CAMERA and device_id is not None:
+            cam_counts[device_id] += n
+    cameras = []
+    if cam_counts:
+        cam_stmt = (
+            select(Device.id, Device.name_device, Device.number_device)
+            .where(Device.id.in_(sorted(cam_counts)))
+            .order_by(Device.id)
         )
-        for row in cam_rows
-    ]
-
-    return ApiSingleResponse(
-        message="Event statistics by device retrieved",
-        data=EventByDeviceResponse(
-            start_date=start_date,
-            end_date=end_date,
-            controllers=controllers,
-            cameras=cameras,
-        ),
+        cameras = [
+            CameraStats(
+                camera_id=row.id,
+                camera_name=row.name_device,
+                camera_number=row.number_device,
+                camera_detection=cam_counts[row.id],
+            )
+            for row in (await db.execute(cam_stmt)).all()
+        ]
+
+    return EventByDeviceResponse(
+        start_date=start_date,
+        end_date=end_date,
+        controllers=controllers,
+        cameras=cameras,
     )
 
 
@@ -400,17 +307,13 @@ async def get_event_trend(
     db: AsyncSession = Depends(get_async_db),
 ):
     start_date, end_date = _naive_kst(start_date), _naive_kst(end_date)  # #4 tz 정규화
-    series = await _build_trend_series(db, start_date, end_date, interval)
-
-    return ApiSingleResponse(
-        message="Event trend statistics retrieved",
-        data=EventTrendResponse(
-            interval=interval,
-            start_date=start_date,
-            end_date=end_date,
-            series=series,
-        ),
-    )
+
+    async def _compute():
+        series = await _build_trend_series(db, start_date, end_date, interval)
+        return EventTrendResponse(interval=interval, start_date=start_date, end_date=end_date, series=series)
+
+    data = await event_stats_cache.get_or_compute(("trend", start_date, end_date, interval), _compute)
+    return ApiSingleResponse(message="Event trend statistics retrieved", data=data)
 
 
 @router.get(
@@ -426,15 +329,40 @@ async def get_event_dashboard(
     db: AsyncSession = Depends(get_async_db),
 ):
     start_date, end_date = _naive_kst(start_date), _naive_kst(end_date)  # #4 tz 정규화
-    summary_resp = await get_event_summary(start_date, end_date, db)
-    trend_resp = await get_event_trend(start_date, end_date, interval, db)
-    by_device_resp = await get_event_by_device(start_date, end_date, db)
-
-    return ApiSingleResponse(
-        message="Event dashboard statistics retrieved",
-        data=EventDashboardResponse(
-            summary=summary_resp.data,
-            trend=trend_resp.data,
-            by_device=by_device_resp.data,
-        ),
-    )
+
+    async def _compute():
+        # user-024: 장비 축 집계 1회(요약·장비별 공유) ∥ 추이 버킷 → 요약 조회 ∥ 장비별 조회
+        counts, trend_counts = await _concurrently(
+            db,
+            lambda s: _device_counts(s, start_date, end_date),
+            lambda s: _trend_counts(s, start_date, end_date, interval),
+        )
+        summary, by_device = await _concurrently(
+            db,
+            lambda s: _summary_data(s, start_date, end_date, counts),
+            lambda s: _by_device_data(s, start_date, end_date, counts),
+        )
+        return EventDashboardResponse(
+            summary=summary,
+            trend=EventTrendResponse(
+                interval=interval, start_date=start_date, end_date=end_date,
+                series=_trend_series(trend_counts, interval),
+            ),
+            by_device=by_device,
+        )
+
+    data = await event_stats_cache.get_or_compute(("dashboard", start_date, end_date, interval), _compute)
+    return ApiSingleResponse(message="Event dashboard statistics retrieved", data=data)
+
+
+async def _concurrently(db: AsyncSession, *jobs):
+    """독립 집계 동시 실행. PostgreSQL 은 작업마다 같은 bind 의 별도 세션(풀 연결)으로 gather,
+    그 외 방언(SQLite — 단일 연결)은 요청 세션으로 순차 실행. 결과는 jobs 순서."""
+    if db.bind is None or db.bind.dialect.name != "postgresql":
+        return [await job(db) for job in jobs]
+
+    async def _run(job):
+        async with AsyncSession(bind=db.bind, expire_on_commit=False) as session:
+            return await job(session)
+
+    return await asyncio.gather(*(_run(job) for job in jobs))
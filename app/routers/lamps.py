@@ -17,6 +17,7 @@ from app.utils.enums import EnumDeviceType, EnumDeviceStatus, EnumDeviceCategory
 from app.schemas.device import LampCreate, LampUpdate, LampResponse, DeviceGroupNestedResponse
 from app.schemas.common import ApiResponse, ApiSingleResponse, PaginationMeta
 from app.services.config_log_service import log_config_change, get_identifier, get_changed_fields, model_to_dict
+from app.services.response_cache import cached
 
 router = APIRouter()
 
@@ -110,6 +111,7 @@ async def _lamp_to_response(lamp: Lamp, db: AsyncSession) -> LampResponse:
 
 
 @router.get("", response_model=ApiResponse[list[LampResponse]])
+@cached("SYNC_DEVICE", "SYNC_DEVICE_GROUP")
 async def get_lamps(
     page: int = Query(1, ge=1, description="페이지 번호 (기본값: 1)"),
     limit: int = Query(20, ge=1, le=100, description="페이지당 항목 수 (기본값: 20, 최대: 100)"),
@@ -171,6 +173,7 @@ async def get_lamps(
 
 
 @router.get("/{lamp_id}", response_model=ApiSingleResponse[LampResponse])
+@cached("SYNC_DEVICE", "SYNC_DEVICE_GROUP")
 async def get_lamp(
     lamp_id: int,
     current_user=Depends(get_current_account_user_optional_async),
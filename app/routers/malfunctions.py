@@ -22,28 +22,19 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload, selectin_polymorphic
 from typing import Optional
 from datetime import datetime
-import math
 
 from app.dependencies import get_async_db
 from app.routers.auth import get_current_account_user_optional_async, require_perm_optional_async
+from app.services.device_nested_service import build_device_nested_response, device_group_loader
 from app.services.event_suppression_service import is_suppressed, record_suppression, suppressed_response
+from app.services.event_bulk_service import ingest_events_bulk
 from app.models.event import MalfunctionEvent, ActionEvent, EnumTrueFalse, EnumFaultType
 from app.models.device import Device, Sensor, Controller, Camera, Speaker, Enclosure, Lamp
-from app.models.device_group import DeviceGroupMapping
-from app.schemas.event import MalfunctionEventCreate, MalfunctionEventReplace, MalfunctionEventResponse, MalfunctionEventUpdate, ActionEventResponse
-from app.schemas.device import (
-    DeviceGroupNestedResponse,
-    DeviceNestedResponse,
-    SensorNestedResponse,
-    ControllerNestedResponse,
-    CameraNestedResponse,
-    SpeakerNestedResponse,
-    LampNestedResponse,
-)
-from app.schemas.common import ApiResponse, ApiSingleResponse, PaginationMeta
+from app.schemas.event import MalfunctionEventCreate, MalfunctionEventBulkCreate, EventBulkResult, MalfunctionEventReplace, MalfunctionEventResponse, MalfunctionEventUpdate, ActionEventResponse
+from app.schemas.common import ApiCursorResponse, ApiResponse, ApiSingleResponse
 from app.utils.enums import EnumDeviceType, EnumDeviceStatus, EnumConfigResourceType, EnumConfigActionType
+from app.utils.event_pagination import fetch_event_page
 from app.services.config_log_service import log_config_change_async, get_changed_fields, model_to_dict
-from typing import Union
 
 router = APIRouter(tags=[])
 
@@ -58,153 +49,13 @@ def _generate_device_description(device: Device) -> str:
     return f"[{device.type_device.value}] {device.name_device} (number: {device.number_device}, id: {device.id})"
 
 
-async def _build_device_nested_response(device: Optional[Device], db: AsyncSession) -> Optional[Union[SensorNestedResponse, ControllerNestedResponse, CameraNestedResponse, SpeakerNestedResponse, LampNestedResponse, DeviceNestedResponse]]:
-    """
-    Device 객체를 타입에 맞는 Nested Response로 변환 (Polymorphic)
-
-    PRD v1.1: Device 삭제 시 None 반환
-    PRD v1.2: device_groups 필드 추가 (EventMapping 연동 필수)
-    PRD v2.7: Device 타입별 Polymorphic Response 반환
-    - Sensor → SensorNestedResponse
-    - Controller → ControllerNestedResponse
-    - Camera → CameraNestedResponse
-    - Speaker → SpeakerNestedResponse
-    - Enclosure → DeviceNestedResponse (전용 NestedResponse 없음)
-    - Lamp → LampNestedResponse
-
-    v6.0 P8 async 전환: db.query → await db.execute(select(...))
-    mapping.group 은 selectinload 로 eager load (async lazy 금지)
-    """
-    if device is None:
-        return None
-
-    # PRD v1.2: Build device_groups from group_mappings relationship
-    # v6.0 P1 Tidy First: lazy='dynamic' relationship → 명시적 쿼리 로 교체
-    # v6.0 P8: async — selectinload(group) 로 관계 eager load (lazy 접근 금지)
-    device_groups = []
-    result = await db.execute(
-        select(DeviceGroupMapping)
-        .options(selectinload(DeviceGroupMapping.group))
-        .where(DeviceGroupMapping.device_id == device.id)
-    )
-    mappings = result.scalars().all()
-    for mapping in mappings:
-        if mapping.group:
-            device_groups.append(DeviceGroupNestedResponse(
-                id=mapping.group.id,
-                name=mapping.group.name
-            ))
-
-    # PRD v2.7: Polymorphic Response - Device 타입에 따라 적절한 스키마 반환
-    if isinstance(device, Sensor):
-        return SensorNestedResponse(
-            id=device.id,
-            number_device=device.number_device,
-            group_device=device.group_device,
-            name_device=device.name_device,
-            type_device=device.type_device.value,
-            version=device.version,
-            status=device.status.value,
-            is_enable=device.is_enable,
-            controller_id=device.controller_id,
-            device_groups=device_groups
-        )
-    elif isinstance(device, Camera):
-        # PRD_Camera_Urls_JsonB.md: urls JSONB 통합 (rtsp_uri/rtsp_port 제거)
-        from app.schemas.device import CameraUrls
-        urls_data = None
-        if device.urls:
-            urls_data = CameraUrls.model_validate(device.urls) if isinstance(device.urls, dict) else device.urls
-        return CameraNestedResponse(
-            id=device.id,
-            number_device=device.number_device,
-            group_device=device.group_device,
-            name_device=device.name_device,
-            type_device=device.type_device.value,
-            version=device.version,
-            status=device.status.value,
-            is_enable=device.is_enable,
-            ip_address=device.ip_address,
-            ip_port=device.ip_port,
-            mode=device.mode.value if device.mode else "NONE",
-            category=device.category.value if device.category else "NONE",
-            is_record=device.is_record,
-            urls=urls_data,
-            device_groups=device_groups
-        )
-    elif isinstance(device, Controller):
-        return ControllerNestedResponse(
-            id=device.id,
-            number_device=device.number_device,
-            group_device=device.group_device,
-            name_device=device.name_device,
-            type_device=device.type_device.value,
-            version=device.version,
-            status=device.status.value,
-            is_enable=device.is_enable,
-            ip_address=device.ip_address,
-            ip_port=device.ip_port,
-            device_groups=device_groups
-        )
-    elif isinstance(device, Speaker):
-        return SpeakerNestedResponse(
-            id=device.id,
-            category_device=device.category_device.value,
-            number_device=device.number_device,
-            name_device=device.name_device,
-            type_device=device.type_device.value,
-            status=device.status.value,
-            is_enable=device.is_enable,
-            speaker_type=device.speaker_type.value if device.speaker_type else "NORMAL",
-            geolocation=device.geolocation,
-        )
-    elif isinstance(device, Lamp):
-        return LampNestedResponse(
-            id=device.id,
-            number_device=device.number_device,
-            group_device=device.group_device,
-            name_device=device.name_device,
-            type_device=device.type_device.value,
-            version=device.version,
-            status=device.status.value,
-            is_enable=device.is_enable,
-            ip_address=device.ip_address,
-            ip_port=device.ip_port,
-            user_name=device.user_name,
-            description=device.description,
-            geolocation=device.geolocation,
-        )
-    elif isinstance(device, Enclosure):
-        return DeviceNestedResponse(
-            id=device.id,
-            number_device=device.number_device,
-            group_device=device.group_device,
-            name_device=device.name_device,
-            type_device=device.type_device.value,
-            status=device.status.value,
-            is_enable=device.is_enable,
-            version=device.version,
-            device_groups=device_groups
-        )
-    else:
-        # Fallback: 알 수 없는 Device 타입
-        return DeviceNestedResponse(
-            id=device.id,
-            number_device=device.number_device,
-            group_device=device.group_device,
-            name_device=device.name_device,
-            type_device=device.type_device.value,
-            status=device.status.value,
-            is_enable=device.is_enable,
-            version=device.version,
-            device_groups=device_groups
-        )
-
-
-@router.get("", response_model=ApiResponse[list[MalfunctionEventResponse]])
+@router.get("", response_model=ApiCursorResponse[list[MalfunctionEventResponse]])
 async def get_malfunction_events(
     page: int = Query(1, ge=1, description="페이지 번호 (기본값: 1)"),
     limit: int = Query(20, ge=1, le=100, description="페이지당 항목 수 (기본값: 20, 최대: 100)"),
+    paging: str = Query("offset", pattern="^(offset|cursor)$", description="페이지네이션 방식 — offset(기본, page 사용) / cursor(keyset, 깊은 페이지도 일정 시간)"),
+    cursor: Optional[str] = Query(None, description="cursor 모드 다음 페이지 — 직전 응답의 cursor.next_cursor (지정 시 cursor 모드)"),
+    total: str = Query("none", pattern="^(none|estimate|exact)$", description="cursor 모드 전체 건수 — none(기본) / estimate(pg_class.reltuples 추정) / exact"),
     device_id: Optional[int] = Query(None, description="장치 ID로 필터링"),
     action_reported: Optional[str] = Query(None, description="조치보고 여부로 필터링"),
     reason: Optional[str] = Query(None, description="장애 원인으로 필터링"),
@@ -223,6 +74,9 @@ async def get_malfunction_events(
     **파라미터**:
     - **page**: 페이지 번호 (기본값: 1)
     - **limit**: 페이지당 항목 수 (기본값: 20, 최대: 100)
+    - **paging**: `offset`(기본) / `cursor` — keyset `(created_at, id)` 커서 (user-014)
+    - **cursor**: 직전 응답의 `cursor.next_cursor` (null 이 될 때까지 반복)
+    - **total**: cursor 모드 전체 건수 — `none`(기본) / `estimate` / `exact`
     - **device_id**: 장치 ID로 필터링
     - **action_reported**: 조치보고 여부로 필터링
     - **reason**: 장애 원인으로 필터링
@@ -253,20 +107,20 @@ async def get_malfunction_events(
         stmt = stmt.where(MalfunctionEvent.created_at <= end_date)
         count_stmt = count_stmt.where(MalfunctionEvent.created_at <= end_date)
 
-    # Get total count (필터 적용된 쿼리 기준)
-    total = (await db.execute(count_stmt)).scalar() or 0
+    # user-014: offset(종전) / keyset cursor 공용 페이지 조회
+    try:
+        events, pagination, cursor_meta = await fetch_event_page(
+            db, stmt, count_stmt, MalfunctionEvent, page=page, limit=limit,
+            paging=paging, cursor=cursor, total=total,
+        )
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        )
 
-    # Calculate pagination
-    skip = (page - 1) * limit
-    total_pages = math.ceil(total / limit) if total > 0 else 1
-
-    # Get paginated results (order by created_at desc)
-    result = await db.execute(
-        stmt.order_by(MalfunctionEvent.created_at.desc(), MalfunctionEvent.id.desc())
-        .offset(skip)
-        .limit(limit)
-    )
-    events = result.scalars().all()
+    # user-015: 페이지 전체 device_groups 를 IN 1쿼리로 선적재(이후 조립은 캐시 적중)
+    await device_group_loader(db).prime(e.device_id for e in events)
 
     # Convert to response format (PRD v2.1: group_event 제거됨, device nested and device_description 포함)
     # PRD v1.3: device_id, sequence 필드 제거 (device.id에 포함, sequence는 Request 전용)
@@ -278,7 +132,7 @@ async def get_malfunction_events(
             type_event=e.type_event,
             action_reported=e.action_reported.value if hasattr(e.action_reported, 'value') else e.action_reported,
             reason=e.reason.value,
-            device=await _build_device_nested_response(e.device, db),
+            device=await build_device_nested_response(e.device, db),
             device_description=e.device_description,
             detail=e.detail,
             created_at=e.created_at,
@@ -287,18 +141,12 @@ async def get_malfunction_events(
         for e in events
     ]
 
-    pagination = PaginationMeta(
-        page=page,
-        limit=limit,
-        total=total,
-        total_pages=total_pages
-    )
-
-    return ApiResponse(
+    return ApiCursorResponse(
         success=True,
         message="Malfunction events retrieved successfully",
         data=event_responses,
-        pagination=pagination
+        pagination=pagination,
+        cursor=cursor_meta,
     )
 
 
@@ -344,7 +192,7 @@ async def get_malfunction_event(
         type_event=event.type_event,
         action_reported=event.action_reported.value if hasattr(event.action_reported, 'value') else event.action_reported,
         reason=event.reason.value,
-        device=await _build_device_nested_response(event.device, db),
+        device=await build_device_nested_response(event.device, db),
         device_description=event.device_description,
         detail=event.detail,
         created_at=event.created_at,
@@ -460,7 +308,7 @@ async def create_malfunction_event(
         type_event=new_event.type_event,
         action_reported=new_event.action_reported.value if hasattr(new_event.action_reported, 'value') else new_event.action_reported,
         reason=new_event.reason.value,
-        device=await _build_device_nested_response(device, db),
+        device=await build_device_nested_response(device, db),
         device_description=new_event.device_description,
         detail=new_event.detail,
         created_at=new_event.created_at,
@@ -474,6 +322,32 @@ async def create_malfunction_event(
     )
 
 
+@router.post("/bulk", response_model=ApiSingleResponse[EventBulkResult], dependencies=[Depends(require_perm_optional_async("events", "edit"))])
+async def create_malfunction_events_bulk(
+    bulk_data: MalfunctionEventBulkCreate,
+    current_user = Depends(get_current_account_user_optional_async),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    장애 이벤트 일괄 생성 (user-022 — 탐지 서버 고빈도 수신)
+
+    단건 `POST` 와 같은 저장·억제·장비 상태·ConfigChangeLog 규칙을 N건 한 트랜잭션으로 처리합니다.
+
+    **Request Body**:
+    - **items**: 단건 생성 요청 배열 (1~500건)
+
+    **Response**: 항목별 결과(요청 순서) — `created`(id) / `suppressed`(schedule_id) / `failed`(error).
+    부분 성공(HTTP 200). device nested 는 포함하지 않습니다(필요 시 단건 GET).
+    """
+    result = await ingest_events_bulk(db, "malfunction", bulk_data.items)
+    return ApiSingleResponse(
+        success=True,
+        message=f"Malfunction events bulk processed: {result.created} created, "
+                f"{result.suppressed} suppressed, {result.failed} failed",
+        data=result
+    )
+
+
 @router.patch("/{event_id}", response_model=ApiSingleResponse[MalfunctionEventResponse], dependencies=[Depends(require_perm_optional_async("events", "edit"))])
 async def update_malfunction_event(
     event_id: int,
@@ -570,7 +444,7 @@ async def update_malfunction_event(
         type_event=event.type_event,
         action_reported=event.action_reported.value if hasattr(event.action_reported, 'value') else event.action_reported,
         reason=event.reason.value,
-        device=await _build_device_nested_response(event.device, db),
+        device=await build_device_nested_response(event.device, db),
         device_description=event.device_description,
         detail=event.detail,
         created_at=event.created_at,
@@ -661,7 +535,7 @@ async def replace_malfunction_event(
         type_event=event.type_event,
         action_reported=event.action_reported.value if hasattr(event.action_reported, 'value') else event.action_reported,
         reason=event.reason.value,
-        device=await _build_device_nested_response(event.device, db),
+        device=await build_device_nested_response(event.device, db),
         device_description=event.device_description,
         detail=event.detail,
         created_at=event.created_at,
@@ -784,7 +658,7 @@ async def get_action_events_for_malfunction(
         type_event=malfunction.type_event,
         action_reported=malfunction.action_reported.value if hasattr(malfunction.action_reported, 'value') else malfunction.action_reported,
         reason=malfunction.reason.value,
-        device=await _build_device_nested_response(malfunction.device, db),
+        device=await build_device_nested_response(malfunction.device, db),
         device_description=malfunction.device_description,
         detail=malfunction.detail,
         created_at=malfunction.created_at,
@@ -23,6 +23,7 @@ v6.0 P8-b (SessionLocal 완전 제거):
 - 백그라운드 생성: AsyncSessionLocal + ReportServiceAsync + build_master_data_async
   + render_report_html_async + asyncio.to_thread(html_to_pdf_bytes) 조합으로
   이벤트루프 논블로킹 실행.
+  (user-008: PDF 는 html_to_pdf_bytes_async — lifespan 상주 Chromium 풀 재사용)
 - Preview (JSON) / Preview page (HTML): 요청 AsyncSession 위에서 ReportServiceAsync
   및 async 마스터 빌더/렌더러 사용.
 """
@@ -553,7 +554,7 @@ async def _run_report_generation(generation_id: int) -> None:
     from app.database import AsyncSessionLocal
     from app.services.report_master_builder import build_master_data_async, build_report_meta
     from app.services.report_html_renderer import render_report_html_async
-    from app.utils.html_to_pdf import html_to_pdf_bytes
+    from app.utils.html_to_pdf import html_to_pdf_bytes_async
 
     # v6.0 후속: 현재 태스크를 dict에 등록 (cancel endpoint용)
     current = asyncio.current_task()
@@ -610,7 +611,7 @@ async def _run_report_generation(generation_id: int) -> None:
             html = await render_report_html_async(data, mode="full")
             await _progress(80, "html")
 
-            pdf_bytes = await asyncio.to_thread(html_to_pdf_bytes, html)
+            pdf_bytes = await html_to_pdf_bytes_async(html)
             await _progress(95, "pdf")
 
             reports_dir = settings.REPORTS_DIR
@@ -17,6 +17,7 @@ from app.schemas.device import SensorCreate, SensorResponse, SensorUpdate, Devic
 from app.schemas.device_group import DeviceGroupResponse
 from app.schemas.common import ApiResponse, ApiSingleResponse, PaginationMeta
 from app.services.config_log_service import log_config_change_async, get_identifier, get_changed_fields, model_to_dict
+from app.services.response_cache import cached
 
 router = APIRouter()
 
@@ -141,6 +142,7 @@ async def _sensor_to_response(sensor: Sensor, db: AsyncSession, include_controll
 
 
 @router.get("", response_model=ApiResponse[list[SensorResponse]])
+@cached("SYNC_DEVICE", "SYNC_DEVICE_GROUP")
 async def get_sensors(
     page: int = Query(1, ge=1, description="페이지 번호 (기본값: 1)"),
     limit: int = Query(20, ge=1, le=100, description="페이지당 항목 수 (기본값: 20, 최대: 100)"),
@@ -234,6 +236,7 @@ async def get_sensors(
 
 
 @router.get("/{sensor_id}", response_model=ApiSingleResponse[SensorResponse])
+@cached("SYNC_DEVICE", "SYNC_DEVICE_GROUP")
 async def get_sensor(
     sensor_id: int,
     include_controller: bool = Query(False, description="컨트롤러 정보 포함 여부"),
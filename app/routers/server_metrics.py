@@ -5,7 +5,7 @@ Based on PRD_System_Event.md Section 2.4
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy import select, func, delete
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import Optional
+from typing import Optional, Union
 from datetime import datetime
 from app.utils.datetime import to_utc, utc_now
 
@@ -19,7 +19,8 @@ from app.schemas.server import (
     ServerMetricsResponse,
     ServerMetricsLatestResponse
 )
-from app.schemas.common import ApiResponse, ApiSingleResponse
+from app.schemas.common import ApiResponse, ApiSingleResponse, MetricBucketResponse
+from app.services.metric_series_service import BUCKET_PATTERN, metric_series
 from app.config import settings
 
 router = APIRouter()
@@ -249,13 +250,17 @@ async def create_server_metrics(
 
 @router.get(
     "/{server_id}/metrics",
-    response_model=ApiResponse[list[ServerMetricsResponse]]
+    response_model=ApiResponse[list[Union[ServerMetricsResponse, MetricBucketResponse]]]
 )
 async def get_server_metrics(
     server_id: int,
     limit: int = Query(100, ge=1, le=1000, description="조회할 메트릭 수 (기본값: 100, 최대: 1000)"),
     start_time: Optional[datetime] = Query(None, description="시작 시간 (ISO 8601)"),
     end_time: Optional[datetime] = Query(None, description="종료 시간 (ISO 8601)"),
+    bucket: Optional[str] = Query(
+        None, pattern=BUCKET_PATTERN,
+        description="다운샘플 버킷(1m|5m|1h) — 지정 시 버킷별 min/avg/max/last 반환"
+    ),
     current_user=Depends(get_current_account_user_optional_async),
     db: AsyncSession = Depends(get_async_db)
 ):
@@ -269,8 +274,9 @@ async def get_server_metrics(
     - **limit**: 조회할 메트릭 수 (기본값: 100)
     - **start_time**: 시작 시간 필터 (ISO 8601)
     - **end_time**: 종료 시간 필터 (ISO 8601)
+    - **bucket**: 1m|5m|1h (user-017). limit = 최대 버킷 수, start_time 미지정 시 최근 limit 버킷
 
-    **Response**: 메트릭 목록 (최신순)
+    **Response**: 메트릭 목록 (최신순). bucket 지정 시 버킷 목록(시간 오름차순)
 
     **Error**:
     - 404: 서버를 찾을 수 없음
@@ -283,6 +289,13 @@ async def get_server_metrics(
             detail=f"Server with id {server_id} not found"
         )
 
+    if bucket:
+        return ApiResponse(
+            success=True,
+            message="Server metrics retrieved successfully (downsampled)",
+            data=await metric_series(db, "server", server_id, bucket, start=start_time, end=end_time, limit=limit)
+        )
+
     # 쿼리 빌드
     stmt = select(ServerMetrics).where(ServerMetrics.server_id == server_id)
 
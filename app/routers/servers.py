@@ -26,6 +26,7 @@ from app.schemas.server import (
     ServerCategorySummary
 )
 from app.schemas.common import ApiResponse, ApiSingleResponse, PaginationMeta
+from app.services.response_cache import cached
 
 router = APIRouter()
 
@@ -73,6 +74,7 @@ def _safe_server_to_response(server: Server) -> Optional[ServerResponse]:
 
 
 @router.get("/summary", response_model=ApiSingleResponse[list[ServerCategorySummary]])
+@cached("SYNC_SERVER", "SYNC_CATEGORY")
 async def get_server_summary(
     current_user=Depends(get_current_account_user_optional_async),
     db: AsyncSession = Depends(get_async_db)
@@ -133,6 +135,7 @@ async def get_server_summary(
 
 
 @router.get("", response_model=ApiResponse[list[ServerResponse]])
+@cached("SYNC_SERVER", "SYNC_CATEGORY")
 async def get_servers(
     page: int = Query(1, ge=1, description="페이지 번호 (기본값: 1)"),
     limit: int = Query(20, ge=1, le=100, description="페이지당 항목 수 (기본값: 20, 최대: 100)"),
@@ -197,6 +200,7 @@ async def get_servers(
 
 
 @router.get("/{server_id}", response_model=ApiSingleResponse[ServerResponse])
+@cached("SYNC_SERVER", "SYNC_CATEGORY")
 async def get_server(
     server_id: int,
     current_user=Depends(get_current_account_user_optional_async),
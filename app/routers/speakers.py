@@ -23,6 +23,7 @@ from app.schemas.device import SpeakerCreate, SpeakerUpdate, SpeakerResponse, De
 from app.schemas.server import ServerNestedResponse
 from app.schemas.common import ApiResponse, ApiSingleResponse, PaginationMeta
 from app.services.config_log_service import log_config_change_async, get_identifier, get_changed_fields, model_to_dict
+from app.services.response_cache import cached
 
 router = APIRouter()
 
@@ -135,6 +136,7 @@ async def _speaker_to_response(speaker: Speaker, db: AsyncSession) -> SpeakerRes
 
 
 @router.get("", response_model=ApiResponse[list[SpeakerResponse]])
+@cached("SYNC_DEVICE", "SYNC_DEVICE_GROUP", "SYNC_SERVER")
 async def get_speakers(
     page: int = Query(1, ge=1, description="페이지 번호 (기본값: 1)"),
     limit: int = Query(20, ge=1, le=100, description="페이지당 항목 수 (기본값: 20, 최대: 100)"),
@@ -203,6 +205,7 @@ async def get_speakers(
 
 
 @router.get("/{speaker_id}", response_model=ApiSingleResponse[SpeakerResponse])
+@cached("SYNC_DEVICE", "SYNC_DEVICE_GROUP", "SYNC_SERVER")
 async def get_speaker(
     speaker_id: int,
     current_user=Depends(get_current_account_user_optional_async),
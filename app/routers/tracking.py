@@ -3,25 +3,29 @@ Tracking History API endpoints (read-only)
 PRD: PRD_Tracking_History_API.md v1.0
 
 GET /api/tracking/points    — 구간 추적점 조회(keyset cursor 청크) — Playback 핵심
-GET /api/tracking/sessions  — 세션 목록(타임라인) — track_id 단위 파생 집계
+                              (resolution/max_points 지정 시 트랙별 서버 다운샘플 — user-005)
+GET /api/tracking/points/stream — 구간 전체 스트리밍(NDJSON / 컬럼형 바이너리, 서버측 커서) — user-007
+GET /api/tracking/sessions  — 세션 목록(타임라인) — track_sessions 요약 테이블(user-006)
 GET /api/tracking/health    — 가용성 게이팅(무인증)
 
 저장(인제스트)은 독립 워커 `gis-ingest`가 수행. 클라는 POST 하지 않는다.
 """
 from fastapi import APIRouter, Depends, HTTPException, status, Query
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from sqlalchemy import func, and_, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional, List
-from datetime import datetime
-from app.utils.datetime import to_utc, utc_now
+from datetime import datetime, timezone
+from app.utils.datetime import to_display, to_utc, utc_now
 import base64
+import json
 
+from app.config import settings
 from app.dependencies import get_async_db
 from app.routers.auth import get_current_account_user_optional_async
-from app.models.tracking import TrackPoint
+from app.models.tracking import TrackPoint, TrackSession
 from app.schemas.tracking import (
-    TrackPointResponse, TrackPointListResponse, CursorMeta, TrackSessionResponse,
+    TrackPointResponse, TrackPointListResponse, CursorMeta, TrackSessionResponse, DownsampleMeta,
 )
 from app.schemas.common import ApiResponse, KST
 
@@ -36,7 +40,9 @@ MAX_LIMIT = 5000
 # ============================================================
 
 def _encode_cursor(observed_at: datetime, row_id: int) -> str:
-    """(observed_at, id) → opaque base64 커서"""
+    """(observed_at, id) → opaque base64 커서. DB 반환 naive(SQLite)는 UTC 로 명시해 재바인딩 오해석 방지."""
+    if observed_at.tzinfo is None:
+        observed_at = observed_at.replace(tzinfo=timezone.utc)
     raw = f"{observed_at.isoformat()}|{row_id}"
     return base64.urlsafe_b64encode(raw.encode()).decode()
 
@@ -54,11 +60,33 @@ def _to_naive_kst(dt: Optional[datetime]) -> Optional[datetime]:
     return to_utc(dt)
 
 
-def _as_dt(v):
-    """SQLite 집계(func.min/max)가 문자열을 돌려줄 때 datetime 보정."""
-    if isinstance(v, str):
-        return datetime.fromisoformat(v)
-    return v
+def _epoch(dt: datetime) -> float:
+    """관측 시각 → epoch 초. SQLite 는 tz 를 버린 UTC 벽시계를 돌려주므로 naive 는 UTC 로 간주."""
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
+
+
+def _point_filters(stmt, *, camera_id, track_id, f, t, keyset=None):
+    """/points · /points/stream 공용 필터 + `(observed_at, id)` 오름차순 정렬."""
+    if camera_id is not None:
+        stmt = stmt.where(TrackPoint.camera_id == camera_id)
+    if track_id:
+        stmt = stmt.where(TrackPoint.track_id == track_id)
+    if f is not None:
+        stmt = stmt.where(TrackPoint.observed_at >= f)
+    if t is not None:
+        stmt = stmt.where(TrackPoint.observed_at <= t)
+    if keyset is not None:
+        c_ts, c_id = keyset
+        # keyset: (observed_at, id) > (c_ts, c_id) — SQLite/PG 호환 전개형
+        stmt = stmt.where(
+            or_(
+                TrackPoint.observed_at > c_ts,
+                and_(TrackPoint.observed_at == c_ts, TrackPoint.id > c_id),
+            )
+        )
+    return stmt.order_by(TrackPoint.observed_at.asc(), TrackPoint.id.asc())
 
 
 # ============================================================
@@ -77,6 +105,10 @@ async def get_track_points(
     track_id: Optional[str] = Query(None, description="단일 트랙 필터"),
     cursor: Optional[str] = Query(None, description="직전 응답의 next_cursor"),
     limit: int = Query(DEFAULT_LIMIT, ge=1, le=MAX_LIMIT, description="페이지 크기(기본 1000, 최대 5000)"),
+    resolution: Optional[float] = Query(
+        None, gt=0, description="다운샘플 허용오차(m) — 시공간 Douglas-Peucker(SED). 지정 시 다운샘플 모드"),
+    max_points: Optional[int] = Query(
+        None, ge=2, le=MAX_LIMIT, description="구간 전체 트랙별 최대 점 수(LTTB). 지정 시 다운샘플 모드"),
     current_user=Depends(get_current_account_user_optional_async),
     db: AsyncSession = Depends(get_async_db),
 ):
@@ -84,38 +116,33 @@ async def get_track_points(
     Playback 구간 추적점 조회. 정렬 `observed_at ASC, id ASC`, keyset 커서 페이지네이션.
 
     클라는 `cursor`가 null이 될 때까지 반복 조회해 구간 전체를 청크로 적재한다.
-    """
-    stmt = select(TrackPoint)
-
-    if camera_id is not None:
-        stmt = stmt.where(TrackPoint.camera_id == camera_id)
-    if track_id:
-        stmt = stmt.where(TrackPoint.track_id == track_id)
 
+    **다운샘플 모드**(`resolution` 또는 `max_points` 지정): 요청 구간 전체(`cursor` 지정 시 그 다음부터)를
+    한 응답으로 — 트랙별로 구간 전체에 걸쳐 한 번 형상 보존 다운샘플한 점만 반환한다(`limit` 무시,
+    트랙 양끝점 항상 유지, `max_points` 는 트랙당 상한). 페이지 경계가 없으므로 `next_cursor` 는 항상 null.
+    구간 원본이 `TRACKING_DOWNSAMPLE_MAX_SCAN` 행을 넘거나, 다운샘플 결과가 전 트랙 합계
+    `TRACKING_DOWNSAMPLE_MAX_RETURN` 점을 넘으면 400 — resolution 을 키우거나 max_points 를 주거나
+    from/to 를 좁힌다(원본 전체는 `/points/stream`).
+    """
     f = _to_naive_kst(from_)
     t = _to_naive_kst(to)
-    if f is not None:
-        stmt = stmt.where(TrackPoint.observed_at >= f)
-    if t is not None:
-        stmt = stmt.where(TrackPoint.observed_at <= t)
-
+    keyset = None
     if cursor:
         try:
-            c_ts, c_id = _decode_cursor(cursor)
+            keyset = _decode_cursor(cursor)
         except Exception:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Invalid cursor",
             )
-        # keyset: (observed_at, id) > (c_ts, c_id) — SQLite/PG 호환 전개형
-        stmt = stmt.where(
-            or_(
-                TrackPoint.observed_at > c_ts,
-                and_(TrackPoint.observed_at == c_ts, TrackPoint.id > c_id),
-            )
-        )
 
-    stmt = stmt.order_by(TrackPoint.observed_at.asc(), TrackPoint.id.asc()).limit(limit + 1)
+    def _filtered(stmt):
+        return _point_filters(stmt, camera_id=camera_id, track_id=track_id, f=f, t=t, keyset=keyset)
+
+    if resolution is not None or max_points is not None:
+        return await _downsampled_points(db, _filtered, resolution, max_points)
+
+    stmt = _filtered(select(TrackPoint)).limit(limit + 1)
 
     rows = (await db.execute(stmt)).scalars().all()
     has_more = len(rows) > limit
@@ -132,6 +159,202 @@ async def get_track_points(
     )
 
 
+_FETCH_CHUNK = 10000  # 2단계 id IN 조회 청크 — asyncpg 바인드 파라미터 상한(32767) 이하
+
+
+async def _downsampled_points(db: AsyncSession, filtered, resolution, max_points) -> TrackPointListResponse:
+    """다운샘플 모드 — 구간 전체를 트랙별로 한 번 다운샘플, 2단계 조회로 전체 행 적재를 피한다.
+
+    1) (id, track_id, observed_at, lat, lng) 경량 컬럼만 `TRACKING_DOWNSAMPLE_SCAN_LIMIT` 행씩 keyset 으로
+       끝까지 스캔해 numpy 배열로 누적(상한 `TRACKING_DOWNSAMPLE_MAX_SCAN`, 초과 시 400)
+       → 트랙별 numpy 다운샘플(스캔 청크 경계와 무관 — max_points 는 구간 전체 트랙당 상한)
+    2) 유지 점 합계가 `TRACKING_DOWNSAMPLE_MAX_RETURN` 을 넘으면 전체 행 적재 전에 400
+    3) 유지된 id 만 전체 컬럼 조회(관측 시각 범위 동반 → 파티션 pruning)
+    """
+    import numpy as np
+    from app.utils.trajectory import downsample_track
+
+    scan_limit = settings.TRACKING_DOWNSAMPLE_SCAN_LIMIT
+    max_scan = settings.TRACKING_DOWNSAMPLE_MAX_SCAN
+    cols = (TrackPoint.id, TrackPoint.track_id, TrackPoint.observed_at, TrackPoint.latitude, TrackPoint.longitude)
+    parts: list[tuple] = []
+    scanned = 0
+    keyset = None
+    lo = hi = None
+    while True:
+        stmt = filtered(select(*cols))
+        if keyset is not None:
+            c_ts, c_id = keyset
+            stmt = stmt.where(or_(
+                TrackPoint.observed_at > c_ts,
+                and_(TrackPoint.observed_at == c_ts, TrackPoint.id > c_id),
+            ))
+        page = (await db.execute(stmt.limit(scan_limit))).all()
+        if not page:
+            break
+        scanned += len(page)
+        if scanned > max_scan:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Downsample range exceeds {max_scan} points — narrow from/to or use /points/stream",
+            )
+        n = len(page)
+        parts.append((
+            np.fromiter((r.id for r in page), dtype=np.int64, count=n),
+            np.fromiter((_epoch(r.observed_at) for r in page), dtype=np.float64, count=n),
+            np.fromiter((r.latitude for r in page), dtype=np.float64, count=n),
+            np.fromiter((r.longitude for r in page), dtype=np.float64, count=n),
+            [r.track_id for r in page],
+        ))
+        if lo is None:
+            lo = page[0].observed_at
+        hi = page[-1].observed_at
+        if n < scan_limit:
+            break
+        # SQLite naive(UTC) 재바인딩 오해석 방지 — aware UTC 로
+        keyset = (datetime.fromtimestamp(_epoch(page[-1].observed_at), timezone.utc), page[-1].id)
+
+    kept_ids: list[int] = []
+    n_tracks = 0
+    if parts:
+        ids, ts, lat, lng = (np.concatenate([p[k] for p in parts]) for k in range(4))
+        _, track_codes = np.unique([tid for p in parts for tid in p[4]], return_inverse=True)
+        # 트랙별 분할 — stable 정렬이라 트랙 내 (observed_at, id) 순서 유지
+        order = np.argsort(track_codes, kind="stable")
+        bounds = np.flatnonzero(np.diff(track_codes[order])) + 1
+        groups = np.split(order, bounds)
+        n_tracks = len(groups)
+        for g in groups:
+            keep = downsample_track(ts[g], lat[g], lng[g], resolution=resolution, max_points=max_points)
+            kept_ids.extend(ids[g[keep]].tolist())
+
+    max_return = settings.TRACKING_DOWNSAMPLE_MAX_RETURN
+    if len(kept_ids) > max_return:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=(f"Downsampled result {len(kept_ids)} points exceeds {max_return} — "
+                    "increase resolution, set max_points or narrow from/to"),
+        )
+
+    rows: list = []
+    if kept_ids:
+        # 스캔 관측 범위(aware UTC) — SQLite naive(UTC) 가 DISPLAY_TZ 로 오해석되지 않도록 epoch 경유
+        lo = datetime.fromtimestamp(_epoch(lo), timezone.utc)
+        hi = datetime.fromtimestamp(_epoch(hi), timezone.utc)
+        for i in range(0, len(kept_ids), _FETCH_CHUNK):
+            chunk = kept_ids[i:i + _FETCH_CHUNK]
+            stmt = select(TrackPoint).where(
+                TrackPoint.id.in_(chunk),
+                TrackPoint.observed_at >= lo,
+                TrackPoint.observed_at <= hi,
+            )
+            rows.extend((await db.execute(stmt)).scalars().all())
+        rows.sort(key=lambda r: (_epoch(r.observed_at), r.id))
+
+    return TrackPointListResponse(
+        success=True,
+        message="Track points retrieved (downsampled)",
+        data=[TrackPointResponse.model_validate(r) for r in rows],
+        cursor=CursorMeta(next_cursor=None, limit=scan_limit, has_more=False),
+        downsample=DownsampleMeta(
+            resolution=resolution, max_points=max_points,
+            scanned=scanned, returned=len(rows), tracks=n_tracks,
+        ),
+    )
+
+
+# ============================================================
+# GET /api/tracking/points/stream
+# ============================================================
+
+STREAM_CHUNK = 5000  # 서버측 커서 fetch 단위(행) = NDJSON 청크 / 바이너리 프레임 크기
+
+_STREAM_COLUMNS = (
+    TrackPoint.id, TrackPoint.camera_id, TrackPoint.track_id, TrackPoint.label, TrackPoint.threat_level,
+    TrackPoint.latitude, TrackPoint.longitude, TrackPoint.distance_m, TrackPoint.confidence,
+    TrackPoint.observed_at, TrackPoint.tracking_state, TrackPoint.speed_mps, TrackPoint.session_seq,
+)
+
+
+def _ndjson_line(r) -> str:
+    """Row → NDJSON 1줄. 필드는 TrackPointResponse 와 동일(observed_at = DISPLAY_TZ ISO8601)."""
+    observed = r.observed_at
+    if observed.tzinfo is None:
+        observed = observed.replace(tzinfo=timezone.utc)  # SQLite naive = UTC
+    return json.dumps({
+        "id": r.id,
+        "camera_id": r.camera_id,
+        "track_id": r.track_id,
+        "label": r.label,
+        "threat_level": r.threat_level,
+        "latitude": r.latitude,
+        "longitude": r.longitude,
+        "distance_m": r.distance_m,
+        "confidence": r.confidence,
+        "observed_at": to_display(observed).isoformat(),
+        "tracking_state": r.tracking_state,
+        "speed_mps": r.speed_mps,
+        "session_seq": r.session_seq,
+    }, ensure_ascii=False, separators=(",", ":")) + "\n"
+
+
+@router.get(
+    "/points/stream",
+    summary="추적점 구간 스트리밍 (NDJSON / 컬럼형 바이너리)",
+    response_class=StreamingResponse,
+)
+async def stream_track_points(
+    from_: Optional[datetime] = Query(None, alias="from", description="구간 시작(observed_at ≥, ISO8601)"),
+    to: Optional[datetime] = Query(None, description="구간 종료(observed_at ≤, ISO8601)"),
+    camera_id: Optional[int] = Query(None, description="카메라 필터"),
+    track_id: Optional[str] = Query(None, description="단일 트랙 필터"),
+    format: str = Query("ndjson", pattern="^(ndjson|binary)$", description="ndjson | binary"),
+    current_user=Depends(get_current_account_user_optional_async),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    구간 전체를 커서 페이지 왕복 없이 한 응답으로 스트리밍한다(user-007).
+
+    - 서버측 커서(`AsyncSession.stream`)로 `STREAM_CHUNK` 행씩 fetch — 전체 적재·ORM/Pydantic 변환 없음.
+    - `format=ndjson`: `application/x-ndjson`, 1행 1 JSON(필드 = `/points` 의 data 원소).
+    - `format=binary`: `application/vnd.gop.trackpoints` 컬럼형 프레임(형식: app/utils/track_frames.py).
+    - 정렬 `observed_at ASC, id ASC`. 클라이언트가 끊으면 커서도 닫힌다.
+    - 커서는 본문 생성기 안에서 여는 전용 세션에서 연다 — yield 의존성(`get_async_db`) 세션은 FastAPI
+      버전(0.106~0.117)에 따라 본문 스트리밍 전에 정리되므로 핸들러 반환 뒤에는 쓰지 않는다.
+    """
+    bind = db.bind  # 요청 세션과 같은 엔진(테스트 오버라이드 포함) — 세션 자체는 넘기지 않는다
+    stmt = _point_filters(
+        select(*_STREAM_COLUMNS),
+        camera_id=camera_id, track_id=track_id, f=_to_naive_kst(from_), t=_to_naive_kst(to),
+    ).execution_options(yield_per=STREAM_CHUNK)
+
+    async def _chunks():
+        async with AsyncSession(bind=bind) as stream_db:
+            result = await stream_db.stream(stmt)
+            try:
+                async for part in result.partitions(STREAM_CHUNK):
+                    yield part
+            finally:
+                await result.close()
+
+    if format == "binary":
+        from app.utils import track_frames
+
+        async def _binary():
+            yield track_frames.preamble()
+            async for part in _chunks():
+                yield track_frames.encode_frame(part)
+            yield track_frames.end_frame()
+
+        return StreamingResponse(_binary(), media_type=track_frames.MEDIA_TYPE)
+
+    async def _ndjson():
+        async for part in _chunks():
+            yield "".join(_ndjson_line(r) for r in part).encode("utf-8")
+
+    return StreamingResponse(_ndjson(), media_type="application/x-ndjson")
+
+
 # ============================================================
 # GET /api/tracking/sessions
 # ============================================================
@@ -149,45 +372,28 @@ async def get_track_sessions(
     db: AsyncSession = Depends(get_async_db),
 ):
     """
-    track_id(+camera_id) 단위로 `MIN/MAX(observed_at)`·`COUNT(*)`를 집계한 세션 목록.
-    별도 세션 테이블 없이 추적점에서 파생한다. from/to는 구간 내 추적점만 집계한다.
+    track_id(+camera_id) 단위 세션 목록 — `track_sessions` 요약 테이블에서 읽는다(user-006).
+
+    요약은 gis-ingest 가 배치 적재 시 증분 갱신하므로 원본 이력 크기와 무관하게 일정 비용.
+    from/to 는 구간과 **겹치는** 세션을 고른다(`end_at ≥ from`, `start_at ≤ to`).
+    start_at/end_at/point_count 는 세션 전체 기준이다(구간 잘림 없음). 보존 기준에 걸친 세션은
+    보존 회차마다 남은 원본 기준으로 재계산된다.
     """
-    stmt = select(
-        TrackPoint.track_id.label("track_id"),
-        TrackPoint.camera_id.label("camera_id"),
-        func.max(TrackPoint.label).label("label"),
-        func.min(TrackPoint.observed_at).label("start_at"),
-        func.max(TrackPoint.observed_at).label("end_at"),
-        func.count(TrackPoint.id).label("point_count"),
-        func.max(TrackPoint.session_seq).label("session_seq"),
-    )
+    stmt = select(TrackSession)
 
     f = _to_naive_kst(from_)
     t = _to_naive_kst(to)
     if f is not None:
-        stmt = stmt.where(TrackPoint.observed_at >= f)
+        stmt = stmt.where(TrackSession.end_at >= f)
     if t is not None:
-        stmt = stmt.where(TrackPoint.observed_at <= t)
+        stmt = stmt.where(TrackSession.start_at <= t)
     if camera_id is not None:
-        stmt = stmt.where(TrackPoint.camera_id == camera_id)
+        stmt = stmt.where(TrackSession.camera_id == camera_id)
 
-    stmt = stmt.group_by(TrackPoint.track_id, TrackPoint.camera_id).order_by(
-        func.min(TrackPoint.observed_at).asc()
-    )
+    stmt = stmt.order_by(TrackSession.start_at.asc(), TrackSession.id.asc())
 
-    rows = (await db.execute(stmt)).all()
-    data = [
-        TrackSessionResponse(
-            track_id=r.track_id,
-            camera_id=r.camera_id,
-            label=r.label,
-            start_at=_as_dt(r.start_at),
-            end_at=_as_dt(r.end_at),
-            point_count=r.point_count,
-            session_seq=r.session_seq,
-        )
-        for r in rows
-    ]
+    rows = (await db.execute(stmt)).scalars().all()
+    data = [TrackSessionResponse.model_validate(r) for r in rows]
 
     return ApiResponse(
         success=True,
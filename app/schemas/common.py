@@ -90,6 +90,40 @@ class ApiResponse(BaseModel, Generic[T]):
         return values
 
 
+class CursorPaginationMeta(BaseModel):
+    """keyset 커서 페이지네이션 메타 (user-014 — 이벤트 목록 `paging=cursor`)"""
+    next_cursor: Optional[str] = Field(
+        None,
+        description="다음 페이지 커서(opaque). null이면 마지막 페이지",
+        json_schema_extra={"example": "MjAyNi0xMC0xN1QwNTozNDoxMSswMDowMHwxMDAxMjM="}
+    )
+    limit: int = Field(..., ge=1, description="요청 페이지 크기", json_schema_extra={"example": 20})
+    has_more: bool = Field(False, description="다음 페이지 존재 여부")
+    total: Optional[int] = Field(None, ge=0, description="전체 건수 (total=none 이면 null)")
+    total_estimated: bool = Field(False, description="total 이 통계 기반 추정치(pg_class.reltuples)인지 여부")
+
+
+class ApiCursorResponse(ApiResponse[T], Generic[T]):
+    """목록 응답 + keyset 커서 메타. offset 모드면 cursor=null, cursor 모드면 pagination=null."""
+    cursor: Optional[CursorPaginationMeta] = None
+
+
+class MetricAggregate(BaseModel):
+    """메트릭 1개의 버킷 집계 (user-017). count=0 이면 나머지 null."""
+    count: int = Field(0, ge=0, description="버킷 내 값이 있는 샘플 수")
+    min: Optional[float] = None
+    avg: Optional[float] = None
+    max: Optional[float] = None
+    last: Optional[float] = Field(None, description="버킷 내 마지막 샘플의 값")
+
+
+class MetricBucketResponse(BaseModel):
+    """다운샘플 시계열 1포인트 (user-017 — 함체/서버 메트릭 `bucket=1m|5m|1h`)"""
+    bucket_start: KSTDatetime = Field(..., description="버킷 시작 시각(UTC 기준 정렬, 포함)")
+    sample_count: int = Field(0, ge=0, description="메트릭별 count 중 최댓값")
+    metrics: Dict[str, MetricAggregate] = Field(default_factory=dict, description="메트릭명 → 집계")
+
+
 class ErrorDetail(BaseModel):
     """Error detail structure"""
     code: str = Field(..., description="에러 코드", json_schema_extra={"example": "NOT_FOUND"})
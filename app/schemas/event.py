@@ -542,6 +542,56 @@ class DetectionLogResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+# =============================================================================
+# user-022: 고빈도 일괄 수신 — POST /api/events/{detections|malfunctions|connections}/bulk
+# =============================================================================
+
+EVENT_BULK_MAX_ITEMS = 500
+
+
+class DetectionEventBulkCreate(BaseModel):
+    """탐지 이벤트 일괄 생성 요청 (1~500건). 항목은 단건 DetectionEventCreate 와 동일."""
+    items: List[DetectionEventCreate] = Field(
+        ..., min_length=1, max_length=EVENT_BULK_MAX_ITEMS,
+        description=f"일괄 생성할 탐지 이벤트 (1~{EVENT_BULK_MAX_ITEMS})",
+    )
+
+
+class MalfunctionEventBulkCreate(BaseModel):
+    """장애 이벤트 일괄 생성 요청 (1~500건). 항목은 단건 MalfunctionEventCreate 와 동일."""
+    items: List[MalfunctionEventCreate] = Field(
+        ..., min_length=1, max_length=EVENT_BULK_MAX_ITEMS,
+        description=f"일괄 생성할 장애 이벤트 (1~{EVENT_BULK_MAX_ITEMS})",
+    )
+
+
+class ConnectionEventBulkCreate(BaseModel):
+    """연결 이벤트 일괄 생성 요청 (1~500건). 항목은 단건 ConnectionEventCreate 와 동일."""
+    items: List[ConnectionEventCreate] = Field(
+        ..., min_length=1, max_length=EVENT_BULK_MAX_ITEMS,
+        description=f"일괄 생성할 연결 이벤트 (1~{EVENT_BULK_MAX_ITEMS})",
+    )
+
+
+class EventBulkItemResult(BaseModel):
+    """일괄 생성 항목별 결과 — 요청 items 순서 그대로(index = 0-based)."""
+    index: int = Field(..., description="요청 items 내 0-based 인덱스", json_schema_extra={"example": 0})
+    status: Literal["created", "suppressed", "failed"] = Field(
+        ..., description="created(저장) / suppressed(억제 창 매치, 무저장) / failed(검증 실패, 무저장)",
+    )
+    id: Optional[int] = Field(None, description="생성된 이벤트 ID (created 만)", json_schema_extra={"example": 1001})
+    schedule_id: Optional[int] = Field(None, description="매치된 억제 스케줄 ID (suppressed 만)")
+    error: Optional[str] = Field(None, description="실패 사유 (failed 만)", json_schema_extra={"example": "Device with id 9 not found"})
+
+
+class EventBulkResult(BaseModel):
+    """일괄 생성 결과 (부분 성공) — device nested 없이 항목별 결과만(대량 응답 경량화)."""
+    created: int = Field(0, ge=0, description="저장된 건수")
+    suppressed: int = Field(0, ge=0, description="억제된 건수")
+    failed: int = Field(0, ge=0, description="실패 건수")
+    items: List[EventBulkItemResult] = Field(default_factory=list, description="항목별 결과")
+
+
 # Forward reference resolution for Nested Response schemas
 # This must be done after all classes are defined
 from app.schemas.device import DeviceNestedResponse, SensorNestedResponse, ControllerNestedResponse, CameraNestedResponse, SpeakerNestedResponse, LampNestedResponse
@@ -23,6 +23,15 @@ class CursorMeta(BaseModel):
     has_more: bool = Field(False, description="다음 페이지 존재 여부")
 
 
+class DownsampleMeta(BaseModel):
+    """다운샘플 모드 메타(user-005) — resolution/max_points 지정 시에만 채워진다"""
+    resolution: Optional[float] = Field(None, description="SED Douglas-Peucker 허용오차(m)")
+    max_points: Optional[int] = Field(None, description="구간 전체 트랙별 최대 점 수(LTTB)")
+    scanned: int = Field(..., description="구간에서 스캔한 원본 추적점 수", json_schema_extra={"example": 100000})
+    returned: int = Field(..., description="다운샘플 후 반환 점 수", json_schema_extra={"example": 1840})
+    tracks: int = Field(..., description="구간 내 트랙 수", json_schema_extra={"example": 3})
+
+
 # ============================================================
 # Response Schemas
 # ============================================================
@@ -52,11 +61,14 @@ class TrackPointListResponse(BaseModel):
     message: str
     data: List[TrackPointResponse]
     cursor: CursorMeta
+    downsample: Optional[DownsampleMeta] = None
     meta: ResponseMeta = Field(default_factory=ResponseMeta)
 
 
 class TrackSessionResponse(BaseModel):
-    """추적 세션(타임라인) — track_id 단위 파생 집계(별도 테이블 없음)"""
+    """추적 세션(타임라인) — track_sessions 요약 테이블 1행(user-006)"""
+    model_config = ConfigDict(from_attributes=True)
+
     track_id: str = Field(..., json_schema_extra={"example": "cam201-1738750245-007"})
     camera_id: int = Field(..., json_schema_extra={"example": 201})
     label: Optional[str] = Field(None, json_schema_extra={"example": "person"})
@@ -64,3 +76,7 @@ class TrackSessionResponse(BaseModel):
     end_at: KSTDatetime = Field(..., json_schema_extra={"example": "2026-02-05T19:34:11+09:00"})
     point_count: int = Field(..., json_schema_extra={"example": 251})
     session_seq: Optional[int] = Field(None, json_schema_extra={"example": None})
+    min_latitude: Optional[float] = Field(None, description="bbox 남단", json_schema_extra={"example": 38.1201})
+    max_latitude: Optional[float] = Field(None, description="bbox 북단", json_schema_extra={"example": 38.1262})
+    min_longitude: Optional[float] = Field(None, description="bbox 서단", json_schema_extra={"example": 127.5644})
+    max_longitude: Optional[float] = Field(None, description="bbox 동단", json_schema_extra={"example": 127.5703})
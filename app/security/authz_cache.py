@@ -0,0 +1,276 @@
+"""
+인가 결정 캐시 — enforce_matrix 요청당 DB 왕복 제거 (user-001)
+
+enforce_matrix 는 매 요청마다 JWT 디코드 + token_blacklist 조회 + AccountUser / UserGroup /
+활성 grant(selectinload) SELECT 를 수행했다(요청당 4~5 왕복). 본 모듈은 그 결과를 프로세스 메모리에
+고정해 두 번째 요청부터 **DB 무접촉**으로 allow/deny 를 판정한다.
+
+- 토큰 캐시: raw Bearer → (login_id, jti, exp). 디코드·블랙리스트 조회 생략. exp 경과 시 자동 만료.
+- 결정 캐시: login_id → AuthzDecision(user_id, role, 유효권한 (module, verb) 집합).
+- 버전: 전역 버전 + 사용자별 버전. 항목은 적재 시점 버전을 기억하고, 조회 시 현재 버전과 다르면 stale(miss).
+  * AccountUser / UserGroupGrant 쓰기 → 해당 사용자 버전 bump
+  * UserGroup 쓰기 · bulk UPDATE/DELETE → 전역 버전 bump (그룹은 누구의 권한 원천인지 모름)
+  * TokenBlacklist INSERT → 해당 jti 토큰 항목 즉시 제거 + 사용자 버전 bump
+  무효화는 ORM 세션 이벤트(after_flush 수집 → after_commit 적용)로 배선 — 호출부 수정 불필요.
+  commit 전에 bump 하면 동시 요청이 구 커밋 데이터로 재적재해 영구 stale 이 되므로 반드시 commit 후.
+- 만료: 다음 grant 경계(활성 grant valid_until · 미래 grant valid_from 중 최소) 또는
+  AUTHZ_CACHE_TTL_SECONDS(프로세스 밖 쓰기 — 수동 SQL·마이그 — 에 대한 상한) 중 이른 시각.
+
+★ 단일 인스턴스 가정(settings_service / token_blacklist_service 캐시와 동일). 멀티 워커 배포 시
+  TTL 이 다른 워커의 쓰기 반영 지연 상한이 된다.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from itertools import chain
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.config import settings
+
+
+@dataclass(frozen=True)
+class AuthzDecision:
+    """사용자 1명의 요청시점 유효권한 스냅샷 — ORM 비의존(세션 종료 후에도 안전)."""
+    user_id: int
+    login_id: str
+    role: str
+    allows: frozenset  # {(module, verb)} — 등급 매트릭스 ∪ 유효 grant 그룹 매트릭스
+
+    def allows_perm(self, module: str, verb: str) -> bool:
+        return (module, verb) in self.allows
+
+
+@dataclass
+class _TokenEntry:
+    login_id: str
+    jti: Optional[str]
+    expires_at: float  # epoch — min(JWT exp, now + TTL)
+
+
+@dataclass
+class _DecisionEntry:
+    decision: AuthzDecision
+    global_version: int
+    user_version: int
+    expires_at: float  # epoch — min(다음 grant 경계, now + TTL)
+
+
+_lock = threading.Lock()
+_global_version: int = 0
+_write_seq: int = 0  # 모든 무효화마다 증가 — 조회~적재 사이 쓰기 감지용
+_user_versions: dict[int, int] = {}
+_tokens: dict[str, _TokenEntry] = {}
+_decisions: dict[str, _DecisionEntry] = {}
+_stats: dict[str, int] = {"hits": 0, "misses": 0, "stores": 0, "invalidations": 0, "evictions": 0}
+
+_PENDING_KEY = "_authz_cache_pending"
+_GLOBAL = object()  # pending 집합 내 "전역 bump" 표식
+
+
+def _enabled() -> bool:
+    return bool(getattr(settings, "AUTHZ_CACHE_ENABLED", True))
+
+
+def _epoch(value: datetime) -> float:
+    """DB 시각 → epoch. sqlite 는 tz 를 버리고 UTC 벽시계를 돌려주므로 naive 는 UTC 로 간주."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+def _evict_if_full(store: dict) -> None:
+    """상한 초과 시 가장 오래 적재된 항목부터 제거(dict 삽입순서 = FIFO)."""
+    limit = max(1, int(getattr(settings, "AUTHZ_CACHE_MAX_ENTRIES", 10000)))
+    while len(store) >= limit:
+        store.pop(next(iter(store)))
+        _stats["evictions"] += 1
+
+
+def snapshot() -> int:
+    """DB 조회 **전에** 떠 두는 쓰기 시퀀스 — store() 시점까지 무효화가 끼어들었으면 적재를 포기한다."""
+    with _lock:
+        return _write_seq
+
+
+def lookup(token: str) -> Optional[AuthzDecision]:
+    """Bearer 토큰으로 캐시된 결정 조회. 없음/만료/버전 불일치 → None(miss)."""
+    if not _enabled():
+        return None
+    now = time.time()
+    with _lock:
+        tok = _tokens.get(token)
+        if tok is None or tok.expires_at <= now:
+            if tok is not None:
+                _tokens.pop(token, None)
+            _stats["misses"] += 1
+            return None
+        entry = _decisions.get(tok.login_id)
+        if (
+            entry is None
+            or entry.expires_at <= now
+            or entry.global_version != _global_version
+            or entry.user_version != _user_versions.get(entry.decision.user_id, 0)
+        ):
+            if entry is not None:
+                _decisions.pop(tok.login_id, None)
+            _stats["misses"] += 1
+            return None
+        _stats["hits"] += 1
+        return entry.decision
+
+
+def store(
+    token: str,
+    *,
+    jti: Optional[str],
+    token_exp: Optional[float],
+    decision: AuthzDecision,
+    boundary: Optional[datetime],
+    seq: int,
+) -> bool:
+    """결정 적재. seq 는 DB 조회 전 snapshot() 값 — 그 사이 커밋된 쓰기가 있으면 적재하지 않는다(False).
+
+    조회 결과가 이미 구버전일 수 있는데 현재 버전을 달아 적재하면 영구 stale 이 되기 때문.
+    """
+    if not _enabled():
+        return False
+    now = time.time()
+    ttl_until = now + max(0, int(getattr(settings, "AUTHZ_CACHE_TTL_SECONDS", 60)))
+    decision_until = min(ttl_until, _epoch(boundary)) if boundary is not None else ttl_until
+    token_until = min(ttl_until, token_exp) if token_exp is not None else ttl_until
+    with _lock:
+        if seq != _write_seq:
+            return False
+        if token not in _tokens:
+            _evict_if_full(_tokens)
+        _tokens[token] = _TokenEntry(login_id=decision.login_id, jti=jti, expires_at=token_until)
+        if decision.login_id not in _decisions:
+            _evict_if_full(_decisions)
+        _decisions[decision.login_id] = _DecisionEntry(
+            decision=decision,
+            global_version=_global_version,
+            user_version=_user_versions.get(decision.user_id, 0),
+            expires_at=decision_until,
+        )
+        _stats["stores"] += 1
+        return True
+
+
+def invalidate_user(user_id: Optional[int]) -> None:
+    """사용자 1명의 결정 무효화(버전 bump). user_id 미상(None)이면 전역 무효화."""
+    global _global_version, _write_seq
+    with _lock:
+        _write_seq += 1
+        if user_id is None:
+            _global_version += 1
+        else:
+            _user_versions[user_id] = _user_versions.get(user_id, 0) + 1
+        _stats["invalidations"] += 1
+
+
+def invalidate_all() -> None:
+    """전역 무효화(그룹 매트릭스 변경 등)."""
+    invalidate_user(None)
+
+
+def forget_jti(jti: str) -> None:
+    """블랙리스트 등재된 jti 의 토큰 항목 제거 — 다음 요청은 DB 경로로 SESSION_REVOKED 판정."""
+    global _write_seq
+    with _lock:
+        _write_seq += 1
+        for token in [t for t, e in _tokens.items() if e.jti == jti]:
+            _tokens.pop(token, None)
+
+
+def clear() -> None:
+    """전체 비움 + 카운터 리셋(테스트 격리용)."""
+    global _global_version, _write_seq
+    with _lock:
+        _tokens.clear()
+        _decisions.clear()
+        _user_versions.clear()
+        _global_version = 0
+        _write_seq = 0
+        for key in _stats:
+            _stats[key] = 0
+
+
+def get_stats() -> dict:
+    """hit/miss 카운터 + 현재 적재 수(진단/모니터링 용도, 프로세스 재시작 시 리셋)."""
+    with _lock:
+        total = _stats["hits"] + _stats["misses"]
+        return {
+            **_stats,
+            "tokens": len(_tokens),
+            "decisions": len(_decisions),
+            "hit_ratio": round(_stats["hits"] / total, 4) if total else None,
+        }
+
+
+# ─── ORM 세션 이벤트 — 쓰기 감지 → commit 후 무효화 ─────────────────
+def _pending(session: Session) -> set:
+    return session.info.setdefault(_PENDING_KEY, set())
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_flushed(session: Session, flush_context) -> None:
+    from app.models.user import AccountUser, UserGroup, UserGroupGrant
+    from app.models.token_blacklist import TokenBlacklist
+
+    pending = None
+    for obj in chain(session.new, session.dirty, session.deleted):
+        if isinstance(obj, AccountUser):
+            key = obj.id
+        elif isinstance(obj, UserGroupGrant):
+            key = obj.user_id
+        elif isinstance(obj, UserGroup):
+            key = _GLOBAL
+        elif isinstance(obj, TokenBlacklist):
+            key = ("jti", obj.jti, obj.user_id)
+        else:
+            continue
+        if pending is None:
+            pending = _pending(session)
+        pending.add(_GLOBAL if key is None else key)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _collect_bulk(orm_execute_state) -> None:
+    if not (orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+    from app.models.user import AccountUser, UserGroup, UserGroupGrant
+    from app.models.token_blacklist import TokenBlacklist
+
+    watched = (AccountUser, UserGroup, UserGroupGrant, TokenBlacklist)
+    if any(m.class_ in watched for m in orm_execute_state.all_mappers):
+        _pending(orm_execute_state.session).add(_GLOBAL)
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_committed(session: Session) -> None:
+    pending = session.info.pop(_PENDING_KEY, None)
+    if not pending:
+        return
+    if _GLOBAL in pending:
+        invalidate_all()
+    for key in pending:
+        if key is _GLOBAL:
+            continue
+        if isinstance(key, tuple):
+            _, jti, user_id = key
+            if jti:
+                forget_jti(jti)
+            invalidate_user(user_id)
+        else:
+            invalidate_user(key)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_rolled_back(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
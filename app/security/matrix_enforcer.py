@@ -13,7 +13,7 @@ from __future__ import annotations
 from fastapi import Request, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 from sqlalchemy.ext.asyncio import AsyncSession
-from jose import JWTError
+from jose import JWTError, jwt
 
 from app.dependencies import get_db, get_async_db
 from app.security.permission_map import lookup_permission
@@ -105,6 +105,58 @@ async def _resolve_user_from_request_async(request: Request, db: AsyncSession):
     return user
 
 
+def _bearer_token(request: Request) -> str | None:
+    auth_header = request.headers.get("Authorization") or request.headers.get("authorization")
+    if not auth_header or not auth_header.lower().startswith("bearer "):
+        return None
+    return auth_header.split(" ", 1)[1].strip()
+
+
+async def _resolve_decision_async(request: Request, db: AsyncSession):
+    """Bearer 토큰 → AuthzDecision (없으면 None) — user-001 결정 캐시 경유.
+
+    hit: DB 무접촉(디코드·블랙리스트·사용자·그룹·grant 조회 전부 생략).
+    miss: `_resolve_user_from_request_async` 로 기존과 동일 판정(401/SESSION_REVOKED 포함) 후 적재.
+    실패(None)·예외 결과는 적재하지 않는다 — 거부 경로는 매번 DB 권위로 재판정.
+    """
+    from app.security import authz_cache
+
+    token = _bearer_token(request)
+    if token is None:
+        return None
+    cached = authz_cache.lookup(token)
+    if cached is not None:
+        return cached
+
+    # 쓰기 시퀀스는 조회 **전에** 고정 — 조회 도중 커밋된 쓰기가 있으면 적재를 건너뛴다(다음 요청 재조회).
+    seq = authz_cache.snapshot()
+    user = await _resolve_user_from_request_async(request, db)
+    if user is None:
+        return None
+
+    if user.role == "ADMIN":
+        allows, boundary = frozenset(), None
+    else:
+        from app.routers.auth import effective_allow_set_async
+        allows, boundary = await effective_allow_set_async(db, user)
+    decision = authz_cache.AuthzDecision(
+        user_id=user.id, login_id=user.login_id, role=user.role, allows=allows,
+    )
+    try:
+        claims = jwt.get_unverified_claims(token)  # 서명·exp 는 위 decode_token 에서 이미 검증됨
+    except JWTError:
+        claims = {}
+    authz_cache.store(
+        token,
+        jti=claims.get("jti"),
+        token_exp=claims.get("exp"),
+        decision=decision,
+        boundary=boundary,
+        seq=seq,
+    )
+    return decision
+
+
 async def enforce_matrix(request: Request, db: AsyncSession = Depends(get_async_db)):
     """전역 매트릭스 집행 의존성.
 
@@ -139,20 +191,19 @@ async def enforce_matrix(request: Request, db: AsyncSession = Depends(get_async_
         )
 
     module, verb = perm
-    user = await _resolve_user_from_request_async(request, db)
-    if user is None:
+    decision = await _resolve_decision_async(request, db)
+    if decision is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Authentication required",
             headers={"WWW-Authenticate": "Bearer"},
         )
-    if user.role == "ADMIN":
+    if decision.role == "ADMIN":
         return  # ADMIN bypass — 매트릭스 무관
 
-    # 유효권한 = 등급 매트릭스 ∪ 현재 유효 grant (요청시점)
-    from app.routers.auth import _effective_allows_async
-    if not await _effective_allows_async(db, user, module, verb):
+    # 유효권한 = 등급 매트릭스 ∪ 현재 유효 grant (요청시점 — 캐시 만료가 다음 grant 경계에 맞춰짐)
+    if not decision.allows_perm(module, verb):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
-            detail=f"Insufficient permission: requires {module}:{verb} (role: {user.role})",
+            detail=f"Insufficient permission: requires {module}:{verb} (role: {decision.role})",
         )
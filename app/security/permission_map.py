@@ -37,11 +37,13 @@ PERMISSION_MAP: dict[Tuple[str, str], Tuple[str, str]] = {
     ("PATCH", "/api/events/detections/{}"): ("events", "edit"),
     ("PUT", "/api/events/detections/{}"): ("events", "edit"),
     ("DELETE", "/api/events/detections/{}"): ("events", "delete"),
+    ("POST", "/api/events/detections/bulk"): ("events", "edit"),
     # 이벤트 — malfunctions
     ("POST", "/api/events/malfunctions"): ("events", "edit"),
     ("PATCH", "/api/events/malfunctions/{}"): ("events", "edit"),
     ("PUT", "/api/events/malfunctions/{}"): ("events", "edit"),
     ("DELETE", "/api/events/malfunctions/{}"): ("events", "delete"),
+    ("POST", "/api/events/malfunctions/bulk"): ("events", "edit"),
     # 장비 — cameras (control 은 별도 PTZ 경로에서 추후 등록)
     ("POST", "/api/devices/cameras"): ("cameras", "edit"),
     ("PATCH", "/api/devices/cameras/{}"): ("cameras", "edit"),
@@ -62,6 +64,7 @@ PERMISSION_MAP: dict[Tuple[str, str], Tuple[str, str]] = {
     ("PATCH", "/api/events/connections/{}"): ("events", "edit"),
     ("PUT", "/api/events/connections/{}"): ("events", "edit"),
     ("DELETE", "/api/events/connections/{}"): ("events", "delete"),
+    ("POST", "/api/events/connections/bulk"): ("events", "edit"),
     # 장비 — speakers (v6.0 후속 Phase 5 확대)
     ("POST", "/api/devices/speakers"): ("devices", "edit"),
     ("PATCH", "/api/devices/speakers/{}"): ("devices", "edit"),
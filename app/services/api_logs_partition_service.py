@@ -1,51 +1,136 @@
 """
-DB-02 — api_logs 월별 파티션 사전 생성 서비스.
+DB-02 — api_logs 파티션 사전 생성 서비스.
 
 v60 파티셔닝(월별 RANGE, `PARTITION BY RANGE ("timestamp")`)은 당월+3개월만 생성했고
 자동 확장 장치가 없어, 마지막 파티션 경계(예: 2026-11-01) 이후 INSERT 가 실패한다
 (대상 파티션 없음 + default 파티션 부재).
 
-이 서비스는 **당월 + 향후 N개월** 파티션을 멱등 생성(`CREATE TABLE IF NOT EXISTS ...
+이 서비스는 **오늘 + 향후 N일** 파티션을 멱등 생성(`CREATE TABLE IF NOT EXISTS ...
 PARTITION OF`, PostgreSQL 11+)하여 경계 초과 INSERT 실패를 예방한다.
 - startup 1회 + 스케줄러(일 1회 cron)로 재보장 → 장기 무재시작 인스턴스도 안전.
-- 파티션명은 v60 규약(`api_logs_YYYY_MM`)과 동일 → 기존 파티션은 IF NOT EXISTS 로 skip.
+
+user-013: 신규 파티션은 **일별**(`api_logs_YYYY_MM_DD`) — 보존 30일을 파티션 DROP 으로 일 단위
+정확히 회수하기 위함(월 파티션이면 최대 ~60일 잔존). 일 경계는 UTC 자정(`timestamp` 는 naive-UTC 저장).
+기존 월 파티션(`api_logs_YYYY_MM`)·`api_logs_before_partition`(MINVALUE~) 은 그대로 두고,
+이미 어떤 파티션이 덮는 날은 건너뛴다 → 월 파티션이 보존기간 경과로 DROP 되면 자연히 일별만 남는다.
+경계 판정은 이름이 아니라 카탈로그의 실제 범위(`pg_get_expr(relpartbound)`)로 한다.
+보존(DETACH + DROP)은 app/services/api_logs_sweep_service.py.
 """
 from __future__ import annotations
 
-from datetime import date
+import re
+from datetime import date, datetime, timedelta
+from typing import NamedTuple, Optional
+
+from app.config import settings
+
+_BOUND_RE = re.compile(r"FROM \((.+?)\) TO \((.+?)\)")
 
-MONTHS_AHEAD_DEFAULT = 6
 
+class PartitionBound(NamedTuple):
+    name: str
+    lower: Optional[datetime]  # None = MINVALUE
+    upper: Optional[datetime]  # None = MAXVALUE
+    is_default: bool
 
-def _month_partition_ddl(year: int, month: int) -> tuple[str, str]:
-    """(partition_name, ddl) — 해당 월 [1일, 다음달 1일) 반열림 RANGE 파티션 DDL."""
-    name = f"api_logs_{year:04d}_{month:02d}"
-    frm = f"{year:04d}-{month:02d}-01"
-    to = f"{year + 1:04d}-01-01" if month == 12 else f"{year:04d}-{month + 1:02d}-01"
+
+def _day_partition_ddl(day: date) -> tuple[str, str]:
+    """(partition_name, ddl) — 해당 일 [UTC 자정, 다음날 자정) 반열림 RANGE 파티션 DDL."""
+    name = f"api_logs_{day:%Y_%m_%d}"
     ddl = (
         f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF api_logs "
-        f"FOR VALUES FROM ('{frm}') TO ('{to}')"
+        f"FOR VALUES FROM ('{day.isoformat()}') TO ('{(day + timedelta(days=1)).isoformat()}')"
     )
     return name, ddl
 
 
-async def ensure_api_log_partitions(months_ahead: int = MONTHS_AHEAD_DEFAULT) -> list[str]:
-    """당월 + 향후 `months_ahead` 개월 api_logs 파티션을 멱등 생성한다.
+def _bound_value(raw: str) -> Optional[datetime]:
+    raw = raw.strip()
+    if raw in ("MINVALUE", "MAXVALUE"):
+        return None
+    return datetime.fromisoformat(raw.strip("'"))
+
+
+def parse_partition_bound(name: str, expr: str) -> Optional[PartitionBound]:
+    """`pg_get_expr(relpartbound, oid)` 문자열 → PartitionBound. 해석 불가면 None."""
+    if expr.strip().upper() == "DEFAULT":
+        return PartitionBound(name, None, None, True)
+    m = _BOUND_RE.search(expr)
+    if not m:
+        return None
+    return PartitionBound(name, _bound_value(m.group(1)), _bound_value(m.group(2)), False)
+
+
+def _covers(bound: PartitionBound, day: date) -> bool:
+    start = datetime.combine(day, datetime.min.time())
+    return (not bound.is_default
+            and (bound.lower is None or bound.lower <= start)
+            and (bound.upper is None or start < bound.upper))
+
+
+def _today() -> date:
+    return datetime.utcnow().date()
+
+
+async def is_partitioned(db, table: str = "api_logs") -> bool:
+    from sqlalchemy import text
+
+    if db.bind.dialect.name != "postgresql":
+        return False
+    kind = (await db.execute(text(
+        "SELECT c.relkind FROM pg_class c JOIN pg_namespace n ON n.oid = c.relnamespace "
+        "WHERE n.nspname = current_schema() AND c.relname = :table"
+    ), {"table": table})).scalar()
+    return kind == "p"
+
+
+async def list_partitions(db, table: str = "api_logs") -> list[PartitionBound]:
+    """table(기본 api_logs)의 현재 파티션 목록(범위 포함, lower 오름차순 — MINVALUE/DEFAULT 먼저).
+
+    user-018: enclosure_metrics/server_metrics 보존(metrics_retention_service)도 같은 판정을 쓴다.
+    """
+    from sqlalchemy import text
+
+    rows = (await db.execute(text(
+        "SELECT c.relname, pg_get_expr(c.relpartbound, c.oid) FROM pg_inherits i "
+        "JOIN pg_class c ON c.oid = i.inhrelid "
+        "JOIN pg_class p ON p.oid = i.inhparent "
+        "WHERE p.relname = :table"
+    ), {"table": table})).all()
+    bounds = [b for b in (parse_partition_bound(name, expr or "") for name, expr in rows) if b is not None]
+    return sorted(bounds, key=lambda b: (not b.is_default, b.lower or datetime.min))
+
+
+async def ensure_api_log_partitions(days_ahead: int | None = None) -> list[str]:
+    """오늘 + 향후 `days_ahead` 일을 덮는 api_logs 파티션을 멱등 보장한다.
 
-    반환: 보장(생성 또는 이미 존재)된 파티션명 리스트.
+    반환: 해당 기간을 덮는 파티션명 리스트(기존 월 파티션 포함, 시간순). 비파티션 테이블이면 [].
     파티션명/경계는 코드가 생성한 상수(사용자 입력 아님)라 SQL injection 무관.
     """
     from sqlalchemy import text
     from app.database import AsyncSessionLocal
 
-    today = date.today()
-    base = today.year * 12 + (today.month - 1)  # 0-기준 월 인덱스
+    if days_ahead is None:
+        days_ahead = settings.API_LOGS_PARTITION_DAYS_AHEAD
+    today = _today()
     ensured: list[str] = []
     async with AsyncSessionLocal() as db:
-        for offset in range(months_ahead + 1):
-            year, month0 = divmod(base + offset, 12)
-            name, ddl = _month_partition_ddl(year, month0 + 1)
-            await db.execute(text(ddl))
-            ensured.append(name)
+        if not await is_partitioned(db):
+            return ensured
+        existing = [b for b in await list_partitions(db) if not b.is_default]
+        for offset in range(days_ahead + 1):
+            day = today + timedelta(days=offset)
+            covering = next((b.name for b in existing if _covers(b, day)), None)
+            if covering is None:
+                covering, ddl = _day_partition_ddl(day)
+                try:
+                    # default 파티션에 해당 일 행이 이미 있으면 생성이 거부된다 — 그 날만 건너뛰고 계속.
+                    async with db.begin_nested():
+                        await db.execute(text(ddl))
+                except Exception as e:
+                    print(f"[WARN] api_logs partition {covering} not created: {e}")
+                    continue
+            if covering not in ensured:
+                ensured.append(covering)
         await db.commit()
     return ensured
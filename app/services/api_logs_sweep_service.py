@@ -5,40 +5,129 @@ v5.4 후속: 문서 A-7 #6 대응 (`GOPDB_통합_원인분석_및_조치_2026070
 배경: 문서 시점 api_logs 크기 10,606,885행 / 3.2GB (무제한 성장). 파티셔닝은 별도.
 간단 TTL로 무한 성장 방지 — 일 1회(정오 근처) 실행, 30일 초과 row DELETE.
 
-파티셔닝/롤오버는 v6.0 async 전환과 함께 도입 예정.
+user-013: 파티션 DROP 보존으로 전환 — 행 DELETE 의 WAL·테이블 팽창·autovacuum 부하 제거.
+- 상한 경계가 보존 기준(cutoff) 이하인 파티션을 `DETACH PARTITION` → `DROP TABLE`(파티션 단위 O(1)).
+  일별/월별/MINVALUE catch-all(`api_logs_before_partition`) 모두 카탈로그 실제 범위로 판정.
+- cutoff 에 걸친 파티션은 유지(다음 회차에 만료) — 일별 파티션이면 최대 1일 초과 보존.
+- DEFAULT 파티션이 있으면 그 안의 만료 행만 DELETE(범위 밖 소량 행 전용).
+- 비파티션 DB(v60 미적용/SQLite)는 종전 DELETE 로 폴백.
+- dry_run=True 면 실행 없이 계획(대상 파티션, 추정 행수/크기)만 반환:
+  `python -m app.services.api_logs_sweep_service --dry-run`
 """
 from __future__ import annotations
 
 from datetime import datetime, timedelta
 
-DEFAULT_RETENTION_DAYS = 30
+from app.config import settings
 
 
-async def run_api_logs_sweep(retention_days: int = DEFAULT_RETENTION_DAYS) -> int:
-    """스케줄러 진입점 — 30일(기본) 초과 api_logs row 삭제.
+async def _plan(db, cutoff: datetime) -> dict:
+    """파티션별 처분 계획 — drop(만료) / boundary(cutoff 걸침, 유지) / default(만료 행 DELETE)."""
+    from sqlalchemy import text
+    from app.services.api_logs_partition_service import list_partitions
+
+    plan: dict = {"drop": [], "boundary": [], "default": None}
+    for b in await list_partitions(db):
+        if b.is_default:
+            rows = (await db.execute(
+                text(f'SELECT count(*) FROM {b.name} WHERE "timestamp" < :cutoff'), {"cutoff": cutoff},
+            )).scalar() or 0
+            plan["default"] = {"name": b.name, "expired_rows": int(rows)}
+            continue
+        if b.upper is not None and b.upper <= cutoff:
+            size = (await db.execute(text(
+                "SELECT c.reltuples::bigint, pg_total_relation_size(c.oid) FROM pg_class c "
+                "WHERE c.oid = to_regclass(:name)"
+            ), {"name": b.name})).first()
+            plan["drop"].append({
+                "name": b.name,
+                "from": b.lower.isoformat() if b.lower else "MINVALUE",
+                "to": b.upper.isoformat(),
+                "rows_estimate": max(int(size[0]), 0) if size else None,
+                "bytes": int(size[1]) if size else None,
+            })
+        elif (b.lower is None or b.lower < cutoff) and (b.upper is None or b.upper > cutoff):
+            plan["boundary"].append(b.name)
+    return plan
+
 
-    Returns: 삭제된 row 수.
+async def run_api_logs_sweep(retention_days: int | None = None, *, dry_run: bool = False) -> dict:
+    """스케줄러 진입점 — 보존기간(기본 API_LOGS_RETENTION_DAYS) 경과 api_logs 회수.
+
+    Returns: {"cutoff", "partitioned", "dry_run", "drop", "boundary", "default", "dropped", "deleted_rows"}.
 
     v6.0: 내부를 AsyncSession으로 교체 — 스케줄러 이벤트 루프 블로킹 방지.
     """
     from sqlalchemy import text
     from app.database import AsyncSessionLocal
+    from app.services.api_logs_partition_service import is_partitioned
+
+    if retention_days is None:
+        retention_days = settings.API_LOGS_RETENTION_DAYS
+    # api_logs.timestamp 는 naive-UTC — 파티션 경계도 UTC 자정 기준
+    cutoff = datetime.utcnow() - timedelta(days=retention_days)
+    report: dict = {
+        "cutoff": cutoff.isoformat(), "partitioned": False, "dry_run": dry_run,
+        "drop": [], "boundary": [], "default": None, "dropped": [], "deleted_rows": 0,
+    }
 
     async with AsyncSessionLocal() as db:
         try:
-            cutoff = datetime.utcnow() - timedelta(days=retention_days)
-            # 컬럼명은 `timestamp` (PostgreSQL 예약어라 quote 필수)
-            result = await db.execute(
-                text('DELETE FROM api_logs WHERE "timestamp" < :cutoff'),
-                {"cutoff": cutoff},
-            )
-            deleted = result.rowcount or 0
-            await db.commit()
-            return deleted
+            if not await is_partitioned(db):
+                if dry_run:
+                    report["deleted_rows"] = (await db.execute(
+                        text('SELECT count(*) FROM api_logs WHERE "timestamp" < :cutoff'), {"cutoff": cutoff},
+                    )).scalar() or 0
+                    return report
+                # 컬럼명은 `timestamp` (PostgreSQL 예약어라 quote 필수)
+                result = await db.execute(
+                    text('DELETE FROM api_logs WHERE "timestamp" < :cutoff'),
+                    {"cutoff": cutoff},
+                )
+                report["deleted_rows"] = result.rowcount or 0
+                await db.commit()
+                return report
+
+            report["partitioned"] = True
+            report.update(await _plan(db, cutoff))
+            if dry_run:
+                return report
+
+            for part in report["drop"]:
+                # 파티션마다 짧은 트랜잭션 — 부모 테이블 잠금 구간 최소화
+                await db.execute(text(f"ALTER TABLE api_logs DETACH PARTITION {part['name']}"))
+                await db.execute(text(f"DROP TABLE IF EXISTS {part['name']}"))
+                await db.commit()
+                report["dropped"].append(part["name"])
+            if report["default"] and report["default"]["expired_rows"]:
+                result = await db.execute(
+                    text(f'DELETE FROM {report["default"]["name"]} WHERE "timestamp" < :cutoff'),
+                    {"cutoff": cutoff},
+                )
+                report["deleted_rows"] = result.rowcount or 0
+                await db.commit()
+            if report["dropped"]:
+                print(f"[api_logs_sweep] dropped partitions: {', '.join(report['dropped'])}")
+            return report
         except Exception as e:
             print(f"[api_logs_sweep] error: {e}")
             try:
                 await db.rollback()
             except Exception:
                 pass
-            return 0
+            return report
+
+
+if __name__ == "__main__":
+    import argparse
+    import asyncio
+    import json
+
+    parser = argparse.ArgumentParser(description="api_logs 보존 — 만료 파티션 DETACH + DROP")
+    parser.add_argument("--dry-run", action="store_true", help="실행 없이 처분 계획만 출력")
+    parser.add_argument("--retention-days", type=int, default=None)
+    args = parser.parse_args()
+    print(json.dumps(
+        asyncio.run(run_api_logs_sweep(args.retention_days, dry_run=args.dry_run)),
+        ensure_ascii=False, indent=2,
+    ))
@@ -3,17 +3,49 @@ Config Change Log Service for tracking configuration changes
 PRD: PRD_ConfigChangeLog.md v1.1
 
 v6.0 P6 후속: sync/async dual-stack (log_config_change_async 신설).
+user-023: CONFIG_LOG_ASYNC_WRITER 시 log_config_change_async 는 행 값만 확정해 큐 배치 writer
+(app/services/config_log_writer.py)에 넘긴다 — 요청 경로의 두 번째 트랜잭션 제거.
 """
 from typing import Dict, Any, Optional, Tuple
 from datetime import datetime
 from enum import Enum
+from sqlalchemy import event
 from sqlalchemy.orm import Session
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import settings
 from app.models.config_change_log import ConfigChangeLog
+from app.services import config_log_writer
+from app.utils.datetime import utc_now
 from app.utils.enums import EnumConfigResourceType, EnumConfigActionType
 
 
+# user-023: 세션 트랜잭션에 flush/실행됐지만 아직 commit 되지 않은 쓰기가 있는지 — 큐 writer 게이트.
+# db.new/dirty/deleted 는 미flush 변경만 보므로 autoflush·db.execute(update/delete) 를 놓친다.
+_UNCOMMITTED_WRITES = "_config_log_uncommitted_writes"
+
+
+@event.listens_for(Session, "after_flush")
+def _mark_flushed(session: Session, flush_context) -> None:
+    session.info[_UNCOMMITTED_WRITES] = True
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _mark_executed(orm_execute_state) -> None:
+    if not orm_execute_state.is_select:  # insert/update/delete·text() 등 읽기 외 문장
+        orm_execute_state.session.info[_UNCOMMITTED_WRITES] = True
+
+
+@event.listens_for(Session, "after_commit")
+@event.listens_for(Session, "after_rollback")
+def _clear_writes(session: Session) -> None:
+    session.info.pop(_UNCOMMITTED_WRITES, None)
+
+
+def _has_uncommitted_writes(db: AsyncSession) -> bool:
+    return bool(db.new or db.dirty or db.deleted or db.sync_session.info.get(_UNCOMMITTED_WRITES))
+
+
 def get_changed_fields(before: Dict[str, Any], after: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
     """
     두 dict를 비교하여 변경된 필드만 추출합니다. (v1.1)
@@ -185,7 +217,30 @@ async def log_config_change_async(
     """log_config_change의 async 병존 버전 (v6.0 P6 후속).
 
     라우터가 AsyncSession 사용 시 호출. 로직/필드는 sync와 100% 동일.
+
+    user-023: CONFIG_LOG_ASYNC_WRITER + writer 기동 중이면 행 값(created_at 포함)을 지금 확정해
+    큐에 넣고 미저장(id 없음) 객체를 반환한다. 세션 트랜잭션에 미커밋 쓰기가 있으면(미flush 변경,
+    autoflush·db.execute(update/delete) 포함 — 종전 이 함수의 commit 에 기대는 호출) 또는 큐 full 이면
+    종전 인라인 저장. 호출자 트랜잭션이 롤백돼도 감사 로그만 남는 일이 없다.
     """
+    if settings.CONFIG_LOG_ASYNC_WRITER and config_log_writer.running() \
+            and not _has_uncommitted_writes(db):
+        row = {
+            "resource_type": resource_type,
+            "resource_id": resource_id,
+            "resource_name": resource_name,
+            "action": action,
+            "before_state": dict(before_state) if before_state is not None else None,
+            "after_state": dict(after_state) if after_state is not None else None,
+            "actor_id": actor_id,
+            "actor_name": actor_name,
+            "actor_ip": actor_ip,
+            "description": description,
+            "created_at": utc_now(),
+        }
+        if config_log_writer.enqueue(db.bind, row):
+            return ConfigChangeLog(**row)
+
     log = ConfigChangeLog(
         resource_type=resource_type,
         resource_id=resource_id,
@@ -0,0 +1,205 @@
+"""
+ConfigChangeLog 큐 배치 writer (user-023)
+
+`log_config_change_async` 는 거의 모든 변경 핸들러(이벤트 생성 포함)에서 인라인 await 되며,
+본 변경 commit 뒤에 감사 로그 INSERT + commit + refresh 를 한 번 더 수행했다(요청당 트랜잭션 2개).
+
+- 캡처는 동기: 호출 시점에 행 값(before/after diff·actor·created_at)을 확정해 큐에 넣는다.
+- 저장은 배치: 단일 consumer 가 `insert(ConfigChangeLog)` executemany 1회 + commit 1회로 flush
+  (api_logs consumer 와 같은 100건 or 500ms 창, 적체 시 _BATCH_MAX 까지 즉시 수집).
+- 대상 DB: 호출 세션의 bind 로 저장 — 변경과 감사 로그가 항상 같은 DB 에 남는다.
+- 유실 방지:
+  * 큐 full / writer 미기동 → `enqueue` False → 호출부가 종전 인라인 저장(요청 지연은 감수).
+  * 배치 저장 실패 → 행 단위 재시도, 그래도 실패한 행만 로그 출력 + `failed` 카운트.
+  * `stop_config_log_writer()` — shutdown 훅, 큐 drain 후 종료.
+- 게이트: `CONFIG_LOG_ASYNC_WRITER`(기본 off — 저장 직후 로그 조회 일관성이 필요한 배포는 종전 인라인).
+"""
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import defaultdict
+from typing import Any, Optional
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import AsyncSessionLocal
+from app.models.config_change_log import ConfigChangeLog
+
+
+_QUEUE_MAXSIZE = 10000
+_BATCH_SIZE = 100
+_BATCH_MAX = 1000
+_BATCH_TIMEOUT = 0.5  # seconds — 첫 아이템 수신 후 최대 대기 시간
+
+_queue: asyncio.Queue[tuple[Any, dict[str, Any]]] = asyncio.Queue(maxsize=_QUEUE_MAXSIZE)
+_writer_task: Optional[asyncio.Task[None]] = None
+
+_stats: dict[str, int] = {
+    "enqueued": 0,
+    "inline_fallback": 0,  # 큐 full → 호출부 인라인 저장
+    "written": 0,
+    "batches": 0,
+    "row_retries": 0,      # 배치 실패 → 행 단위 재시도한 행
+    "failed": 0,           # 행 단위 재시도도 실패(유실)
+}
+_last_flush_ms: Optional[float] = None
+_max_flush_ms: float = 0.0
+
+
+def running() -> bool:
+    return _writer_task is not None and not _writer_task.done()
+
+
+def enqueue(bind: Any, row: dict[str, Any]) -> bool:
+    """행 값을 큐에 넣는다. False = writer 미기동 또는 큐 full(호출부가 인라인 저장)."""
+    if not running():
+        return False
+    try:
+        _queue.put_nowait((bind, row))
+    except asyncio.QueueFull:
+        _stats["inline_fallback"] += 1
+        return False
+    _stats["enqueued"] += 1
+    return True
+
+
+def get_stats() -> dict:
+    return {
+        **_stats,
+        "running": running(),
+        "queue_depth": _queue.qsize(),
+        "queue_max": _QUEUE_MAXSIZE,
+        "last_flush_ms": _last_flush_ms,
+        "max_flush_ms": round(_max_flush_ms, 2),
+    }
+
+
+def reset_stats() -> None:
+    global _last_flush_ms, _max_flush_ms
+    for k in _stats:
+        _stats[k] = 0
+    _last_flush_ms = None
+    _max_flush_ms = 0.0
+
+
+def _session(bind: Any) -> AsyncSession:
+    return AsyncSessionLocal() if bind is None else AsyncSession(bind=bind, expire_on_commit=False)
+
+
+async def _write_rows(bind: Any, rows: list[dict[str, Any]]) -> None:
+    """같은 bind 의 행을 executemany 1회로 저장. 실패 시 행 단위 재시도."""
+    async with _session(bind) as db:
+        try:
+            await db.execute(insert(ConfigChangeLog), rows)
+            await db.commit()
+            _stats["written"] += len(rows)
+            return
+        except Exception as e:
+            await db.rollback()
+            print(f"[config_log_writer] batch insert failed ({len(rows)} rows) — retry per row: {e}")
+        for row in rows:
+            _stats["row_retries"] += 1
+            try:
+                await db.execute(insert(ConfigChangeLog), [row])
+                await db.commit()
+                _stats["written"] += 1
+            except Exception as e:
+                await db.rollback()
+                _stats["failed"] += 1
+                print(
+                    f"[config_log_writer] drop {row.get('resource_type')}#{row.get('resource_id')} "
+                    f"{row.get('action')}: {e}"
+                )
+
+
+async def _flush_batch(batch: list[tuple[Any, dict[str, Any]]]) -> None:
+    global _last_flush_ms, _max_flush_ms
+    if not batch:
+        return
+    started = time.perf_counter()
+    by_bind: dict[Any, list[dict[str, Any]]] = defaultdict(list)
+    for bind, row in batch:
+        by_bind[bind].append(row)
+    for bind, rows in by_bind.items():
+        await _write_rows(bind, rows)
+    elapsed = (time.perf_counter() - started) * 1000
+    _last_flush_ms = round(elapsed, 2)
+    _max_flush_ms = max(_max_flush_ms, elapsed)
+    _stats["batches"] += 1
+
+
+async def _writer() -> None:
+    """단일 consumer — api_logs `_log_consumer` 와 같은 배치 창. 셧다운 시 남은 큐 drain."""
+    loop = asyncio.get_event_loop()
+
+    while True:
+        batch: list[tuple[Any, dict[str, Any]]] = []
+        try:
+            batch.append(await _queue.get())
+            while len(batch) < _BATCH_MAX:
+                try:
+                    batch.append(_queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+            deadline = loop.time() + _BATCH_TIMEOUT
+            while len(batch) < _BATCH_SIZE:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(_queue.get(), timeout=remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            await _flush_batch(batch)
+
+        except asyncio.CancelledError:
+            print(f"[config_log_writer] shutdown — draining {_queue.qsize()} queued rows (batch={len(batch)})")
+            while not _queue.empty():
+                try:
+                    batch.append(_queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+            try:
+                await _flush_batch(batch)
+            except Exception as e:
+                print(f"[config_log_writer] shutdown drain flush failed: {e}")
+            raise
+
+        except Exception as e:
+            print(f"[config_log_writer] error: {e}")
+            await asyncio.sleep(1)
+
+
+async def start_config_log_writer() -> None:
+    """FastAPI startup 훅에서 호출(idempotent)."""
+    global _writer_task
+    if running():
+        return
+    _writer_task = asyncio.create_task(_writer(), name="config_log_writer")
+
+
+async def stop_config_log_writer() -> None:
+    """FastAPI shutdown 훅에서 호출 — cancel → 큐 drain 저장 → 종료 대기."""
+    global _writer_task
+    if _writer_task is None:
+        return
+    _writer_task.cancel()
+    try:
+        await _writer_task
+    except asyncio.CancelledError:
+        pass
+    except Exception as e:
+        print(f"[config_log_writer] stop error: {e}")
+    finally:
+        _writer_task = None
+    # 첫 스텝 전에 취소된 태스크는 drain 분기에 들어가지 못한다 — 잔여분 직접 저장.
+    rest: list[tuple[Any, dict[str, Any]]] = []
+    while not _queue.empty():
+        rest.append(_queue.get_nowait())
+    try:
+        await _flush_batch(rest)
+    except Exception as e:
+        print(f"[config_log_writer] shutdown drain flush failed: {e}")
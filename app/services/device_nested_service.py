@@ -0,0 +1,236 @@
+"""
+이벤트 응답 device nested 조립 + device_groups 배치 로더 — user-015.
+
+배경: detections/malfunctions/connections/detection_logs/actions 라우터가 각자 사본
+`_build_device_nested_response` 를 갖고, 이벤트 1건마다 `DeviceGroupMapping` 을 따로 조회했다
+(100건 페이지 = 그룹 조회 100회 + selectinload 100회).
+
+`DeviceGroupLoader`(DataLoader 방식, 세션 = 요청 범위):
+- 목록 라우터는 페이지의 device_id 를 `prime()` 으로 한 번에 넘긴다 → `IN` 1쿼리(매핑 ⋈ 그룹).
+- 이후 `load()` 는 캐시 적중. prime 되지 않은 id(단건 조회 등)는 그 id 만 1쿼리 — 종전과 동일 비용.
+- 로더는 `AsyncSession.info` 에 붙어 요청(세션)이 끝나면 함께 사라진다.
+  그룹 매핑을 바꾼 뒤 같은 세션에서 다시 조립해야 하면 `invalidate()`.
+"""
+from __future__ import annotations
+
+from typing import Iterable, Optional, Union
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.device import Camera, Controller, Device, Lamp, Sensor, Speaker
+from app.models.device_group import DeviceGroup, DeviceGroupMapping
+from app.schemas.device import (
+    CameraNestedResponse,
+    ControllerNestedResponse,
+    DeviceGroupNestedResponse,
+    DeviceNestedResponse,
+    LampNestedResponse,
+    SensorNestedResponse,
+    SpeakerNestedResponse,
+)
+
+_SESSION_KEY = "device_group_loader"
+
+NestedDeviceResponse = Union[
+    SensorNestedResponse, ControllerNestedResponse, CameraNestedResponse,
+    SpeakerNestedResponse, LampNestedResponse, DeviceNestedResponse,
+]
+
+
+class DeviceGroupLoader:
+    """device_id → [DeviceGroupNestedResponse] 요청 범위 배치 로더."""
+
+    def __init__(self, db: AsyncSession):
+        self._db = db
+        self._cache: dict[int, list[DeviceGroupNestedResponse]] = {}
+        self.queries = 0  # 실행한 IN 쿼리 수(진단/테스트용)
+
+    async def prime(self, device_ids: Iterable[Optional[int]]) -> None:
+        """아직 캐시에 없는 device_id 들의 그룹을 IN 쿼리 1회로 적재."""
+        missing = sorted({i for i in device_ids if i is not None and i not in self._cache})
+        if not missing:
+            return
+        rows = (await self._db.execute(
+            select(DeviceGroupMapping.device_id, DeviceGroup.id, DeviceGroup.name)
+            .join(DeviceGroup, DeviceGroup.id == DeviceGroupMapping.group_id)
+            .where(DeviceGroupMapping.device_id.in_(missing))
+            .order_by(DeviceGroupMapping.id)
+        )).all()
+        self.queries += 1
+        for device_id in missing:
+            self._cache[device_id] = []
+        for device_id, group_id, name in rows:
+            self._cache[device_id].append(DeviceGroupNestedResponse(id=group_id, name=name))
+
+    async def load(self, device_id: int) -> list[DeviceGroupNestedResponse]:
+        if device_id not in self._cache:
+            await self.prime([device_id])
+        return self._cache[device_id]
+
+    def invalidate(self, device_id: Optional[int] = None) -> None:
+        if device_id is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(device_id, None)
+
+
+def device_group_loader(db: AsyncSession) -> DeviceGroupLoader:
+    """세션(=요청)에 붙은 로더 — 없으면 생성."""
+    loader = db.info.get(_SESSION_KEY)
+    if loader is None:
+        loader = db.info[_SESSION_KEY] = DeviceGroupLoader(db)
+    return loader
+
+
+async def build_device_nested_response(device: Optional[Device], db: AsyncSession) -> Optional[NestedDeviceResponse]:
+    """
+    Device 객체를 타입에 맞는 Nested Response로 변환 (Polymorphic)
+
+    PRD v1.1: Device 삭제 시 None 반환
+    PRD v1.2: device_groups 필드 추가 (EventMapping 연동 필수)
+    PRD v2.7: Device 타입별 Polymorphic Response 반환
+    - Sensor → SensorNestedResponse
+    - Controller → ControllerNestedResponse
+    - Camera → CameraNestedResponse
+    - Speaker → SpeakerNestedResponse
+    - Enclosure → DeviceNestedResponse (전용 NestedResponse 없음)
+    - Lamp → LampNestedResponse
+
+    user-015: device_groups 는 요청 범위 배치 로더에서 — 목록은 호출 전 `prime()`.
+    """
+    if device is None:
+        return None
+
+    device_groups = await device_group_loader(db).load(device.id)
+
+    # PRD v2.7: Polymorphic Response - Device 타입에 따라 적절한 스키마 반환
+    if isinstance(device, Sensor):
+        return SensorNestedResponse(
+            id=device.id,
+            number_device=device.number_device,
+            group_device=device.group_device,
+            name_device=device.name_device,
+            type_device=device.type_device.value,
+            version=device.version,
+            status=device.status.value,
+            is_enable=device.is_enable,
+            controller_id=device.controller_id,
+            device_groups=device_groups
+        )
+    elif isinstance(device, Camera):
+        # PRD_Camera_Urls_JsonB.md: urls JSONB 통합 (rtsp_uri/rtsp_port 제거)
+        from app.schemas.device import CameraUrls
+        urls_data = None
+        if device.urls:
+            urls_data = CameraUrls.model_validate(device.urls) if isinstance(device.urls, dict) else device.urls
+        return CameraNestedResponse(
+            id=device.id,
+            number_device=device.number_device,
+            group_device=device.group_device,
+            name_device=device.name_device,
+            type_device=device.type_device.value,
+            version=device.version,
+            status=device.status.value,
+            is_enable=device.is_enable,
+            ip_address=device.ip_address,
+            ip_port=device.ip_port,
+            mode=device.mode.value if device.mode else "NONE",
+            category=device.category.value if device.category else "NONE",
+            is_record=device.is_record,
+            urls=urls_data,
+            device_groups=device_groups
+        )
+    elif isinstance(device, Controller):
+        return ControllerNestedResponse(
+            id=device.id,
+            number_device=device.number_device,
+            group_device=device.group_device,
+            name_device=device.name_device,
+            type_device=device.type_device.value,
+            version=device.version,
+            status=device.status.value,
+            is_enable=device.is_enable,
+            ip_address=device.ip_address,
+            ip_port=device.ip_port,
+            device_groups=device_groups
+        )
+    elif isinstance(device, Speaker):
+        return SpeakerNestedResponse(
+            id=device.id,
+            category_device=device.category_device.value,
+            number_device=device.number_device,
+            name_device=device.name_device,
+            type_device=device.type_device.value,
+            status=device.status.value,
+            is_enable=device.is_enable,
+            speaker_type=device.speaker_type.value if device.speaker_type else "NORMAL",
+            geolocation=device.geolocation,
+        )
+    elif isinstance(device, Lamp):
+        return LampNestedResponse(
+            id=device.id,
+            number_device=device.number_device,
+            group_device=device.group_device,
+            name_device=device.name_device,
+            type_device=device.type_device.value,
+            version=device.version,
+            status=device.status.value,
+            is_enable=device.is_enable,
+            ip_address=device.ip_address,
+            ip_port=device.ip_port,
+            user_name=device.user_name,
+            description=device.description,
+            geolocation=device.geolocation,
+        )
+    else:
+        # Enclosure(전용 NestedResponse 없음) / 알 수 없는 Device 타입
+        return DeviceNestedResponse(
+            id=device.id,
+            number_device=device.number_device,
+            group_device=device.group_device,
+            name_device=device.name_device,
+            type_device=device.type_device.value,
+            status=device.status.value,
+            is_enable=device.is_enable,
+            version=device.version,
+            device_groups=device_groups
+        )
+
+
+async def build_flat_device_nested_response(device: Optional[Device], db: AsyncSession) -> Optional[DeviceNestedResponse]:
+    """
+    Device 객체를 단일 DeviceNestedResponse 로 변환 (조치 이벤트 from_event 내 device — PRD v1.3)
+
+    타입별 필드는 getattr 로 채운다(해당 없는 타입은 None). device_groups 는 배치 로더.
+    """
+    if device is None:
+        return None
+
+    device_groups = await device_group_loader(db).load(device.id)
+
+    # PRD_Camera_Urls_JsonB.md: urls JSONB 통합 (rtsp_uri/rtsp_port 제거)
+    from app.schemas.device import CameraUrls
+    urls_data = None
+    raw_urls = getattr(device, 'urls', None)
+    if raw_urls:
+        urls_data = CameraUrls.model_validate(raw_urls) if isinstance(raw_urls, dict) else raw_urls
+
+    return DeviceNestedResponse(
+        id=device.id,
+        number_device=device.number_device,
+        group_device=device.group_device,
+        name_device=device.name_device,
+        type_device=device.type_device.value,
+        status=device.status.value,
+        is_enable=device.is_enable,
+        version=device.version,
+        ip_address=getattr(device, 'ip_address', None),
+        ip_port=getattr(device, 'ip_port', None),
+        controller_id=getattr(device, 'controller_id', None),
+        mode=getattr(device, 'mode', None).value if hasattr(device, 'mode') and getattr(device, 'mode', None) else None,
+        category=getattr(device, 'category', None).value if hasattr(device, 'category') and getattr(device, 'category', None) else None,
+        is_record=getattr(device, 'is_record', None),
+        urls=urls_data,
+        device_groups=device_groups
+    )
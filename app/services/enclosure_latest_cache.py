@@ -0,0 +1,101 @@
+"""
+함체별 최신 메트릭 메모리 테이블 — 대시보드 폴링의 메트릭 이력 무접촉 (user-016)
+
+`GET /api/enclosure-metrics` 는 함체마다 `ORDER BY created_at DESC` 를 따로 실행했다(N+1, 이력 테이블 반복 접근).
+- 적재: 캐시가 비었거나 TTL 경과 시 라우터가 함체별 최신 1행을 **단일 쿼리**로 읽어 `store_all()` 로 통째 교체
+  (함체마다 `(enclosure_id, created_at DESC, id DESC)` 인덱스 1회 탐색 — LATERAL 과 같은 실행형).
+- 갱신: `create_enclosure_metric` 커밋 직후 `record()` 로 write-through — 폴링은 TTL 안에서 DB 무접촉.
+- 무효화: 메트릭 DELETE 는 최신값이 무엇으로 바뀌는지 모르므로 `invalidate()` → 다음 폴링이 재적재.
+- 값은 API 응답 dict(`_metric_to_response`) 그대로 보관 — 읽기 측 변환 비용 없음.
+
+★ 단일 인스턴스 가정(authz_cache 와 동일). 프로세스 밖 쓰기(수동 SQL·다른 워커)는
+  ENCLOSURE_LATEST_CACHE_TTL_SECONDS 가 반영 지연 상한.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from datetime import datetime
+from typing import Optional
+
+from app.config import settings
+
+_lock = threading.Lock()
+# enclosure_id → (created_at, 응답 dict). 적재 시 메트릭 없는 함체는 항목 없음.
+_latest: dict[int, tuple[datetime, dict]] = {}
+_loaded_at: Optional[float] = None
+_write_seq = 0  # record/invalidate 마다 증가 — 적재 쿼리 도중 쓰기 감지
+_stats: dict[str, int] = {"hits": 0, "misses": 0, "loads": 0, "records": 0, "invalidations": 0}
+
+
+def _fresh() -> bool:
+    return _loaded_at is not None and time.monotonic() - _loaded_at < settings.ENCLOSURE_LATEST_CACHE_TTL_SECONDS
+
+
+def snapshot() -> Optional[dict[int, dict]]:
+    """유효하면 {enclosure_id: 최신 메트릭 응답 dict} 사본, 비었거나 만료면 None(miss)."""
+    with _lock:
+        if not _fresh():
+            _stats["misses"] += 1
+            return None
+        _stats["hits"] += 1
+        return {k: v[1] for k, v in _latest.items()}
+
+
+def get(enclosure_id: int) -> tuple[bool, Optional[dict]]:
+    """(적중 여부, 최신 메트릭). 적중인데 None 이면 "메트릭 없음" 이 확정된 함체."""
+    with _lock:
+        if not _fresh():
+            _stats["misses"] += 1
+            return False, None
+        _stats["hits"] += 1
+        entry = _latest.get(enclosure_id)
+        return True, entry[1] if entry else None
+
+
+def write_seq() -> int:
+    with _lock:
+        return _write_seq
+
+
+def store_all(rows: dict[int, tuple[datetime, dict]], seq: int) -> None:
+    """적재 결과로 교체. 적재 쿼리 도중 record/invalidate 가 있었으면(seq 불일치) 버린다."""
+    global _latest, _loaded_at
+    with _lock:
+        if seq != _write_seq:
+            return
+        _latest = dict(rows)
+        _loaded_at = time.monotonic()
+        _stats["loads"] += 1
+
+
+def record(enclosure_id: int, created_at: datetime, data: dict) -> None:
+    """신규 메트릭 write-through. 더 오래된 값(지연 도착 등)은 최신을 덮지 않는다."""
+    global _write_seq
+    with _lock:
+        _write_seq += 1
+        current = _latest.get(enclosure_id)
+        if current is None or current[0] <= created_at:
+            _latest[enclosure_id] = (created_at, data)
+        _stats["records"] += 1
+
+
+def invalidate() -> None:
+    global _loaded_at, _write_seq
+    with _lock:
+        _write_seq += 1
+        _latest.clear()
+        _loaded_at = None
+        _stats["invalidations"] += 1
+
+
+def get_stats() -> dict:
+    with _lock:
+        return {**_stats, "entries": len(_latest), "loaded": _fresh()}
+
+
+def reset_stats() -> None:
+    with _lock:
+        for k in _stats:
+            _stats[k] = 0
+
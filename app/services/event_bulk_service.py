@@ -0,0 +1,179 @@
+"""
+이벤트 고빈도 일괄 수신 — POST /api/events/{detections|malfunctions|connections}/bulk (user-022)
+
+단건 POST 는 이벤트마다 polymorphic device SELECT → 억제 게이트 → commit → refresh →
+log_config_change_async(자체 commit) → device nested 응답 조립(추가 쿼리)을 수행한다. 탐지 폭주 시
+왕복 수가 이벤트 수에 비례했다. 본 서비스는 한 요청의 N건을 **한 트랜잭션**으로 처리한다.
+
+1. 장비: 요청의 device_id 집합을 base 컬럼만 IN 1쿼리(서브타입 로드 불필요 — 스냅샷은 base 필드).
+2. 억제: 장비별 1회 `is_suppressed`(user-021 메모리 인덱스 — 적중 시 DB 무접촉).
+3. 저장: events + 서브타입 테이블 다중행 INSERT(ORM bulk insert, RETURNING id — 요청 순서 보존).
+4. 상태 플립: 저장된 장비 중 목표 상태가 아닌 것만 UPDATE 1문(불필요한 SYNC_DEVICE 트리거 발화 방지).
+5. ConfigChangeLog: CREATED 행 다중행 INSERT — 위와 같은 트랜잭션, commit 1회.
+
+검증 실패(장비 없음·enum 오류)·억제는 항목 단위 결과로 보고하고 나머지는 저장한다(부분 성공).
+단건 POST 와 저장 필드·상태 플립·감사 로그 내용은 동일하다(응답만 경량: device nested 없음).
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+from sqlalchemy import insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.config_change_log import ConfigChangeLog
+from app.models.device import Device
+from app.models.event import ConnectionEvent, DetectionEvent, MalfunctionEvent
+from app.schemas.event import EventBulkItemResult, EventBulkResult
+from app.services.event_suppression_service import is_suppressed, record_suppression
+from app.utils.datetime import utc_now
+from app.utils.enums import (
+    EnumConfigActionType,
+    EnumConfigResourceType,
+    EnumDetectionType,
+    EnumDeviceStatus,
+    EnumFaultType,
+    EnumTrueFalse,
+)
+
+
+def _detection_fields(item) -> dict:
+    return {
+        "action_reported": EnumTrueFalse.False_.value,  # PRD v2.8: 자동 설정
+        "result": EnumDetectionType(item.result),
+        "detail": item.detail,
+    }
+
+
+def _malfunction_fields(item) -> dict:
+    return {
+        "action_reported": EnumTrueFalse.False_.value,  # PRD v2.8: 자동 설정
+        "reason": EnumFaultType(item.reason),
+        "detail": item.detail,
+    }
+
+
+@dataclass(frozen=True)
+class EventKind:
+    """이벤트 카테고리별 일괄 저장 규칙 — 단건 POST 핸들러와 같은 값."""
+    category: str                          # 억제 게이트 category / polymorphic identity
+    model: type
+    label: str                             # ConfigChangeLog resource_name 접두(예: DetectionEvent)
+    resource_type: EnumConfigResourceType
+    device_status: Optional[EnumDeviceStatus]  # 저장 시 장비 상태 플립(None=변경 없음)
+    fields: Optional[Callable[[Any], dict]]    # 서브타입 전용 필드(ValueError = 항목 실패)
+
+
+KINDS: dict[str, EventKind] = {
+    "detection": EventKind(
+        "detection", DetectionEvent, "DetectionEvent", EnumConfigResourceType.DETECTION_EVENT,
+        EnumDeviceStatus.ACTIVATED, _detection_fields,
+    ),
+    "malfunction": EventKind(
+        "malfunction", MalfunctionEvent, "MalfunctionEvent", EnumConfigResourceType.MALFUNCTION_EVENT,
+        EnumDeviceStatus.ERROR, _malfunction_fields,
+    ),
+    "connection": EventKind(
+        "connection", ConnectionEvent, "ConnectionEvent", EnumConfigResourceType.CONNECTION_EVENT,
+        None, None,
+    ),
+}
+
+
+def _value(v) -> str:
+    return v.value if hasattr(v, "value") else str(v)
+
+
+def _device_description(row) -> str:
+    """단건 라우터 `_generate_device_description` 과 같은 형식(base 컬럼 행에서)."""
+    return f"[{_value(row.type_device)}] {row.name_device} (number: {row.number_device}, id: {row.id})"
+
+
+async def ingest_events_bulk(db: AsyncSession, kind: str, items: list) -> EventBulkResult:
+    """N건 일괄 저장(1 트랜잭션). 반환: 항목별 결과(요청 순서)."""
+    spec = KINDS[kind]
+    results: list[Optional[EventBulkItemResult]] = [None] * len(items)
+
+    # 1) 장비 base 컬럼 IN 1쿼리
+    device_ids = {item.device_id for item in items}
+    rows = (await db.execute(
+        select(Device.id, Device.type_device, Device.name_device, Device.number_device,
+               Device.category_device, Device.status)
+        .where(Device.id.in_(device_ids))
+    )).all()
+    devices = {r.id: r for r in rows}
+
+    # 2) 억제 — 장비별 1회(메모리 인덱스)
+    suppression: dict[int, tuple[bool, Optional[int]]] = {}
+    for device_id, row in devices.items():
+        suppression[device_id] = await is_suppressed(db, device_id, row.category_device, spec.category)
+
+    now = utc_now()
+    to_insert: list[tuple[int, Any, dict]] = []  # (index, item, values)
+    for i, item in enumerate(items):
+        row = devices.get(item.device_id)
+        if row is None:
+            results[i] = EventBulkItemResult(
+                index=i, status="failed", error=f"Device with id {item.device_id} not found",
+            )
+            continue
+        suppressed, schedule_id = suppression[item.device_id]
+        if suppressed:
+            record_suppression(item.device_id, spec.category, schedule_id)
+            results[i] = EventBulkItemResult(index=i, status="suppressed", schedule_id=schedule_id)
+            continue
+        try:
+            extra = spec.fields(item) if spec.fields is not None else {}
+        except ValueError as e:
+            results[i] = EventBulkItemResult(index=i, status="failed", error=f"Invalid enum value: {e}")
+            continue
+        to_insert.append((i, item, {
+            "type_event": _value(item.type_event),
+            "device_id": item.device_id,
+            "device_description": _device_description(row),
+            "created_at": now,
+            "updated_at": now,
+            **extra,
+        }))
+
+    if to_insert:
+        # 3) events + 서브타입 다중행 INSERT (joined inheritance ORM bulk insert, RETURNING 순서 보존)
+        ids = (await db.execute(
+            insert(spec.model).returning(spec.model.id, sort_by_parameter_order=True),
+            [values for _, _, values in to_insert],
+        )).scalars().all()
+
+        # 4) 상태 플립 — 목표 상태가 아닌 장비만
+        if spec.device_status is not None:
+            flip = {item.device_id for _, item, _ in to_insert
+                    if devices[item.device_id].status != spec.device_status}
+            if flip:
+                await db.execute(
+                    update(Device).where(Device.id.in_(flip)).values(status=spec.device_status),
+                    execution_options={"synchronize_session": False},
+                )
+
+        # 5) ConfigChangeLog CREATED — 같은 트랜잭션
+        await db.execute(insert(ConfigChangeLog), [
+            {
+                "resource_type": spec.resource_type,
+                "resource_id": event_id,
+                "resource_name": f"{spec.label}-{event_id} ({values['type_event']})",
+                "action": EnumConfigActionType.CREATED,
+                "after_state": {"id": event_id, "type_event": values["type_event"]},
+                "description": f"{spec.label} 생성",
+            }
+            for event_id, (_, _, values) in zip(ids, to_insert)
+        ])
+        await db.commit()
+
+        for event_id, (i, _, _) in zip(ids, to_insert):
+            results[i] = EventBulkItemResult(index=i, status="created", id=event_id)
+
+    return EventBulkResult(
+        created=sum(1 for r in results if r.status == "created"),
+        suppressed=sum(1 for r in results if r.status == "suppressed"),
+        failed=sum(1 for r in results if r.status == "failed"),
+        items=results,
+    )
@@ -0,0 +1,98 @@
+"""
+이벤트 통계 결과 단기 캐시 — 같은 대시보드를 폴링하는 다수 클라이언트 (user-024)
+
+관제 화면 여러 대가 같은 (구간, 집계 단위)로 `/api/events/statistics/*` 를 수 초 간격 폴링한다.
+응답 데이터는 구간이 같으면 TTL 안에서 동일하므로 엔드포인트·구간·단위 키로 보관한다.
+
+- 키: (엔드포인트, start UTC, end UTC, interval). 값은 응답 data 모델 그대로.
+- 만료: EVENT_STATS_CACHE_TTL_SECONDS(기본 10초, 0 = 비활성) — 이벤트 쓰기로 무효화하지 않는다
+  (탐지 폭주 중에는 매 커밋 무효화가 캐시를 무의미하게 만든다). 최신 이벤트 반영 지연 = TTL.
+- 동시 miss 합류: 같은 키를 계산 중이면 새로 계산하지 않고 그 결과를 기다린다(만료 직후 폭주 방지).
+  선행 계산이 실패하면 합류자는 각자 계산한다.
+- 상한 _MAX_ENTRIES — 넘치면 가장 오래 적재된 항목부터 축출(authz_cache 와 같은 FIFO).
+
+★ 단일 인스턴스 가정(authz_cache / enclosure_latest_cache 와 동일).
+"""
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from typing import Any, Awaitable, Callable, Hashable
+
+from app.config import settings
+
+_MAX_ENTRIES = 256
+
+_lock = threading.Lock()
+_entries: dict[Hashable, tuple[float, Any]] = {}  # key → (만료 monotonic, 값)
+_inflight: dict[Hashable, asyncio.Future] = {}
+_stats: dict[str, int] = {"hits": 0, "misses": 0, "joined": 0, "invalidations": 0}
+
+
+def _get(key: Hashable) -> tuple[bool, Any]:
+    with _lock:
+        entry = _entries.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            return False, None
+        _stats["hits"] += 1
+        return True, entry[1]
+
+
+def _put(key: Hashable, value: Any) -> None:
+    now = time.monotonic()
+    with _lock:
+        _entries.pop(key, None)
+        while len(_entries) >= _MAX_ENTRIES:
+            _entries.pop(next(iter(_entries)))  # 가장 오래 적재된 항목부터(authz_cache 와 같은 FIFO)
+        _entries[key] = (now + settings.EVENT_STATS_CACHE_TTL_SECONDS, value)
+
+
+async def get_or_compute(key: Hashable, compute: Callable[[], Awaitable[Any]]) -> Any:
+    """적중이면 캐시 값, 계산 중인 같은 키가 있으면 그 결과, 아니면 `compute()` 후 저장."""
+    if settings.EVENT_STATS_CACHE_TTL_SECONDS <= 0:
+        return await compute()
+    hit, value = _get(key)
+    if hit:
+        return value
+    pending = _inflight.get(key)
+    if pending is not None:
+        _stats["joined"] += 1
+        try:
+            return await asyncio.shield(pending)
+        except asyncio.CancelledError:
+            if not pending.cancelled():
+                raise  # 대기자 자신이 취소됨
+        return await compute()  # 선행 계산 실패/취소 — 직접 계산(오류는 각자 전파)
+
+    _stats["misses"] += 1
+    future = asyncio.get_running_loop().create_future()
+    _inflight[key] = future
+    try:
+        value = await compute()
+    except BaseException:
+        future.cancel()
+        raise
+    else:
+        _put(key, value)
+        future.set_result(value)
+        return value
+    finally:
+        _inflight.pop(key, None)
+
+
+def invalidate() -> None:
+    with _lock:
+        _entries.clear()
+        _stats["invalidations"] += 1
+
+
+def get_stats() -> dict:
+    with _lock:
+        return {**_stats, "entries": len(_entries), "inflight": len(_inflight)}
+
+
+def reset_stats() -> None:
+    with _lock:
+        for k in _stats:
+            _stats[k] = 0
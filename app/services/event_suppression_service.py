@@ -2,6 +2,7 @@
 이벤트 억제(정비 창) 도메인 서비스 — event-suppression-schedule PRD v1.1
 
 - is_suppressed        : 수신 게이트(요청시점 lazy 평가 = 억제 권위). fail-open(오류 시 억제 안 함).
+                         user-021: 메모리 구간 인덱스(suppression_index) 조회 — 적중 시 DB 무접촉.
 - suppression_status   : 파생 상태(PENDING/ACTIVE/EXPIRED/CANCELLED) 계산 (순수함수).
 - get_active_schedules : 현재 활성 창 조회 (/active, UI 배너·외부 조회 훅).
 - run_suppression_sweep: 만료 창 is_active=false 정리 (비권위 백스톱, grant sweep 이식).
@@ -17,9 +18,9 @@ from datetime import datetime, timezone
 
 from sqlalchemy import select
 
+from app.services import suppression_index  # noqa: F401 — import 시 ORM 커밋 무효화 리스너 등록
 from app.utils.datetime import utc_now
 from app.utils.enums import (
-    EnumSuppressionTargetType,
     EnumSuppressionEventScope,
     EnumSuppressionStatus,
 )
@@ -92,64 +93,27 @@ async def is_suppressed(db, device_id: int, device_category, category: str, now:
 
     3개 수신 핸들러(detections/malfunctions/connections)가 device 조회 직후·상태 플립 전에 호출한다.
     ★ fail-open: 게이트 조회 오류가 이벤트 저장을 막지 않는다(탐지 서버에서 조용한 유실 방지).
+
+    user-021: 메모리 구간 인덱스(suppression_index) 조회 — 적중 시 DB 무접촉. 인덱스가 없거나
+    만료면 이 세션으로 1회 재적재(스케줄 + 대상 그룹 멤버십 2쿼리) 후 판정한다.
     """
     try:
         if category not in _SUPPRESSIBLE_CATEGORIES:
             return False, None
         try:
-            scope_for_category = EnumSuppressionEventScope(category)
+            EnumSuppressionEventScope(category)
         except ValueError:
             return False, None
 
-        from app.models.event_suppression import EventSuppressionSchedule
-        from app.models.device_group import DeviceGroupMapping
+        n = _naive_utc(now or utc_now())
+        index = suppression_index.get(n)
+        if index is None:
+            seq = suppression_index.write_seq()
+            index = await suppression_index.build(db, min(n, _naive_utc(utc_now())))
+            suppression_index.store(index, seq)
 
-        n = now or utc_now()
-        stmt = select(EventSuppressionSchedule).where(
-            EventSuppressionSchedule.revoked_at.is_(None),
-            EventSuppressionSchedule.window_start <= n,
-            EventSuppressionSchedule.window_end > n,
-            EventSuppressionSchedule.event_scope.in_(
-                [EnumSuppressionEventScope.ALL, scope_for_category]
-            ),
-        ).order_by(EventSuppressionSchedule.id)  # 다중 매치 시 결정적 first-match(L1, 감사 추적 안정)
-        candidates = (await db.execute(stmt)).scalars().all()
-        if not candidates:
-            return False, None
-
-        device_side = _derive_side(device_category)
-
-        # GROUP 후보들의 대상 그룹 **합집합**으로 멤버십 1회 배치 조회(N+1 회피 유지).
-        # target_groups 는 relationship lazy="selectin" 으로 후보 로드 시 자동 eager 로드됨.
-        group_ids = {
-            g.group_id for c in candidates
-            if c.target_type == EnumSuppressionTargetType.GROUP
-            for g in c.target_groups
-        }
-        member_groups: set[int] = set()
-        if group_ids:
-            rows = (await db.execute(
-                select(DeviceGroupMapping.group_id).where(
-                    DeviceGroupMapping.device_id == device_id,
-                    DeviceGroupMapping.group_id.in_(group_ids),
-                )
-            )).scalars().all()
-            member_groups = set(rows)
-
-        for c in candidates:
-            tt = c.target_type
-            if tt == EnumSuppressionTargetType.DEVICE:
-                # device_id ∈ 대상 장비 집합
-                if device_id in {t.device_id for t in c.target_devices}:
-                    return True, c.id
-            elif tt == EnumSuppressionTargetType.ALL:
-                if _side_matches(device_side, c.target_side):
-                    return True, c.id
-            elif tt == EnumSuppressionTargetType.GROUP:
-                # 대상 그룹 집합 ∩ 장비 소속 그룹 ≠ ∅
-                if ({t.group_id for t in c.target_groups} & member_groups) and _side_matches(device_side, c.target_side):
-                    return True, c.id
-        return False, None
+        matched = index.match(device_id, _derive_side(device_category), category, n)
+        return matched is not None, matched
     except Exception as e:  # fail-open — 억제 게이트 오류가 이벤트 저장을 막지 않음
         # ★ H2: 조회 예외로 세션이 무효(inactive) 상태일 수 있음. rollback 으로 복구하지 않으면
         #   호출부의 db.add(new_event)/commit 이 PendingRollbackError 로 500 → 이벤트 유실(진짜 fail-open 붕괴).
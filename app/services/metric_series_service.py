@@ -0,0 +1,286 @@
+"""
+함체/서버 메트릭 다운샘플 시계열 — SQL 버킷 집계 + 1시간 롤업 증분 잡 (user-017)
+
+`GET /api/devices/enclosures/{id}/metrics` / `GET /api/servers/{id}/metrics` 는 원본 행을 그대로 돌려줘
+10초 주기 텔레메트리 1주 차트 = 수만 포인트를 클라이언트가 받아 접었다.
+`bucket=1m|5m|1h` 지정 시 버킷별 min/avg/max/last 를 SQL 에서 계산해 버킷 수만큼만 반환한다.
+
+버킷 집계(_raw_aggregates):
+- 버킷 = PostgreSQL `date_bin(interval, created_at, 1970-01-01 UTC)`(UTC 정렬). SQLite(테스트 DB)는 epoch 초 정수 나눗셈.
+- min/max/sum/count = GROUP BY, last = `row_number() OVER (PARTITION BY 버킷 ORDER BY created_at DESC, id DESC) = 1` 의 값.
+- 함체 메트릭 값 컬럼은 문자열(Decimal 호환 저장)이라 Float 로 캐스팅해 집계.
+
+롤업(metric_rollup_hourly, 잡 run_metric_rollup — METRIC_ROLLUP_INTERVAL_MINUTES 주기):
+- event_rollup_service 와 같은 워터마크 방식 — 닫힌 정시(METRIC_ROLLUP_SETTLE_SECONDS 여유)까지 24시간 창 단위
+  재계산(DELETE + INSERT, 멱등), 직전 METRIC_ROLLUP_RECOMPUTE_HOURS 겹침으로 늦은 수집분 흡수. 최초 실행은 백필.
+- `bucket=1h` 조회는 워터마크 이전의 완전한 정시 = 롤업, 범위 가장자리·워터마크 이후 = 원본. 잡 미실행이면 전부 원본
+  — 결과는 같고 느릴 뿐. 1m/5m 는 항상 원본(짧은 범위 전제).
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from sqlalchemy import Float, Integer, case, cast, delete, func, insert, literal_column, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.models.device import EnclosureMetric
+from app.models.event_rollup import EventRollupState
+from app.models.metric_rollup import MetricRollupHourly
+from app.models.server import ServerMetrics
+from app.schemas.common import MetricAggregate, MetricBucketResponse
+from app.utils.datetime import to_utc, utc_now
+
+# 허용 버킷(쿼리 파라미터 값 → 초). 새 크기는 여기만 추가.
+BUCKETS = {"1m": 60, "5m": 300, "1h": 3600}
+BUCKET_PATTERN = "^(" + "|".join(BUCKETS) + ")$"
+
+_HOUR = timedelta(hours=1)
+_WINDOW = timedelta(hours=24)
+
+
+@dataclass(frozen=True)
+class MetricSource:
+    """다운샘플 대상 원본 테이블 정의."""
+    name: str  # metric_rollup_hourly.source
+    model: type
+    entity_col: str
+    metrics: tuple[str, ...]
+    watermark: str  # EventRollupState.name
+
+
+SOURCES = {
+    "enclosure": MetricSource(
+        "enclosure", EnclosureMetric, "enclosure_id",
+        ("temperature", "humidity", "current", "voltage", "vibration", "ups_battery_level"),
+        "enclosure_metrics",
+    ),
+    "server": MetricSource(
+        "server", ServerMetrics, "server_id",
+        ("cpu_usage", "ram_usage", "ram_used_gb", "disk_usage", "disk_used_gb",
+         "network_in_mbps", "network_out_mbps", "process_count"),
+        "server_metrics",
+    ),
+}
+
+# {(entity_id, bucket_start): {metric: [count, min, max, sum, last]}}
+_Aggs = dict[tuple[int, datetime], dict[str, list]]
+
+
+# ------------------------------------------------------------------
+# 시간 경계 헬퍼 (전부 aware UTC)
+# ------------------------------------------------------------------
+
+def _aware(dt: datetime) -> datetime:
+    """SQLite 가 돌려주는 naive(UTC 벽시계) 포함 → aware UTC."""
+    return dt.replace(tzinfo=timezone.utc) if dt.tzinfo is None else dt.astimezone(timezone.utc)
+
+
+def _floor(dt: datetime, seconds: int) -> datetime:
+    epoch = int(_aware(dt).timestamp())
+    return datetime.fromtimestamp(epoch - epoch % seconds, tz=timezone.utc)
+
+
+def _ceil(dt: datetime, seconds: int) -> datetime:
+    f = _floor(dt, seconds)
+    return f if f == _aware(dt) else f + timedelta(seconds=seconds)
+
+
+def _bucket_start(value) -> datetime:
+    """버킷 식 결과 → aware UTC. PG date_bin 은 timestamptz, SQLite 는 epoch 초."""
+    if isinstance(value, datetime):
+        return _aware(value)
+    return datetime.fromtimestamp(int(value), tz=timezone.utc)
+
+
+def _bucket_expr(db: AsyncSession, col, seconds: int):
+    if db.bind.dialect.name == "postgresql":
+        # seconds 는 BUCKETS 화이트리스트 값 — 리터럴 삽입 안전
+        return func.date_bin(
+            literal_column(f"interval '{int(seconds)} seconds'"), col,
+            literal_column("timestamptz '1970-01-01 00:00:00+00'"),
+        )
+    return cast(func.strftime("%s", col), Integer) // seconds * seconds
+
+
+# ------------------------------------------------------------------
+# 집계
+# ------------------------------------------------------------------
+
+async def _raw_aggregates(
+    db: AsyncSession, src: MetricSource, seconds: int, lo: datetime, hi: datetime,
+    *, entity_id: Optional[int] = None, inclusive: bool = False,
+) -> _Aggs:
+    """원본 [lo, hi) (inclusive 면 [lo, hi]) 를 seconds 버킷으로 — 쿼리 1회."""
+    m = src.model
+    ts, ent = m.created_at, getattr(m, src.entity_col)
+    bucket = _bucket_expr(db, ts, seconds)
+    where = [ts >= lo, ts <= hi if inclusive else ts < hi]
+    if entity_id is not None:
+        where.append(ent == entity_id)
+    inner = select(
+        ent.label("entity_id"),
+        bucket.label("bucket"),
+        *[cast(getattr(m, f), Float).label(f) for f in src.metrics],
+        func.row_number().over(partition_by=(ent, bucket), order_by=(ts.desc(), m.id.desc())).label("rn"),
+    ).where(*where).subquery()
+
+    cols = [inner.c.entity_id, inner.c.bucket]
+    for f in src.metrics:
+        c = inner.c[f]
+        cols += [func.count(c), func.min(c), func.max(c), func.sum(c), func.max(case((inner.c.rn == 1, c)))]
+    rows = (await db.execute(select(*cols).group_by(inner.c.entity_id, inner.c.bucket))).all()
+
+    out: _Aggs = {}
+    for r in rows:
+        per = {}
+        for i, f in enumerate(src.metrics):
+            count, mn, mx, total, last = r[2 + 5 * i: 7 + 5 * i]
+            if count:
+                per[f] = [int(count), mn, mx, total, last]
+        out[(r[0], _bucket_start(r[1]))] = per
+    return out
+
+
+async def _rollup_aggregates(
+    db: AsyncSession, src: MetricSource, lo: datetime, hi: datetime, entity_id: int,
+) -> _Aggs:
+    r = MetricRollupHourly
+    rows = (await db.execute(
+        select(r.bucket_start, r.metric, r.sample_count, r.min_value, r.max_value, r.sum_value, r.last_value)
+        .where(r.source == src.name, r.entity_id == entity_id, r.bucket_start >= lo, r.bucket_start < hi)
+    )).all()
+    out: _Aggs = {}
+    for b, metric, count, mn, mx, total, last in rows:
+        out.setdefault((entity_id, _aware(b)), {})[metric] = [count, mn, mx, total, last]
+    return out
+
+
+async def get_watermark(db: AsyncSession, name: str) -> Optional[datetime]:
+    """이 시각 이전 정시는 롤업이 권위. 잡 미실행이면 None."""
+    wm = (await db.execute(select(EventRollupState.watermark).where(EventRollupState.name == name))).scalar()
+    return _aware(wm) if wm is not None else None
+
+
+def _to_response(src: MetricSource, bucket_start: datetime, per: dict[str, list]) -> MetricBucketResponse:
+    metrics = {}
+    for f in src.metrics:
+        count, mn, mx, total, last = per.get(f) or (0, None, None, None, None)
+        metrics[f] = MetricAggregate(
+            count=count, min=mn, max=mx, avg=(total / count) if count else None, last=last,
+        )
+    return MetricBucketResponse(
+        bucket_start=bucket_start,
+        sample_count=max((v[0] for v in per.values()), default=0),
+        metrics=metrics,
+    )
+
+
+async def metric_series(
+    db: AsyncSession,
+    source: str,
+    entity_id: int,
+    bucket: str,
+    *,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    limit: int = 100,
+) -> list[MetricBucketResponse]:
+    """entity 1개의 버킷 시계열(시간 오름차순, 최근 limit 버킷).
+
+    start 미지정 시 end(기본 now) 기준 최근 limit 버킷 범위만 읽는다.
+    """
+    src = SOURCES[source]
+    seconds = BUCKETS[bucket]
+    end = to_utc(end) if end else utc_now()
+    start = to_utc(start) if start else _floor(end, seconds) - timedelta(seconds=seconds * (limit - 1))
+
+    # 1h: 워터마크 이전의 완전한 정시 [h_lo, h_hi) 는 롤업 — 버킷 경계와 겹치지 않으므로 단순 병합
+    h_lo = h_hi = start
+    if seconds == 3600:
+        wm = await get_watermark(db, src.watermark)
+        if wm is not None:
+            h_lo, h_hi = _ceil(start, 3600), _floor(max(start, min(end, wm)), 3600)
+
+    aggs: _Aggs = {}
+    if h_lo < h_hi:
+        if start < h_lo:
+            aggs.update(await _raw_aggregates(db, src, seconds, start, h_lo, entity_id=entity_id))
+        aggs.update(await _rollup_aggregates(db, src, h_lo, h_hi, entity_id))
+        aggs.update(await _raw_aggregates(db, src, seconds, h_hi, end, entity_id=entity_id, inclusive=True))
+    else:
+        aggs.update(await _raw_aggregates(db, src, seconds, start, end, entity_id=entity_id, inclusive=True))
+
+    keys = sorted(aggs, key=lambda k: k[1])[-limit:]
+    return [_to_response(src, k[1], aggs[k]) for k in keys]
+
+
+# ------------------------------------------------------------------
+# 증분 잡
+# ------------------------------------------------------------------
+
+async def _rebuild_hourly(db: AsyncSession, src: MetricSource, lo: datetime, hi: datetime) -> int:
+    await db.execute(delete(MetricRollupHourly).where(
+        MetricRollupHourly.source == src.name,
+        MetricRollupHourly.bucket_start >= lo, MetricRollupHourly.bucket_start < hi,
+    ))
+    rows = [
+        {"source": src.name, "entity_id": entity_id, "metric": metric, "bucket_start": b,
+         "sample_count": v[0], "min_value": v[1], "max_value": v[2], "sum_value": v[3], "last_value": v[4]}
+        for (entity_id, b), per in (await _raw_aggregates(db, src, 3600, lo, hi)).items()
+        for metric, v in per.items()
+    ]
+    if rows:
+        await db.execute(insert(MetricRollupHourly), rows)
+    return len(rows)
+
+
+async def rollup_metrics(db: AsyncSession, source: str, now: Optional[datetime] = None) -> dict:
+    """한 회차 — source 원본의 닫힌 정시까지 시간 롤업 재계산.
+
+    Returns: {"from", "to", "hours", "rows"} (진단용).
+    """
+    src = SOURCES[source]
+    boundary = _floor((now or utc_now()) - timedelta(seconds=settings.METRIC_ROLLUP_SETTLE_SECONDS), 3600)
+    state = await db.get(EventRollupState, src.watermark)
+    if state is None:
+        first = (await db.execute(select(func.min(src.model.created_at)))).scalar()
+        wm = min(_floor(first, 3600), boundary) if first is not None else boundary
+        state = EventRollupState(name=src.watermark, watermark=wm)
+        db.add(state)
+        cur = wm
+    else:
+        wm = _aware(state.watermark)
+        cur = min(wm, boundary) - timedelta(hours=settings.METRIC_ROLLUP_RECOMPUTE_HOURS)
+
+    start, hours, written = cur, 0, 0
+    while cur < boundary:
+        nxt = min(cur + _WINDOW, boundary)
+        written += await _rebuild_hourly(db, src, cur, nxt)
+        hours += int((nxt - cur) / _HOUR)
+        wm = max(wm, nxt)
+        state.watermark = wm
+        await db.commit()
+        cur = nxt
+    await db.commit()
+    return {"from": start, "to": wm, "hours": hours, "rows": written}
+
+
+async def run_metric_rollup() -> dict:
+    """스케줄러 진입점 — source 별 독립 세션, 실패는 로그만(다음 회차가 같은 구간부터 이어 감)."""
+    from app.database import AsyncSessionLocal
+
+    results = {}
+    for source in SOURCES:
+        async with AsyncSessionLocal() as db:
+            try:
+                results[source] = await rollup_metrics(db, source)
+            except Exception as e:
+                print(f"[metric_rollup] {source} error: {e}")
+                try:
+                    await db.rollback()
+                except Exception:
+                    pass
+    return results
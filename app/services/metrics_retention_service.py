@@ -0,0 +1,160 @@
+"""
+enclosure_metrics / server_metrics 보존·계층화 — 원본 N일(파티션 DROP) + 1시간 롤업 M개월 (user-018)
+
+배경: 두 테이블은 무제한 성장했고(정리는 수동 DELETE 엔드포인트뿐), db_monitor ENCLOSURE_METRICS 주기
+조회가 전 이력을 훑었다. v79 로 두 테이블을 일별 RANGE 파티셔닝(`created_at`, UTC 자정 경계,
+`<table>_YYYY_MM_DD`)하고, 이 서비스가 api_logs(user-013)와 같은 형틀로 관리한다.
+
+- 사전 생성(ensure_metric_partitions): 오늘 + METRICS_PARTITION_DAYS_AHEAD 일, 멱등. startup 1회 + 일 1회 cron.
+  DEFAULT 파티션은 두지 않는다(api_logs 와 동일) — created_at 은 서버 시각이라 사전 생성 지평 밖 행이 없고,
+  DEFAULT 에 행이 쌓이면 해당 범위 새 파티션 CREATE 가 거부된다.
+- 계층화(run_metrics_tiering, 일 1회 cron) — source 별:
+  1. 1시간 롤업(user-017 rollup_metrics)을 먼저 따라잡는다 — 버릴 원본은 항상 롤업된 뒤에만.
+  2. 원본: 상한 경계가 min(오늘 - METRICS_RAW_RETENTION_DAYS, 롤업 워터마크) 이하인 파티션 DETACH + DROP.
+     (수동 추가된) DEFAULT 파티션은 만료 행만 DELETE. 비파티션 DB(v79 미적용/SQLite)는 DELETE 폴백.
+  3. 롤업: METRICS_ROLLUP_RETENTION_MONTHS 개월 경과 metric_rollup_hourly 행 DELETE
+     (원본 10초 주기 대비 ~360배 작아 행 DELETE 로 충분).
+- 원본이 DROP 된 구간도 `bucket=1h` 조회는 롤업으로 계속 응답한다(1m/5m 는 원본 보존기간까지만).
+"""
+from __future__ import annotations
+
+import calendar
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Optional
+
+from sqlalchemy import delete, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.models.metric_rollup import MetricRollupHourly
+from app.services.api_logs_partition_service import PartitionBound, is_partitioned, list_partitions
+from app.services.metric_series_service import SOURCES, MetricSource, get_watermark, rollup_metrics
+from app.utils.datetime import utc_now
+
+
+def _table(src: MetricSource) -> str:
+    return src.model.__tablename__
+
+
+def _day_partition_ddl(table: str, day: date) -> tuple[str, str]:
+    """(partition_name, ddl) — 해당 일 [UTC 자정, 다음날 자정) 반열림 RANGE 파티션 DDL."""
+    name = f"{table}_{day:%Y_%m_%d}"
+    ddl = (
+        f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF {table} "
+        f"FOR VALUES FROM ('{day.isoformat()} 00:00:00+00') TO ('{(day + timedelta(days=1)).isoformat()} 00:00:00+00')"
+    )
+    return name, ddl
+
+
+def _utc_midnight(day: date) -> datetime:
+    return datetime.combine(day, time.min, tzinfo=timezone.utc)
+
+
+def _months_before(day: date, months: int) -> date:
+    """day 에서 months 개월 전 같은 날(말일 보정)."""
+    y, m = divmod(day.year * 12 + day.month - 1 - months, 12)
+    return date(y, m + 1, min(day.day, calendar.monthrange(y, m + 1)[1]))
+
+
+def _covers(bound: PartitionBound, day: date) -> bool:
+    """timestamptz 경계(aware) 파티션이 UTC 날짜 day 를 덮는지."""
+    start = _utc_midnight(day)
+    return (not bound.is_default
+            and (bound.lower is None or bound.lower <= start)
+            and (bound.upper is None or start < bound.upper))
+
+
+async def ensure_metric_partitions(days_ahead: int | None = None) -> list[str]:
+    """오늘 + 향후 `days_ahead` 일 enclosure_metrics/server_metrics 파티션을 멱등 보장.
+
+    반환: 보장된 파티션명 리스트. 비파티션 테이블은 건너뛴다(둘 다 비파티션이면 []).
+    """
+    from app.database import AsyncSessionLocal
+
+    if days_ahead is None:
+        days_ahead = settings.METRICS_PARTITION_DAYS_AHEAD
+    today = utc_now().date()
+    ensured: list[str] = []
+    async with AsyncSessionLocal() as db:
+        for src in SOURCES.values():
+            table = _table(src)
+            if not await is_partitioned(db, table):
+                continue
+            existing = [b for b in await list_partitions(db, table) if not b.is_default]
+            for offset in range(days_ahead + 1):
+                day = today + timedelta(days=offset)
+                if any(_covers(b, day) for b in existing):
+                    continue
+                name, ddl = _day_partition_ddl(table, day)
+                try:
+                    # default 파티션에 해당 일 행이 있으면 생성이 거부된다 — 그 날만 건너뛰고 계속.
+                    async with db.begin_nested():
+                        await db.execute(text(ddl))
+                    ensured.append(name)
+                except Exception as e:
+                    print(f"[WARN] {table} partition {name} not created: {e}")
+        await db.commit()
+    return ensured
+
+
+async def tier_metrics(db: AsyncSession, source: str, now: Optional[datetime] = None) -> dict:
+    """source 1개 계층화 한 회차. Returns: {"raw_cutoff", "dropped", "deleted_rows", "rollup_deleted"}."""
+    src = SOURCES[source]
+    table = _table(src)
+    now = now or utc_now()
+    today = now.astimezone(timezone.utc).date()
+
+    await rollup_metrics(db, source, now=now)
+    wm = await get_watermark(db, src.watermark)
+    raw_cutoff = _utc_midnight(today - timedelta(days=settings.METRICS_RAW_RETENTION_DAYS))
+    if wm is None or wm < raw_cutoff:
+        # 롤업이 못 따라온 구간의 원본은 버리지 않는다
+        raw_cutoff = wm or datetime.min.replace(tzinfo=timezone.utc)
+
+    dropped: list[str] = []
+    deleted = 0
+    if await is_partitioned(db, table):
+        for b in await list_partitions(db, table):
+            if b.is_default:
+                result = await db.execute(
+                    text(f"DELETE FROM {b.name} WHERE created_at < :cutoff"), {"cutoff": raw_cutoff},
+                )
+                deleted += result.rowcount or 0
+            elif b.upper is not None and b.upper <= raw_cutoff:
+                await db.execute(text(f"ALTER TABLE {table} DETACH PARTITION {b.name}"))
+                await db.execute(text(f"DROP TABLE IF EXISTS {b.name}"))
+                dropped.append(b.name)
+    else:
+        result = await db.execute(delete(src.model).where(src.model.created_at < raw_cutoff))
+        deleted = result.rowcount or 0
+
+    rollup_cutoff = _utc_midnight(_months_before(today, settings.METRICS_ROLLUP_RETENTION_MONTHS))
+    result = await db.execute(delete(MetricRollupHourly).where(
+        MetricRollupHourly.source == src.name, MetricRollupHourly.bucket_start < rollup_cutoff,
+    ))
+    await db.commit()
+    return {
+        "raw_cutoff": raw_cutoff, "dropped": dropped, "deleted_rows": deleted,
+        "rollup_deleted": result.rowcount or 0,
+    }
+
+
+async def run_metrics_tiering() -> dict:
+    """스케줄러 진입점 — source 별 독립 세션, 실패는 로그만(다음 회차가 이어 감)."""
+    from app.database import AsyncSessionLocal
+    from app.services import enclosure_latest_cache
+
+    results = {}
+    for source in SOURCES:
+        async with AsyncSessionLocal() as db:
+            try:
+                results[source] = await tier_metrics(db, source)
+            except Exception as e:
+                print(f"[metrics_tiering] {source} error: {e}")
+                try:
+                    await db.rollback()
+                except Exception:
+                    pass
+    # 오래 조용한 함체의 최신 행이 보존 밖으로 빠졌을 수 있다(user-016 캐시)
+    enclosure_latest_cache.invalidate()
+    return results
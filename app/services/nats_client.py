@@ -0,0 +1,240 @@
+"""
+API 프로세스 공용 NATS 연결 — lifespan 관리 장기 연결 + 유계 송신 버퍼 + 배치 flush (user-002)
+
+이전: publish_session_revoke / publish_permissions_changed 가 메시지마다 `nats.connect()` → publish →
+flush → close. 일괄 강제로그아웃·grant 만료 sweep 이 수백 건이면 TCP+핸드셰이크를 수백 번 지불했다.
+
+- 연결: lifespan 에서 1회 기동(start_nats_client). 끊기면 nats-py 자체 재연결(max_reconnect_attempts=-1),
+  초기 연결 실패는 감독 태스크가 지수 백오프로 재시도 — 기동을 막지 않는다.
+- 버퍼: asyncio.Queue(NATS_PUBLISH_BUFFER_SIZE). full 이면 drop-and-count(요청 방해 금지, api_logs 큐와 동일 계약).
+- flush: 첫 메시지 수신 후 NATS_FLUSH_INTERVAL_MS 안에 NATS_FLUSH_BATCH_SIZE 까지 모아 publish 후
+  `flush()` 1회(PING/PONG 1왕복) — 메시지당 왕복 제거. `_log_consumer` 의 크기/데드라인 트리거와 같은 형틀.
+- 계약: publish() 는 **절대 raise 하지 않는다**(best-effort, FR-SVF-11). True = 전달 수락(버퍼 적재 또는
+  1회성 발행 성공), False = 버퍼 full / 발행 실패.
+- lifespan 밖(스크립트·단위테스트 등 미기동 상태)에서는 기존 1회성 connect 경로로 폴백한다.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Optional
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+_queue: Optional[asyncio.Queue] = None
+_task: Optional[asyncio.Task] = None
+_nc = None
+
+_stats: dict[str, int] = {
+    "published": 0,     # flush 까지 성공한 메시지
+    "failed": 0,        # publish/flush 예외로 유실된 메시지
+    "dropped": 0,       # 버퍼 full 로 버린 메시지
+    "batches": 0,
+    "oneshot": 0,       # 미기동 폴백(1회성 connect) 발행 수
+    "connects": 0,
+    "disconnects": 0,
+    "reconnects": 0,
+}
+_last_flush_ms: Optional[float] = None
+_max_flush_ms: float = 0.0
+
+
+def is_running() -> bool:
+    return _task is not None and not _task.done()
+
+
+def is_connected() -> bool:
+    return _nc is not None and bool(getattr(_nc, "is_connected", False))
+
+
+def get_stats() -> dict:
+    """발행 카운터 + 버퍼 깊이 + flush 지연(진단/모니터링 용도, 프로세스 재시작 시 리셋)."""
+    return {
+        **_stats,
+        "running": is_running(),
+        "connected": is_connected(),
+        "queue_depth": _queue.qsize() if _queue is not None else 0,
+        "last_flush_ms": _last_flush_ms,
+        "max_flush_ms": round(_max_flush_ms, 3),
+    }
+
+
+def reset_stats() -> None:
+    global _last_flush_ms, _max_flush_ms
+    for key in _stats:
+        _stats[key] = 0
+    _last_flush_ms = None
+    _max_flush_ms = 0.0
+
+
+async def publish(subject: str, data: bytes) -> bool:
+    """best-effort 발행 — 예외를 던지지 않는다.
+
+    기동 상태면 버퍼에 적재만 하고 즉시 반환(O(1)). 미기동이면 1회성 connect 로 직접 발행.
+    """
+    if _queue is not None and is_running():
+        try:
+            _queue.put_nowait((subject, data))
+            return True
+        except asyncio.QueueFull:
+            _stats["dropped"] += 1
+            if _stats["dropped"] % 128 == 1:
+                logger.warning("nats publish buffer full — drop (total dropped=%d, qsize=%d)",
+                               _stats["dropped"], _queue.qsize())
+            return False
+    return await _publish_once(subject, data)
+
+
+async def _publish_once(subject: str, data: bytes) -> bool:
+    """lifespan 밖 폴백 — 기존 발행마다 connect 경로 그대로."""
+    try:
+        import nats
+        nc = await nats.connect(settings.NATS_URL, connect_timeout=2, max_reconnect_attempts=1)
+        try:
+            await nc.publish(subject, data)
+            await nc.flush(timeout=2)
+        finally:
+            await nc.close()
+        _stats["oneshot"] += 1
+        return True
+    except Exception as e:
+        _stats["failed"] += 1
+        logger.warning("nats one-shot publish failed (subject=%s): %s", subject, e)
+        return False
+
+
+async def _connect():
+    import nats
+
+    async def _disconnected_cb():
+        _stats["disconnects"] += 1
+        logger.warning("nats disconnected — client will reconnect")
+
+    async def _reconnected_cb():
+        _stats["reconnects"] += 1
+        logger.info("nats reconnected")
+
+    async def _error_cb(e):
+        logger.warning("nats client error: %s", e)
+
+    nc = await nats.connect(
+        settings.NATS_URL,
+        name="gop-api-server",
+        connect_timeout=2,
+        allow_reconnect=True,
+        max_reconnect_attempts=-1,
+        reconnect_time_wait=2,
+        disconnected_cb=_disconnected_cb,
+        reconnected_cb=_reconnected_cb,
+        error_cb=_error_cb,
+    )
+    _stats["connects"] += 1
+    return nc
+
+
+async def _send_batch(batch: list[tuple[str, bytes]]) -> None:
+    """배치 publish 후 flush 1회. 실패분은 카운트만(best-effort, 재시도 없음)."""
+    global _last_flush_ms, _max_flush_ms
+    if not batch:
+        return
+    started = time.perf_counter()
+    try:
+        for subject, data in batch:
+            await _nc.publish(subject, data)
+        await _nc.flush(timeout=2)
+    except Exception as e:
+        _stats["failed"] += len(batch)
+        logger.warning("nats batch publish failed (%d msgs): %s", len(batch), e)
+        return
+    elapsed = (time.perf_counter() - started) * 1000
+    _last_flush_ms = round(elapsed, 3)
+    _max_flush_ms = max(_max_flush_ms, elapsed)
+    _stats["published"] += len(batch)
+    _stats["batches"] += 1
+
+
+async def _fill_batch(batch: list[tuple[str, bytes]]) -> None:
+    """첫 메시지는 blocking get, 이후 NATS_FLUSH_INTERVAL_MS 창 안에서 NATS_FLUSH_BATCH_SIZE 까지 수집.
+
+    호출자 리스트에 제자리 적재 — 수집 도중 취소돼도 이미 꺼낸 메시지가 shutdown 방출에 포함된다.
+    """
+    loop = asyncio.get_running_loop()
+    batch.append(await _queue.get())
+    deadline = loop.time() + settings.NATS_FLUSH_INTERVAL_MS / 1000
+    while len(batch) < settings.NATS_FLUSH_BATCH_SIZE:
+        try:
+            batch.append(_queue.get_nowait())
+            continue
+        except asyncio.QueueEmpty:
+            pass
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            break
+        try:
+            batch.append(await asyncio.wait_for(_queue.get(), timeout=remaining))
+        except asyncio.TimeoutError:
+            break
+
+
+async def _run() -> None:
+    """감독 + flusher 단일 태스크. 연결 전엔 버퍼에 쌓이기만 하고(유계) 연결 후 순서대로 방출."""
+    global _nc
+    backoff = 1.0
+    batch: list[tuple[str, bytes]] = []
+    try:
+        while True:
+            if _nc is None or getattr(_nc, "is_closed", False):
+                try:
+                    _nc = await _connect()
+                    backoff = 1.0
+                except Exception as e:
+                    _nc = None
+                    logger.warning("nats connect failed (%s) — retry in %.0fs", e, backoff)
+                    await asyncio.sleep(backoff)
+                    backoff = min(backoff * 2, 30.0)
+                    continue
+            await _fill_batch(batch)
+            await _send_batch(batch)
+            batch.clear()
+    except asyncio.CancelledError:
+        # graceful shutdown: 미방출분 + 큐 잔여를 마지막 1배치로 방출 시도 후 재-raise.
+        while _queue is not None and not _queue.empty():
+            batch.append(_queue.get_nowait())
+        if batch and is_connected():
+            await _send_batch(batch)
+        elif batch:
+            _stats["failed"] += len(batch)
+        raise
+
+
+async def start_nats_client() -> None:
+    """lifespan startup 훅 — 이미 실행 중이면 무시(idempotent). 연결 실패가 기동을 막지 않는다."""
+    global _queue, _task
+    if is_running():
+        return
+    _queue = asyncio.Queue(maxsize=settings.NATS_PUBLISH_BUFFER_SIZE)
+    _task = asyncio.create_task(_run(), name="nats_publisher")
+
+
+async def stop_nats_client() -> None:
+    """lifespan shutdown 훅 — flusher 취소(잔여 방출) 후 연결 종료."""
+    global _task, _nc, _queue
+    if _task is not None:
+        _task.cancel()
+        try:
+            await _task
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            logger.warning("nats publisher stop error: %s", e)
+        _task = None
+    if _nc is not None:
+        try:
+            await _nc.close()
+        except Exception:
+            pass
+        _nc = None
+    _queue = None
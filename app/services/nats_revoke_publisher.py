@@ -9,8 +9,8 @@ per-session 전용 subject 로 서명된 revoke 메시지를 발행한다(best-e
   subject 스킴이 클라 EffectiveSubject 와 매칭되는지 확인(V-SVF-05) + 발행 ACL(FR-SVF-08) 을
   적용한 뒤에만 True 로 켠다. False 인 동안 publish_session_revoke 는 즉시 False 를 반환(무동작).
 
-성능 주: 현재는 발행마다 connect 한다(force_logout 은 드문 관리자 동작이라 허용).
-  활성화 후 트래픽이 늘면 lifespan 관리 장기 연결로 최적화한다.
+성능 주: 발행은 app.services.nats_client 공용 장기 연결(lifespan 관리)로 위임한다(user-002) —
+  버퍼 적재 후 즉시 반환, 배치당 flush 1회. lifespan 밖(스크립트·테스트)에선 1회성 connect 폴백.
 """
 import json
 import logging
@@ -19,6 +19,7 @@ from datetime import datetime, timezone
 from typing import Optional
 
 from app.config import settings
+from app.services import nats_client
 from app.utils.enums import EnumLogoutReason
 from app.utils.revoke_signing import build_signed_revoke
 
@@ -69,28 +70,16 @@ async def publish_session_revoke(
     """단일 세션 revoke 를 best-effort 로 발행. 실패해도 예외를 던지지 않는다(FR-SVF-11).
 
     Returns:
-        True  — 발행 성공
-        False — 비활성(게이트 off) 또는 발행 실패(로그만 남김)
+        True  — 발행 수락(공용 연결 버퍼 적재, 또는 폴백 1회성 발행 성공)
+        False — 비활성(게이트 off) · 버퍼 full · 발행 실패(로그만 남김)
     """
     if not settings.NATS_REVOKE_ENABLED:
         return False
 
     subject = revoke_subject(user_id, session_id)
     message = build_revoke_message(user_id=user_id, session_id=session_id, jti=jti, reason=reason)
-    try:
-        import nats
-        nc = await nats.connect(
-            settings.NATS_URL, connect_timeout=2, max_reconnect_attempts=1
-        )
-        try:
-            await nc.publish(subject, json.dumps(message).encode("utf-8"))
-            await nc.flush(timeout=2)
-        finally:
-            await nc.close()
-        return True
-    except Exception as e:  # best-effort: 발행 실패가 force_logout 을 막지 않음
-        logger.warning("revoke publish failed (subject=%s): %s", subject, e)
-        return False
+    # best-effort: 발행 실패가 force_logout 을 막지 않음(nats_client.publish 는 raise 하지 않는다)
+    return await nats_client.publish(subject, json.dumps(message).encode("utf-8"))
 
 
 # ──────────────────────────────────────────────────────────────────────────
@@ -139,25 +128,13 @@ async def publish_permissions_changed(
     WS-B(권한그룹 스케쥴링) 가 grants 생성/회수 + sweep 만료 시 호출한다.
 
     Returns:
-        True  — 발행 성공
-        False — 비활성(게이트 off) 또는 발행 실패(로그만 남김)
+        True  — 발행 수락(공용 연결 버퍼 적재, 또는 폴백 1회성 발행 성공)
+        False — 비활성(게이트 off) · 버퍼 full · 발행 실패(로그만 남김)
     """
     if not settings.NATS_REVOKE_ENABLED:
         return False
 
     subject = permissions_changed_subject(user_id)
     message = build_permissions_changed_message(user_id=user_id, reason=reason)
-    try:
-        import nats
-        nc = await nats.connect(
-            settings.NATS_URL, connect_timeout=2, max_reconnect_attempts=1
-        )
-        try:
-            await nc.publish(subject, json.dumps(message).encode("utf-8"))
-            await nc.flush(timeout=2)
-        finally:
-            await nc.close()
-        return True
-    except Exception as e:  # best-effort: 발행 실패가 grant 작업을 막지 않음
-        logger.warning("permissions_changed publish failed (subject=%s): %s", subject, e)
-        return False
+    # best-effort: 발행 실패가 grant 작업을 막지 않음
+    return await nats_client.publish(subject, json.dumps(message).encode("utf-8"))
@@ -0,0 +1,209 @@
+"""
+보고서 PDF 렌더 — lifespan 소유 장기 헤드리스 Chromium 풀 (user-008)
+
+이전: 보고서 1건마다 워커 스레드에서 `sync_playwright()` 기동 + Chromium 신규 launch(수 초, 수백 MB)
+후 렌더하고 고정 `wait_for_timeout(600)` 까지 기다렸다 — 처리량이 렌더가 아니라 브라우저 기동에 묶였다.
+
+- 슬롯 = 브라우저 1개 + 재사용 BrowserContext 1개. 렌더마다 새 page 만 열고 닫는다.
+- 동시성: 슬롯 수(PDF_RENDER_POOL_SIZE) = 동시 렌더 상한. 빈 슬롯이 없으면 대기(큐).
+  LIFO 반납 — 직전에 쓴(따뜻한) 브라우저부터 재사용, 나머지 슬롯은 동시 요청이 몰릴 때만 launch.
+- 기동: lifespan 은 풀만 만들고 브라우저는 슬롯 첫 사용 시 launch(Chromium 미설치 환경에서도 앱 기동 유지).
+- 재활용: 슬롯이 PDF_RENDER_RECYCLE_AFTER 회 렌더하면 브라우저 재시작(장기 누수/단편화 차단).
+- 크래시: 브라우저 연결이 끊긴 채 렌더가 실패하면 재launch 후 1회 재시도. 브라우저가 살아 있는
+  실패(HTML/타임아웃)는 재시도 없이 그대로 raise.
+- 준비 판정: `window.__READY__`(차트 완료) → 폰트 로드 + 2프레임 페인트 대기(SETTLE_JS). 고정 sleep 없음.
+- lifespan 밖(스크립트·동기 ReportService)은 html_to_pdf.html_to_pdf_bytes 의 1회성 경로를 그대로 쓴다.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Optional
+
+from app.config import settings
+from app.utils.html_to_pdf import LAUNCH_ARGS, PDF_OPTIONS, SETTLE_JS
+
+logger = logging.getLogger(__name__)
+
+
+class _Slot:
+    __slots__ = ("index", "browser", "context", "renders")
+
+    def __init__(self, index: int):
+        self.index = index
+        self.browser = None
+        self.context = None
+        self.renders = 0
+
+
+_playwright = None
+_playwright_lock: Optional[asyncio.Lock] = None
+_slots: Optional[asyncio.LifoQueue] = None
+_all_slots: list[_Slot] = []
+
+_stats: dict[str, int] = {
+    "renders": 0,       # 성공 렌더
+    "failures": 0,      # 최종 실패 렌더
+    "launches": 0,      # 브라우저 launch(최초 + 재시작)
+    "recycles": 0,      # N회 렌더 후 계획 재시작
+    "crashes": 0,       # 연결 끊김 감지 후 재시작
+}
+_last_render_ms: Optional[float] = None
+_max_render_ms: float = 0.0
+
+
+def is_running() -> bool:
+    return _slots is not None
+
+
+def get_stats() -> dict:
+    """렌더 카운터 + 슬롯 상태(진단/모니터링 용도, 프로세스 재시작 시 리셋)."""
+    return {
+        **_stats,
+        "running": is_running(),
+        "pool_size": len(_all_slots),
+        "idle": _slots.qsize() if _slots is not None else 0,
+        "browsers_alive": sum(1 for s in _all_slots if _alive(s)),
+        "last_render_ms": _last_render_ms,
+        "max_render_ms": round(_max_render_ms, 3),
+    }
+
+
+def reset_stats() -> None:
+    global _last_render_ms, _max_render_ms
+    for key in _stats:
+        _stats[key] = 0
+    _last_render_ms = None
+    _max_render_ms = 0.0
+
+
+def _alive(slot: _Slot) -> bool:
+    return slot.browser is not None and slot.browser.is_connected()
+
+
+async def _get_playwright():
+    global _playwright
+    async with _playwright_lock:
+        if _playwright is None:
+            try:
+                from playwright.async_api import async_playwright
+            except ImportError as e:  # pragma: no cover
+                raise RuntimeError(
+                    "playwright가 설치되지 않았습니다. 'pip install playwright' 후 'playwright install chromium'"
+                ) from e
+            _playwright = await async_playwright().start()
+        return _playwright
+
+
+async def _close_browser(slot: _Slot) -> None:
+    browser, slot.browser, slot.context = slot.browser, None, None
+    slot.renders = 0
+    if browser is not None:
+        try:
+            await browser.close()
+        except Exception:
+            pass  # 이미 죽은 브라우저
+
+
+async def _ensure_browser(slot: _Slot) -> None:
+    if slot.browser is not None:
+        if not slot.browser.is_connected():
+            _stats["crashes"] += 1
+            logger.warning("pdf render pool: slot %d 브라우저 연결 끊김 — 재시작", slot.index)
+            await _close_browser(slot)
+        elif slot.renders >= settings.PDF_RENDER_RECYCLE_AFTER:
+            _stats["recycles"] += 1
+            await _close_browser(slot)
+    if slot.browser is None:
+        pw = await _get_playwright()
+        slot.browser = await pw.chromium.launch(headless=True, args=LAUNCH_ARGS)
+        slot.context = await slot.browser.new_context()
+        slot.renders = 0
+        _stats["launches"] += 1
+
+
+async def _render_page(slot: _Slot, html: str, ready_timeout_ms: int) -> bytes:
+    page = await slot.context.new_page()
+    try:
+        await page.set_content(html, wait_until="load", timeout=ready_timeout_ms)
+        try:
+            await page.wait_for_function("window.__READY__===true", timeout=ready_timeout_ms)
+        except Exception as e:  # 차트 렌더 지연/실패해도 본문은 출력
+            if not _alive(slot):
+                raise
+            logger.warning("report render: __READY__ 대기 실패 (차트 일부 누락 가능): %s", e)
+        await page.evaluate(SETTLE_JS)
+        return await page.pdf(**PDF_OPTIONS)
+    finally:
+        try:
+            await page.close()
+        except Exception:
+            pass
+
+
+async def render_pdf(html: str, ready_timeout_ms: int = 120_000) -> bytes:
+    """완전한 HTML 문서 → A4 PDF 바이트(미압축). 빈 슬롯이 날 때까지 대기한다.
+
+    Raises:
+        RuntimeError: 풀 미기동 / Playwright 미설치.
+        Exception: 렌더 실패(크래시 1회 재시도 후에도 실패 포함).
+    """
+    # 대기/렌더 중 stop_pdf_render_pool 이 _slots 를 비워도 획득한 큐로 반납한다
+    slots = _slots
+    if slots is None:
+        raise RuntimeError("pdf render pool not started")
+    global _last_render_ms, _max_render_ms
+    slot = await slots.get()
+    if _slots is not slots:
+        slots.put_nowait(slot)  # 다음 대기자도 같은 판정으로 빠져나가게
+        raise RuntimeError("pdf render pool stopped")
+    try:
+        t0 = time.perf_counter()
+        for attempt in (1, 2):
+            try:
+                await _ensure_browser(slot)
+                pdf = await _render_page(slot, html, ready_timeout_ms)
+                break
+            except Exception:
+                if attempt == 2 or slot.browser is None or _alive(slot):
+                    _stats["failures"] += 1
+                    raise
+                _stats["crashes"] += 1
+                logger.warning("pdf render pool: slot %d 렌더 중 브라우저 크래시 — 재시작 후 재시도", slot.index)
+                await _close_browser(slot)
+        slot.renders += 1
+        _stats["renders"] += 1
+        _last_render_ms = round((time.perf_counter() - t0) * 1000, 3)
+        _max_render_ms = max(_max_render_ms, _last_render_ms)
+        return pdf
+    finally:
+        if _slots is not slots:
+            await _close_browser(slot)  # 정지 후 재launch 된 브라우저 누수 방지
+        slots.put_nowait(slot)
+
+
+async def start_pdf_render_pool() -> None:
+    global _slots, _all_slots, _playwright_lock
+    if _slots is not None:
+        return
+    size = max(1, settings.PDF_RENDER_POOL_SIZE)
+    _playwright_lock = asyncio.Lock()
+    _all_slots = [_Slot(i) for i in range(size)]
+    _slots = asyncio.LifoQueue()
+    for slot in reversed(_all_slots):
+        _slots.put_nowait(slot)
+
+
+async def stop_pdf_render_pool() -> None:
+    """모든 브라우저 종료 + Playwright 드라이버 정지. 진행 중 렌더는 끊긴다(생성 태스크가 FAILED 처리)."""
+    global _slots, _all_slots, _playwright
+    slots, _slots, _all_slots = _all_slots, None, []
+    for slot in slots:
+        await _close_browser(slot)
+    pw, _playwright = _playwright, None
+    if pw is not None:
+        try:
+            await pw.stop()
+        except Exception:
+            pass
@@ -8,6 +8,7 @@ PRD: PRD_Report_Master_Redesign
 """
 from __future__ import annotations
 
+import asyncio
 import re
 from collections import Counter
 from datetime import datetime
@@ -18,6 +19,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.utils import report_labels as L
+from app.utils.datetime import to_display
 
 _NAME_RE = re.compile(r"\]\s*(.+?)\s*\(number:")
 _ZONE_RE = re.compile(r"-\s*([A-Za-z])\s*\d+")
@@ -314,6 +316,55 @@ def build_master_data(
     return {"meta": meta, "sections": sections}
 
 
+def _fold_grouping_sets(rows: list, n_keys: int, n_aggs: int = 1) -> tuple[list[list[tuple]], tuple]:
+    """GROUPING SETS 결과 → (키별 [(값, *집계)] 리스트, 총계 집계 튜플).
+
+    행 형식: GROUPING(k1)..GROUPING(kn), k1..kn, 집계1..집계m — GROUPING()=0 인 키가 그 행의 그룹 키,
+    전부 1 이면 `()` 총계 행.
+    """
+    groups: list[list[tuple]] = [[] for _ in range(n_keys)]
+    total: tuple = (0,) * n_aggs
+    for r in rows:
+        flags, keys = r[:n_keys], r[n_keys:2 * n_keys]
+        aggs = tuple(int(v or 0) for v in r[2 * n_keys:2 * n_keys + n_aggs])
+        grouped = [i for i, g in enumerate(flags) if not g]
+        if grouped:
+            i = grouped[0]
+            groups[i].append((keys[i], *aggs))
+        else:
+            total = aggs
+    return groups, total
+
+
+def _by_count(pairs: list[tuple]) -> list[tuple]:
+    """`order by count desc` 등가 — 동률은 키 순으로 고정."""
+    return sorted(pairs, key=lambda x: (-x[1], str(x[0])))
+
+
+async def _run_queries(db: AsyncSession, queries: dict[str, str], params: dict) -> dict[str, list]:
+    """이름 → SQL 묶음 실행. PostgreSQL 이면 독립 쿼리를 풀 커넥션 여러 개에서 동시 실행
+    (REPORT_QUERY_CONCURRENCY 상한), 그 외(SQLite 테스트 등)는 요청 세션에서 순차 실행."""
+    engine = db.bind
+    if engine is None or engine.dialect.name != "postgresql":
+        out = {}
+        for name, sql in queries.items():
+            out[name] = list((await db.execute(text(sql), params)).all())
+        return out
+
+    from app.config import settings
+
+    sem = asyncio.Semaphore(max(1, settings.REPORT_QUERY_CONCURRENCY))
+
+    async def _one(sql: str) -> list:
+        async with sem:
+            async with engine.connect() as conn:
+                return list((await conn.execute(text(sql), params)).all())
+
+    names = list(queries)
+    results = await asyncio.gather(*(_one(queries[n]) for n in names))
+    return dict(zip(names, results))
+
+
 async def build_master_data_async(
     db: AsyncSession,
     start: datetime,
@@ -322,23 +373,22 @@ async def build_master_data_async(
     enabled_components: Optional[set[str]] = None,
     severity_filter: Optional[list[str]] = None,
 ) -> dict:
-    """AsyncSession 버전 — build_master_data와 동일 로직/결과.
+    """AsyncSession 버전 — build_master_data와 동일 결과(통계는 전체, 상세 rows 상위 500).
 
     v6.0 Phase 3: reports.py 라우터 async 전환에 대응해 신설.
-    - db.execute(text(...)) → await db.execute(text(...))
-    - 나머지(Row 처리, dict 조립, _filter_sections)는 sync 버전과 동일.
     - severity_filter 화이트리스트 검증 유지 (SQL injection 차단).
-    """
-    p = {"start": start, "end": end}
 
-    async def q(sql: str, params: dict | None = None) -> list:
-        result = await db.execute(text(sql), {**p, **(params or {})})
-        return list(result.all())
+    user-009: 테이블별 count(*)/GROUP BY 를 순차 왕복하던 구조(약 30 쿼리) → 도메인별 집계 1스캔.
+    - 시스템/로그인/장비/사용자 통계는 각각 GROUPING SETS 한 문장(총계 = `()` 집합).
+    - user-010: 탐지(유형/구역/시간대)·장애(유형) 분포와 총계는 이벤트 롤업(rollup_counts) —
+      닫힌 버킷은 event_rollup_daily/hourly, 가장자리·열린 구간만 원본. 조치 완료 수만 원본 1문장.
+    - 기간 무관 단순 카운트는 스칼라 서브쿼리 한 문장으로 묶음.
+    - 집계·상세 쿼리는 서로 독립 → _run_queries 가 풀 커넥션 여러 개에서 동시 실행
+      (섹션 간 스냅샷은 쿼리 단위 — 보고서 용도로 허용).
+    """
+    from app.services.event_rollup_service import rollup_counts
 
-    async def scalar(sql: str) -> int:
-        result = await db.execute(text(sql), p)
-        r = result.scalar()
-        return int(r or 0)
+    p = {"start": start, "end": end}
 
     EV = "e.created_at >= :start AND e.created_at < :end"
     CC = "created_at >= :start AND created_at < :end"
@@ -348,17 +398,90 @@ async def build_master_data_async(
     _safe_sev = [s.upper() for s in (severity_filter or []) if isinstance(s, str) and s.upper() in _valid_sev]
     SEV_FILTER = f" AND severity::text IN ({', '.join(repr(s) for s in _safe_sev)})" if _safe_sev else ""
 
-    det_total = await scalar(f"select count(*) from detection_events d join events e on e.id=d.id where {EV}")
-    mal_total = await scalar(f"select count(*) from malfunction_events m join events e on e.id=m.id where {EV}")
-    act_total = await scalar(f"select count(*) from action_events where {CC}")
-    dev_total = await scalar("select count(*) from devices")
-    sys_total = await scalar(f"select count(*) from system_events where {CC}{SEV_FILTER}")
-    cfg_total = await scalar(f"select count(*) from config_change_logs where {CC}")
-    aud_total = await scalar(f"select count(*) from audit_logs where {CC}")
-    usr_total = await scalar("select count(*) from account_users")
-    ses_total = await scalar("select count(*) from user_sessions")
-    log_total = await scalar(f"select count(*) from user_login_logs where {CC}")
-    srv_total = await scalar("select count(*) from servers")
+    # user-010: 탐지/장애 분포는 이벤트 롤업(닫힌 날짜·시간) + 원본(가장자리·열린 구간)
+    _ev_counts = await rollup_counts(db, start, end, ("category", "kind", "zone"))
+    _ev_hours = await rollup_counts(db, start, end, ("category",), bucket="hour")
+    _det_type, _det_zone, _mal_reason = Counter(), Counter(), Counter()
+    for (cat, kind, zone), n in _ev_counts.items():
+        if cat == "DETECTION":
+            _det_type[kind] += n
+            _det_zone[zone] += n
+        elif cat == "MALFUNCTION":
+            _mal_reason[kind] += n
+    det_total, mal_total = sum(_det_type.values()), sum(_mal_reason.values())
+    _hour_map = Counter()
+    for (bucket, cat), n in _ev_hours.items():
+        if cat == "DETECTION":
+            _hour_map[to_display(bucket).hour] += n
+
+    r = await _run_queries(db, {
+        # ── 집계 (도메인당 1스캔) ──
+        # 조치 완료 여부는 사후 조치 등록으로 바뀌는 값이라 롤업하지 않고 원본에서 센다
+        "det_done": f"""select count(*) from detection_events dt join events e on e.id=dt.id
+            where {EV} and (dt.action_reported::text = 'True'
+                           or exists (select 1 from action_events a where a.from_event_id = e.id))""",
+        "sys_agg": f"""select grouping(severity), grouping(day), severity, day, count(*) from (
+            select severity, to_char(date_trunc('day',created_at),'MM-DD') as day
+            from system_events where {CC}{SEV_FILTER}) s
+            group by grouping sets ((severity), (day), ())""",
+        "log_agg": f"""select grouping(result), grouping(day), result, day, count(*) from (
+            select result, to_char(date_trunc('day',created_at),'MM-DD') as day
+            from user_login_logs where {CC}) l
+            group by grouping sets ((result), (day), ())""",
+        "dev_agg": """select grouping(status), grouping(category_device), status, category_device, count(*)
+            from devices group by grouping sets ((status), (category_device), ())""",
+        "usr_agg": "select grouping(role), role, count(*) from account_users group by grouping sets ((role), ())",
+        "counts": f"""select (select count(*) from action_events where {CC}),
+            (select count(*) from config_change_logs where {CC}),
+            (select count(*) from audit_logs where {CC}),
+            (select count(*) from user_sessions),
+            (select count(*) from servers)""",
+        # ── 상세 rows ── v6.0-report_progress_perf: 상위 500 (CSV 다운로드로 전량 보전)
+        "dev_rows": "select id, name_device, category_device, type_device, version, status, is_enable from devices order by id",
+        "det_rows": f"""select e.id, to_char(e.created_at,'YYYY-MM-DD HH24:MI'), coalesce(d.name_device,''),
+            dt.result::text, coalesce(dt.action_reported,'False'), coalesce(s.geolocation->>'location',''),
+            (select count(*) from action_events a where a.from_event_id=e.id), coalesce(e.device_description,'')
+            from detection_events dt join events e on e.id=dt.id
+            left join devices d on d.id=e.device_id left join sensors s on s.id=e.device_id
+            where {EV} order by e.created_at desc limit 500""",
+        "mal_rows": f"""select e.id, to_char(e.created_at,'YYYY-MM-DD HH24:MI'), m.reason::text,
+            coalesce(d.name_device,''), coalesce(s.geolocation->>'location',''),
+            (select count(*) from action_events a where a.from_event_id=e.id), coalesce(e.device_description,'')
+            from malfunction_events m join events e on e.id=m.id
+            left join devices d on d.id=e.device_id left join sensors s on s.id=e.device_id
+            where {EV} order by e.created_at desc limit 500""",
+        "act_rows": f"select id, to_char(created_at,'YYYY-MM-DD HH24:MI'), type_event, content, \"user\" from action_events where {CC} order by created_at desc limit 500",
+        # v6.1: title 컬럼 추가
+        "sys_rows": f"select id, to_char(created_at,'YYYY-MM-DD HH24:MI'), type_event::text, severity::text, coalesce(title,''), coalesce(message,'') from system_events where {CC}{SEV_FILTER} order by created_at desc limit 500",
+        # v6.1: actor_name/actor_ip/resource_name/description 확장
+        "cfg_rows": f"""select id, to_char(created_at,'YYYY-MM-DD HH24:MI'),
+            coalesce(actor_name, '(system)'), coalesce(actor_ip, ''),
+            resource_type::text, coalesce(resource_name, ''), coalesce(cast(resource_id as text), ''),
+            action::text, coalesce(description, '')
+            from config_change_logs where {CC} order by created_at desc limit 500""",
+        # v6.1: actor_login_id 폴백
+        "aud_rows": f"""select id, to_char(created_at,'YYYY-MM-DD HH24:MI'),
+            action_type, action_status, resource_type,
+            coalesce(actor_name, actor_login_id, '(system)')
+            from audit_logs where {CC} order by created_at desc limit 500""",
+        "usr_rows": "select id, login_id, name, role, email from account_users order by id",
+        "log_rows": f"select id, to_char(created_at,'YYYY-MM-DD HH24:MI'), login_id, action, result, ip_address from user_login_logs where {CC} order by created_at desc limit 500",
+        # v6.1: account_users LEFT JOIN
+        "ses_rows": """select s.id, s.user_id, coalesce(u.login_id, ''), coalesce(u.name, ''),
+            coalesce(s.ip_address, ''),
+            to_char(s.created_at,'YYYY-MM-DD HH24:MI'),
+            to_char(s.expires_at,'YYYY-MM-DD HH24:MI')
+            from user_sessions s left join account_users u on u.id = s.user_id
+            order by s.created_at desc limit 500""",
+        "srv_rows": "select s.id, s.name, s.status::text, coalesce(c.name,'') from servers s left join server_categories c on c.id=s.category_id order by s.id",
+    }, p)
+
+    det_done = int(r["det_done"][0][0] or 0)
+    (_sys_sev, _sys_day), (sys_total,) = _fold_grouping_sets(r["sys_agg"], 2)
+    (_log_result, _log_day), (log_total,) = _fold_grouping_sets(r["log_agg"], 2)
+    (_dev_status, _dev_type), (dev_total,) = _fold_grouping_sets(r["dev_agg"], 2)
+    (_usr_role,), (usr_total,) = _fold_grouping_sets(r["usr_agg"], 1)
+    act_total, cfg_total, aud_total, ses_total, srv_total = (int(v or 0) for v in r["counts"][0])
 
     sections: list[dict] = []
 
@@ -381,14 +504,11 @@ async def build_master_data_async(
     ]})
 
     # ── 2. 장비 현황 ──
-    _dev_status_raw = await q("select status, count(*) from devices group by status order by 2 desc")
-    dev_status = [(L.label(L.STATUS, r[0]), int(r[1])) for r in _dev_status_raw]
-    _dev_type_raw = await q("select category_device, count(*) from devices group by category_device order by 2 desc")
-    dev_type = [(L.label(L.DEVICE_CATEGORY, r[0]), int(r[1])) for r in _dev_type_raw]
-    _dev_rows_raw = await q("select id, name_device, category_device, type_device, version, status, is_enable from devices order by id")
-    dev_rows = [[r[0], r[1], L.label(L.DEVICE_CATEGORY, r[2]), r[3], r[4] or "",
-                 L.label(L.STATUS, r[5]), "사용" if r[6] else "미사용"]
-                for r in _dev_rows_raw]
+    dev_status = [(L.label(L.STATUS, k), n) for k, n in _by_count(_dev_status)]
+    dev_type = [(L.label(L.DEVICE_CATEGORY, k), n) for k, n in _by_count(_dev_type)]
+    dev_rows = [[x[0], x[1], L.label(L.DEVICE_CATEGORY, x[2]), x[3], x[4] or "",
+                 L.label(L.STATUS, x[5]), "사용" if x[6] else "미사용"]
+                for x in r["dev_rows"]]
     sections.append({"no": 2, "name": "장비 현황", "sub": "자산 현황", "blocks": [
         {"type": "charts", "charts": [
             _chart("DEVICE_STATUS_PIE", "dev_status", "장비 상태 분포", "doughnut", [x[0] for x in dev_status], [x[1] for x in dev_status], center=[f"{dev_total}", "대"]),
@@ -399,44 +519,16 @@ async def build_master_data_async(
     ]})
 
     # ── 3. 탐지 이벤트 ──
-    # v6.0-report_progress_perf: 통계는 GROUP BY SQL로 이관 (파이썬 66k iter 제거).
-    #   by_type, by_hour, done_count는 전체 대상 정확도 유지.
-    #   by_zone은 sensors.geolocation approximation (파이썬 정규식 name-based zone은 SQL 이관 복잡).
-    # 상세 rows는 LIMIT 500 (사용자 결정 Y: PDF 상위 500 + CSV 다운로드로 전량 보전).
-    _type_raw = await q(f"""select dt.result::text, count(*)
-        from detection_events dt join events e on e.id=dt.id
-        where {EV} group by dt.result order by 2 desc""")
-    type_dist = [(L.label(L.DETECTION, r[0]), int(r[1])) for r in _type_raw]
-
-    _zone_raw = await q(f"""select coalesce(nullif(split_part(s.geolocation->>'location', '-', 1), ''), '미지정') as zone,
-        count(*)
-        from detection_events dt join events e on e.id=dt.id
-        left join sensors s on s.id = e.device_id
-        where {EV} group by zone order by 2 desc""")
-    zone_dist = [(str(r[0]), int(r[1])) for r in _zone_raw]
-
-    _hour_raw = await q(f"""select extract(hour from e.created_at)::int as h, count(*)
-        from detection_events dt join events e on e.id=dt.id
-        where {EV} group by h""")
-    _hour_map = {int(r[0]): int(r[1]) for r in _hour_raw}
+    # by_zone 은 sensors.geolocation approximation (파이썬 정규식 name-based zone 은 상세 rows 에만).
+    type_dist = [(L.label(L.DETECTION, k), n) for k, n in _by_count(list(_det_type.items()))]
+    zone_dist = [(str(k), n) for k, n in _by_count(list(_det_zone.items()))]
     hourly = [_hour_map.get(h, 0) for h in range(24)]
 
-    det_done = await scalar(f"""select count(*) from detection_events dt join events e on e.id=dt.id
-        where {EV} and (dt.action_reported::text = 'True'
-                       or exists (select 1 from action_events a where a.from_event_id = e.id))""")
-
-    # 상세 rows — 상위 500 (최근순). 전체는 별도 CSV 다운로드로 100% 보전.
-    _det_rows_raw = await q(f"""select e.id, to_char(e.created_at,'YYYY-MM-DD HH24:MI'), coalesce(d.name_device,''),
-        dt.result::text, coalesce(dt.action_reported,'False'), coalesce(s.geolocation->>'location',''),
-        (select count(*) from action_events a where a.from_event_id=e.id), coalesce(e.device_description,'')
-        from detection_events dt join events e on e.id=dt.id
-        left join devices d on d.id=e.device_id left join sensors s on s.id=e.device_id
-        where {EV} order by e.created_at desc limit 500""")
     det_rows = []
-    for r in _det_rows_raw:
-        name = _parse_name(r[2], r[7]); zone = _zone_of(r[5], name)
-        tko = L.label(L.DETECTION, r[3]); done = str(r[4]).lower() == "true" or int(r[6] or 0) > 0
-        det_rows.append([r[0], tko, name, zone, r[1], "완료" if done else "미처리"])
+    for x in r["det_rows"]:
+        name = _parse_name(x[2], x[7]); zone = _zone_of(x[5], name)
+        tko = L.label(L.DETECTION, x[3]); done = str(x[4]).lower() == "true" or int(x[6] or 0) > 0
+        det_rows.append([x[0], tko, name, zone, x[1], "완료" if done else "미처리"])
     sections.append({"no": 3, "name": "탐지 이벤트 현황", "sub": "현황 분석", "blocks": [
         {"type": "summary", "cid": "EVENT_SUMMARY_PIE", "lines": [
             f"탐지 이벤트 {det_total:,}건 · 조치 완료율 {round(det_done/det_total*100,1) if det_total else 0}% ({det_done:,}/{det_total:,})",
@@ -454,22 +546,11 @@ async def build_master_data_async(
     ]})
 
     # ── 4. 장애 이벤트 ──
-    # v6.0-report_progress_perf: 통계는 SQL GROUP BY, 상세 rows는 LIMIT 500.
-    _mal_reason_raw = await q(f"""select m.reason::text, count(*)
-        from malfunction_events m join events e on e.id=m.id
-        where {EV} group by m.reason order by 2 desc""")
-    mal_dist = [(L.label(L.FAULT, r[0]), int(r[1])) for r in _mal_reason_raw]
-
-    _mal_rows_raw = await q(f"""select e.id, to_char(e.created_at,'YYYY-MM-DD HH24:MI'), m.reason::text,
-        coalesce(d.name_device,''), coalesce(s.geolocation->>'location',''),
-        (select count(*) from action_events a where a.from_event_id=e.id), coalesce(e.device_description,'')
-        from malfunction_events m join events e on e.id=m.id
-        left join devices d on d.id=e.device_id left join sensors s on s.id=e.device_id
-        where {EV} order by e.created_at desc limit 500""")
+    mal_dist = [(L.label(L.FAULT, k), n) for k, n in _by_count(list(_mal_reason.items()))]
     mal_rows = []
-    for r in _mal_rows_raw:
-        name = _parse_name(r[3], r[6]); rko = L.label(L.FAULT, r[2])
-        mal_rows.append([r[0], rko, name, _zone_of(r[4], name), r[1], "완료" if int(r[5] or 0) > 0 else "미처리"])
+    for x in r["mal_rows"]:
+        name = _parse_name(x[3], x[6]); rko = L.label(L.FAULT, x[2])
+        mal_rows.append([x[0], rko, name, _zone_of(x[4], name), x[1], "완료" if int(x[5] or 0) > 0 else "미처리"])
     sections.append({"no": 4, "name": "장애 이벤트 현황", "sub": "현황 분석", "blocks": [
         {"type": "summary", "cid": "EVENT_MALFUNCTION_GRID", "lines": [
             f"장애 이벤트 {mal_total:,}건 발생",
@@ -483,42 +564,31 @@ async def build_master_data_async(
     ]})
 
     # ── 5. 조치 이벤트 ──
-    # v6.0-report_progress_perf: 상세 rows LIMIT 500 (CSV 다운로드로 전량 보전).
-    _act_raw = await q(f"select id, to_char(created_at,'YYYY-MM-DD HH24:MI'), type_event, content, \"user\" from action_events where {CC} order by created_at desc limit 500")
-    act_rows = [[r[0], r[1], L.label(L.ACTION_TYPE, r[2]), r[3] or "", r[4] or ""]
-                for r in _act_raw]
+    act_rows = [[x[0], x[1], L.label(L.ACTION_TYPE, x[2]), x[3] or "", x[4] or ""]
+                for x in r["act_rows"]]
     sections.append({"no": 5, "name": "조치 이벤트 현황", "sub": "상세 데이터", "blocks": [
         _grid("EVENT_ACTION_GRID", "조치 이벤트 목록", ["번호", "조치 일시", "유형", "조치 내용", "조치자"],
               [8, 18, 13, 46, 15], act_rows, act_total),
     ]})
 
     # ── 6. 시스템 / 운영 로그 ──
-    _sys_sev_raw = await q(f"select severity, count(*) from system_events where {CC}{SEV_FILTER} group by severity order by 2 desc")
-    sys_sev = [(L.label(L.SEVERITY, r[0]), int(r[1])) for r in _sys_sev_raw]
-    sys_daily = await q(f"select to_char(date_trunc('day',created_at),'MM-DD'), count(*) from system_events where {CC}{SEV_FILTER} group by 1 order by 1")
-    # v6.1: title 컬럼 추가. v6.0-report_progress_perf: LIMIT 500.
-    _sys_rows_raw = await q(f"select id, to_char(created_at,'YYYY-MM-DD HH24:MI'), type_event::text, severity::text, coalesce(title,''), coalesce(message,'') from system_events where {CC}{SEV_FILTER} order by created_at desc limit 500")
-    sys_rows = [[r[0], r[1], L.label(L.SYSTEM_EVENT, r[2]), L.label(L.SEVERITY, r[3]), r[4], r[5]]
-                for r in _sys_rows_raw]
+    sys_sev = [(L.label(L.SEVERITY, k), n) for k, n in _by_count(_sys_sev)]
+    sys_daily = sorted(_sys_day, key=lambda x: str(x[0]))
+    sys_rows = [[x[0], x[1], L.label(L.SYSTEM_EVENT, x[2]), L.label(L.SEVERITY, x[3]), x[4], x[5]]
+                for x in r["sys_rows"]]
     sections.append({"no": 6, "name": "시스템 / 운영 로그", "sub": "현황 분석", "blocks": [
         {"type": "charts", "charts": [
             _chart("SYSTEM_SEVERITY_BAR", "sys_sev", "심각도별 분포", "vbar", [x[0] for x in sys_sev], [x[1] for x in sys_sev]),
-            _chart("SYSTEM_TREND_LINE", "sys_trend", "시스템 이벤트 추이", "line", [str(r[0]) for r in sys_daily], [int(r[1]) for r in sys_daily]),
+            _chart("SYSTEM_TREND_LINE", "sys_trend", "시스템 이벤트 추이", "line", [str(x[0]) for x in sys_daily], [x[1] for x in sys_daily]),
         ]},
         _grid("SYSTEM_EVENT_GRID", "시스템 이벤트 목록", ["번호", "발생 일시", "유형", "심각도", "제목", "메시지"],
               [7, 16, 15, 12, 20, 30], sys_rows, sys_total),
     ]})
 
     # ── 7. 설정 변경 이력 ──
-    # v6.1: actor_name/actor_ip/resource_name/description 확장. v6.0-report_progress_perf: LIMIT 500.
-    _cfg_raw = await q(f"""select id, to_char(created_at,'YYYY-MM-DD HH24:MI'),
-        coalesce(actor_name, '(system)'), coalesce(actor_ip, ''),
-        resource_type::text, coalesce(resource_name, ''), coalesce(cast(resource_id as text), ''),
-        action::text, coalesce(description, '')
-        from config_change_logs where {CC} order by created_at desc limit 500""")
-    cfg_rows = [[r[0], r[1], r[2], r[3], L.label(L.CONFIG_RESOURCE, r[4]),
-                 (r[5] or r[6] or ""), L.label(L.CONFIG_ACTION, r[7]), r[8]]
-                for r in _cfg_raw]
+    cfg_rows = [[x[0], x[1], x[2], x[3], L.label(L.CONFIG_RESOURCE, x[4]),
+                 (x[5] or x[6] or ""), L.label(L.CONFIG_ACTION, x[7]), x[8]]
+                for x in r["cfg_rows"]]
     sections.append({"no": 7, "name": "설정 변경 이력", "sub": "상세 데이터", "blocks": [
         _grid("SYSTEM_CONFIG_GRID", "설정 변경 이력",
               ["번호", "변경 일시", "행위자", "IP", "리소스 유형", "리소스명", "액션", "변경설명"],
@@ -526,46 +596,30 @@ async def build_master_data_async(
     ]})
 
     # ── 8. 감사 로그 ──
-    # v6.1: actor_login_id 폴백. v6.0-report_progress_perf: LIMIT 500.
-    _aud_raw = await q(f"""select id, to_char(created_at,'YYYY-MM-DD HH24:MI'),
-        action_type, action_status, resource_type,
-        coalesce(actor_name, actor_login_id, '(system)')
-        from audit_logs where {CC} order by created_at desc limit 500""")
-    aud_rows = [[r[0], r[1], L.label(L.AUDIT_ACTION, r[2]), L.label(L.RESULT, r[3]), L.label(L.AUDIT_RESOURCE, r[4]), r[5]]
-                for r in _aud_raw]
+    aud_rows = [[x[0], x[1], L.label(L.AUDIT_ACTION, x[2]), L.label(L.RESULT, x[3]), L.label(L.AUDIT_RESOURCE, x[4]), x[5]]
+                for x in r["aud_rows"]]
     sections.append({"no": 8, "name": "감사 로그", "sub": "상세 데이터", "blocks": [
         _grid("SYSTEM_AUDIT_GRID", "감사 로그", ["번호", "발생 일시", "액션", "상태", "리소스", "행위자"],
               [8, 18, 18, 14, 20, 22], aud_rows, aud_total),
     ]})
 
     # ── 9. 사용자 현황 ──
-    _usr_role_raw = await q("select role, count(*) from account_users group by role order by 2 desc")
-    usr_role = [(L.label(L.ROLE, r[0]), int(r[1])) for r in _usr_role_raw]
-    log_daily = await q(f"select to_char(date_trunc('day',created_at),'MM-DD'), count(*) from user_login_logs where {CC} group by 1 order by 1")
-    _log_result_raw = await q(f"select result, count(*) from user_login_logs where {CC} group by result order by 2 desc")
-    log_result = [(L.label(L.RESULT, r[0]), int(r[1])) for r in _log_result_raw]
-    _usr_rows_raw = await q("select id, login_id, name, role, email from account_users order by id")
-    usr_rows = [[r[0], r[1] or "", r[2] or "", L.label(L.ROLE, r[3]), r[4] or ""]
-                for r in _usr_rows_raw]
-    _log_rows_raw = await q(f"select id, to_char(created_at,'YYYY-MM-DD HH24:MI'), login_id, action, result, ip_address from user_login_logs where {CC} order by created_at desc limit 500")
-    log_rows = [[r[0], r[1], r[2] or "", L.label(L.LOGIN_ACTION, r[3]), L.label(L.RESULT, r[4]), r[5] or ""]
-                for r in _log_rows_raw]
-    # v6.1: account_users LEFT JOIN. v6.0-report_progress_perf: LIMIT 500.
-    _ses_rows_raw = await q("""select s.id, s.user_id, coalesce(u.login_id, ''), coalesce(u.name, ''),
-        coalesce(s.ip_address, ''),
-        to_char(s.created_at,'YYYY-MM-DD HH24:MI'),
-        to_char(s.expires_at,'YYYY-MM-DD HH24:MI')
-        from user_sessions s left join account_users u on u.id = s.user_id
-        order by s.created_at desc limit 500""")
-    ses_rows = [[r[0], r[2] or f"(uid:{r[1]})", r[3], r[4], r[5], r[6]]
-                for r in _ses_rows_raw]
+    usr_role = [(L.label(L.ROLE, k), n) for k, n in _by_count(_usr_role)]
+    log_daily = sorted(_log_day, key=lambda x: str(x[0]))
+    log_result = [(L.label(L.RESULT, k), n) for k, n in _by_count(_log_result)]
+    usr_rows = [[x[0], x[1] or "", x[2] or "", L.label(L.ROLE, x[3]), x[4] or ""]
+                for x in r["usr_rows"]]
+    log_rows = [[x[0], x[1], x[2] or "", L.label(L.LOGIN_ACTION, x[3]), L.label(L.RESULT, x[4]), x[5] or ""]
+                for x in r["log_rows"]]
+    ses_rows = [[x[0], x[2] or f"(uid:{x[1]})", x[3], x[4], x[5], x[6]]
+                for x in r["ses_rows"]]
     sections.append({"no": 9, "name": "사용자 현황", "sub": "현황 분석", "blocks": [
         {"type": "charts", "charts": [
             _chart("USER_ROLE_PIE", "usr_role", "역할별 사용자 분포", "doughnut", [x[0] for x in usr_role], [x[1] for x in usr_role], center=[f"{usr_total}", "명"]),
             _chart("USER_LOGIN_RESULT_PIE", "usr_result", "로그인 결과 분포", "doughnut", [x[0] for x in log_result], [x[1] for x in log_result], center=[f"{log_total:,}", "건"], accent="green"),
         ]},
         {"type": "charts", "charts": [
-            _chart("USER_LOGIN_TREND_LINE", "usr_login", "일별 로그인 추이", "line", [str(r[0]) for r in log_daily], [int(r[1]) for r in log_daily]),
+            _chart("USER_LOGIN_TREND_LINE", "usr_login", "일별 로그인 추이", "line", [str(x[0]) for x in log_daily], [x[1] for x in log_daily]),
         ]},
         _grid("USER_GRID", "사용자 목록", ["ID", "로그인 ID", "이름", "역할", "이메일"], [8, 20, 18, 18, 36], usr_rows, usr_total),
         _grid("USER_LOGIN_GRID", "로그인 이력", ["번호", "발생 일시", "로그인 ID", "액션", "결과", "IP"], [8, 18, 20, 14, 14, 26], log_rows, log_total),
@@ -575,10 +629,9 @@ async def build_master_data_async(
 
     # ── 10. 서버 현황 ──
     srv_status, srv_rows = Counter(), []
-    _srv_raw = await q("select s.id, s.name, s.status::text, coalesce(c.name,'') from servers s left join server_categories c on c.id=s.category_id order by s.id")
-    for r in _srv_raw:
-        st = L.label(L.STATUS, r[2] or "미상"); srv_status[st] += 1
-        srv_rows.append([r[0], r[1] or "", st, r[3]])
+    for x in r["srv_rows"]:
+        st = L.label(L.STATUS, x[2] or "미상"); srv_status[st] += 1
+        srv_rows.append([x[0], x[1] or "", st, x[3]])
     sections.append({"no": 10, "name": "서버 현황", "sub": "자산 현황", "blocks": [
         {"type": "charts", "charts": [
             _chart("SERVER_STATUS_PIE", "srv_status", "서버 상태 분포", "doughnut", list(srv_status.keys()), list(srv_status.values()), center=[f"{srv_total}", "대"]),
@@ -0,0 +1,319 @@
+"""
+저변경 마스터 데이터 응답 캐시 — ETag / 조건부 GET (user-025)
+
+장비 목록(controllers/sensors/cameras/speakers/lamps/enclosures), 장비 그룹, 서버, 이벤트 매핑 GET 은
+클라이언트가 주기 폴링하지만 거의 바뀌지 않는다. 바뀌는 시점은 `app/db_triggers.py` 의 `gop_sync`
+pg_notify(SYNC_*)가 정확히 알려준다.
+
+- 적용: 라우트 핸들러에 `@cached("SYNC_DEVICE", ...)` — 인가(enforce_matrix·route 의존성)는 그대로
+  실행된 뒤 핸들러 진입 시점에 조회하므로 캐시가 권한 검사를 우회하지 않는다.
+- 키: (경로, 정렬한 쿼리 문자열). 대상 응답은 호출자와 무관하다(사용자별 필터 없음).
+- 적중: 저장해 둔 응답 바이트를 그대로 반환(DB 조회·직렬화 없음). `If-None-Match` 일치 시 304.
+- 미스: 핸들러가 평소대로 응답하고 `ResponseCacheMiddleware` 가 200 응답 바이트를 잡아 저장 +
+  강한 ETag(본문 SHA-256) 부여. 본문의 meta.timestamp 는 표현 생성 시각이 된다.
+- 무효화(태그 = SYNC_* cmd):
+  * 프로세스 내 쓰기 — ORM 커밋 이벤트에서 변경 테이블 → 트리거와 같은 SYNC_* 로 매핑, commit 반환 전
+    무효화(쓰기 직후 GET 이 새 값을 본다).
+  * 프로세스 밖 쓰기(다른 서비스·수동 SQL) — PostgreSQL 이면 `LISTEN gop_sync` 태스크가 같은 통지로 무효화.
+    연결 재수립 시 전체 무효화(공백 동안 놓친 통지 보정).
+  * RESPONSE_CACHE_TTL_SECONDS — 위 둘이 놓친 경로(Core SQL·SQLite 외부 쓰기) 반영 지연 상한.
+
+★ 단일 인스턴스 가정(authz_cache / enclosure_latest_cache 와 동일). 워커가 여럿이면 워커마다 LISTEN.
+"""
+from __future__ import annotations
+
+import asyncio
+import functools
+import hashlib
+import inspect
+import json
+import threading
+import time
+from dataclasses import dataclass
+from itertools import chain
+from typing import Optional
+
+from sqlalchemy import event, inspect as sa_inspect
+from sqlalchemy.orm import Session
+from starlette.requests import Request
+from starlette.responses import Response
+
+from app.config import settings
+
+SYNC_CHANNEL = "gop_sync"
+SCOPE_KEY = "gop.response_cache"  # 미스 시 핸들러 → 미들웨어 전달(key, tags, seq)
+
+_MAX_ENTRIES = 1000
+_LISTEN_RETRY_SECONDS = 5.0
+_LISTEN_LIVENESS_SECONDS = 30.0
+_REQUEST_PARAM = "_response_cache_request"
+
+# 변경 테이블 → 트리거(fn_notify_gop_sync / statement-level 트리거)가 발행하는 SYNC_* cmd.
+# xy_points 는 트리거가 없으나 카메라 단건(include_rois)의 point_count 에 반영되므로 SYNC_PRESET 으로 묶는다.
+TABLE_TAGS: dict[str, str] = {
+    "devices": "SYNC_DEVICE",
+    "controllers": "SYNC_DEVICE",
+    "sensors": "SYNC_DEVICE",
+    "cameras": "SYNC_DEVICE",
+    "speakers": "SYNC_DEVICE",
+    "enclosures": "SYNC_DEVICE",
+    "lamps": "SYNC_DEVICE",
+    "servers": "SYNC_SERVER",
+    "server_categories": "SYNC_CATEGORY",
+    "device_groups": "SYNC_DEVICE_GROUP",
+    "device_group_mappings": "SYNC_DEVICE_GROUP",
+    "event_mappings": "SYNC_EVENT_MAPPING",
+    "event_mapping_cameras": "SYNC_EVENT_MAPPING",
+    "event_mapping_speakers": "SYNC_EVENT_MAPPING",
+    "event_mapping_lamps": "SYNC_EVENT_MAPPING",
+    "camera_presets": "SYNC_PRESET",
+    "rois": "SYNC_PRESET",
+    "xy_points": "SYNC_PRESET",
+    "file_groups": "SYNC_FILE_GROUP",
+    "camera_settings": "SYNC_CAMERA_SETTING",
+    "proxy_settings": "SYNC_PROXY_SETTING",
+}
+
+
+@dataclass(frozen=True)
+class _Entry:
+    body: bytes
+    etag: str
+    media_type: str
+    tags: tuple[str, ...]
+    expires_at: float
+
+
+_lock = threading.Lock()
+_entries: dict[tuple, _Entry] = {}
+_tag_seq: dict[str, int] = {}  # 태그별 무효화 순번 — 미스 계산 도중 무효화 감지
+_stats: dict[str, int] = {"hits": 0, "not_modified": 0, "misses": 0, "stores": 0, "invalidations": 0, "notifications": 0}
+_listen_task: Optional[asyncio.Task[None]] = None
+_listening = False
+
+_PENDING_KEY = "_response_cache_pending_tags"
+
+
+# ─── 저장소 ──────────────────────────────────────────────────────
+
+def _key(request: Request) -> tuple:
+    return (request.url.path, tuple(sorted(request.query_params.multi_items())))
+
+
+def _seq(tags: tuple[str, ...]) -> tuple[int, ...]:
+    with _lock:
+        return tuple(_tag_seq.get(t, 0) for t in tags)
+
+
+def _lookup(key: tuple) -> Optional[_Entry]:
+    with _lock:
+        entry = _entries.get(key)
+        if entry is None or entry.expires_at <= time.monotonic():
+            _stats["misses"] += 1
+            return None
+        _stats["hits"] += 1
+        return entry
+
+
+def make_etag(body: bytes) -> str:
+    return '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 비교(RFC 9110 weak comparison — `W/` 접두 무시, `*` 허용)."""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+def store(key: tuple, tags: tuple[str, ...], seq: tuple[int, ...], body: bytes, media_type: str) -> Optional[str]:
+    """미스 응답 저장 후 ETag 반환. 계산 도중 해당 태그가 무효화됐으면 저장하지 않는다(ETag 는 부여)."""
+    etag = make_etag(body)
+    with _lock:
+        if tuple(_tag_seq.get(t, 0) for t in tags) != seq:
+            return etag
+        _entries.pop(key, None)
+        while len(_entries) >= _MAX_ENTRIES:
+            _entries.pop(next(iter(_entries)))  # 가장 오래 적재된 항목부터(authz_cache 와 같은 FIFO)
+        _entries[key] = _Entry(body, etag, media_type, tags, time.monotonic() + settings.RESPONSE_CACHE_TTL_SECONDS)
+        _stats["stores"] += 1
+    return etag
+
+
+def invalidate_tags(tags) -> None:
+    tags = set(tags)
+    if not tags:
+        return
+    with _lock:
+        for t in tags:
+            _tag_seq[t] = _tag_seq.get(t, 0) + 1
+        for k in [k for k, e in _entries.items() if tags.intersection(e.tags)]:
+            del _entries[k]
+        _stats["invalidations"] += 1
+
+
+def invalidate() -> None:
+    with _lock:
+        for t in set(TABLE_TAGS.values()):
+            _tag_seq[t] = _tag_seq.get(t, 0) + 1
+        _entries.clear()
+        _stats["invalidations"] += 1
+
+
+def get_stats() -> dict:
+    with _lock:
+        return {**_stats, "entries": len(_entries), "listening": _listening}
+
+
+def reset_stats() -> None:
+    with _lock:
+        for k in _stats:
+            _stats[k] = 0
+
+
+# ─── 라우트 데코레이터 ───────────────────────────────────────────
+
+def cached(*tags: str):
+    """GET 핸들러 응답 캐시. tags = 응답 내용이 의존하는 SYNC_* cmd.
+
+    핸들러 시그니처에 Request 키워드 인자를 덧붙여(FastAPI 가 주입) 키·If-None-Match 를 읽는다.
+    """
+    tags = tuple(tags)
+
+    def decorator(func):
+        sig = inspect.signature(func)
+        params = [*sig.parameters.values(),
+                  inspect.Parameter(_REQUEST_PARAM, inspect.Parameter.KEYWORD_ONLY, annotation=Request)]
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            request: Optional[Request] = kwargs.pop(_REQUEST_PARAM, None)
+            if request is None or not settings.RESPONSE_CACHE_ENABLED:  # 직접 호출(테스트·내부) — 캐시 우회
+                return await func(*args, **kwargs)
+            key = _key(request)
+            entry = _lookup(key)
+            if entry is not None:
+                headers = {"ETag": entry.etag, "Cache-Control": "no-cache"}
+                if etag_matches(request.headers.get("if-none-match"), entry.etag):
+                    with _lock:
+                        _stats["not_modified"] += 1
+                    return Response(status_code=304, headers=headers)
+                return Response(content=entry.body, media_type=entry.media_type, headers=headers)
+            request.scope[SCOPE_KEY] = (key, tags, _seq(tags))
+            return await func(*args, **kwargs)
+
+        wrapper.__signature__ = sig.replace(parameters=params)
+        return wrapper
+
+    return decorator
+
+
+# ─── ORM 세션 이벤트 — 프로세스 내 쓰기 → commit 후 무효화 ────────
+
+def _tags_of_mapper(mapper) -> set[str]:
+    return {TABLE_TAGS[t.name] for t in mapper.tables if getattr(t, "name", None) in TABLE_TAGS}
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_flushed(session: Session, flush_context) -> None:
+    tags: set[str] = set()
+    for obj in chain(session.new, session.deleted):
+        tags |= _tags_of_mapper(sa_inspect(obj).mapper)
+    for obj in session.dirty:
+        if session.is_modified(obj, include_collections=False):  # 같은 값 재대입(상태 플립 등)은 제외
+            tags |= _tags_of_mapper(sa_inspect(obj).mapper)
+    if tags:
+        session.info.setdefault(_PENDING_KEY, set()).update(tags)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _collect_bulk(orm_execute_state) -> None:
+    if not (orm_execute_state.is_update or orm_execute_state.is_delete or orm_execute_state.is_insert):
+        return
+    tags: set[str] = set()
+    for m in orm_execute_state.all_mappers:
+        tags |= _tags_of_mapper(m)
+    if tags:
+        orm_execute_state.session.info.setdefault(_PENDING_KEY, set()).update(tags)
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_committed(session: Session) -> None:
+    tags = session.info.pop(_PENDING_KEY, None)
+    if tags:
+        invalidate_tags(tags)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_rolled_back(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
+
+
+# ─── LISTEN gop_sync — 프로세스 밖 쓰기 (PostgreSQL) ─────────────
+
+def _on_notify(connection, pid, channel, payload) -> None:
+    try:
+        cmd = json.loads(payload).get("cmd")
+    except (TypeError, ValueError, AttributeError):
+        return
+    with _lock:
+        _stats["notifications"] += 1
+    if cmd in set(TABLE_TAGS.values()):
+        invalidate_tags([cmd])
+
+
+async def _listen_loop() -> None:
+    global _listening
+    from app.database import async_engine
+
+    while True:
+        try:
+            async with async_engine.connect() as conn:
+                driver = (await conn.get_raw_connection()).driver_connection  # asyncpg.Connection
+                await driver.add_listener(SYNC_CHANNEL, _on_notify)
+                try:
+                    _listening = True
+                    invalidate()  # 연결 공백 동안 놓친 통지 보정
+                    while True:
+                        await asyncio.sleep(_LISTEN_LIVENESS_SECONDS)
+                        await driver.execute("SELECT 1")
+                finally:
+                    _listening = False
+                    try:
+                        await driver.remove_listener(SYNC_CHANNEL, _on_notify)
+                    except Exception:
+                        pass
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            print(f"[response_cache] LISTEN {SYNC_CHANNEL} lost — retry in {_LISTEN_RETRY_SECONDS}s: {e}")
+            await asyncio.sleep(_LISTEN_RETRY_SECONDS)
+
+
+async def start_response_cache_listener() -> None:
+    """FastAPI startup 훅에서 호출(idempotent). PostgreSQL(asyncpg) 외 방언은 ORM 이벤트 + TTL 만 사용."""
+    global _listen_task
+    from app.database import async_engine
+
+    if _listen_task is not None and not _listen_task.done():
+        return
+    if async_engine.dialect.name != "postgresql" or async_engine.dialect.driver != "asyncpg":
+        return
+    _listen_task = asyncio.create_task(_listen_loop(), name="response_cache_listen")
+
+
+async def stop_response_cache_listener() -> None:
+    global _listen_task
+    if _listen_task is None:
+        return
+    _listen_task.cancel()
+    try:
+        await _listen_task
+    except asyncio.CancelledError:
+        pass
+    finally:
+        _listen_task = None
@@ -0,0 +1,231 @@
+"""
+억제 창 메모리 구간 인덱스 — 이벤트 수신 게이트의 DB 무접촉 판정 (user-021)
+
+`is_suppressed` 는 detections/malfunctions/connections POST 마다 활성 스케줄 전체(+selectin 대상 목록)와
+`DeviceGroupMapping` 을 조회했다. 탐지 폭주(분당 수천 건) 동안 같은 조회의 반복이다.
+
+- 적재: 미취소 · `window_end > now` 스케줄 전부(진행 중 + 예정)를 한 번에 읽어 구간 항목으로 펼친다.
+  * DEVICE 대상 → device_id 키 / GROUP 대상 → group_id 키 + 대상 그룹 멤버십(device_id → group_ids)
+  * ALL 대상 → target_side 키(both/detection/surveillance)
+- 판정: 키로 후보를 모아 `window_start <= now < window_end` · event_scope · side 를 메모리에서 검사.
+  창 경계는 구간 비교로 처리되므로 경계 도달만으로는 재적재가 필요 없다(예정 창도 미리 적재).
+- 무효화: 억제 스케줄/대상, 장비 그룹/매핑 쓰기 — 즉 SYNC_EVENT_SUPPRESSION · SYNC_DEVICE_GROUP 트리거가
+  발화하는 바로 그 쓰기 — 를 ORM 커밋 이벤트로 감지해 `invalidate()`(authz_cache 와 같은 배선).
+  `suppression_scheduler` 창 경계 잡과 sweep 도 같은 경로로(+경계 잡은 명시 호출) 재적재를 유도한다.
+- 만료: SUPPRESSION_INDEX_TTL_SECONDS — 프로세스 밖 쓰기(수동 SQL·다른 워커) 반영 지연 상한.
+
+★ 단일 인스턴스 가정(authz_cache / enclosure_latest_cache 와 동일).
+"""
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from itertools import chain
+from typing import Optional
+
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session
+
+from app.config import settings
+
+
+@dataclass(frozen=True)
+class _Window:
+    """스케줄 1건의 판정용 스냅샷 — ORM 비의존(세션 종료 후에도 안전). 시각은 naive-UTC."""
+    schedule_id: int
+    window_start: datetime
+    window_end: datetime
+    scope: str   # 'all' | 'detection' | 'malfunction' | 'connection'
+    side: str    # 'both' | 'detection' | 'surveillance'
+
+
+@dataclass
+class SuppressionIndex:
+    """억제 창 구간 인덱스. `built_for` 이전 시각은 판정하지 않는다(그때 끝난 창은 적재되지 않음)."""
+    built_for: datetime
+    by_device: dict[int, list[_Window]]
+    by_group: dict[int, list[_Window]]
+    by_side: dict[str, list[_Window]]
+    device_groups: dict[int, frozenset]
+
+    def match(self, device_id: int, device_side: str, category: str, now: datetime) -> Optional[int]:
+        """매치된 스케줄 id(다중 매치 시 최소 id — 결정적 first-match) 또는 None."""
+        from app.services.event_suppression_service import _side_matches
+
+        best: Optional[int] = None
+
+        def consider(w: _Window, check_side: bool) -> None:
+            nonlocal best
+            if not (w.window_start <= now < w.window_end):
+                return
+            if w.scope not in ("all", category):
+                return
+            if check_side and not _side_matches(device_side, w.side):
+                return
+            if best is None or w.schedule_id < best:
+                best = w.schedule_id
+
+        for w in self.by_device.get(device_id, ()):
+            consider(w, check_side=False)  # DEVICE 대상은 side 무관
+        for gid in self.device_groups.get(device_id, ()):
+            for w in self.by_group.get(gid, ()):
+                consider(w, check_side=True)
+        for side in ("both", device_side):
+            for w in self.by_side.get(side, ()):
+                consider(w, check_side=True)
+        return best
+
+
+_lock = threading.Lock()
+_index: Optional[SuppressionIndex] = None
+_loaded_at: Optional[float] = None
+_write_seq = 0  # invalidate 마다 증가 — 적재 쿼리 도중 쓰기 감지
+_stats: dict[str, int] = {"hits": 0, "misses": 0, "loads": 0, "invalidations": 0}
+
+_PENDING_KEY = "_suppression_index_pending"
+
+
+def _fresh() -> bool:
+    return _loaded_at is not None and time.monotonic() - _loaded_at < settings.SUPPRESSION_INDEX_TTL_SECONDS
+
+
+def get(now: datetime) -> Optional[SuppressionIndex]:
+    """유효한 인덱스 또는 None(miss — 비었음/TTL 만료/`now` 가 적재 기준 이전)."""
+    with _lock:
+        if _index is None or not _fresh() or now < _index.built_for:
+            _stats["misses"] += 1
+            return None
+        _stats["hits"] += 1
+        return _index
+
+
+def write_seq() -> int:
+    with _lock:
+        return _write_seq
+
+
+def store(index: SuppressionIndex, seq: int) -> None:
+    """적재 결과로 교체. 적재 쿼리 도중 invalidate 가 있었으면(seq 불일치) 버린다."""
+    global _index, _loaded_at
+    with _lock:
+        if seq != _write_seq:
+            return
+        _index = index
+        _loaded_at = time.monotonic()
+        _stats["loads"] += 1
+
+
+def invalidate() -> None:
+    global _index, _loaded_at, _write_seq
+    with _lock:
+        _write_seq += 1
+        _index = None
+        _loaded_at = None
+        _stats["invalidations"] += 1
+
+
+def get_stats() -> dict:
+    with _lock:
+        return {**_stats, "loaded": _index is not None and _fresh()}
+
+
+def reset_stats() -> None:
+    with _lock:
+        for k in _stats:
+            _stats[k] = 0
+
+
+async def build(db, now: datetime) -> SuppressionIndex:
+    """미취소 · `window_end > now` 스케줄 + 대상 그룹 멤버십 2쿼리로 인덱스 구성(now 는 naive-UTC)."""
+    from app.models.device_group import DeviceGroupMapping
+    from app.models.event_suppression import EventSuppressionSchedule
+    from app.services.event_suppression_service import _enum_value, _naive_utc
+    from app.utils.enums import EnumSuppressionTargetType
+
+    schedules = (await db.execute(
+        select(EventSuppressionSchedule).where(
+            EventSuppressionSchedule.revoked_at.is_(None),
+            EventSuppressionSchedule.window_end > now,
+        )
+    )).scalars().all()
+
+    by_device: dict[int, list[_Window]] = {}
+    by_group: dict[int, list[_Window]] = {}
+    by_side: dict[str, list[_Window]] = {}
+    for s in schedules:
+        w = _Window(
+            schedule_id=s.id,
+            window_start=_naive_utc(s.window_start),
+            window_end=_naive_utc(s.window_end),
+            scope=_enum_value(s.event_scope),
+            side=_enum_value(s.target_side),
+        )
+        if s.target_type == EnumSuppressionTargetType.DEVICE:
+            for t in s.target_devices:
+                by_device.setdefault(t.device_id, []).append(w)
+        elif s.target_type == EnumSuppressionTargetType.GROUP:
+            for t in s.target_groups:
+                by_group.setdefault(t.group_id, []).append(w)
+        elif s.target_type == EnumSuppressionTargetType.ALL:
+            by_side.setdefault(w.side, []).append(w)
+
+    memberships: dict[int, set[int]] = {}
+    if by_group:
+        rows = (await db.execute(
+            select(DeviceGroupMapping.device_id, DeviceGroupMapping.group_id).where(
+                DeviceGroupMapping.group_id.in_(list(by_group)),
+            )
+        )).all()
+        for device_id, group_id in rows:
+            memberships.setdefault(device_id, set()).add(group_id)
+
+    return SuppressionIndex(
+        built_for=now,
+        by_device=by_device,
+        by_group=by_group,
+        by_side=by_side,
+        device_groups={k: frozenset(v) for k, v in memberships.items()},
+    )
+
+
+# ─── ORM 세션 이벤트 — 억제/그룹 쓰기 감지 → commit 후 무효화 ─────────
+def _watched() -> tuple:
+    from app.models.device_group import DeviceGroup, DeviceGroupMapping
+    from app.models.event_suppression import (
+        EventSuppressionSchedule,
+        EventSuppressionTargetDevice,
+        EventSuppressionTargetGroup,
+    )
+    return (
+        EventSuppressionSchedule, EventSuppressionTargetDevice, EventSuppressionTargetGroup,
+        DeviceGroup, DeviceGroupMapping,
+    )
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_flushed(session: Session, flush_context) -> None:
+    watched = _watched()
+    if any(isinstance(obj, watched) for obj in chain(session.new, session.dirty, session.deleted)):
+        session.info[_PENDING_KEY] = True
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _collect_bulk(orm_execute_state) -> None:
+    if not (orm_execute_state.is_update or orm_execute_state.is_delete or orm_execute_state.is_insert):
+        return
+    watched = _watched()
+    if any(m.class_ in watched for m in orm_execute_state.all_mappers):
+        orm_execute_state.session.info[_PENDING_KEY] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_committed(session: Session) -> None:
+    if session.info.pop(_PENDING_KEY, None):
+        invalidate()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_rolled_back(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
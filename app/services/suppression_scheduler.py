@@ -62,8 +62,11 @@ async def _fire_boundary(schedule_id: int, boundary: str) -> None:
         from sqlalchemy import select
         from app.database import AsyncSessionLocal
         from app.models.event_suppression import EventSuppressionSchedule
+        from app.services import suppression_index
         from app.services.event_suppression_service import suppression_status
 
+        # user-021: 경계 도달 — 게이트 인덱스 재적재 유도(판정은 구간 비교라 정확, 지난 창 정리 목적)
+        suppression_index.invalidate()
         async with AsyncSessionLocal() as db:
             s = (await db.execute(
                 select(EventSuppressionSchedule).where(EventSuppressionSchedule.id == schedule_id)
@@ -0,0 +1,225 @@
+"""
+track_points 일별 파티션 관리 — 사전 생성 + 파티션 DROP 보존정책 (user-004).
+
+v72 파티셔닝(일별 RANGE, `PARTITION BY RANGE (observed_at)`) 이후:
+- 사전 생성: 오늘 + 향후 N일(`TRACK_POINTS_PARTITION_DAYS_AHEAD`) 파티션을 멱등 생성
+  (`CREATE TABLE IF NOT EXISTS ... PARTITION OF`). startup 1회 + 스케줄러(일 1회 cron) 재보장.
+  api_logs_partition_service 와 동일 형틀, 단 주기가 일 단위.
+  default 파티션에 그 날 행이 이미 있으면(지평 밖 미래 관측 흡수분) CREATE 가 거부되므로, 한 트랜잭션에서
+  default DETACH → 일 파티션 CREATE → 해당 일 행 INSERT … SELECT + DELETE → default 재ATTACH 로 옮긴다.
+- 보존: 상한 경계가 보존 기준(오늘 - `TRACK_POINTS_RETENTION_DAYS`) 이하인 파티션을 DROP(O(1)).
+  대량 DELETE(purge_track_points) 의 테이블 팽창·vacuum 비용을 없앤다.
+  default 파티션(범위 밖 관측 흡수)만 소량 DELETE. track_sessions 요약도 end_at 기준 함께 만료하고,
+  보존 기준에 걸친 세션(start_at < 기준 ≤ end_at)은 남은 추적점으로 start/end/count/bbox 재계산.
+
+일 경계는 표시 타임존(settings.display_tz) 자정 — 운영자 기준 "하루" 재생 조회가 파티션 1개만 접근.
+파티션명 `track_points_YYYY_MM_DD` (해당 표시 tz 날짜).
+
+파티셔닝 전(v72 미적용) DB 에서는: 사전 생성 no-op, 보존은 기존 DELETE 로 폴백(전환기 안전).
+"""
+from __future__ import annotations
+
+import re
+from datetime import date, datetime, time, timedelta
+
+from app.config import settings
+
+_PARTITION_RE = re.compile(r"^track_points_(\d{4})_(\d{2})_(\d{2})$")
+_DEFAULT_PARTITION = "track_points_default"
+
+
+def _day_bound(day: date) -> str:
+    """표시 tz 자정의 aware ISO 문자열 — timestamptz 경계를 세션 TimeZone 과 무관하게 고정."""
+    return datetime.combine(day, time.min, tzinfo=settings.display_tz).isoformat()
+
+
+def _day_partition_ddl(day: date) -> tuple[str, str]:
+    """(partition_name, ddl) — 해당 일 [자정, 다음날 자정) 반열림 RANGE 파티션 DDL."""
+    name = f"track_points_{day:%Y_%m_%d}"
+    ddl = (
+        f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF track_points "
+        f"FOR VALUES FROM ('{_day_bound(day)}') TO ('{_day_bound(day + timedelta(days=1))}')"
+    )
+    return name, ddl
+
+
+def _move_from_default_sql(day: date) -> tuple[str, list[str]]:
+    """(partition_name, statements) — default 파티션에 있는 해당 일 행을 새 일 파티션으로 옮기는 DDL/DML.
+
+    DETACH 상태에서 CREATE 해야 default 검증 스캔에 걸리지 않는다. 호출자가 한 트랜잭션(savepoint)으로 묶는다.
+    """
+    name, create = _day_partition_ddl(day)
+    in_day = f"observed_at >= '{_day_bound(day)}' AND observed_at < '{_day_bound(day + timedelta(days=1))}'"
+    return name, [
+        f"ALTER TABLE track_points DETACH PARTITION {_DEFAULT_PARTITION}",
+        create,
+        f"INSERT INTO {name} SELECT * FROM {_DEFAULT_PARTITION} WHERE {in_day}",
+        f"DELETE FROM {_DEFAULT_PARTITION} WHERE {in_day}",
+        f"ALTER TABLE track_points ATTACH PARTITION {_DEFAULT_PARTITION} DEFAULT",
+    ]
+
+
+def partition_day(name: str) -> date | None:
+    """파티션명 → 날짜. 규약 밖 이름(default 등)은 None."""
+    m = _PARTITION_RE.match(name)
+    if not m:
+        return None
+    return date(int(m.group(1)), int(m.group(2)), int(m.group(3)))
+
+
+def _today() -> date:
+    return datetime.now(settings.display_tz).date()
+
+
+async def _is_partitioned(db) -> bool:
+    from sqlalchemy import text
+
+    if db.bind.dialect.name != "postgresql":
+        return False
+    kind = (await db.execute(text(
+        "SELECT c.relkind FROM pg_class c JOIN pg_namespace n ON n.oid = c.relnamespace "
+        "WHERE n.nspname = current_schema() AND c.relname = 'track_points'"
+    ))).scalar()
+    return kind == "p"
+
+
+async def ensure_track_point_partitions(days_ahead: int | None = None) -> list[str]:
+    """오늘 + 향후 `days_ahead` 일 track_points 파티션을 멱등 생성한다.
+
+    반환: 보장(생성 또는 이미 존재)된 파티션명 리스트. 비파티션 테이블이면 [].
+    default 파티션에 그 날 행이 있으면 새 파티션으로 옮긴 뒤 생성한다(_move_from_default_sql).
+    파티션명/경계는 코드가 생성한 상수(사용자 입력 아님)라 SQL injection 무관.
+    """
+    from sqlalchemy import text
+    from app.database import AsyncSessionLocal
+
+    if days_ahead is None:
+        days_ahead = settings.TRACK_POINTS_PARTITION_DAYS_AHEAD
+    today = _today()
+    ensured: list[str] = []
+    async with AsyncSessionLocal() as db:
+        if not await _is_partitioned(db):
+            return ensured
+        has_default = (await db.execute(
+            text("SELECT to_regclass(:name) IS NOT NULL"), {"name": _DEFAULT_PARTITION},
+        )).scalar()
+        for offset in range(days_ahead + 1):
+            day = today + timedelta(days=offset)
+            name, ddl = _day_partition_ddl(day)
+            statements = [ddl]
+            if has_default and not (await db.execute(
+                text("SELECT to_regclass(:name) IS NOT NULL"), {"name": name},
+            )).scalar():
+                in_day = (await db.execute(text(
+                    f"SELECT EXISTS (SELECT 1 FROM {_DEFAULT_PARTITION} "
+                    "WHERE observed_at >= :lo AND observed_at < :hi)"
+                ), {
+                    "lo": datetime.combine(day, time.min, tzinfo=settings.display_tz),
+                    "hi": datetime.combine(day + timedelta(days=1), time.min, tzinfo=settings.display_tz),
+                })).scalar()
+                if in_day:
+                    # default 에 그 날 행이 있으면 CREATE 가 거부된다 — 한 savepoint 에서 옮기며 생성
+                    _, statements = _move_from_default_sql(day)
+            try:
+                async with db.begin_nested():
+                    for stmt in statements:
+                        await db.execute(text(stmt))
+                ensured.append(name)
+                if len(statements) > 1:
+                    print(f"[INFO] track_points partition {name} created with rows moved from {_DEFAULT_PARTITION}")
+            except Exception as e:
+                print(f"[WARN] track_points partition {name} not created: {e}")
+        await db.commit()
+    return ensured
+
+
+async def _expire_track_sessions(db, cutoff: datetime) -> None:
+    """세션 요약(user-006)을 원본 보존에 맞춘다 — 원본 삭제와 같은 트랜잭션.
+
+    - 마지막 관측이 기준 이전(end_at < cutoff)인 세션 삭제.
+    - 기준에 걸친 세션(start_at < cutoff ≤ end_at)은 남은 점(observed_at ≥ cutoff)으로
+      start_at/end_at/point_count/bbox 재계산(남은 점이 없으면 삭제). 대상은 기준 시각에 살아 있던
+      트랙뿐이라 소량 — 세션별 상관 서브쿼리(track_id 인덱스 + 파티션 pruning).
+    """
+    from sqlalchemy import and_, delete, exists, func, select, update
+    from app.models.tracking import TrackPoint, TrackSession
+
+    await db.execute(delete(TrackSession).where(TrackSession.end_at < cutoff))
+
+    remaining = and_(
+        TrackPoint.track_id == TrackSession.track_id,
+        TrackPoint.camera_id == TrackSession.camera_id,
+        TrackPoint.observed_at >= cutoff,
+    )
+    straddling = and_(TrackSession.start_at < cutoff, TrackSession.end_at >= cutoff)
+    await db.execute(
+        delete(TrackSession).where(straddling, ~exists().where(remaining))
+        .execution_options(synchronize_session=False)
+    )
+
+    def _agg(expr):
+        return select(expr).where(remaining).scalar_subquery()
+
+    await db.execute(
+        update(TrackSession).where(straddling).values(
+            start_at=_agg(func.min(TrackPoint.observed_at)),
+            end_at=_agg(func.max(TrackPoint.observed_at)),
+            point_count=_agg(func.count()),
+            min_latitude=_agg(func.min(TrackPoint.latitude)),
+            max_latitude=_agg(func.max(TrackPoint.latitude)),
+            min_longitude=_agg(func.min(TrackPoint.longitude)),
+            max_longitude=_agg(func.max(TrackPoint.longitude)),
+        ).execution_options(synchronize_session=False)
+    )
+
+
+async def run_track_points_retention(retention_days: int | None = None) -> list[str]:
+    """스케줄러 진입점 — 보존기간 경과 파티션 DROP.
+
+    Returns: DROP 된 파티션명 리스트(비파티션 폴백 DELETE 시 []).
+    """
+    from sqlalchemy import delete, text
+    from app.database import AsyncSessionLocal
+    from app.models.tracking import TrackPoint
+
+    if retention_days is None:
+        retention_days = settings.TRACK_POINTS_RETENTION_DAYS
+    cutoff_day = _today() - timedelta(days=retention_days)
+    cutoff = datetime.combine(cutoff_day, time.min, tzinfo=settings.display_tz)
+
+    async with AsyncSessionLocal() as db:
+        try:
+            if not await _is_partitioned(db):
+                result = await db.execute(delete(TrackPoint).where(TrackPoint.observed_at < cutoff))
+                await _expire_track_sessions(db, cutoff)
+                await db.commit()
+                print(f"[track_points_retention] not partitioned — deleted {result.rowcount or 0} rows")
+                return []
+
+            names = (await db.execute(text(
+                "SELECT c.relname FROM pg_inherits i "
+                "JOIN pg_class c ON c.oid = i.inhrelid "
+                "JOIN pg_class p ON p.oid = i.inhparent "
+                "WHERE p.relname = 'track_points'"
+            ))).scalars().all()
+            dropped: list[str] = []
+            for name in sorted(names):
+                day = partition_day(name)
+                # 파티션 상한(day+1 자정) ≤ cutoff 인 것만 — 경계 걸친 파티션은 다음 회차로.
+                if day is not None and day + timedelta(days=1) <= cutoff_day:
+                    await db.execute(text(f"DROP TABLE IF EXISTS {name}"))
+                    dropped.append(name)
+            await db.execute(
+                text("DELETE FROM track_points_default WHERE observed_at < :cutoff"), {"cutoff": cutoff}
+            )
+            # 세션 요약(user-006)도 원본과 같이 만료 + 기준에 걸친 세션 재계산
+            await _expire_track_sessions(db, cutoff)
+            await db.commit()
+            return dropped
+        except Exception as e:
+            print(f"[track_points_retention] error: {e}")
+            try:
+                await db.rollback()
+            except Exception:
+                pass
+            return []
@@ -0,0 +1,133 @@
+"""이벤트 목록 keyset(커서) 페이지네이션 — user-014.
+
+탐지/장애/연결/조치 이벤트 목록은 `page`/`limit` → `OFFSET` + 매 호출 `count(*)` 라
+`events` 가 커질수록 깊은 페이지와 건수 집계가 선형으로 느려진다.
+`paging=cursor`(또는 `cursor` 지정) 시 정렬 키 `(created_at DESC, id DESC)` 를 keyset 으로
+직전 페이지 마지막 행 "이후"만 읽는다 — 페이지 깊이와 무관한 인덱스 범위 스캔
+(app/routers/tracking.py 의 `(observed_at, id)` 커서와 같은 방식, 방향만 역순).
+
+전체 건수는 cursor 모드에서 선택:
+- `none`(기본) : 집계 안 함
+- `estimate`  : 필터 없으면 `pg_class.reltuples`(통계 추정, O(1)). 필터가 있거나 PostgreSQL 이
+                아니면 정확 집계로 대체(`total_estimated=false`).
+- `exact`     : 종전 `count(*)`
+offset 모드(기본)는 응답·동작 모두 종전 그대로.
+"""
+from __future__ import annotations
+
+import base64
+import math
+from datetime import datetime, timezone
+from typing import Any, Optional
+
+from sqlalchemy import and_, inspect, or_, text
+
+from app.schemas.common import CursorPaginationMeta, PaginationMeta
+
+
+def encode_cursor(created_at: datetime, row_id: int) -> str:
+    """(created_at, id) → opaque base64 커서. DB 반환 naive(SQLite)는 UTC 로 명시해 재바인딩 오해석 방지."""
+    if created_at.tzinfo is None:
+        created_at = created_at.replace(tzinfo=timezone.utc)
+    raw = f"{created_at.isoformat()}|{row_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """opaque 커서 → (created_at, id). 형식 오류 시 ValueError."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        ts_str, id_str = raw.rsplit("|", 1)
+        return datetime.fromisoformat(ts_str), int(id_str)
+    except Exception as e:
+        raise ValueError(f"invalid cursor: {cursor!r}") from e
+
+
+def keyset_before(created_col, id_col, keyset: tuple[datetime, int]):
+    """`(created_at, id) < (c_ts, c_id)` — 내림차순 다음 페이지 조건(SQLite/PG 호환 전개형)."""
+    c_ts, c_id = keyset
+    return or_(created_col < c_ts, and_(created_col == c_ts, id_col < c_id))
+
+
+async def estimate_rows(db, table_name: str) -> Optional[int]:
+    """`pg_class.reltuples` 기반 행수 추정. PostgreSQL 아님/통계 없음(-1, ANALYZE 전)이면 None."""
+    if db.bind.dialect.name != "postgresql":
+        return None
+    est = (await db.execute(
+        text("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:name)"), {"name": table_name},
+    )).scalar()
+    return int(est) if est is not None and est >= 0 else None
+
+
+def _keyset_columns(model):
+    """cursor 모드 정렬·keyset 컬럼과 카테고리 조건.
+
+    Event 하위 타입(joined inheritance)은 서브타입 테이블 id 가 아니라 부모 `events` 의
+    `(created_at, id)` 로 정렬하고 `category_event = <identity>` 를 명시해야
+    `idx_events_category_created_id` 범위 스캔이 된다(희소 카테고리가 events 전체를 훑지 않음).
+    """
+    mapper = inspect(model)
+    if mapper.inherits is not None and mapper.polymorphic_on is not None:
+        base = mapper.base_mapper.class_
+        return base.created_at, base.id, mapper.polymorphic_on == mapper.polymorphic_identity
+    return model.created_at, model.id, None
+
+
+def cursor_page_stmt(stmt, model, *, limit: int, cursor: Optional[str] = None):
+    """cursor 모드 조회문 — 카테고리 조건 + keyset + `(created_at DESC, id DESC)` + limit+1(다음 페이지 판정)."""
+    created_col, id_col, category = _keyset_columns(model)
+    if category is not None:
+        stmt = stmt.where(category)
+    if cursor:
+        stmt = stmt.where(keyset_before(created_col, id_col, decode_cursor(cursor)))
+    return stmt.order_by(created_col.desc(), id_col.desc()).limit(limit + 1)
+
+
+async def fetch_event_page(
+    db,
+    stmt,
+    count_stmt,
+    model,
+    *,
+    page: int,
+    limit: int,
+    paging: str = "offset",
+    cursor: Optional[str] = None,
+    total: Optional[str] = None,
+) -> tuple[list[Any], Optional[PaginationMeta], Optional[CursorPaginationMeta]]:
+    """필터 적용된 stmt/count_stmt 로 한 페이지 조회 → (rows, pagination, cursor_meta).
+
+    cursor 모드면 pagination=None, offset 모드면 cursor_meta=None.
+    estimate 는 count_stmt 에 WHERE 가 없을 때(무필터)만 reltuples 를 쓴다.
+    잘못된 cursor 는 ValueError(라우터에서 400).
+    """
+    order = (model.created_at.desc(), model.id.desc())
+
+    if paging != "cursor" and not cursor:
+        count = (await db.execute(count_stmt)).scalar() or 0
+        rows = (await db.execute(
+            stmt.order_by(*order).offset((page - 1) * limit).limit(limit)
+        )).scalars().all()
+        return rows, PaginationMeta(
+            page=page, limit=limit, total=count,
+            total_pages=math.ceil(count / limit) if count > 0 else 1,
+        ), None
+
+    rows = (await db.execute(cursor_page_stmt(stmt, model, limit=limit, cursor=cursor))).scalars().all()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    count, estimated = None, False
+    if total == "estimate" and count_stmt.whereclause is None:
+        count = await estimate_rows(db, model.__table__.name)
+        estimated = count is not None
+    if total == "exact" or (total == "estimate" and count is None):
+        count = (await db.execute(count_stmt)).scalar() or 0
+
+    return rows, None, CursorPaginationMeta(
+        next_cursor=encode_cursor(rows[-1].created_at, rows[-1].id) if (has_more and rows) else None,
+        limit=limit,
+        has_more=has_more,
+        total=count,
+        total_estimated=estimated,
+    )
@@ -2,14 +2,47 @@
 
 PRD: PRD_Report_Master_Redesign
 백그라운드 태스크(스레드) 내에서 동기 Playwright로 A4 PDF 바이트를 생성한다.
-Chart.js 렌더 완료(window.__READY__) 후 page.pdf 호출.
+Chart.js 렌더 완료(window.__READY__) + 폰트/페인트 안정화(SETTLE_JS) 후 page.pdf 호출.
+
+user-008: 비동기 경로(html_to_pdf_bytes_async)는 lifespan 의 상주 Chromium 풀
+(app/services/pdf_render_pool.py)로 렌더한다. 풀 미기동 시 아래 1회성 동기 경로로 폴백.
 """
 from __future__ import annotations
 
+import asyncio
 import logging
 
 logger = logging.getLogger(__name__)
 
+LAUNCH_ARGS = ["--no-sandbox", "--disable-dev-shm-usage", "--disable-gpu"]
+
+PDF_OPTIONS = {
+    "format": "A4",
+    "print_background": True,
+    "prefer_css_page_size": True,
+    "margin": {"top": "0", "bottom": "0", "left": "0", "right": "0"},
+}
+
+# 고정 sleep 대신: 웹폰트 로드 완료 + 2프레임 페인트(레이아웃/캔버스 반영) 대기
+SETTLE_JS = """async () => {
+    await document.fonts.ready;
+    await new Promise(r => requestAnimationFrame(() => requestAnimationFrame(r)));
+}"""
+
+
+async def html_to_pdf_bytes_async(html: str, ready_timeout_ms: int = 120_000) -> bytes:
+    """html_to_pdf_bytes 의 async 판 — 풀 기동 시 상주 브라우저로 렌더, 재압축만 스레드에서.
+
+    Raises:
+        RuntimeError: Playwright 미설치 또는 렌더 실패 시.
+    """
+    from app.services import pdf_render_pool
+
+    if not pdf_render_pool.is_running():
+        return await asyncio.to_thread(html_to_pdf_bytes, html, ready_timeout_ms)
+    pdf = await pdf_render_pool.render_pdf(html, ready_timeout_ms)
+    return await asyncio.to_thread(_compress_pdf, pdf)
+
 
 def html_to_pdf_bytes(html: str, ready_timeout_ms: int = 120_000) -> bytes:
     """완전한 HTML 문서를 A4 PDF 바이트로 렌더링한다.
@@ -23,10 +56,7 @@ def html_to_pdf_bytes(html: str, ready_timeout_ms: int = 120_000) -> bytes:
         raise RuntimeError("playwright가 설치되지 않았습니다. 'pip install playwright' 후 'playwright install chromium'") from e
 
     with sync_playwright() as p:
-        browser = p.chromium.launch(
-            headless=True,
-            args=["--no-sandbox", "--disable-dev-shm-usage", "--disable-gpu"],
-        )
+        browser = p.chromium.launch(headless=True, args=LAUNCH_ARGS)
         try:
             page = browser.new_page()
             page.set_content(html, wait_until="load", timeout=ready_timeout_ms)
@@ -34,11 +64,8 @@ def html_to_pdf_bytes(html: str, ready_timeout_ms: int = 120_000) -> bytes:
                 page.wait_for_function("window.__READY__===true", timeout=ready_timeout_ms)
             except Exception as e:  # 차트 렌더 지연/실패해도 본문은 출력
                 logger.warning("report render: __READY__ 대기 실패 (차트 일부 누락 가능): %s", e)
-            page.wait_for_timeout(600)
-            pdf = page.pdf(
-                format="A4", print_background=True, prefer_css_page_size=True,
-                margin={"top": "0", "bottom": "0", "left": "0", "right": "0"},
-            )
+            page.evaluate(SETTLE_JS)
+            pdf = page.pdf(**PDF_OPTIONS)
         finally:
             browser.close()
 
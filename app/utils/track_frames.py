@@ -0,0 +1,155 @@
+"""
+추적점 컬럼형 바이너리 프레임 — `GET /api/tracking/points/stream?format=binary` (user-007)
+
+대용량 Playback 전송용. JSON 대비 필드명 반복·숫자 문자열화가 없고, 클라는 열 단위로 바로
+Float64Array/Int32Array 등에 매핑할 수 있다. 전부 little-endian.
+
+스트림 = 프리앰블 1회 + 프레임 N개 + 종료 프레임(n_rows=0)
+
+    프리앰블  : b"GTPS" | uint16 version(=1) | uint16 reserved(=0)
+    프레임    : b"GTPF" | uint32 n_rows | uint32 strings_len | strings(JSON UTF-8 배열) | 열들
+    열(순서)  : id          int64[n]
+                observed_at float64[n]   epoch 초(UTC)
+                latitude    float64[n]
+                longitude   float64[n]
+                camera_id   int32[n]
+                track       uint32[n]    strings 인덱스
+                label       int32[n]     strings 인덱스, -1 = null
+                threat      int32[n]     strings 인덱스, -1 = null
+                distance_m  float32[n]   NaN = null
+                confidence  float32[n]   NaN = null
+                speed_mps   float32[n]   NaN = null
+
+strings 는 프레임 단위 사전(track_id/label/threat_level 고유값) — 프레임 간 독립이라 어느 프레임부터
+읽어도 복원 가능. tracking_state/session_seq 는 재생에 불필요해 싣지 않는다(NDJSON 은 전 필드).
+"""
+from __future__ import annotations
+
+import json
+import struct
+from datetime import datetime, timezone
+from typing import Sequence
+
+import numpy as np
+
+STREAM_MAGIC = b"GTPS"
+FRAME_MAGIC = b"GTPF"
+VERSION = 1
+MEDIA_TYPE = "application/vnd.gop.trackpoints"
+
+_PREAMBLE = struct.Struct("<4sHH")
+_FRAME_HEADER = struct.Struct("<4sII")
+
+# (이름, dtype) — 인코딩/디코딩 공용 열 순서
+COLUMNS: tuple[tuple[str, str], ...] = (
+    ("id", "<i8"),
+    ("observed_at", "<f8"),
+    ("latitude", "<f8"),
+    ("longitude", "<f8"),
+    ("camera_id", "<i4"),
+    ("track", "<u4"),
+    ("label", "<i4"),
+    ("threat", "<i4"),
+    ("distance_m", "<f4"),
+    ("confidence", "<f4"),
+    ("speed_mps", "<f4"),
+)
+
+
+def preamble() -> bytes:
+    return _PREAMBLE.pack(STREAM_MAGIC, VERSION, 0)
+
+
+def end_frame() -> bytes:
+    return _FRAME_HEADER.pack(FRAME_MAGIC, 0, 0)
+
+
+def _epoch(dt: datetime) -> float:
+    """SQLite 는 tz 를 버린 UTC 벽시계를 돌려주므로 naive 는 UTC 로 간주."""
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
+
+
+def encode_frame(rows: Sequence) -> bytes:
+    """Row 시퀀스 → 프레임 1개. Row 는 속성 id/observed_at/latitude/longitude/camera_id/track_id/
+    label/threat_level/distance_m/confidence/speed_mps 를 가진다(select 열 Row)."""
+    n = len(rows)
+    strings: dict[str, int] = {}
+
+    def _ref(value) -> int:
+        if value is None:
+            return -1
+        idx = strings.get(value)
+        if idx is None:
+            idx = strings[value] = len(strings)
+        return idx
+
+    def _f(value) -> float:
+        return np.nan if value is None else value
+
+    cols = {
+        "id": np.fromiter((r.id for r in rows), "<i8", n),
+        "observed_at": np.fromiter((_epoch(r.observed_at) for r in rows), "<f8", n),
+        "latitude": np.fromiter((r.latitude for r in rows), "<f8", n),
+        "longitude": np.fromiter((r.longitude for r in rows), "<f8", n),
+        "camera_id": np.fromiter((r.camera_id for r in rows), "<i4", n),
+        "track": np.fromiter((_ref(r.track_id) for r in rows), "<u4", n),
+        "label": np.fromiter((_ref(r.label) for r in rows), "<i4", n),
+        "threat": np.fromiter((_ref(r.threat_level) for r in rows), "<i4", n),
+        "distance_m": np.fromiter((_f(r.distance_m) for r in rows), "<f4", n),
+        "confidence": np.fromiter((_f(r.confidence) for r in rows), "<f4", n),
+        "speed_mps": np.fromiter((_f(r.speed_mps) for r in rows), "<f4", n),
+    }
+    table = json.dumps(list(strings), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    parts = [_FRAME_HEADER.pack(FRAME_MAGIC, n, len(table)), table]
+    parts.extend(cols[name].tobytes() for name, _ in COLUMNS)
+    return b"".join(parts)
+
+
+def decode_stream(data: bytes) -> list[dict]:
+    """스트림 전체 → 행 dict 리스트(검증/파이썬 클라용). 형식 오류 시 ValueError."""
+    magic, version, _ = _PREAMBLE.unpack_from(data, 0)
+    if magic != STREAM_MAGIC or version != VERSION:
+        raise ValueError("not a track point stream")
+    pos = _PREAMBLE.size
+    out: list[dict] = []
+    while True:
+        magic, n, slen = _FRAME_HEADER.unpack_from(data, pos)
+        if magic != FRAME_MAGIC:
+            raise ValueError("bad frame header")
+        pos += _FRAME_HEADER.size
+        if n == 0:
+            return out
+        strings = json.loads(data[pos:pos + slen].decode("utf-8"))
+        pos += slen
+        cols = {}
+        for name, dtype in COLUMNS:
+            arr = np.frombuffer(data, dtype=dtype, count=n, offset=pos)
+            pos += arr.nbytes
+            cols[name] = arr
+        for i in range(n):
+            out.append(_row(cols, strings, i))
+
+
+def _row(cols: dict, strings: list, i: int) -> dict:
+    def _s(ref) -> object:
+        return None if ref < 0 else strings[ref]
+
+    def _opt(value) -> object:
+        return None if np.isnan(value) else float(value)
+
+    return {
+        "id": int(cols["id"][i]),
+        "observed_at": datetime.fromtimestamp(float(cols["observed_at"][i]), timezone.utc),
+        "latitude": float(cols["latitude"][i]),
+        "longitude": float(cols["longitude"][i]),
+        "camera_id": int(cols["camera_id"][i]),
+        "track_id": strings[int(cols["track"][i])],
+        "label": _s(int(cols["label"][i])),
+        "threat_level": _s(int(cols["threat"][i])),
+        "distance_m": _opt(cols["distance_m"][i]),
+        "confidence": _opt(cols["confidence"][i]),
+        "speed_mps": _opt(cols["speed_mps"][i]),
+    }
+
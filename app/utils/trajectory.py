@@ -0,0 +1,104 @@
+"""
+궤적 다운샘플링 — Playback 전송량 축소 (user-005)
+
+`GET /api/tracking/points?resolution=&max_points=` 가 트랙별로 호출한다. 입력은 한 트랙의
+(observed_at epoch초, lat, lng) 배열(시각 오름차순), 출력은 유지할 **원본 인덱스**(오름차순, 양끝 포함).
+
+- resolution(m): 시공간 Douglas-Peucker — 거리 척도는 SED(Synchronized Euclidean Distance):
+  점과 "같은 시각에 구간 위에 있었을 위치"(선형 보간) 사이 거리. 순수 공간 DP 와 달리 정지/가감속
+  구간도 보존돼 재생 시 속도가 왜곡되지 않는다.
+- max_points: LTTB(Largest-Triangle-Three-Buckets) — 시간순 버킷마다 직전 선택점·다음 버킷 평균과
+  이루는 (평면) 삼각형 면적이 최대인 점을 고른다. 정확히 max_points 개로 상한.
+- 둘 다 주면 DP 후 초과분만 LTTB 로 상한.
+
+좌표는 트랙 중심 기준 등장방형(equirectangular) 근사로 미터 평면 투영 — 수 km 추적 범위에서 오차 무시 가능.
+모든 거리/면적 계산은 numpy 벡터 연산(점 단위 파이썬 루프 없음).
+"""
+from __future__ import annotations
+
+import math
+from typing import Optional
+
+import numpy as np
+
+_M_PER_DEG_LAT = 110_540.0
+_M_PER_DEG_LNG = 111_320.0
+
+
+def project_m(lat: np.ndarray, lng: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """위경도(deg) → 트랙 중심 기준 평면 좌표(m)."""
+    lat0 = float(lat.mean())
+    x = (lng - float(lng.mean())) * (_M_PER_DEG_LNG * math.cos(math.radians(lat0)))
+    y = (lat - lat0) * _M_PER_DEG_LAT
+    return x, y
+
+
+def douglas_peucker_sed(t: np.ndarray, x: np.ndarray, y: np.ndarray, epsilon: float) -> np.ndarray:
+    """시공간 DP — SED 가 epsilon(m) 초과인 점만 분할점으로 유지. 유지 인덱스(오름차순) 반환."""
+    n = len(t)
+    if n <= 2:
+        return np.arange(n)
+    keep = np.zeros(n, dtype=bool)
+    keep[0] = keep[-1] = True
+    stack = [(0, n - 1)]  # 재귀 대신 명시 스택(긴 트랙 재귀 한도 회피)
+    while stack:
+        i, j = stack.pop()
+        if j - i < 2:
+            continue
+        inner = slice(i + 1, j)
+        span = t[j] - t[i]
+        ratio = (t[inner] - t[i]) / span if span > 0 else np.zeros(j - i - 1)
+        d = np.hypot(x[inner] - (x[i] + ratio * (x[j] - x[i])),
+                     y[inner] - (y[i] + ratio * (y[j] - y[i])))
+        k = int(np.argmax(d))
+        if d[k] > epsilon:
+            m = i + 1 + k
+            keep[m] = True
+            stack.append((i, m))
+            stack.append((m, j))
+    return np.flatnonzero(keep)
+
+
+def lttb(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """LTTB — 시간순 n 점 중 n_out 점 선택. 유지 인덱스(오름차순, 양끝 포함) 반환."""
+    n = len(x)
+    if n_out >= n:
+        return np.arange(n)
+    if n_out <= 2:
+        return np.array([0, n - 1]) if n > 1 else np.arange(n)
+    # 내부 점 [1, n-1) 을 n_out-2 개 버킷으로 — n_out < n 이면 버킷 폭 ≥ 1 이라 빈 버킷 없음
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    out = np.empty(n_out, dtype=np.int64)
+    out[0], out[-1] = 0, n - 1
+    a = 0
+    for b in range(n_out - 2):
+        lo, hi = edges[b], edges[b + 1]
+        nlo = hi
+        nhi = edges[b + 2] if b + 2 < len(edges) else n
+        avg_x = x[nlo:nhi].mean()
+        avg_y = y[nlo:nhi].mean()
+        area = np.abs((x[a] - avg_x) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (avg_y - y[a]))
+        a = lo + int(np.argmax(area))
+        out[b + 1] = a
+    return out
+
+
+def downsample_track(
+    t: np.ndarray,
+    lat: np.ndarray,
+    lng: np.ndarray,
+    *,
+    resolution: Optional[float] = None,
+    max_points: Optional[int] = None,
+) -> np.ndarray:
+    """한 트랙 다운샘플 — 유지할 원본 인덱스(오름차순) 반환. 둘 다 None 이면 전부."""
+    n = len(t)
+    idx = np.arange(n)
+    if n <= 2:
+        return idx
+    x, y = project_m(lat, lng)
+    if resolution is not None:
+        idx = douglas_peucker_sed(t, x, y, resolution)
+    if max_points is not None and len(idx) > max_points:
+        idx = idx[lttb(x[idx], y[idx], max_points)]
+    return idx
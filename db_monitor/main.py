@@ -15,7 +15,7 @@ import os
 import random
 import time
 import uuid
-from datetime import datetime
+from datetime import datetime, timezone
 from zoneinfo import ZoneInfo
 
 KST = ZoneInfo("Asia/Seoul")
@@ -23,6 +23,22 @@ KST = ZoneInfo("Asia/Seoul")
 HEARTBEAT_FILE = os.environ.get("DB_MONITOR_HEARTBEAT", "/tmp/db_monitor_heartbeat")
 LIVENESS_INTERVAL = 3.0   # 초 — SELECT 1 liveness 프로브 + 하트비트 주기
 BACKOFF_MAX = 30.0        # 초 — 재연결 백오프 상한
+ENCLOSURE_METRICS_CHANNEL = "gop_metrics"  # user-019: enclosure_metrics INSERT 트리거 채널
+
+# user-020: gop_sync 병합 창·배치 — 대량 import/그룹 재배정 시 SYNC_* 폭주 억제
+SYNC_COALESCE_WINDOW = float(os.environ.get("SYNC_COALESCE_WINDOW", "0.25"))  # 초 — 0 이면 즉시 발행(병합 없음)
+SYNC_BATCH = os.environ.get("SYNC_BATCH", "0") == "1"   # 1 이면 창마다 cmd 별 배치 envelope
+SYNC_BATCH_MAX = int(os.environ.get("SYNC_BATCH_MAX", "500"))  # 배치 envelope 1건당 최대 항목 수
+STATS_LOG_INTERVAL = 60.0  # 초 — 발행 통계/발행률 로그 주기
+
+# user-020: 발행 통계 (get_stats / reset_stats)
+_stats = {
+    "received": 0,         # 수신 NOTIFY (gop_sync + gop_event)
+    "coalesced": 0,        # 병합 창에서 같은 (cmd, 식별자) 로 흡수된 건수
+    "dropped": 0,          # 미등재 cmd 로 버린 건수
+    "published": 0,        # NATS publish 호출 수 (배치 envelope 1건 = 1)
+    "published_items": 0,  # publish 된 body 항목 수
+}
 
 CMD_SUBJECT_MAP = {
     "SYNC_DEVICE":         "all.sync.device",
@@ -37,7 +53,7 @@ CMD_SUBJECT_MAP = {
     "SYNC_DETECTION":      "all.sync.detection",     # 탐지 갱신 알림 (detection-sync-message, UPDATE/DELETE만, from=DBApi)
     "SYNC_EVENT_SUPPRESSION": "all.sync.event-suppression",  # 억제(정비 창) 변경·창경계 전이 알림 — 이벤트 파이프라인 통제 상태
     "SYSTEM_EVENT":        "all.event.system",       # Full-DTO (gop_event 채널)
-    "ENCLOSURE_METRICS":   "gis.enclosure-metrics",  # 주기 텔레메트리 (주기 태스크)
+    "ENCLOSURE_METRICS":   "gis.enclosure-metrics",  # 텔레메트리 (gop_metrics NOTIFY 디바운스 + 스냅샷)
 }
 
 
@@ -61,66 +77,239 @@ def build_nats_envelope(cmd: str, body: dict) -> dict:
     }
 
 
-def make_handler(nc, unit_id: str):
+def build_nats_batch_envelope(cmd: str, bodies: list[dict]) -> dict:
+    """user-020: 배치 envelope (SYNC_BATCH=1 선택형) — body = {"items": [...], "count": N}.
+
+    단건 envelope 와 같은 헤더에 `batch: true` 만 더한다. 소비자는 `batch` 유무로 단건/배치를 구분.
+    """
+    envelope = build_nats_envelope(cmd, {"items": bodies, "count": len(bodies)})
+    envelope["batch"] = True
+    return envelope
+
+
+def get_stats() -> dict:
+    return dict(_stats)
+
+
+def reset_stats() -> None:
+    for k in _stats:
+        _stats[k] = 0
+
+
+async def _publish(nc, subject: str, envelope: dict, items: int = 1) -> None:
+    await nc.publish(subject, json.dumps(envelope).encode())
+    _stats["published"] += 1
+    _stats["published_items"] += items
+
+
+class SyncCoalescer:
+    """user-020: gop_sync 병합 창 — 같은 (cmd, 식별자) 알림은 마지막 action 1건으로 합친다.
+
+    식별자 = body 에서 action 을 뺀 전 필드(트리거가 정한 resource_id/camera_id/server_id 등).
+    CREATED→UPDATED→DELETED 가 한 창에 오면 DELETED 1건. 순서는 키가 처음 들어온 순서를 유지한다.
+    """
+
+    def __init__(self) -> None:
+        self._pending: dict[tuple[str, str], tuple[str, dict]] = {}
+
+    def offer(self, cmd: str, subject: str, body: dict) -> None:
+        ident = json.dumps({k: v for k, v in body.items() if k != "action"}, sort_keys=True, default=str)
+        key = (cmd, ident)
+        if key in self._pending:
+            _stats["coalesced"] += 1
+        self._pending[key] = (subject, body)
+
+    def drain(self) -> list[tuple[str, str, dict]]:
+        """[(cmd, subject, body)] — 병합 결과를 비우며 반환."""
+        items = [(cmd, subject, body) for (cmd, _), (subject, body) in self._pending.items()]
+        self._pending.clear()
+        return items
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    async def flush(self, nc, batch: bool = False, batch_max: int = SYNC_BATCH_MAX) -> int:
+        """대기분 발행. batch=True 면 cmd 별로 최대 batch_max 항목씩 배치 envelope. 반환: publish 호출 수."""
+        items = self.drain()
+        if not batch:
+            for cmd, subject, body in items:
+                await _publish(nc, subject, build_nats_envelope(cmd, body))
+            return len(items)
+        groups: dict[tuple[str, str], list[dict]] = {}
+        for cmd, subject, body in items:
+            groups.setdefault((cmd, subject), []).append(body)
+        sent = 0
+        for (cmd, subject), bodies in groups.items():
+            for i in range(0, len(bodies), batch_max):
+                chunk = bodies[i:i + batch_max]
+                await _publish(nc, subject, build_nats_batch_envelope(cmd, chunk), items=len(chunk))
+                sent += 1
+        return sent
+
+
+def make_handler(nc, unit_id: str, coalescer: SyncCoalescer | None = None):
     """Return asyncpg listener callback that publishes to NATS.
 
     gop_sync(SYNC 알림만) + gop_event(SYSTEM_EVENT Full-DTO) 공용 핸들러.
     body = payload 의 cmd 제외 전 필드 통과 — 트리거가 식별자를 결정하므로
     (resource_id/camera_id/server_id/type_device 등) monitor 는 운반만 한다.
     (nats-dbapi-sync-completion FR-06: 하드코딩 resource_id 제거 → 식별자 갭 자동 수용.)
+
+    user-020: `coalescer` 가 있으면 gop_sync 알림은 병합 창에 넣기만 한다(발행은 _sync_flush_loop).
+    gop_event(SYSTEM_EVENT) 는 건별 고유 이벤트라 병합 없이 즉시 발행.
     """
     async def on_notify(conn, pid, channel, payload):
+        _stats["received"] += 1
         data = json.loads(payload)
         cmd = data.pop("cmd", None)
         subject = cmd_to_subject(cmd, unit_id)
         if subject is None:
             # ★ 무성 유실 방지: 트리거는 새 cmd 를 쏘는데 db_monitor 가 구버전이면 조용히 버려진다.
             #   배포 순서(db_monitor 먼저)를 어겼을 때 즉시 드러나도록 경고를 남긴다.
+            _stats["dropped"] += 1
             print(f"[db_monitor][WARN] unmapped cmd '{cmd}' — dropped. "
                   f"CMD_SUBJECT_MAP 등재 누락 또는 db_monitor 구버전(배포 순서 확인)", flush=True)
             return
+        if coalescer is not None and channel == "gop_sync":
+            coalescer.offer(cmd, subject, data)
+            return
         envelope = build_nats_envelope(cmd, data)  # data = cmd 제외 잔여 = body
-        await nc.publish(subject, json.dumps(envelope).encode())
+        await _publish(nc, subject, envelope)
 
     return on_notify
 
 
-async def _enclosure_metrics_loop(db_url: str, nc, unit_id: str, interval: float):
-    """ENCLOSURE_METRICS (nats-dbapi-sync-completion FR-05): 주기 텔레메트리.
+async def _sync_flush_loop(nc, coalescer: SyncCoalescer, window: float, batch: bool) -> None:
+    """user-020: 병합 창 주기로 gop_sync 대기분 발행."""
+    while True:
+        await asyncio.sleep(window)
+        if len(coalescer):
+            await coalescer.flush(nc, batch=batch)
+
 
-    이벤트가 아닌 주기 push 이므로 트리거로 발화할 수 없다 → db_monitor 가 함체별 최신
-    metrics 를 조회해 발행한다. 리스너 연결과 **분리된 전용 asyncpg 연결** 사용
-    (asyncpg 연결은 동시 쿼리 비안전). measured_at = REST created_at 대응.
-    """
-    import asyncpg
-    subject = f"sensorway.{unit_id}.gis.enclosure-metrics"
+class PublishRate:
+    """user-020: 발행률 — 직전 sample() 이후 카운터 증분 / 경과초."""
 
-    def _f(v):
+    def __init__(self) -> None:
+        self._at = time.monotonic()
+        self._prev = get_stats()
+
+    def sample(self) -> dict:
+        now, cur = time.monotonic(), get_stats()
+        elapsed = max(now - self._at, 1e-9)
+        rates = {f"{k}_per_sec": round((cur[k] - self._prev[k]) / elapsed, 2) for k in cur}
+        self._at, self._prev = now, cur
+        return rates
+
+
+def _f(v):
+    """메트릭 값(문자열 컬럼 포함) → float. 변환 불가/None 은 None."""
+    try:
+        return float(v) if v is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _measured_at(v) -> datetime | None:
+    """created_at(asyncpg datetime 또는 NOTIFY payload 의 ISO 문자열) → UTC aware datetime."""
+    if v is None:
+        return None
+    if isinstance(v, str):
         try:
-            return float(v) if v is not None else None
-        except (TypeError, ValueError):
+            v = datetime.fromisoformat(v)
+        except ValueError:
             return None
+    if v.tzinfo is None:
+        v = v.replace(tzinfo=timezone.utc)
+    return v.astimezone(timezone.utc)
+
+
+def enclosure_metrics_body(row) -> dict:
+    """최신 metrics 1행(asyncpg Record 또는 NOTIFY dict) → ENCLOSURE_METRICS body."""
+    at = _measured_at(row["created_at"])
+    return {
+        "enclosure_id": row["enclosure_id"],
+        "temperature": _f(row["temperature"]),
+        "humidity": _f(row["humidity"]),
+        "voltage": _f(row["voltage"]),
+        "current": _f(row["current"]),
+        "measured_at": at.isoformat() if at else None,
+    }
+
+
+class EnclosureMetricsBuffer:
+    """user-019: 함체별 최신 body 1건만 보관하는 디바운스 버퍼.
+
+    NOTIFY 가 몰려도 같은 함체는 마지막(measured_at 최신) 값으로 덮어쓰고, drain() 시 변경된
+    함체만 1건씩 나간다. 스냅샷 행도 같은 경로로 넣어 NOTIFY 와의 중복·역순(옛 값 재발행)을 막는다.
+    """
+
+    def __init__(self) -> None:
+        self._pending: dict[int, dict] = {}
+
+    def offer(self, body: dict) -> None:
+        key = body["enclosure_id"]
+        prev = self._pending.get(key)
+        if prev is not None and (prev["measured_at"] or "") > (body["measured_at"] or ""):
+            return  # 늦게 도착한 옛 측정값 — 버린다 (UTC isoformat 이라 문자열 비교 = 시각 비교)
+        self._pending[key] = body
+
+    def drain(self) -> list[dict]:
+        items = [self._pending[k] for k in sorted(self._pending)]
+        self._pending.clear()
+        return items
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+
+def make_metrics_handler(buffer: EnclosureMetricsBuffer):
+    """gop_metrics(ENCLOSURE_METRICS 신규 행) listener — 버퍼에 넣기만 한다(발행은 디바운스 루프)."""
+    def on_notify(conn, pid, channel, payload):
+        try:
+            buffer.offer(enclosure_metrics_body(json.loads(payload)))
+        except (ValueError, KeyError, TypeError) as e:
+            print(f"[db_monitor][WARN] bad gop_metrics payload dropped: {e!r}", flush=True)
+
+    return on_notify
+
+
+async def _enclosure_metrics_loop(db_url: str, nc, unit_id: str, buffer: EnclosureMetricsBuffer,
+                                  snapshot_interval: float, debounce: float):
+    """ENCLOSURE_METRICS (nats-dbapi-sync-completion FR-05): 함체 텔레메트리 발행.
+
+    user-019: 주기 전수 조회·재발행 → NOTIFY 구동. enclosure_metrics AFTER INSERT 트리거
+    (db_triggers, 채널 gop_metrics)가 새 행을 밀어주면 리스너가 `buffer` 에 모으고, 이 루프가
+    `debounce` 초마다 **바뀐 함체만** 발행한다. `snapshot_interval` 초마다 전 함체 최신값 스냅샷을
+    같은 버퍼로 흘려 안전망으로 삼는다(트리거 미적용 DB·LISTEN 재연결 사이 유실분 복구).
+
+    스냅샷은 리스너 연결과 **분리된 전용 asyncpg 연결** 사용(asyncpg 연결은 동시 쿼리 비안전).
+    measured_at = REST created_at 대응.
+
+    user-018: 전 이력 `DISTINCT ON` 정렬 대신 함체별 LATERAL `LIMIT 1` — (enclosure_id, created_at, id)
+    인덱스(v77, 파티션별 상속 v79) 역방향 1회 탐색. 이력 크기는 보존 정책(원본 N일)이 상한.
+    """
+    import asyncpg
+    subject = f"sensorway.{unit_id}.gis.enclosure-metrics"
 
     conn = await asyncpg.connect(db_url, server_settings={"application_name": "db_monitor_encl"})
     try:
+        next_snapshot = 0.0  # 세션 시작 직후 1회 — 재연결 사이 유실분 즉시 복구
         while True:
-            rows = await conn.fetch(
-                "SELECT DISTINCT ON (enclosure_id) enclosure_id, temperature, humidity, "
-                "voltage, current, created_at FROM enclosure_metrics "
-                "ORDER BY enclosure_id, created_at DESC"
-            )
-            for r in rows:
-                body = {
-                    "enclosure_id": r["enclosure_id"],
-                    "temperature": _f(r["temperature"]),
-                    "humidity": _f(r["humidity"]),
-                    "voltage": _f(r["voltage"]),
-                    "current": _f(r["current"]),
-                    "measured_at": r["created_at"].isoformat() if r["created_at"] else None,
-                }
-                envelope = build_nats_envelope("ENCLOSURE_METRICS", body)
-                await nc.publish(subject, json.dumps(envelope).encode())
-            await asyncio.sleep(interval)
+            if time.monotonic() >= next_snapshot:
+                rows = await conn.fetch(
+                    "SELECT e.id AS enclosure_id, m.temperature, m.humidity, m.voltage, m.current, m.created_at "
+                    "FROM enclosures e CROSS JOIN LATERAL ("
+                    "SELECT temperature, humidity, voltage, current, created_at FROM enclosure_metrics "
+                    "WHERE enclosure_id = e.id ORDER BY created_at DESC, id DESC LIMIT 1) m "
+                    "ORDER BY e.id"
+                )
+                for r in rows:
+                    buffer.offer(enclosure_metrics_body(r))
+                next_snapshot = time.monotonic() + snapshot_interval
+            for body in buffer.drain():
+                await _publish(nc, subject, build_nats_envelope("ENCLOSURE_METRICS", body))
+            await asyncio.sleep(debounce)
     finally:
         try:
             await conn.close()
@@ -137,8 +326,9 @@ def _write_heartbeat() -> None:
         print(f"[db_monitor] heartbeat write failed: {e}")
 
 
-async def _connect_and_listen(db_url: str, nats_url: str, unit_id: str, encl_interval: float) -> None:
-    """1회 연결 세션: PostgreSQL LISTEN(gop_sync/gop_event) + ENCLOSURE_METRICS 주기 태스크 + NATS 발행.
+async def _connect_and_listen(db_url: str, nats_url: str, unit_id: str, encl_interval: float,
+                              encl_debounce: float) -> None:
+    """1회 연결 세션: PostgreSQL LISTEN(gop_sync/gop_event/gop_metrics) + ENCLOSURE_METRICS 태스크 + NATS 발행.
 
     liveness 프로브(SELECT 1) 가 실패하면(연결 단절) 예외로 이탈해 상위 감독 루프가 재연결한다.
     주기 태스크가 죽어도 세션을 재시작한다(finally 에서 취소·정리).
@@ -152,14 +342,26 @@ async def _connect_and_listen(db_url: str, nats_url: str, unit_id: str, encl_int
     )
     # application_name 지정 — pg_stat_activity 관측/운영 진단 및 타깃 종료에 사용
     conn = await asyncpg.connect(db_url, server_settings={"application_name": "db_monitor"})
-    handler = make_handler(nc, unit_id)
+    # user-020: SYNC_* 병합 창 (SYNC_COALESCE_WINDOW=0 이면 기존처럼 건별 즉시 발행)
+    coalescer = SyncCoalescer() if SYNC_COALESCE_WINDOW > 0 else None
+    handler = make_handler(nc, unit_id, coalescer)
     await conn.add_listener("gop_sync", handler)     # SYNC 9종 (알림만)
     await conn.add_listener("gop_event", handler)    # SYSTEM_EVENT (Full-DTO)
-    # ENCLOSURE_METRICS 주기 발행 태스크 (전용 연결)
-    encl_task = asyncio.create_task(_enclosure_metrics_loop(db_url, nc, unit_id, encl_interval))
-    print(f"[db_monitor] Listening gop_sync/gop_event → NATS {nats_url} "
-          f"(unit_id={unit_id}, encl_interval={encl_interval}s)")
+    # user-019: ENCLOSURE_METRICS — 새 행 NOTIFY 를 버퍼에 모으고 디바운스 발행 (+ 저빈도 스냅샷, 전용 연결)
+    encl_buffer = EnclosureMetricsBuffer()
+    metrics_handler = make_metrics_handler(encl_buffer)
+    await conn.add_listener(ENCLOSURE_METRICS_CHANNEL, metrics_handler)
+    encl_task = asyncio.create_task(
+        _enclosure_metrics_loop(db_url, nc, unit_id, encl_buffer, encl_interval, encl_debounce)
+    )
+    sync_task = (asyncio.create_task(_sync_flush_loop(nc, coalescer, SYNC_COALESCE_WINDOW, SYNC_BATCH))
+                 if coalescer is not None else None)
+    print(f"[db_monitor] Listening gop_sync/gop_event/{ENCLOSURE_METRICS_CHANNEL} → NATS {nats_url} "
+          f"(unit_id={unit_id}, encl_snapshot={encl_interval}s, encl_debounce={encl_debounce}s, "
+          f"sync_window={SYNC_COALESCE_WINDOW}s, sync_batch={SYNC_BATCH})")
     _write_heartbeat()
+    rate = PublishRate()
+    next_stats = time.monotonic() + STATS_LOG_INTERVAL
 
     try:
         while True:
@@ -167,15 +369,27 @@ async def _connect_and_listen(db_url: str, nats_url: str, unit_id: str, encl_int
             await conn.execute("SELECT 1")
             if encl_task.done():  # 주기 태스크가 종료되면 세션 재시작(전용 연결 단절 등)
                 raise RuntimeError(f"enclosure metrics task ended: {encl_task.exception()!r}")
+            if sync_task is not None and sync_task.done():
+                raise RuntimeError(f"sync flush task ended: {sync_task.exception()!r}")
             if not nc.is_connected:
                 print("[db_monitor] NATS disconnected (client auto-reconnecting)…")
+            if time.monotonic() >= next_stats:
+                print(f"[db_monitor] stats {get_stats()} rate {rate.sample()}", flush=True)
+                next_stats = time.monotonic() + STATS_LOG_INTERVAL
             _write_heartbeat()
             await asyncio.sleep(LIVENESS_INTERVAL)
     finally:
         encl_task.cancel()
-        for ch in ("gop_sync", "gop_event"):
+        if sync_task is not None:
+            sync_task.cancel()
+            try:  # 창에 남은 알림은 best-effort 발행 (NATS 가 살아 있으면)
+                await coalescer.flush(nc, batch=SYNC_BATCH)
+            except Exception:
+                pass
+        for ch, cb in (("gop_sync", handler), ("gop_event", handler),
+                       (ENCLOSURE_METRICS_CHANNEL, metrics_handler)):
             try:
-                await conn.remove_listener(ch, handler)
+                await conn.remove_listener(ch, cb)
             except Exception:
                 pass
         try:
@@ -188,12 +402,13 @@ async def _connect_and_listen(db_url: str, nats_url: str, unit_id: str, encl_int
             pass
 
 
-async def run_supervised(db_url: str, nats_url: str, unit_id: str, encl_interval: float) -> None:
+async def run_supervised(db_url: str, nats_url: str, unit_id: str, encl_interval: float,
+                         encl_debounce: float = 1.0) -> None:
     """감독 루프 — 연결 세션이 단절/오류로 끝나면 지수 백오프+지터로 무한 재연결."""
     backoff = 1.0
     while True:
         try:
-            await _connect_and_listen(db_url, nats_url, unit_id, encl_interval)
+            await _connect_and_listen(db_url, nats_url, unit_id, encl_interval, encl_debounce)
             backoff = 1.0
         except Exception as e:
             capped = min(backoff, BACKOFF_MAX)
@@ -207,5 +422,7 @@ if __name__ == "__main__":
     db_url = os.environ["DATABASE_URL"]
     nats_url = os.environ.get("NATS_URL", "nats://localhost:4222")
     unit_id = os.environ.get("UNIT_ID", "unit001")
-    encl_interval = float(os.environ.get("ENCLOSURE_METRICS_INTERVAL", "10"))
-    asyncio.run(run_supervised(db_url, nats_url, unit_id, encl_interval))
+    # user-019: INTERVAL 은 안전망 스냅샷 주기(기본 300s), 실시간 경로는 NOTIFY + DEBOUNCE(기본 1s)
+    encl_interval = float(os.environ.get("ENCLOSURE_METRICS_INTERVAL", "300"))
+    encl_debounce = float(os.environ.get("ENCLOSURE_METRICS_DEBOUNCE", "1"))
+    asyncio.run(run_supervised(db_url, nats_url, unit_id, encl_interval, encl_debounce))
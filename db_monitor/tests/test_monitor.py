@@ -86,3 +86,114 @@ def test_envelope_id_is_unique():
     e1 = build_nats_envelope("SYNC_SERVER", body)
     e2 = build_nats_envelope("SYNC_SERVER", body)
     assert e1["id"] != e2["id"]
+
+
+# user-019: ENCLOSURE_METRICS NOTIFY 디바운스 버퍼
+def _metrics_payload(enclosure_id, created_at, temperature="21.5"):
+    import json
+    return json.dumps({
+        "cmd": "ENCLOSURE_METRICS", "enclosure_id": enclosure_id, "temperature": temperature,
+        "humidity": 40, "voltage": None, "current": "bad", "created_at": created_at,
+    })
+
+
+def test_metrics_buffer_should_keep_latest_per_enclosure():
+    from db_monitor.main import EnclosureMetricsBuffer, make_metrics_handler
+    buffer = EnclosureMetricsBuffer()
+    on_notify = make_metrics_handler(buffer)
+    on_notify(None, 1, "gop_metrics", _metrics_payload(2, "2026-10-17T15:00:01+09:00", "22"))
+    on_notify(None, 1, "gop_metrics", _metrics_payload(1, "2026-10-17T06:00:00.5+00:00"))
+    on_notify(None, 1, "gop_metrics", _metrics_payload(2, "2026-10-17T06:00:03+00:00", "23"))
+    # 늦게 도착한 옛 측정값은 최신값을 덮지 않는다
+    on_notify(None, 1, "gop_metrics", _metrics_payload(2, "2026-10-17T15:00:02+09:00", "99"))
+
+    items = buffer.drain()
+    assert [b["enclosure_id"] for b in items] == [1, 2]
+    assert items[0] == {
+        "enclosure_id": 1, "temperature": 21.5, "humidity": 40.0, "voltage": None, "current": None,
+        "measured_at": "2026-10-17T06:00:00.500000+00:00",
+    }
+    assert items[1]["temperature"] == 23.0 and items[1]["measured_at"] == "2026-10-17T06:00:03+00:00"
+    assert buffer.drain() == []  # 변경 없으면 발행 없음
+
+
+def test_metrics_handler_should_drop_bad_payload():
+    from db_monitor.main import EnclosureMetricsBuffer, make_metrics_handler
+    buffer = EnclosureMetricsBuffer()
+    on_notify = make_metrics_handler(buffer)
+    on_notify(None, 1, "gop_metrics", "not json")
+    on_notify(None, 1, "gop_metrics", '{"cmd": "ENCLOSURE_METRICS"}')
+    assert len(buffer) == 0
+
+
+# user-020: gop_sync 병합 창 + 배치 envelope + 발행 통계
+class _RecordingNats:
+    def __init__(self):
+        self.sent = []
+
+    async def publish(self, subject, data):
+        import json
+        self.sent.append((subject, json.loads(data)))
+
+
+def _sync(cmd, action, **ids):
+    import json
+    return json.dumps({"cmd": cmd, "action": action, **ids})
+
+
+def test_coalescer_should_merge_same_resource_keeping_last_action():
+    import asyncio
+    from db_monitor.main import SyncCoalescer, get_stats, make_handler, reset_stats
+    reset_stats()
+    nc, coalescer = _RecordingNats(), SyncCoalescer()
+    on_notify = make_handler(nc, "unit001", coalescer)
+
+    async def run():
+        for rid in range(100):
+            await on_notify(None, 1, "gop_sync", _sync("SYNC_DEVICE", "CREATED", resource_id=rid))
+        await on_notify(None, 1, "gop_sync", _sync("SYNC_DEVICE", "UPDATED", resource_id=5))
+        await on_notify(None, 1, "gop_sync", _sync("SYNC_DEVICE_GROUP", "UPDATED", resource_id=5))
+        await on_notify(None, 1, "gop_sync", _sync("SYNC_DEVICE", "DELETED", resource_id=5))
+        # 식별자 필드가 다르면(camera_id) 다른 리소스
+        await on_notify(None, 1, "gop_sync", _sync("SYNC_PRESET", "UPDATED", resource_id=1, camera_id=7))
+        await on_notify(None, 1, "gop_sync", _sync("SYNC_PRESET", "UPDATED", resource_id=1, camera_id=8))
+        assert nc.sent == []  # 창이 닫히기 전엔 발행 없음
+        return await coalescer.flush(nc)
+
+    assert asyncio.run(run()) == 103
+    device = [e["body"] for s, e in nc.sent if e["cmd"] == "SYNC_DEVICE"]
+    assert len(device) == 100 and device[5] == {"action": "DELETED", "resource_id": 5}
+    assert sum(1 for _, e in nc.sent if e["cmd"] == "SYNC_DEVICE_GROUP") == 1
+    assert sum(1 for _, e in nc.sent if e["cmd"] == "SYNC_PRESET") == 2
+    stats = get_stats()
+    assert stats["received"] == 105 and stats["coalesced"] == 2 and stats["published"] == 103
+
+
+def test_coalescer_batch_should_group_per_cmd_and_chunk():
+    import asyncio
+    from db_monitor.main import SyncCoalescer, get_stats, reset_stats
+    reset_stats()
+    nc, coalescer = _RecordingNats(), SyncCoalescer()
+    for rid in range(5):
+        coalescer.offer("SYNC_DEVICE", "sensorway.unit001.all.sync.device", {"action": "UPDATED", "resource_id": rid})
+    coalescer.offer("SYNC_SERVER", "sensorway.unit001.all.sync.server", {"action": "UPDATED", "resource_id": 1})
+
+    assert asyncio.run(coalescer.flush(nc, batch=True, batch_max=2)) == 4
+    subjects = [s for s, _ in nc.sent]
+    assert subjects.count("sensorway.unit001.all.sync.device") == 3
+    first = nc.sent[0][1]
+    assert first["batch"] is True and first["cmd"] == "SYNC_DEVICE" and first["m_type"] == "PUB"
+    assert first["body"] == {"items": [{"action": "UPDATED", "resource_id": 0},
+                                       {"action": "UPDATED", "resource_id": 1}], "count": 2}
+    assert get_stats()["published_items"] == 6 and len(coalescer) == 0
+
+
+def test_system_event_should_bypass_coalescer():
+    import asyncio
+    from db_monitor.main import SyncCoalescer, make_handler, reset_stats
+    reset_stats()
+    nc, coalescer = _RecordingNats(), SyncCoalescer()
+    on_notify = make_handler(nc, "unit001", coalescer)
+    asyncio.run(on_notify(None, 1, "gop_event", '{"cmd": "SYSTEM_EVENT", "id": 1}'))
+    assert [s for s, _ in nc.sent] == ["sensorway.unit001.all.event.system"]
+    assert len(coalescer) == 0
@@ -9,10 +9,22 @@ db_monitor(pg_notify→NATS publish)의 **역방향** 미러:
 - 구버전(단일 body.target/target_location) 수신 시 방어 정규화(합의 전 호환).
 - 멱등: UNIQUE(track_id, observed_at) → ON CONFLICT DO NOTHING.
 - observed_at(UTC ISO) → aware UTC 저장(datetime-unification: track_points.observed_at=timestamptz).
+
+배치 파이프라인(user-003) — 메시지당 풀 acquire + executemany 왕복이 쓰기 상한이던 구조를 분리:
+  NATS handler ──(parse)──▶ asyncio.Queue[행] ──▶ writer: 크기(GIS_INGEST_BATCH_SIZE) or
+  데드라인(GIS_INGEST_FLUSH_MS) 트리거로 여러 메시지 행을 합쳐 1배치 ──▶ flush 태스크(최대
+  GIS_INGEST_WRITERS 동시) : COPY(copy_records_to_table) → 임시 staging → INSERT..SELECT
+  ON CONFLICT (track_id, observed_at) DO NOTHING(uq_track_points_track_observed 병합).
+  같은 문장에서 실제 삽입분만 track_sessions 요약(start/end/count/label/bbox)에 증분 UPSERT(user-006).
+  app/middleware/logging._log_consumer(100건/500ms) 와 같은 크기/데드라인 형틀.
+- 백프레셔: 큐 유계(GIS_INGEST_QUEUE_MAX 행). full 이면 handler 가 put 에서 대기 → 구독 콜백이
+  멈추고 NATS 클라 pending 버퍼가 완충(한도 초과 시 slow consumer 로 NATS 가 버림).
+- 관측: 메시지당 print 제거 → GIS_INGEST_STATS_INTERVAL 초마다 처리량 1줄.
 """
 import asyncio
 import json
 import os
+import time
 from datetime import datetime, timezone
 from zoneinfo import ZoneInfo
 
@@ -20,12 +32,56 @@ KST = ZoneInfo("Asia/Seoul")
 
 SUBJECT = "sensorway.*.gis.tracking-status"
 
-INSERT_SQL = """
-INSERT INTO track_points
-    (camera_id, track_id, label, threat_level, latitude, longitude,
-     distance_m, confidence, observed_at, tracking_state, created_at)
-VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11)
-ON CONFLICT (track_id, observed_at) DO NOTHING
+BATCH_SIZE = int(os.environ.get("GIS_INGEST_BATCH_SIZE", "1000"))
+FLUSH_MS = int(os.environ.get("GIS_INGEST_FLUSH_MS", "500"))
+QUEUE_MAX = int(os.environ.get("GIS_INGEST_QUEUE_MAX", "50000"))
+WRITERS = int(os.environ.get("GIS_INGEST_WRITERS", "2"))
+STATS_INTERVAL = int(os.environ.get("GIS_INGEST_STATS_INTERVAL", "30"))
+
+COLUMNS = (
+    "camera_id", "track_id", "label", "threat_level", "latitude", "longitude",
+    "distance_m", "confidence", "observed_at", "tracking_state", "created_at",
+)
+_COLS = ", ".join(COLUMNS)
+
+# 세션 임시 테이블 — 타입은 track_points 에서 그대로 복제(마이그 상태와 자동 정합).
+# ON COMMIT DELETE ROWS: 배치 트랜잭션 종료 시 비워짐. 풀 연결 재사용 시 IF NOT EXISTS 로 재생성 생략.
+STAGE_SQL = f"""
+CREATE TEMP TABLE IF NOT EXISTS track_points_stage ON COMMIT DELETE ROWS AS
+SELECT {_COLS} FROM track_points WITH NO DATA
+"""
+
+# 병합 + 세션 요약 증분(user-006)을 한 문장으로: 실제 삽입된 행(RETURNING)만 track_sessions 에 접어 넣는다
+# → 재전송 중복은 point_count 에 반영되지 않는다. ORDER BY 로 세션 행 잠금 순서를 고정해 동시 배치 간 교착 회피.
+MERGE_SQL = f"""
+WITH ins AS (
+    INSERT INTO track_points ({_COLS})
+    SELECT {_COLS} FROM track_points_stage
+    ON CONFLICT (track_id, observed_at) DO NOTHING
+    RETURNING track_id, camera_id, label, observed_at, latitude, longitude, session_seq
+), sess AS (
+    INSERT INTO track_sessions AS s
+        (track_id, camera_id, label, start_at, end_at, point_count,
+         min_latitude, max_latitude, min_longitude, max_longitude, session_seq, updated_at)
+    SELECT track_id, camera_id, MAX(label), MIN(observed_at), MAX(observed_at), COUNT(*),
+           MIN(latitude), MAX(latitude), MIN(longitude), MAX(longitude), MAX(session_seq), now()
+    FROM ins
+    GROUP BY track_id, camera_id
+    ORDER BY track_id, camera_id
+    ON CONFLICT (track_id, camera_id) DO UPDATE SET
+        label         = COALESCE(EXCLUDED.label, s.label),
+        start_at      = LEAST(s.start_at, EXCLUDED.start_at),
+        end_at        = GREATEST(s.end_at, EXCLUDED.end_at),
+        point_count   = s.point_count + EXCLUDED.point_count,
+        min_latitude  = LEAST(s.min_latitude, EXCLUDED.min_latitude),
+        max_latitude  = GREATEST(s.max_latitude, EXCLUDED.max_latitude),
+        min_longitude = LEAST(s.min_longitude, EXCLUDED.min_longitude),
+        max_longitude = GREATEST(s.max_longitude, EXCLUDED.max_longitude),
+        session_seq   = GREATEST(s.session_seq, EXCLUDED.session_seq),
+        updated_at    = now()
+    RETURNING 1
+)
+SELECT count(*) FROM ins
 """
 
 
@@ -111,28 +167,141 @@ def parse_tracking_status(envelope: dict) -> list[dict]:
     return rows
 
 
-async def _insert_rows(pool, rows: list[dict]) -> int:
-    if not rows:
-        return 0
-    # created_at = 인제스트 시각(aware UTC). raw asyncpg 경로라 ORM Python default 미적용 →
-    # 명시 지정(컬럼 NOT NULL, DB default 없음). datetime-unification: timestamptz 정합.
-    ingested_at = datetime.now(timezone.utc)
-    params = [
+def to_records(rows: list[dict], ingested_at: datetime) -> list[tuple]:
+    """행 dict → COPY 레코드(COLUMNS 순서).
+
+    created_at = 인제스트 시각(aware UTC). raw asyncpg 경로라 ORM Python default 미적용 →
+    명시 지정(컬럼 NOT NULL). datetime-unification: timestamptz 정합.
+    """
+    return [
         (r["camera_id"], r["track_id"], r["label"], r["threat_level"],
          r["latitude"], r["longitude"], r["distance_m"], r["confidence"],
          r["observed_at"], r["tracking_state"], ingested_at)
         for r in rows
     ]
+
+
+async def collect_batch(queue: asyncio.Queue, batch: list, batch_size: int, flush_ms: int) -> list:
+    """첫 행은 blocking get, 이후 flush_ms 창 안에서 batch_size 까지 수집(크기 or 데드라인).
+
+    호출자 리스트에 제자리 적재 — 수집 도중 취소돼도 이미 꺼낸 행이 shutdown 방출에 포함된다.
+    """
+    loop = asyncio.get_running_loop()
+    batch.append(await queue.get())
+    deadline = loop.time() + flush_ms / 1000
+    while len(batch) < batch_size:
+        try:
+            batch.append(queue.get_nowait())
+            continue
+        except asyncio.QueueEmpty:
+            pass
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            break
+        try:
+            batch.append(await asyncio.wait_for(queue.get(), timeout=remaining))
+        except asyncio.TimeoutError:
+            break
+    return batch
+
+
+class IngestStats:
+    """주기 처리량 카운터 — 메시지당 print 대체."""
+
+    def __init__(self):
+        self.reset()
+        self.started = time.monotonic()
+
+    def reset(self):
+        self.messages = 0
+        self.rows = 0
+        self.inserted = 0
+        self.batches = 0
+        self.failed_rows = 0
+        self.bad_messages = 0
+        self.blocked = 0  # 큐 full 로 handler 가 대기한 횟수(백프레셔 발동)
+        self.window_started = time.monotonic()
+
+    def line(self, queue_depth: int) -> str:
+        elapsed = max(time.monotonic() - self.window_started, 1e-6)
+        avg = self.rows / self.batches if self.batches else 0
+        return (
+            f"[gis-ingest] {elapsed:.0f}s: msgs={self.messages} rows={self.rows} "
+            f"inserted={self.inserted} dup={self.rows - self.inserted - self.failed_rows} "
+            f"batches={self.batches} avg_batch={avg:.0f} rate={self.inserted / elapsed:.1f}/s "
+            f"queue={queue_depth} blocked={self.blocked} failed={self.failed_rows} bad={self.bad_messages}"
+        )
+
+
+async def merge_batch(pool, records: list[tuple]) -> int:
+    """COPY → staging → ON CONFLICT 병합 + 세션 요약 증분. 배치당 왕복 고정(행 수 무관). 삽입 행 수 반환."""
     async with pool.acquire() as conn:
-        await conn.executemany(INSERT_SQL, params)
-    return len(rows)
+        async with conn.transaction():
+            await conn.execute(STAGE_SQL)
+            await conn.copy_records_to_table("track_points_stage", records=records, columns=COLUMNS)
+            inserted = await conn.fetchval(MERGE_SQL)
+    return int(inserted or 0)
+
+
+async def _flush(pool, rows: list[dict], stats: IngestStats, sem: asyncio.Semaphore) -> None:
+    """배치 1건 병합 — 일시 장애는 짧게 재시도, 최종 실패는 카운트 후 폐기(워커는 계속)."""
+    try:
+        records = to_records(rows, datetime.now(timezone.utc))
+        for attempt in range(3):
+            try:
+                stats.inserted += await merge_batch(pool, records)
+                stats.rows += len(rows)
+                stats.batches += 1
+                return
+            except Exception as e:
+                if attempt == 2:
+                    stats.rows += len(rows)
+                    stats.failed_rows += len(rows)
+                    print(f"[gis-ingest] ERROR(drop batch {len(rows)} rows): {e}")
+                    return
+                await asyncio.sleep(0.5 * (attempt + 1))
+    finally:
+        sem.release()
+
+
+async def writer(pool, queue: asyncio.Queue, stats: IngestStats) -> None:
+    """수집과 병합을 파이프라인화 — 이전 배치 COPY 중에도 다음 배치를 모은다(동시 flush ≤ WRITERS)."""
+    sem = asyncio.Semaphore(WRITERS)
+    inflight: set[asyncio.Task] = set()
+    batch: list[dict] = []
+    try:
+        while True:
+            await collect_batch(queue, batch, BATCH_SIZE, FLUSH_MS)
+            await sem.acquire()
+            task = asyncio.create_task(_flush(pool, batch, stats, sem))
+            batch = []
+            inflight.add(task)
+            task.add_done_callback(inflight.discard)
+    except asyncio.CancelledError:
+        # graceful shutdown: 진행 중 flush 완료 + 큐 잔여 방출
+        while not queue.empty():
+            batch.append(queue.get_nowait())
+        if inflight:
+            await asyncio.gather(*inflight, return_exceptions=True)
+        if batch:
+            await sem.acquire()
+            await _flush(pool, batch, stats, sem)
+        raise
+
+
+async def _report(queue: asyncio.Queue, stats: IngestStats) -> None:
+    while True:
+        await asyncio.sleep(STATS_INTERVAL)
+        if stats.messages or queue.qsize():
+            print(stats.line(queue.qsize()))
+        stats.reset()
 
 
 async def _connect_db(asyncpg, db_url: str):
     """DB 기동 대기(컨테이너 startup 레이스 대비) 후 풀 생성."""
     for attempt in range(30):
         try:
-            return await asyncpg.create_pool(db_url, min_size=1, max_size=4)
+            return await asyncpg.create_pool(db_url, min_size=1, max_size=max(4, WRITERS + 1))
         except Exception as e:
             print(f"[gis-ingest] DB 연결 대기({attempt + 1}/30): {e}")
             await asyncio.sleep(2)
@@ -150,25 +319,42 @@ async def run(db_url: str, nats_url: str, unit_id: str) -> None:
         max_reconnect_attempts=-1,  # 무한 재연결
     )
 
+    queue: asyncio.Queue = asyncio.Queue(maxsize=QUEUE_MAX)
+    stats = IngestStats()
+    writer_task = asyncio.create_task(writer(pool, queue, stats))
+    report_task = asyncio.create_task(_report(queue, stats))
+
     async def handler(msg):
         try:
             envelope = json.loads(msg.data.decode())
             rows = parse_tracking_status(envelope)
-            n = await _insert_rows(pool, rows)
-            if n:
-                cam = (envelope.get("body") or {}).get("camera_id")
-                print(f"[gis-ingest] +{n} track_points (cam={cam})")
-        except Exception as e:
-            print(f"[gis-ingest] ERROR(skip msg): {e}")
+        except Exception:
+            stats.bad_messages += 1
+            return
+        stats.messages += 1
+        for row in rows:
+            if queue.full():
+                stats.blocked += 1
+            await queue.put(row)  # 백프레셔: full 이면 writer 가 비울 때까지 대기
 
     await nc.subscribe(SUBJECT, cb=handler)
-    print(f"[gis-ingest] Subscribed {SUBJECT} → postgres (unit_id={unit_id}, nats={nats_url})")
+    print(
+        f"[gis-ingest] Subscribed {SUBJECT} → postgres (unit_id={unit_id}, nats={nats_url}, "
+        f"batch={BATCH_SIZE}/{FLUSH_MS}ms, queue_max={QUEUE_MAX}, writers={WRITERS})"
+    )
 
     try:
         while True:
             await asyncio.sleep(1)
     finally:
-        await nc.close()
+        await nc.drain()  # 구독 해제 + 수신분 handler 처리 완료 후 종료
+        report_task.cancel()
+        writer_task.cancel()
+        try:
+            await writer_task
+        except asyncio.CancelledError:
+            pass
+        print(stats.line(queue.qsize()))
         await pool.close()
 
 
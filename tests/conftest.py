@@ -83,6 +83,51 @@ def _reset_settings_cache():
     settings_service.invalidate_cache()
 
 
+@pytest.fixture(scope="function", autouse=True)
+def _reset_authz_cache():
+    """authz_cache(user-001)는 login_id 키 모듈 전역 — 함수 스코프 DB 간 동일 login_id 재사용 시 오염 방지."""
+    from app.security import authz_cache
+    authz_cache.clear()
+    yield
+    authz_cache.clear()
+
+
+@pytest.fixture(scope="function", autouse=True)
+def _reset_enclosure_latest_cache():
+    """enclosure_latest_cache(user-016)는 enclosure_id 키 모듈 전역 — 함수 스코프 DB 간 오염 방지."""
+    from app.services import enclosure_latest_cache
+    enclosure_latest_cache.invalidate()
+    yield
+    enclosure_latest_cache.invalidate()
+
+
+@pytest.fixture(scope="function", autouse=True)
+def _reset_suppression_index():
+    """suppression_index(user-021)는 모듈 전역 — 함수 스코프 DB 간 억제 창 오염 방지."""
+    from app.services import suppression_index
+    suppression_index.invalidate()
+    yield
+    suppression_index.invalidate()
+
+
+@pytest.fixture(scope="function", autouse=True)
+def _reset_event_stats_cache():
+    """event_stats_cache(user-024)는 (구간, 단위) 키 모듈 전역 — 함수 스코프 DB 간 같은 구간 재사용 시 오염 방지."""
+    from app.services import event_stats_cache
+    event_stats_cache.invalidate()
+    yield
+    event_stats_cache.invalidate()
+
+
+@pytest.fixture(scope="function", autouse=True)
+def _reset_response_cache():
+    """response_cache(user-025)는 (경로, 쿼리) 키 모듈 전역 — 함수 스코프 DB 간 같은 경로 응답 재사용 방지."""
+    from app.services import response_cache
+    response_cache.invalidate()
+    yield
+    response_cache.invalidate()
+
+
 @pytest.fixture(scope="function")
 def test_db():
     """
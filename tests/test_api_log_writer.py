@@ -0,0 +1,226 @@
+"""
+api_logs 배치 writer — overflow spill / 재생 / 저장 실패 spill (user-012)
+
+DB 저장(_write_batch)은 수집용 대체 함수로 바꿔 spill 파일 동작만 검증한다(COPY 경로는 PostgreSQL 전용).
+"""
+import asyncio
+import json
+import os
+from datetime import datetime
+
+import pytest
+
+from app.config import settings
+from app.middleware import logging as api_logging
+
+
+def _payload(i: int) -> dict:
+    return {
+        "resource": f"sensors/{i}", "method": "GET", "client_uuid": None, "request_id": f"r{i}",
+        "description": "센서 조회", "status_code": 200, "body": None, "param": None,
+        "error_message": None, "timestamp": datetime(2026, 10, 1, 12, 0, i),
+    }
+
+
+@pytest.fixture
+def spill(tmp_path, monkeypatch):
+    path = tmp_path / "spill" / "api_logs.ndjson"
+    monkeypatch.setattr(settings, "API_LOG_SPILL_PATH", str(path))
+    monkeypatch.setattr(api_logging, "_log_queue", asyncio.Queue(maxsize=2))
+    monkeypatch.setattr(api_logging, "_spill_retry_at", 0.0)
+    monkeypatch.setattr(api_logging, "_spill_pending", False)
+    api_logging._close_spill()
+    api_logging.reset_stats()
+    written: list[dict] = []
+
+    async def fake_write(batch):
+        written.extend(batch)
+
+    monkeypatch.setattr(api_logging, "_write_batch", fake_write)
+    yield path, written
+    api_logging._join_spill_writer()
+    api_logging._close_spill()
+
+
+def test_queue_overflow_should_spill_instead_of_drop(spill):
+    path, _ = spill
+
+    for i in range(5):
+        api_logging._put_log(_payload(i))
+    api_logging._join_spill_writer()  # 파일 쓰기는 writer 스레드 몫
+
+    stats = api_logging.get_stats()
+    assert stats["enqueued"] == 2 and stats["overflowed"] == 3
+    assert stats["spilled"] == 3 and stats["dropped"] == 0
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["request_id"] for line in lines] == ["r2", "r3", "r4"]
+    assert stats["spill_bytes"] == os.path.getsize(path)
+
+
+@pytest.mark.asyncio
+async def test_replay_should_restore_rows_and_remove_file(spill):
+    path, written = spill
+    api_logging._spill([_payload(i) for i in range(3)])
+
+    await api_logging._replay_spill()
+
+    assert [w["request_id"] for w in written] == ["r0", "r1", "r2"]
+    assert written[0]["timestamp"] == datetime(2026, 10, 1, 12, 0, 0)
+    assert api_logging.get_stats()["replayed"] == 3
+    assert not path.exists() and api_logging._spill_size() == 0
+    assert api_logging._spill_pending is False
+
+
+@pytest.mark.asyncio
+async def test_replay_failure_should_keep_rows_for_retry(spill, monkeypatch):
+    path, _ = spill
+    api_logging._spill([_payload(i) for i in range(3)])
+
+    async def failing_write(batch):
+        raise RuntimeError("db down")
+
+    monkeypatch.setattr(api_logging, "_write_batch", failing_write)
+    await api_logging._replay_spill()
+
+    replay = path.with_name(path.name + ".replay")
+    assert len(replay.read_text(encoding="utf-8").splitlines()) == 3
+    assert api_logging._spill_retry_at > 0
+    # 재생 중 새로 넘친 행은 새 spill 파일로
+    api_logging._spill([_payload(9)])
+    assert len(path.read_text(encoding="utf-8").splitlines()) == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_flush_should_spill_batch(spill, monkeypatch):
+    path, _ = spill
+
+    async def failing_write(batch):
+        raise RuntimeError("db down")
+
+    monkeypatch.setattr(api_logging, "_write_batch", failing_write)
+    await api_logging._flush_batch([_payload(0), _payload(1)])
+
+    stats = api_logging.get_stats()
+    assert stats["failed_batches"] == 1 and stats["spilled"] == 2 and stats["written"] == 0
+    assert len(path.read_text(encoding="utf-8").splitlines()) == 2
+
+
+def test_spill_cap_should_count_drops(spill, monkeypatch):
+    monkeypatch.setattr(settings, "API_LOG_SPILL_MAX_MB", 0)
+
+    api_logging._spill([_payload(0)])
+
+    assert api_logging.get_stats()["dropped"] == 1
+    assert api_logging.get_stats()["spilled"] == 0
+
+
+def test_overflow_spill_should_write_off_the_event_loop_thread(spill, monkeypatch):
+    import threading
+
+    writers: list[str] = []
+    real_spill = api_logging._spill
+
+    def _recording_spill(batch):
+        writers.append(threading.current_thread().name)
+        real_spill(batch)
+
+    monkeypatch.setattr(api_logging, "_spill", _recording_spill)
+    for i in range(4):
+        api_logging._put_log(_payload(i))
+    api_logging._join_spill_writer()
+
+    assert writers and threading.current_thread().name not in writers
+    assert api_logging.get_stats()["spilled"] == 2
+
+
+def test_consumer_should_restart_on_a_new_event_loop(spill):
+    """루프가 바뀌어도(재기동·TestClient 마다 새 루프) consumer 가 큐를 다시 받아 저장해야 한다."""
+    _, written = spill
+
+    async def _cycle(i: int) -> None:
+        await api_logging.start_log_consumer()
+        await asyncio.sleep(0.01)  # consumer 가 빈 큐에서 대기(현재 루프에 묶임)
+        api_logging._put_log(_payload(i))
+        await api_logging.stop_log_consumer()  # drain → flush
+
+    asyncio.run(_cycle(0))
+    asyncio.run(_cycle(1))
+
+    assert [w["request_id"] for w in written] == ["r0", "r1"]
+
+
+class _FakeAsyncpg:
+    """asyncpg.Connection 대체 — transaction() 중첩(savepoint)·롤백 의미만 흉내 낸다."""
+
+    def __init__(self, fail_table: str):
+        self.fail_table = fail_table
+        self.committed: list[tuple] = []
+        self._stack: list[list[tuple]] = []
+
+    def transaction(self):
+        conn = self
+
+        class _Tx:
+            async def __aenter__(self):
+                conn._stack.append([])
+
+            async def __aexit__(self, exc_type, exc, tb):
+                rows = conn._stack.pop()
+                if exc_type is None:
+                    (conn._stack[-1] if conn._stack else conn.committed).extend(rows)
+                return False
+
+        return _Tx()
+
+    async def copy_records_to_table(self, table, *, records, columns):
+        if table == self.fail_table:
+            raise RuntimeError("copy failed")
+        (self._stack[-1] if self._stack else self.committed).extend(records)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("insert_ok", [True, False])
+async def test_copy_failure_on_later_day_should_land_each_row_once(async_db, tmp_path, monkeypatch, insert_ok):
+    """2일차 COPY 실패 → 1일차 COPY 도 롤백. INSERT 대체(또는 그마저 실패 시 spill)가 배치를 1회만 저장."""
+    from contextlib import asynccontextmanager
+    from types import SimpleNamespace
+
+    from sqlalchemy import select
+    from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+    from app.models.log import ApiLog
+
+    path = tmp_path / "api_logs.ndjson"
+    monkeypatch.setattr(settings, "API_LOG_SPILL_PATH", str(path))
+    api_logging._close_spill()
+    api_logging.reset_stats()
+
+    driver = _FakeAsyncpg(fail_table="api_logs_2026_10_02")
+
+    class _Conn:
+        async def get_raw_connection(self):
+            return SimpleNamespace(driver_connection=driver)
+
+    @asynccontextmanager
+    async def _connect():
+        yield _Conn()
+
+    # INSERT 실패 = 테이블 없는 빈 DB
+    bind = async_db.bind if insert_ok else create_async_engine("sqlite+aiosqlite:///:memory:")
+    monkeypatch.setattr(api_logging, "async_engine", SimpleNamespace(connect=_connect))
+    monkeypatch.setattr(api_logging, "_copy_supported", lambda: True)
+    monkeypatch.setattr(api_logging, "AsyncSessionLocal", lambda: AsyncSession(bind=bind))
+    monkeypatch.setattr(api_logging, "_copy_targets", {})
+
+    batch = [_payload(0), _payload(1), {**_payload(2), "timestamp": datetime(2026, 10, 2, 9, 0, 0)}]
+    try:
+        await api_logging._flush_batch(batch)
+    finally:
+        api_logging._close_spill()
+
+    assert driver.committed == []  # 1일차 COPY 까지 롤백
+    inserted = (await async_db.execute(select(ApiLog.request_id))).scalars().all()
+    spilled = [json.loads(line)["request_id"] for line in path.read_text(encoding="utf-8").splitlines()] \
+        if path.exists() else []
+    assert sorted(inserted + spilled) == ["r0", "r1", "r2"]
+    assert (len(inserted), len(spilled)) == ((3, 0) if insert_ok else (0, 3))
@@ -0,0 +1,59 @@
+"""
+api_logs 일별 파티션 / 파티션 DROP 보존 — 순수 DDL·경계 해석 단위 테스트 (DB 불요)
+user-013: app/services/api_logs_partition_service.py, app/middleware/logging.py(_copy_candidates)
+"""
+from datetime import date, datetime
+
+from app.middleware.logging import _copy_candidates
+from app.services.api_logs_partition_service import (
+    PartitionBound, _covers, _day_partition_ddl, parse_partition_bound,
+)
+
+
+class TestDayPartitionDdl:
+
+    def test_should_bound_partition_at_utc_midnight(self):
+        name, ddl = _day_partition_ddl(date(2026, 10, 17))
+        assert name == "api_logs_2026_10_17"
+        assert ddl == (
+            "CREATE TABLE IF NOT EXISTS api_logs_2026_10_17 PARTITION OF api_logs "
+            "FOR VALUES FROM ('2026-10-17') TO ('2026-10-18')"
+        )
+
+    def test_should_roll_over_year(self):
+        _, ddl = _day_partition_ddl(date(2026, 12, 31))
+        assert "TO ('2027-01-01')" in ddl
+
+
+class TestParsePartitionBound:
+
+    def test_should_parse_monthly_bound(self):
+        b = parse_partition_bound(
+            "api_logs_2026_10", "FOR VALUES FROM ('2026-10-01 00:00:00') TO ('2026-11-01 00:00:00')")
+        assert b == PartitionBound("api_logs_2026_10", datetime(2026, 10, 1), datetime(2026, 11, 1), False)
+
+    def test_should_map_minvalue_to_none(self):
+        b = parse_partition_bound(
+            "api_logs_before_partition", "FOR VALUES FROM (MINVALUE) TO ('2026-07-01 00:00:00')")
+        assert b.lower is None and b.upper == datetime(2026, 7, 1)
+
+    def test_should_detect_default_and_ignore_unknown(self):
+        assert parse_partition_bound("api_logs_default", "DEFAULT").is_default is True
+        assert parse_partition_bound("x", "FOR VALUES IN (1)") is None
+
+
+class TestCovers:
+
+    def test_monthly_partition_should_cover_its_days_only(self):
+        b = PartitionBound("api_logs_2026_10", datetime(2026, 10, 1), datetime(2026, 11, 1), False)
+        assert _covers(b, date(2026, 10, 1)) and _covers(b, date(2026, 10, 31))
+        assert not _covers(b, date(2026, 11, 1))
+
+    def test_minvalue_partition_should_cover_history_and_default_nothing(self):
+        before = PartitionBound("api_logs_before_partition", None, datetime(2026, 7, 1), False)
+        assert _covers(before, date(2020, 1, 1)) and not _covers(before, date(2026, 7, 1))
+        assert not _covers(PartitionBound("api_logs_default", None, None, True), date(2026, 10, 17))
+
+
+def test_copy_should_try_daily_then_monthly_then_parent():
+    assert _copy_candidates(date(2026, 10, 17)) == ["api_logs_2026_10_17", "api_logs_2026_10", "api_logs"]
@@ -0,0 +1,99 @@
+"""
+Test: 순수 ASGI 미들웨어 스택 (user-011)
+
+- APILoggingMiddleware: 요청 body 관찰 캡처(상한) + 마스킹, 오류 응답 message 추출, 제외 경로
+- UTF8CharsetMiddleware: JSON content-type charset 보강
+- LatencyHistogramMiddleware: 요청당 1회 관측
+"""
+import asyncio
+
+import pytest
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.testclient import TestClient
+
+from app.middleware import latency
+from app.middleware import logging as api_logging
+from app.middleware.charset import UTF8CharsetMiddleware
+from app.middleware.latency import LatencyHistogramMiddleware
+from app.middleware.logging import APILoggingMiddleware, _REDACTED
+from app.middleware.request_id import RequestIDMiddleware
+
+
+def _drain() -> list[dict]:
+    items = []
+    while True:
+        try:
+            items.append(api_logging._log_queue.get_nowait())
+        except asyncio.QueueEmpty:
+            return items
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+
+    @app.post("/api/sensors")
+    async def create(request: Request):
+        raw = await request.body()
+        return {"size": len(raw), "request_id": request.state.request_id}
+
+    @app.get("/api/sensors/{sid}")
+    async def detail(sid: int):
+        raise HTTPException(status_code=404, detail="센서 없음")
+
+    @app.get("/health")
+    async def health():
+        return {"ok": True}
+
+    app.add_middleware(APILoggingMiddleware)
+    app.add_middleware(RequestIDMiddleware)
+    app.add_middleware(UTF8CharsetMiddleware)
+    app.add_middleware(LatencyHistogramMiddleware)
+    _drain()
+    latency.reset_stats()
+    yield TestClient(app)
+    _drain()
+
+
+def test_should_log_redacted_body_and_pass_full_body_to_endpoint(client):
+    resp = client.post("/api/sensors?x=1", json={"name": "s1", "password": "pw"},
+                       headers={"X-Request-ID": "rid-1", "X-Client-UUID": "c-1"})
+
+    assert resp.status_code == 200
+    assert resp.json()["request_id"] == "rid-1"
+    assert resp.headers["content-type"] == "application/json; charset=utf-8"
+    [log] = _drain()
+    assert log["method"] == "POST" and log["resource"] == "sensors" and log["param"] == "x=1"
+    assert log["request_id"] == "rid-1" and log["client_uuid"] == "c-1"
+    assert "pw" not in log["body"] and _REDACTED in log["body"]
+
+
+def test_should_bound_body_capture_without_truncating_request(client):
+    payload = b'{"blob": "' + b"a" * (api_logging._BODY_CAPTURE_BYTES + 10) + b'"}'
+
+    resp = client.post("/api/sensors", content=payload, headers={"content-type": "application/json"})
+
+    assert resp.json()["size"] == len(payload)
+    [log] = _drain()
+    assert "aaaa" not in log["body"]
+    assert str(api_logging._BODY_CAPTURE_BYTES) in log["body"]
+
+
+def test_should_extract_error_message_and_skip_excluded_paths(client):
+    assert client.get("/api/sensors/7").status_code == 404
+    assert client.get("/health").status_code == 200
+
+    [log] = _drain()
+    assert log["status_code"] == 404
+    assert log["error_message"] == "센서 없음"
+    assert log["description"] == "센서 조회 실패"
+
+
+def test_latency_histogram_should_observe_each_request(client):
+    client.get("/health")
+    client.get("/api/sensors/1")
+
+    stats = latency.get_stats()
+    assert stats["count"] == 2
+    assert sum(stats["buckets"].values()) == 2
+    assert stats["p50_ms"] is not None and stats["max_ms"] > 0
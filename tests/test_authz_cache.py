@@ -0,0 +1,184 @@
+"""
+인가 결정 캐시 테스트 — user-001 (enforce_matrix 요청당 DB 왕복 제거)
+
+- 2번째 요청부터 DB 무접촉(hit) — db 인자에 None 을 넘겨도 통과해야 한다.
+- 사용자/그룹/grant 쓰기 커밋 → 무효화(miss) 후 새 권한 반영.
+- 캐시 만료 = 다음 grant 경계(valid_from / valid_until).
+- 블랙리스트 등재 → 토큰 항목 제거 → SESSION_REVOKED.
+"""
+import time
+from datetime import timedelta
+
+import pytest
+from fastapi import HTTPException
+from starlette.requests import Request
+
+from app.config import settings
+from app.security import authz_cache
+from app.utils.datetime import utc_now
+
+
+def _req(method, path, token=None):
+    headers = []
+    if token:
+        headers.append((b"authorization", b"Bearer " + token.encode()))
+    return Request({
+        "type": "http",
+        "method": method,
+        "path": path,
+        "headers": headers,
+        "query_string": b"",
+    })
+
+
+def _token(login_id):
+    from app.utils.auth import create_access_token
+    return create_access_token(data={"sub": login_id})
+
+
+async def _make_user(db, login_id, modules=None, role="USER"):
+    from app.models.user import AccountUser, UserGroup
+
+    group = UserGroup(name=f"grp_{login_id}", permissions={"modules": modules or {}})
+    db.add(group)
+    await db.commit()
+    user = AccountUser(login_id=login_id, password_hash="x", name="u", role=role,
+                       group_id=group.id, is_active=True)
+    db.add(user)
+    await db.commit()
+    return user, group
+
+
+async def _grant(db, user, modules, valid_from, valid_until=None):
+    from app.models.user import UserGroup, UserGroupGrant
+
+    gg = UserGroup(name=f"grant_{user.login_id}_{valid_from.timestamp()}", permissions={"modules": modules})
+    db.add(gg)
+    await db.commit()
+    grant = UserGroupGrant(user_id=user.id, group_id=gg.id, valid_from=valid_from, valid_until=valid_until)
+    db.add(grant)
+    await db.commit()
+    return grant
+
+
+@pytest.fixture
+def token_mode(monkeypatch):
+    monkeypatch.setattr(settings, "AUTH_MODE", "token")
+
+
+@pytest.mark.asyncio
+async def test_should_serve_second_request_without_db(async_db, token_mode):
+    from app.security.matrix_enforcer import enforce_matrix
+
+    await _make_user(async_db, "cache_hit", {"cameras": {"edit": True}})
+    token = _token("cache_hit")
+    await enforce_matrix(_req("POST", "/api/devices/cameras", token), async_db)
+    # hit 경로는 세션을 건드리지 않는다 — None 을 넘겨도 통과
+    await enforce_matrix(_req("POST", "/api/devices/cameras", token), None)
+    stats = authz_cache.get_stats()
+    assert stats["hits"] >= 1 and stats["stores"] == 1
+
+
+@pytest.mark.asyncio
+async def test_should_deny_from_cache_when_permission_missing(async_db, token_mode):
+    from app.security.matrix_enforcer import enforce_matrix
+
+    await _make_user(async_db, "cache_deny", {"cameras": {"view": True}})
+    token = _token("cache_deny")
+    for db in (async_db, None):
+        with pytest.raises(HTTPException) as ei:
+            await enforce_matrix(_req("POST", "/api/devices/cameras", token), db)
+        assert ei.value.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_should_invalidate_when_grant_committed(async_db, token_mode):
+    from app.security.matrix_enforcer import enforce_matrix
+
+    user, _ = await _make_user(async_db, "cache_grant")
+    token = _token("cache_grant")
+    with pytest.raises(HTTPException):
+        await enforce_matrix(_req("POST", "/api/devices/cameras", token), async_db)
+
+    await _grant(async_db, user, {"cameras": {"edit": True}}, utc_now() - timedelta(hours=1))
+    await enforce_matrix(_req("POST", "/api/devices/cameras", token), async_db)
+
+
+@pytest.mark.asyncio
+async def test_should_invalidate_when_group_matrix_changes(async_db, token_mode):
+    from app.security.matrix_enforcer import enforce_matrix
+
+    _, group = await _make_user(async_db, "cache_group", {"cameras": {"edit": True}})
+    token = _token("cache_group")
+    await enforce_matrix(_req("POST", "/api/devices/cameras", token), async_db)
+
+    group.permissions = {"modules": {}}
+    await async_db.commit()
+    with pytest.raises(HTTPException) as ei:
+        await enforce_matrix(_req("POST", "/api/devices/cameras", token), async_db)
+    assert ei.value.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_should_not_invalidate_when_rolled_back(async_db, token_mode):
+    from app.security.matrix_enforcer import enforce_matrix
+
+    user, _ = await _make_user(async_db, "cache_rb", {"cameras": {"edit": True}})
+    token = _token("cache_rb")
+    await enforce_matrix(_req("POST", "/api/devices/cameras", token), async_db)
+    before = authz_cache.get_stats()["invalidations"]
+
+    user.is_locked = True
+    await async_db.flush()
+    await async_db.rollback()
+    assert authz_cache.get_stats()["invalidations"] == before
+
+
+@pytest.mark.asyncio
+async def test_should_expire_at_next_grant_boundary(async_db, token_mode):
+    from app.routers.auth import effective_allow_set_async
+
+    user, _ = await _make_user(async_db, "cache_boundary")
+    now = utc_now()
+    await _grant(async_db, user, {"cameras": {"edit": True}}, now - timedelta(hours=1), now + timedelta(hours=3))
+    await _grant(async_db, user, {"events": {"view": True}}, now + timedelta(hours=1))
+
+    allows, boundary = await effective_allow_set_async(async_db, user, now)
+    assert ("cameras", "edit") in allows
+    assert ("events", "view") not in allows  # 미래 grant 는 아직 미반영
+    assert abs(authz_cache._epoch(boundary) - (now + timedelta(hours=1)).timestamp()) < 1
+
+
+def test_should_miss_after_boundary_passes():
+    decision = authz_cache.AuthzDecision(user_id=1, login_id="b", role="USER", allows=frozenset())
+    seq = authz_cache.snapshot()
+    authz_cache.store("tok", jti="j", token_exp=None, decision=decision,
+                      boundary=utc_now() - timedelta(seconds=1), seq=seq)
+    assert authz_cache.lookup("tok") is None
+
+
+def test_should_skip_store_when_write_interleaved():
+    decision = authz_cache.AuthzDecision(user_id=1, login_id="s", role="USER", allows=frozenset())
+    seq = authz_cache.snapshot()
+    authz_cache.invalidate_user(1)  # 조회~적재 사이 쓰기 커밋
+    assert authz_cache.store("tok", jti=None, token_exp=time.time() + 60, decision=decision,
+                             boundary=None, seq=seq) is False
+    assert authz_cache.lookup("tok") is None
+
+
+@pytest.mark.asyncio
+async def test_should_revoke_cached_token_when_blacklisted(async_db, token_mode):
+    from jose import jwt
+    from app.security.matrix_enforcer import enforce_matrix
+    from app.services.token_blacklist_service import add_to_blacklist_async
+
+    user, _ = await _make_user(async_db, "cache_bl", {"cameras": {"edit": True}})
+    token = _token("cache_bl")
+    await enforce_matrix(_req("POST", "/api/devices/cameras", token), async_db)
+
+    jti = jwt.get_unverified_claims(token)["jti"]
+    await add_to_blacklist_async(async_db, jti=jti, expires_at=utc_now() + timedelta(hours=1),
+                                 reason="FORCED", user_id=user.id)
+    with pytest.raises(HTTPException) as ei:
+        await enforce_matrix(_req("POST", "/api/devices/cameras", token), async_db)
+    assert ei.value.status_code == 401
@@ -0,0 +1,107 @@
+"""
+ConfigChangeLog 큐 배치 writer (user-023)
+
+app/services/config_log_writer: 행 값은 호출 시점에 확정, 저장은 배치(호출 세션과 같은 DB),
+shutdown drain 으로 유실 없음. 미커밋 변경이 남은 세션·writer 미기동은 종전 인라인 저장.
+"""
+import pytest
+from sqlalchemy import func, select, update
+
+import app.models  # noqa: F401 — 모델 등록(Base.metadata) 보장
+from app.config import settings
+from app.models.config_change_log import ConfigChangeLog
+from app.models.event_suppression import EventSuppressionSchedule
+from app.services import config_log_writer
+from app.services.config_log_service import log_config_change_async
+from app.utils.datetime import utc_now
+from app.utils.enums import (
+    EnumConfigActionType,
+    EnumConfigResourceType,
+    EnumSuppressionEventScope,
+    EnumSuppressionTargetType,
+)
+
+
+async def _count(db) -> int:
+    return (await db.execute(select(func.count()).select_from(ConfigChangeLog))).scalar()
+
+
+async def _log(db, resource_id):
+    return await log_config_change_async(
+        db=db,
+        resource_type=EnumConfigResourceType.DETECTION_EVENT,
+        resource_id=resource_id,
+        action=EnumConfigActionType.CREATED,
+        after_state={"id": resource_id},
+        description="DetectionEvent 생성",
+    )
+
+
+@pytest.mark.asyncio
+async def test_writer_should_batch_and_drain_on_shutdown(async_db, monkeypatch):
+    monkeypatch.setattr(settings, "CONFIG_LOG_ASYNC_WRITER", True)
+    config_log_writer.reset_stats()
+    await config_log_writer.start_config_log_writer()
+    try:
+        before = utc_now()
+        logs = [await _log(async_db, i) for i in range(1, 4)]
+        assert all(log.id is None for log in logs)  # 큐 적재 — 요청 경로에서 미저장
+        assert all(log.created_at >= before for log in logs)  # 시각은 호출 시점 확정
+    finally:
+        await config_log_writer.stop_config_log_writer()
+
+    assert await _count(async_db) == 3
+    stats = config_log_writer.get_stats()
+    assert stats["enqueued"] == 3 and stats["written"] == 3 and stats["failed"] == 0
+    assert stats["running"] is False
+
+
+@pytest.mark.asyncio
+async def test_pending_session_changes_should_fall_back_to_inline(async_db, monkeypatch):
+    monkeypatch.setattr(settings, "CONFIG_LOG_ASYNC_WRITER", True)
+    await config_log_writer.start_config_log_writer()
+    try:
+        now = utc_now()
+        async_db.add(EventSuppressionSchedule(
+            name="t", target_type=EnumSuppressionTargetType.ALL, event_scope=EnumSuppressionEventScope.ALL,
+            window_start=now, window_end=now,
+        ))
+        log = await _log(async_db, 1)  # 종전 commit 에 기대는 호출 — 인라인 저장
+        assert log.id is not None
+        assert (await async_db.execute(select(func.count()).select_from(EventSuppressionSchedule))).scalar() == 1
+    finally:
+        await config_log_writer.stop_config_log_writer()
+    assert await _count(async_db) == 1
+
+
+@pytest.mark.asyncio
+async def test_writer_not_running_should_write_inline(async_db, monkeypatch):
+    monkeypatch.setattr(settings, "CONFIG_LOG_ASYNC_WRITER", True)
+    log = await _log(async_db, 1)
+    assert log.id is not None
+    assert await _count(async_db) == 1
+
+
+@pytest.mark.asyncio
+async def test_flushed_or_executed_uncommitted_writes_should_fall_back_to_inline(async_db, monkeypatch):
+    monkeypatch.setattr(settings, "CONFIG_LOG_ASYNC_WRITER", True)
+    now = utc_now()
+    sched = EventSuppressionSchedule(
+        name="t", target_type=EnumSuppressionTargetType.ALL, event_scope=EnumSuppressionEventScope.ALL,
+        window_start=now, window_end=now,
+    )
+    async_db.add(sched)
+    await async_db.commit()
+    await config_log_writer.start_config_log_writer()
+    try:
+        sched.name = "flushed"
+        await async_db.flush()  # 미커밋이지만 db.dirty 는 비어 있음
+        assert (await _log(async_db, 1)).id is not None
+
+        await async_db.execute(update(EventSuppressionSchedule).values(name="executed"))
+        assert (await _log(async_db, 2)).id is not None
+
+        assert (await _log(async_db, 3)).id is None  # 커밋 뒤 — 큐 적재
+    finally:
+        await config_log_writer.stop_config_log_writer()
+    assert await _count(async_db) == 3
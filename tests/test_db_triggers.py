@@ -152,3 +152,30 @@ class TestDeviceGroupMappingsStatementLevelTrigger:
         from app.db_triggers import GET_TRIGGER_SQLS
         joined = "\n".join(GET_TRIGGER_SQLS)
         assert "'SYNC_DEVICE_GROUP'" in joined
+
+
+# =============================================================================
+# user-019 — enclosure_metrics INSERT → gop_metrics NOTIFY (db_monitor 디바운스 발행)
+# =============================================================================
+
+class TestEnclosureMetricsNotifyTrigger:
+    """enclosure_metrics 문장 단위 INSERT 트리거가 함체별 최신 1행만 gop_metrics 로 NOTIFY 하는지 검증."""
+
+    def test_should_notify_latest_row_per_enclosure(self):
+        from app.db_triggers import GET_TRIGGER_SQLS
+        joined = "\n".join(GET_TRIGGER_SQLS)
+        assert "pg_notify('gop_metrics'" in joined
+        assert "'ENCLOSURE_METRICS'" in joined
+        assert "SELECT DISTINCT ON (enclosure_id)" in joined
+
+    def test_should_be_statement_level_insert_trigger(self):
+        from app.db_triggers import GET_TRIGGER_SQLS
+        sql = next(s for s in GET_TRIGGER_SQLS if "trg_notify_enclosure_metrics" in s)
+        assert "DROP TRIGGER IF EXISTS trg_notify_enclosure_metrics ON enclosure_metrics" in sql
+        assert "AFTER INSERT ON enclosure_metrics" in sql
+        assert "FOR EACH STATEMENT EXECUTE FUNCTION fn_notify_enclosure_metrics_stmt()" in sql
+
+    def test_channel_should_match_db_monitor(self):
+        from app.db_triggers import GET_TRIGGER_SQLS
+        from db_monitor.main import ENCLOSURE_METRICS_CHANNEL
+        assert f"pg_notify('{ENCLOSURE_METRICS_CHANNEL}'" in "\n".join(GET_TRIGGER_SQLS)
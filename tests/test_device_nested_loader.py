@@ -0,0 +1,89 @@
+"""
+이벤트 응답 device nested — device_groups 배치 로더 (user-015)
+
+app/services/device_nested_service: 페이지 device_id 를 prime 하면 그룹 조회가 IN 1쿼리로 끝나고,
+조립 결과(device_groups)는 종전 건별 조회와 같아야 한다.
+"""
+import pytest
+from sqlalchemy import event, select
+
+from app.models.device import Controller, Sensor
+from app.models.device_group import DeviceGroup, DeviceGroupMapping
+from app.models.event import DetectionEvent
+from app.services.device_nested_service import build_device_nested_response, device_group_loader
+from app.utils.enums import (
+    EnumDetectionType, EnumDeviceCategory, EnumDeviceStatus, EnumDeviceType, EnumEventCategory,
+)
+
+
+async def _seed(db):
+    ctrl = Controller(
+        number_device=1, group_device=1, name_device="C1",
+        type_device=EnumDeviceType.IoController, status=EnumDeviceStatus.ACTIVATED,
+        ip_address="192.168.1.100", ip_port=8080,
+    )
+    db.add(ctrl)
+    await db.flush()
+    sensors = [
+        Sensor(
+            number_device=i, group_device=1, name_device=f"S{i}",
+            type_device=EnumDeviceType.Multi, status=EnumDeviceStatus.ACTIVATED, controller_id=ctrl.id,
+        )
+        for i in range(1, 4)
+    ]
+    g1, g2 = DeviceGroup(name="북측 울타리"), DeviceGroup(name="정문")
+    db.add_all(sensors + [g1, g2])
+    await db.flush()
+    db.add_all([
+        DeviceGroupMapping(device_id=sensors[0].id, category_device=EnumDeviceCategory.SENSOR, group_id=g1.id),
+        DeviceGroupMapping(device_id=sensors[0].id, category_device=EnumDeviceCategory.SENSOR, group_id=g2.id),
+        DeviceGroupMapping(device_id=sensors[1].id, category_device=EnumDeviceCategory.SENSOR, group_id=g2.id),
+    ])
+    for s in sensors * 2:
+        db.add(DetectionEvent(
+            category_event=EnumEventCategory.DETECTION, type_event="Intrusion", device_id=s.id,
+            action_reported="False", result=EnumDetectionType.PIR_SENSOR,
+        ))
+    await db.flush()
+    return sensors, (g1, g2)
+
+
+@pytest.mark.asyncio
+async def test_prime_should_load_page_groups_in_one_query(async_db):
+    sensors, (g1, g2) = await _seed(async_db)
+    events = (await async_db.execute(select(DetectionEvent).order_by(DetectionEvent.id))).scalars().all()
+    statements: list[str] = []
+    engine = async_db.bind.sync_engine
+
+    def _count(conn, cursor, statement, *args):
+        if "device_group_mappings" in statement:
+            statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _count)
+    try:
+        loader = device_group_loader(async_db)
+        await loader.prime(e.device_id for e in events)
+        nested = [await build_device_nested_response(await async_db.get(Sensor, e.device_id), async_db)
+                  for e in events]
+    finally:
+        event.remove(engine, "before_cursor_execute", _count)
+
+    assert len(statements) == 1 and loader.queries == 1
+    by_id = {n.id: [g.name for g in n.device_groups] for n in nested}
+    assert by_id == {sensors[0].id: ["북측 울타리", "정문"], sensors[1].id: ["정문"], sensors[2].id: []}
+
+
+@pytest.mark.asyncio
+async def test_loader_should_be_session_scoped_and_load_on_miss(async_db):
+    sensors, _ = await _seed(async_db)
+    loader = device_group_loader(async_db)
+    assert device_group_loader(async_db) is loader
+
+    groups = await loader.load(sensors[1].id)
+    assert [g.name for g in groups] == ["정문"] and loader.queries == 1
+    await loader.load(sensors[1].id)
+    assert loader.queries == 1
+
+    loader.invalidate(sensors[1].id)
+    await loader.load(sensors[1].id)
+    assert loader.queries == 2
@@ -0,0 +1,101 @@
+"""
+GET /api/enclosure-metrics — 단일 쿼리 + 최신 메트릭 캐시 (user-016)
+
+app/routers/enclosure_metrics: 함체 수와 무관하게 쿼리 1회로 함체별 최신 1행(동률은 id 큰 쪽)을 고르고,
+이후 폴링은 app/services/enclosure_latest_cache 적중 — POST 는 write-through, DELETE 는 무효화.
+"""
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import event
+
+from app.models.device import Enclosure, EnclosureMetric
+from app.routers.enclosure_metrics import (
+    create_enclosure_metric, delete_enclosure_metrics, get_all_enclosure_metrics,
+)
+from app.schemas.device import EnclosureMetricCreate
+from app.services import enclosure_latest_cache
+from app.utils.enums import EnumDeviceStatus, EnumDeviceType, EnumDoorStatus
+
+T0 = datetime(2026, 10, 1, 0, 0, tzinfo=timezone.utc)
+
+
+async def _seed(db):
+    enclosure_latest_cache.reset_stats()
+    encs = [
+        Enclosure(
+            number_device=i, group_device=0, name_device=f"E{i}",
+            type_device=EnumDeviceType.IoController, status=EnumDeviceStatus.ACTIVATED,
+            door_status=EnumDoorStatus.CLOSED,
+        )
+        for i in range(1, 4)
+    ]
+    db.add_all(encs)
+    await db.flush()
+    db.add_all([
+        EnclosureMetric(enclosure_id=encs[0].id, temperature="20.0", created_at=T0),
+        EnclosureMetric(enclosure_id=encs[0].id, temperature="21.0", created_at=T0 + timedelta(minutes=1)),
+        # 같은 created_at 동률 — id 큰 쪽이 최신
+        EnclosureMetric(enclosure_id=encs[1].id, temperature="30.0", created_at=T0),
+        EnclosureMetric(enclosure_id=encs[1].id, temperature="31.0", created_at=T0),
+    ])
+    await db.commit()
+    return encs
+
+
+def _temps(body):
+    return {
+        item["enclosure_name"]: item["latest_metrics"]["temperature"] if item["latest_metrics"] else None
+        for item in body["data"]
+    }
+
+
+@pytest.mark.asyncio
+async def test_list_should_pick_latest_per_enclosure_in_one_query(async_db):
+    await _seed(async_db)
+    statements: list[str] = []
+    engine = async_db.bind.sync_engine
+
+    def _count(conn, cursor, statement, *args):
+        if "enclosure_metrics" in statement:
+            statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _count)
+    try:
+        body = await get_all_enclosure_metrics(db=async_db, current_user=None)
+        again = await get_all_enclosure_metrics(db=async_db, current_user=None)
+    finally:
+        event.remove(engine, "before_cursor_execute", _count)
+
+    assert _temps(body) == {"E1": "21.0", "E2": "31.0", "E3": None}
+    assert again == body
+    # 첫 조회 단일 쿼리, 두 번째는 캐시 적중(메트릭 테이블 무접촉)
+    assert len(statements) == 1
+    assert enclosure_latest_cache.get_stats()["loads"] == 1
+
+
+@pytest.mark.asyncio
+async def test_post_should_write_through_and_delete_should_invalidate(async_db):
+    encs = await _seed(async_db)
+    await get_all_enclosure_metrics(db=async_db, current_user=None)
+
+    await create_enclosure_metric(encs[2].id, EnclosureMetricCreate(temperature=40.5), db=async_db, current_user=None)
+    body = await get_all_enclosure_metrics(db=async_db, current_user=None)
+    assert _temps(body)["E3"] == "40.5"
+    assert enclosure_latest_cache.get_stats()["loads"] == 1
+
+    await delete_enclosure_metrics(encs[0].id, before_date=None, db=async_db, current_user=None)
+    assert enclosure_latest_cache.snapshot() is None
+    body = await get_all_enclosure_metrics(db=async_db, current_user=None)
+    assert _temps(body) == {"E1": None, "E2": "31.0", "E3": "40.5"}
+
+
+def test_store_all_should_drop_load_raced_by_write():
+    seq = enclosure_latest_cache.write_seq()
+    enclosure_latest_cache.record(1, T0 + timedelta(minutes=5), {"temperature": "new"})
+    enclosure_latest_cache.store_all({1: (T0, {"temperature": "old"})}, seq)
+    assert enclosure_latest_cache.snapshot() is None
+
+    enclosure_latest_cache.store_all({1: (T0, {"temperature": "old"})}, enclosure_latest_cache.write_seq())
+    enclosure_latest_cache.record(1, T0 - timedelta(minutes=5), {"temperature": "stale"})
+    assert enclosure_latest_cache.get(1) == (True, {"temperature": "old"})
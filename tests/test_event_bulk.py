@@ -0,0 +1,112 @@
+"""
+이벤트 고빈도 일괄 수신 (user-022)
+
+app/services/event_bulk_service: N건 1 트랜잭션 저장 — 항목별 created/suppressed/failed,
+장비 상태 플립(목표 상태가 아닌 장비만), ConfigChangeLog 동일 트랜잭션, polymorphic 조회 가능.
+"""
+from datetime import timedelta
+
+import pytest
+from sqlalchemy import select
+
+import app.models  # noqa: F401 — 모델 등록(Base.metadata) 보장
+from app.models.config_change_log import ConfigChangeLog
+from app.models.device import Controller, Sensor
+from app.models.event import ConnectionEvent, DetectionEvent, Event
+from app.models.event_suppression import EventSuppressionSchedule, EventSuppressionTargetDevice
+from app.schemas.event import ConnectionEventCreate, DetectionEventCreate
+from app.services.event_bulk_service import ingest_events_bulk
+from app.utils.datetime import utc_now
+from app.utils.enums import (
+    EnumConfigResourceType,
+    EnumDeviceStatus,
+    EnumDeviceType,
+    EnumSuppressionEventScope,
+    EnumSuppressionSide,
+    EnumSuppressionTargetType,
+)
+
+
+async def _seed(db):
+    c = Controller(
+        number_device=1, group_device=1, name_device="CTL-001", type_device=EnumDeviceType.Controller,
+        status=EnumDeviceStatus.ACTIVATED, ip_address="10.0.1.1", ip_port=9011,
+    )
+    db.add(c)
+    await db.flush()
+    sensors = [
+        Sensor(
+            number_device=n, group_device=1, name_device=f"SEN-{n:03d}", type_device=EnumDeviceType.Multi,
+            status=EnumDeviceStatus.DEACTIVATED, controller_id=c.id,
+        )
+        for n in (1, 2)
+    ]
+    db.add_all(sensors)
+    await db.commit()
+    return [s.id for s in sensors]
+
+
+def _det(device_id, result="PIR_SENSOR"):
+    return DetectionEventCreate(type_event="Intrusion", device_id=device_id, result=result)
+
+
+@pytest.mark.asyncio
+async def test_bulk_detection_should_store_in_one_pass_with_per_item_results(async_db):
+    s1, s2 = await _seed(async_db)
+    now = utc_now()
+    sched = EventSuppressionSchedule(
+        name="maint", target_type=EnumSuppressionTargetType.DEVICE, target_side=EnumSuppressionSide.BOTH,
+        event_scope=EnumSuppressionEventScope.ALL,
+        window_start=now - timedelta(hours=1), window_end=now + timedelta(hours=1),
+    )
+    sched.target_devices = [EventSuppressionTargetDevice(device_id=s2)]
+    async_db.add(sched)
+    await async_db.commit()
+    sched_id = sched.id
+
+    result = await ingest_events_bulk(async_db, "detection", [
+        _det(s1), _det(9999), _det(s1, result="BOGUS"), _det(s2), _det(s1, result="THERMAL_SENSOR"),
+    ])
+
+    assert (result.created, result.suppressed, result.failed) == (2, 1, 2)
+    assert [r.status for r in result.items] == ["created", "failed", "failed", "suppressed", "created"]
+    assert [r.index for r in result.items] == [0, 1, 2, 3, 4]
+    assert "not found" in result.items[1].error
+    assert result.items[3].schedule_id == sched_id
+    assert result.items[0].id < result.items[4].id
+
+    # polymorphic 조회 — discriminator/서브타입 행 함께 저장
+    events = (await async_db.execute(select(Event).order_by(Event.id))).scalars().all()
+    assert [type(e) for e in events] == [DetectionEvent, DetectionEvent]
+    detections = (await async_db.execute(select(DetectionEvent).order_by(DetectionEvent.id))).scalars().all()
+    assert [e.result.value for e in detections] == ["PIR_SENSOR", "THERMAL_SENSOR"]
+    assert detections[0].device_description == f"[Multi] SEN-001 (number: 1, id: {s1})"
+
+    # 상태 플립은 저장된 장비만
+    async_db.expire_all()
+    assert (await async_db.get(Sensor, s1)).status == EnumDeviceStatus.ACTIVATED
+    assert (await async_db.get(Sensor, s2)).status == EnumDeviceStatus.DEACTIVATED
+
+    logs = (await async_db.execute(
+        select(ConfigChangeLog).where(ConfigChangeLog.resource_type == EnumConfigResourceType.DETECTION_EVENT)
+    )).scalars().all()
+    assert sorted(log.resource_id for log in logs) == [result.items[0].id, result.items[4].id]
+
+
+@pytest.mark.asyncio
+async def test_bulk_connection_should_not_touch_device_status(async_db):
+    s1, _ = await _seed(async_db)
+
+    result = await ingest_events_bulk(async_db, "connection", [
+        ConnectionEventCreate(type_event="Connection", device_id=s1) for _ in range(3)
+    ])
+
+    assert result.created == 3
+    assert len((await async_db.execute(select(ConnectionEvent))).scalars().all()) == 3
+    async_db.expire_all()
+    assert (await async_db.get(Sensor, s1)).status == EnumDeviceStatus.DEACTIVATED
+
+
+def test_bulk_endpoint_should_reject_empty_items(client):
+    response = client.post("/api/events/detections/bulk", json={"items": []})
+    assert response.status_code == 422
@@ -0,0 +1,152 @@
+"""
+이벤트 목록 keyset(커서) 페이지네이션 (user-014)
+
+app/utils/event_pagination.fetch_event_page: cursor 모드로 끝까지 넘긴 결과가
+offset 모드 전체 결과와 같은 순서·같은 행이어야 한다 — 같은 created_at 동률(id 타이브레이크) 포함.
+"""
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import func, select, text
+from sqlalchemy.dialects import postgresql
+
+from app.models.event import ActionEvent, DetectionEvent, MalfunctionEvent
+from app.utils.enums import EnumDetectionType, EnumEventCategory, EnumFaultType
+from app.utils.event_pagination import cursor_page_stmt, decode_cursor, encode_cursor, fetch_event_page
+
+T0 = datetime(2026, 10, 1, 0, 0, tzinfo=timezone.utc)
+
+
+async def _seed(db, n: int = 11):
+    for i in range(n):
+        # 3건씩 같은 created_at — id 로만 순서가 갈린다
+        at = T0 + timedelta(minutes=i // 3)
+        db.add(DetectionEvent(
+            category_event=EnumEventCategory.DETECTION, type_event="Intrusion",
+            action_reported="False", result=EnumDetectionType.PIR_SENSOR,
+            created_at=at, updated_at=at,
+        ))
+    await db.flush()
+
+
+def _stmts(*where):
+    stmt = select(DetectionEvent).where(*where)
+    count_stmt = select(func.count()).select_from(DetectionEvent).where(*where)
+    return stmt, count_stmt
+
+
+@pytest.mark.asyncio
+async def test_cursor_pages_should_match_offset_order(async_db):
+    await _seed(async_db)
+    stmt, count_stmt = _stmts()
+    expected, _, _ = await fetch_event_page(async_db, stmt, count_stmt, DetectionEvent, page=1, limit=100)
+
+    seen, cursor, pages = [], None, 0
+    while True:
+        rows, pagination, meta = await fetch_event_page(
+            async_db, stmt, count_stmt, DetectionEvent, page=1, limit=4, paging="cursor", cursor=cursor,
+        )
+        assert pagination is None and meta.total is None
+        seen.extend(r.id for r in rows)
+        pages += 1
+        cursor = meta.next_cursor
+        if cursor is None:
+            assert meta.has_more is False
+            break
+
+    assert pages == 3
+    assert seen == [r.id for r in expected]
+
+
+@pytest.mark.asyncio
+async def test_cursor_mode_should_apply_filters_and_totals(async_db):
+    await _seed(async_db)
+    stmt, count_stmt = _stmts(DetectionEvent.created_at >= T0 + timedelta(minutes=2))
+
+    rows, _, meta = await fetch_event_page(
+        async_db, stmt, count_stmt, DetectionEvent, page=1, limit=10, paging="cursor", total="exact",
+    )
+    assert len(rows) == 5 and meta.total == 5 and meta.next_cursor is None
+
+    # estimate: SQLite 는 reltuples 가 없어 정확 집계로 대체
+    _, _, meta = await fetch_event_page(
+        async_db, *_stmts(), DetectionEvent, page=1, limit=2, paging="cursor", total="estimate",
+    )
+    assert meta.total == 11 and meta.total_estimated is False and meta.has_more is True
+
+
+@pytest.mark.asyncio
+async def test_offset_mode_should_keep_page_meta(async_db):
+    await _seed(async_db)
+
+    rows, pagination, meta = await fetch_event_page(
+        async_db, *_stmts(), DetectionEvent, page=3, limit=4,
+    )
+    assert meta is None
+    assert (pagination.page, pagination.total, pagination.total_pages) == (3, 11, 3)
+    assert len(rows) == 3
+
+
+@pytest.mark.asyncio
+async def test_invalid_cursor_should_raise_value_error(async_db):
+    with pytest.raises(ValueError):
+        await fetch_event_page(
+            async_db, select(ActionEvent), select(func.count()).select_from(ActionEvent), ActionEvent,
+            page=1, limit=10, cursor="not-a-cursor",
+        )
+
+
+def test_cursor_stmt_should_key_on_parent_events_with_category():
+    """서브타입 커서 조회는 events 의 (category_event, created_at, id) 인덱스로 풀려야 한다."""
+    cursor = encode_cursor(T0, 7)
+    sql = str(cursor_page_stmt(select(DetectionEvent), DetectionEvent, limit=5, cursor=cursor)
+              .compile(dialect=postgresql.dialect()))
+    assert "events.category_event = " in sql
+    assert "events.created_at < " in sql and "events.id < " in sql
+    assert "detection_events.id <" not in sql
+    assert "ORDER BY events.created_at DESC, events.id DESC" in sql
+
+    # 조치 이벤트(단일 테이블)는 종전 그대로
+    sql = str(cursor_page_stmt(select(ActionEvent), ActionEvent, limit=5).compile(dialect=postgresql.dialect()))
+    assert "category_event" not in sql and "ORDER BY action_events.created_at DESC, action_events.id DESC" in sql
+
+
+@pytest.mark.asyncio
+async def test_cursor_query_should_use_category_index_and_skip_other_categories(async_db):
+    await _seed(async_db, n=6)
+    for i in range(6):
+        at = T0 + timedelta(minutes=i // 3, seconds=1)
+        async_db.add(MalfunctionEvent(
+            category_event=EnumEventCategory.MALFUNCTION, type_event="Fault", action_reported="False",
+            reason=EnumFaultType.FAULT_FENCE, created_at=at, updated_at=at,
+        ))
+    await async_db.flush()
+
+    stmt, count_stmt = _stmts()
+    rows, _, meta = await fetch_event_page(
+        async_db, stmt, count_stmt, DetectionEvent, page=1, limit=10, paging="cursor",
+    )
+    assert len(rows) == 6 and all(isinstance(r, DetectionEvent) for r in rows) and meta.has_more is False
+
+    compiled = cursor_page_stmt(stmt, DetectionEvent, limit=5, cursor=encode_cursor(T0, 1)).compile(
+        dialect=async_db.bind.dialect, compile_kwargs={"literal_binds": True},
+    )
+    plan = (await async_db.execute(text(f"EXPLAIN QUERY PLAN {compiled}"))).all()
+    assert any("idx_events_category_created_id" in str(row) for row in plan), plan
+
+
+def test_cursor_should_roundtrip_naive_as_utc():
+    ts, row_id = decode_cursor(encode_cursor(datetime(2026, 10, 1, 9, 30), 42))
+    assert ts == datetime(2026, 10, 1, 9, 30, tzinfo=timezone.utc) and row_id == 42
+
+
+def test_list_endpoints_should_accept_cursor_mode(client):
+    for path in ("/api/events/detections", "/api/events/malfunctions",
+                 "/api/events/connections", "/api/events/actions"):
+        resp = client.get(path, params={"paging": "cursor", "limit": 5})
+        assert resp.status_code == 200, resp.text
+        body = resp.json()
+        assert body["pagination"] is None and body["cursor"]["limit"] == 5
+
+        assert client.get(path, params={"cursor": "bogus"}).status_code == 400
+        assert client.get(path).json()["cursor"] is None
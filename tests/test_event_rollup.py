@@ -0,0 +1,178 @@
+"""
+이벤트 롤업 — 증분 잡 + 롤업/원본 합산 조회 (user-010)
+
+app/services/event_rollup_service: rollup_events 이후 rollup_counts 결과가
+워터마크 없는(전부 원본) 결과와 동일해야 한다 — 가장자리·열린 구간·버킷 단위 포함.
+"""
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import func, select
+
+from app.models.device import Camera, Controller, Sensor
+from app.models.event import ActionEvent, DetectionEvent, MalfunctionEvent
+from app.models.event_rollup import EventRollupDaily, EventRollupDirty, EventRollupHourly, EventRollupState
+from app.services.event_rollup_service import get_watermark, rollup_counts, rollup_events
+from app.utils.enums import (
+    EnumCameraMode, EnumCameraType, EnumDetectionType, EnumDeviceStatus, EnumDeviceType,
+    EnumEventCategory, EnumFaultType,
+)
+
+UTC = timezone.utc
+T0 = datetime(2026, 3, 1, 0, 0, tzinfo=UTC)
+NOW = T0 + timedelta(days=4, hours=5, minutes=30)
+
+
+async def _seed(db):
+    ctrl = Controller(
+        number_device=1, group_device=1, name_device="C1",
+        type_device=EnumDeviceType.IoController, status=EnumDeviceStatus.ACTIVATED,
+        ip_address="192.168.1.100", ip_port=8080,
+    )
+    db.add(ctrl)
+    await db.flush()
+    sensor = Sensor(
+        number_device=1, group_device=1, name_device="S1",
+        type_device=EnumDeviceType.Multi, status=EnumDeviceStatus.ACTIVATED,
+        controller_id=ctrl.id, geolocation={"location": "A-1"},
+    )
+    camera = Camera(
+        number_device=2, group_device=1, name_device="CAM1",
+        type_device=EnumDeviceType.IpCamera, status=EnumDeviceStatus.ACTIVATED,
+        ip_address="192.168.1.200", ip_port=80,
+        mode=EnumCameraMode.ONVIF, category=EnumCameraType.PTZ,
+    )
+    db.add_all([sensor, camera])
+    await db.flush()
+
+    # 4일 + 열린 구간(NOW 직전)에 걸쳐 7시간 간격 탐지/장애, 일부에 조치
+    for i in range(0, 4 * 24 + 5, 7):
+        at = T0 + timedelta(hours=i, minutes=(i * 13) % 60)
+        det = DetectionEvent(
+            category_event=EnumEventCategory.DETECTION, type_event="Intrusion",
+            device_id=sensor.id if i % 2 else camera.id, action_reported="False",
+            result=EnumDetectionType.PIR_SENSOR if i % 3 else EnumDetectionType.THERMAL_SENSOR,
+            created_at=at, updated_at=at,
+        )
+        mal = MalfunctionEvent(
+            category_event=EnumEventCategory.MALFUNCTION, type_event="Fault",
+            device_id=sensor.id, action_reported="False", reason=EnumFaultType.FAULT_FENCE,
+            created_at=at + timedelta(minutes=5), updated_at=at + timedelta(minutes=5),
+        )
+        db.add_all([det, mal])
+        await db.flush()
+        if i % 4 == 0:
+            act_at = at + timedelta(minutes=20)
+            db.add(ActionEvent(type_event="Action", content="ok", user="tester",
+                               from_event_id=det.id, created_at=act_at, updated_at=act_at))
+    await db.commit()
+
+
+RANGES = [
+    (T0, NOW),                                                               # 전체(열린 꼬리 포함)
+    (T0 + timedelta(hours=3, minutes=10), T0 + timedelta(days=3, hours=2, minutes=40)),  # 정시 아닌 양끝
+    (T0 + timedelta(days=1, hours=5), T0 + timedelta(days=1, hours=9)),      # 하루 안
+]
+QUERIES = [
+    (("category", "kind", "zone"), None),
+    (("category", "device_category", "device_id"), None),
+    (("category",), "hour"),
+    (("category",), "day"),
+]
+
+
+@pytest.mark.asyncio
+async def test_rollup_counts_should_match_raw_after_rollup(async_db):
+    await _seed(async_db)
+    expected = {
+        (r, dims, bucket): await rollup_counts(async_db, r[0], r[1], dims, bucket=bucket)
+        for r in RANGES for dims, bucket in QUERIES
+    }
+    assert await get_watermark(async_db) is None
+
+    await rollup_events(async_db, now=NOW)
+
+    assert await get_watermark(async_db) == T0 + timedelta(days=4, hours=5)
+    assert (await async_db.execute(select(func.count()).select_from(EventRollupDaily))).scalar() > 0
+    for (r, dims, bucket), want in expected.items():
+        assert await rollup_counts(async_db, r[0], r[1], dims, bucket=bucket) == want, (r, dims, bucket)
+
+
+@pytest.mark.asyncio
+async def test_rollup_events_should_be_idempotent_and_absorb_late_rows(async_db):
+    await _seed(async_db)
+    await rollup_events(async_db, now=NOW)
+    hourly = (await async_db.execute(select(func.sum(EventRollupHourly.event_count)))).scalar()
+
+    await rollup_events(async_db, now=NOW)
+    assert (await async_db.execute(select(func.sum(EventRollupHourly.event_count)))).scalar() == hourly
+
+    # 워터마크 직전(재계산 겹침 구간)에 늦게 커밋된 이벤트
+    late_at = T0 + timedelta(days=4, hours=4, minutes=50)
+    async_db.add(MalfunctionEvent(
+        category_event=EnumEventCategory.MALFUNCTION, type_event="Fault", device_id=None,
+        action_reported="False", reason=EnumFaultType.FAULT_FENCE, created_at=late_at, updated_at=late_at,
+    ))
+    await async_db.commit()
+    await rollup_events(async_db, now=NOW + timedelta(minutes=10))
+
+    assert (await async_db.execute(select(func.sum(EventRollupHourly.event_count)))).scalar() == hourly + 1
+    counts = await rollup_counts(async_db, T0, NOW, ("category",))
+    assert counts[("MALFUNCTION",)] == len(range(0, 4 * 24 + 5, 7)) + 1
+
+
+@pytest.mark.asyncio
+async def test_rollup_counts_should_reject_unknown_dim(async_db):
+    with pytest.raises(ValueError):
+        await rollup_counts(async_db, T0, NOW, ("severity",))
+
+
+async def _raw_only(db, dims, bucket=None):
+    """워터마크를 잠시 치워 전부 원본으로 센 기대값(세션 롤백으로 원복)."""
+    await db.delete(await db.get(EventRollupState, "events"))
+    await db.flush()
+    try:
+        return await rollup_counts(db, T0, NOW, dims, bucket=bucket)
+    finally:
+        await db.rollback()
+
+
+@pytest.mark.asyncio
+async def test_closed_bucket_delete_and_backdated_insert_should_be_recomputed(async_db):
+    await _seed(async_db)
+    await rollup_events(async_db, now=NOW)
+    assert (await async_db.execute(select(func.count()).select_from(EventRollupDirty))).scalar() == 0
+
+    # 닫힌 구간(재계산 겹침 밖) 이벤트 삭제 + created_at 을 과거로 준 조치 삽입
+    victim = (await async_db.execute(
+        select(MalfunctionEvent).order_by(MalfunctionEvent.id).limit(1)
+    )).scalars().one()
+    source = (await async_db.execute(select(DetectionEvent).order_by(DetectionEvent.id).limit(1))).scalars().one()
+    await async_db.delete(victim)
+    back_at = T0 + timedelta(days=1, hours=2, minutes=15)
+    async_db.add(ActionEvent(type_event="Action", content="late", user="tester",
+                             from_event_id=source.id, created_at=back_at, updated_at=back_at))
+    await async_db.commit()
+    assert (await async_db.execute(select(func.count()).select_from(EventRollupDirty))).scalar() > 0
+
+    result = await rollup_events(async_db, now=NOW + timedelta(minutes=10))
+
+    assert result["dirty_hours"] == 2
+    assert (await async_db.execute(select(func.count()).select_from(EventRollupDirty))).scalar() == 0
+    for dims, bucket in QUERIES:
+        assert await rollup_counts(async_db, T0, NOW, dims, bucket=bucket) == \
+            await _raw_only(async_db, dims, bucket), (dims, bucket)
+
+
+@pytest.mark.asyncio
+async def test_zone_should_follow_current_sensor_location(async_db):
+    await _seed(async_db)
+    await rollup_events(async_db, now=NOW)
+
+    sensor = (await async_db.execute(select(Sensor))).scalars().one()
+    sensor.geolocation = {"location": "B-7"}
+    await async_db.commit()
+
+    counts = await rollup_counts(async_db, T0, NOW, ("category", "kind", "zone"))
+    assert not any(key[-1] == "A" for key in counts)
+    assert counts == await _raw_only(async_db, ("category", "kind", "zone"))
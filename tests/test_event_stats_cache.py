@@ -0,0 +1,114 @@
+"""
+이벤트 통계 대시보드 공유 집계 + 단기 결과 캐시 (user-024)
+
+app/routers/event_statistics: 대시보드는 장비 축 집계 1회를 요약·장비별이 공유해도 개별 엔드포인트와
+같은 결과, 응답 data 는 (엔드포인트, 구간, 단위) 키 TTL 캐시, 동시 miss 는 계산 1회로 합류.
+"""
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+import app.models  # noqa: F401 — 모델 등록(Base.metadata) 보장
+from app.models.device import Camera, Controller, Sensor
+from app.models.event import ActionEvent, ConnectionEvent, DetectionEvent, MalfunctionEvent
+from app.routers import event_statistics as stats
+from app.services import event_stats_cache
+from app.utils.enums import (
+    EnumCameraMode,
+    EnumCameraType,
+    EnumDetectionType,
+    EnumDeviceStatus,
+    EnumDeviceType,
+    EnumEventCategory,
+    EnumFaultType,
+)
+
+T0 = datetime(2026, 3, 1, tzinfo=timezone.utc)
+T1 = T0 + timedelta(days=2)
+
+
+async def _seed(db):
+    ctrl = Controller(
+        number_device=1, group_device=1, name_device="C1", type_device=EnumDeviceType.IoController,
+        status=EnumDeviceStatus.ACTIVATED, ip_address="192.168.1.100", ip_port=8080,
+    )
+    db.add(ctrl)
+    await db.flush()
+    sensor = Sensor(
+        number_device=1, group_device=1, name_device="S1", type_device=EnumDeviceType.Multi,
+        status=EnumDeviceStatus.ACTIVATED, controller_id=ctrl.id,
+    )
+    camera = Camera(
+        number_device=2, group_device=1, name_device="CAM1", type_device=EnumDeviceType.IpCamera,
+        status=EnumDeviceStatus.ACTIVATED, ip_address="192.168.1.200", ip_port=80,
+        mode=EnumCameraMode.ONVIF, category=EnumCameraType.PTZ,
+    )
+    db.add_all([sensor, camera])
+    await db.flush()
+    for i in range(6):
+        at = T0 + timedelta(hours=5 * i, minutes=7)
+        det = DetectionEvent(
+            category_event=EnumEventCategory.DETECTION, type_event="Intrusion", action_reported="False",
+            device_id=sensor.id if i % 2 else camera.id, result=EnumDetectionType.PIR_SENSOR,
+            created_at=at, updated_at=at,
+        )
+        db.add_all([det, MalfunctionEvent(
+            category_event=EnumEventCategory.MALFUNCTION, type_event="Fault", action_reported="False",
+            device_id=sensor.id, reason=EnumFaultType.FAULT_FENCE, created_at=at, updated_at=at,
+        )])
+        await db.flush()
+        if i % 3 == 0:
+            db.add(ActionEvent(type_event="Action", content="ok", user="tester",
+                               from_event_id=det.id, created_at=at, updated_at=at))
+    await db.commit()
+    return sensor.id
+
+
+@pytest.mark.asyncio
+async def test_dashboard_should_match_individual_endpoints_and_cache(async_db):
+    sensor_id = await _seed(async_db)
+    event_stats_cache.reset_stats()
+
+    dashboard = (await stats.get_event_dashboard(T0, T1, "hour", db=async_db)).data
+    summary = (await stats.get_event_summary(T0, T1, db=async_db)).data
+    trend = (await stats.get_event_trend(T0, T1, "hour", db=async_db)).data
+    by_device = (await stats.get_event_by_device(T0, T1, db=async_db)).data
+
+    assert dashboard.summary == summary
+    assert dashboard.trend == trend
+    assert dashboard.by_device == by_device
+    assert (summary.sensor_detection, summary.camera_detection, summary.malfunction, summary.action) == (3, 3, 6, 2)
+    assert summary.active_devices.controllers == 1
+
+    # TTL 안에서는 새 이벤트가 있어도 같은 응답(캐시 적중)
+    async_db.add(ConnectionEvent(
+        category_event=EnumEventCategory.CONNECTION, type_event="Connection", device_id=sensor_id,
+        created_at=T0 + timedelta(hours=1), updated_at=T0 + timedelta(hours=1),
+    ))
+    await async_db.commit()
+    assert (await stats.get_event_summary(T0, T1, db=async_db)).data is summary
+    assert event_stats_cache.get_stats()["hits"] == 1
+
+    event_stats_cache.invalidate()
+    assert (await stats.get_event_summary(T0, T1, db=async_db)).data.connection == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_should_compute_once(monkeypatch):
+    event_stats_cache.reset_stats()
+    calls = []
+
+    async def _compute():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return {"n": len(calls)}
+
+    results = await asyncio.gather(*(event_stats_cache.get_or_compute(("k",), _compute) for _ in range(5)))
+    assert calls == [1] and all(r == {"n": 1} for r in results)
+    assert event_stats_cache.get_stats()["joined"] == 4
+
+    from app.config import settings
+    monkeypatch.setattr(settings, "EVENT_STATS_CACHE_TTL_SECONDS", 0)
+    await event_stats_cache.get_or_compute(("k",), _compute)
+    assert len(calls) == 2  # 비활성 — 매번 계산
@@ -4,9 +4,10 @@ PRD: PRD_Tracking_History_API.md §7 / Phase 6
 
 parse_tracking_status(envelope) → track_points 행 dict 리스트
 """
+import asyncio
 from datetime import datetime, timezone
 
-from gis_ingest.main import parse_tracking_status, _parse_observed_at
+from gis_ingest.main import COLUMNS, collect_batch, parse_tracking_status, to_records, _parse_observed_at
 
 
 def _envelope(targets, tracking="active", camera_id=201,
@@ -91,3 +92,39 @@ class TestParseObservedAt:
 
     def test_should_assume_utc_when_naive_input(self):
         assert _parse_observed_at("2026-02-05T10:30:00") == datetime(2026, 2, 5, 10, 30, 0, tzinfo=timezone.utc)
+
+
+class TestBatchPipeline:
+    """user-003 배치 파이프라인 — 순수 수집/레코드 변환(DB 불요)."""
+
+    def test_should_build_copy_records_in_column_order(self):
+        env = _envelope([
+            {"track_id": "t1", "label": "person", "observed_at": "2026-02-05T10:30:00.000Z",
+             "location": {"latitude": 38.1, "longitude": 127.5, "distance_m": 10.0}},
+        ])
+        ingested = datetime(2026, 2, 5, 10, 31, tzinfo=timezone.utc)
+        [record] = to_records(parse_tracking_status(env), ingested)
+        row = dict(zip(COLUMNS, record))
+        assert row["track_id"] == "t1" and row["camera_id"] == 201
+        assert row["latitude"] == 38.1 and row["distance_m"] == 10.0
+        assert row["created_at"] == ingested
+
+    def test_should_cut_batch_at_size_across_messages(self):
+        async def _run():
+            q = asyncio.Queue()
+            for i in range(25):
+                q.put_nowait({"track_id": f"t{i}"})
+            first = await collect_batch(q, [], batch_size=10, flush_ms=1000)
+            second = await collect_batch(q, [], batch_size=10, flush_ms=1000)
+            return first, second, q.qsize()
+
+        first, second, left = asyncio.run(_run())
+        assert len(first) == 10 and len(second) == 10 and left == 5
+
+    def test_should_cut_batch_at_deadline_when_queue_idle(self):
+        async def _run():
+            q = asyncio.Queue()
+            q.put_nowait({"track_id": "t1"})
+            return await collect_batch(q, [], batch_size=1000, flush_ms=20)
+
+        assert len(asyncio.run(_run())) == 1
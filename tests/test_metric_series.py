@@ -0,0 +1,106 @@
+"""
+함체/서버 메트릭 다운샘플 시계열 — SQL 버킷 집계 + 1시간 롤업 (user-017)
+
+app/services/metric_series_service: 버킷별 min/avg/max/last 가 원본과 일치해야 하고,
+rollup_metrics 이후 `1h` 결과는 워터마크 없는(전부 원본) 결과와 동일해야 한다 — 가장자리·열린 구간 포함.
+"""
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import func, select
+
+from app.models.device import Enclosure, EnclosureMetric
+from app.models.metric_rollup import MetricRollupHourly
+from app.models.server import Server, ServerCategory, ServerMetrics
+from app.services.metric_series_service import metric_series, rollup_metrics
+from app.utils.enums import EnumDeviceStatus, EnumDeviceType, EnumDoorStatus, EnumServerType
+
+UTC = timezone.utc
+T0 = datetime(2026, 3, 1, 0, 0, tzinfo=UTC)
+NOW = T0 + timedelta(hours=5, minutes=30)
+
+
+async def _seed_enclosure(db):
+    enc = Enclosure(
+        number_device=1, group_device=0, name_device="E1",
+        type_device=EnumDeviceType.IoController, status=EnumDeviceStatus.ACTIVATED,
+        door_status=EnumDoorStatus.CLOSED,
+    )
+    db.add(enc)
+    await db.flush()
+    # 5시간 30분, 1분 간격 — 온도 = 분 인덱스, 진동은 짝수 분만
+    for i in range(5 * 60 + 30):
+        db.add(EnclosureMetric(
+            enclosure_id=enc.id, temperature=str(float(i)), vibration=i if i % 2 == 0 else None,
+            created_at=T0 + timedelta(minutes=i),
+        ))
+    await db.commit()
+    return enc
+
+
+def _dump(points):
+    return [p.model_dump() for p in points]
+
+
+@pytest.mark.asyncio
+async def test_bucket_should_aggregate_min_avg_max_last(async_db):
+    enc = await _seed_enclosure(async_db)
+
+    points = await metric_series(
+        async_db, "enclosure", enc.id, "5m", start=T0, end=T0 + timedelta(minutes=14, seconds=59),
+    )
+    assert [p.bucket_start for p in points] == [T0 + timedelta(minutes=m) for m in (0, 5, 10)]
+    temp = points[1].metrics["temperature"]
+    assert (temp.count, temp.min, temp.max, temp.avg, temp.last) == (5, 5.0, 9.0, 7.0, 9.0)
+    vib = points[1].metrics["vibration"]
+    assert (vib.count, vib.min, vib.max, vib.last) == (2, 6.0, 8.0, None)
+    assert points[1].sample_count == 5 and points[0].metrics["humidity"].count == 0
+
+    # start 미지정 → end 기준 최근 limit 버킷
+    latest = await metric_series(async_db, "enclosure", enc.id, "1m", end=NOW - timedelta(seconds=1), limit=3)
+    assert [p.metrics["temperature"].last for p in latest] == [327.0, 328.0, 329.0]
+
+
+@pytest.mark.asyncio
+async def test_hourly_rollup_should_match_raw(async_db):
+    enc = await _seed_enclosure(async_db)
+    start, end = T0 + timedelta(minutes=17), NOW
+
+    raw = _dump(await metric_series(async_db, "enclosure", enc.id, "1h", start=start, end=end))
+    result = await rollup_metrics(async_db, "enclosure", now=NOW)
+    assert result["hours"] == 5
+    rows = (await async_db.execute(select(func.count()).select_from(MetricRollupHourly))).scalar()
+    assert rows == 5 * 2  # 5시간 × (temperature, vibration)
+
+    rolled = _dump(await metric_series(async_db, "enclosure", enc.id, "1h", start=start, end=end))
+    assert rolled == raw
+    assert len(rolled) == 6 and rolled[0]["metrics"]["temperature"]["min"] == 17.0
+
+    # 재실행 멱등
+    await rollup_metrics(async_db, "enclosure", now=NOW)
+    assert (await async_db.execute(select(func.count()).select_from(MetricRollupHourly))).scalar() == rows
+
+
+@pytest.mark.asyncio
+async def test_server_series_should_use_server_columns(async_db):
+    category = ServerCategory(name="API", type_server=EnumServerType.SPEAKER_API)
+    async_db.add(category)
+    await async_db.flush()
+    server = Server(category_id=category.id, name="srv", ip_address="10.0.0.1", port=8080)
+    async_db.add(server)
+    await async_db.flush()
+    for i in range(4):
+        async_db.add(ServerMetrics(
+            server_id=server.id, cpu_usage=10.0 * (i + 1), created_at=T0 + timedelta(seconds=20 * i),
+        ))
+    await async_db.commit()
+
+    (point,) = await metric_series(async_db, "server", server.id, "1m", start=T0, end=T0 + timedelta(seconds=59))
+    cpu = point.metrics["cpu_usage"]
+    assert (cpu.count, cpu.min, cpu.max, cpu.avg, cpu.last) == (3, 10.0, 30.0, 20.0, 30.0)
+
+
+def test_metrics_endpoints_should_accept_bucket(client):
+    for path in ("/api/devices/enclosures/99999/metrics", "/api/servers/99999/metrics"):
+        assert client.get(path, params={"bucket": "5m"}).status_code == 404
+        assert client.get(path, params={"bucket": "7m"}).status_code == 422
@@ -0,0 +1,83 @@
+"""
+enclosure_metrics / server_metrics 계층화 — 원본 N일 + 1시간 롤업 M개월 (user-018)
+
+app/services/metrics_retention_service: 원본은 롤업된 뒤에만 버리고(비파티션 DB 는 DELETE 폴백),
+버린 구간의 `bucket=1h` 조회는 롤업으로 같은 결과를 내야 한다. 롤업은 M개월 경과분만 만료.
+"""
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import func, select
+
+from app.config import settings
+from app.models.device import Enclosure, EnclosureMetric
+from app.models.metric_rollup import MetricRollupHourly
+from app.services.api_logs_partition_service import parse_partition_bound
+from app.services.metric_series_service import metric_series
+from app.services.metrics_retention_service import _covers, _day_partition_ddl, _months_before, tier_metrics
+from app.utils.enums import EnumDeviceStatus, EnumDeviceType, EnumDoorStatus
+
+UTC = timezone.utc
+NOW = datetime(2026, 10, 17, 6, 0, tzinfo=UTC)
+
+
+async def _seed(db, days_back: list[int]):
+    enc = Enclosure(
+        number_device=1, group_device=0, name_device="E1",
+        type_device=EnumDeviceType.IoController, status=EnumDeviceStatus.ACTIVATED,
+        door_status=EnumDoorStatus.CLOSED,
+    )
+    db.add(enc)
+    await db.flush()
+    for d in days_back:
+        base = NOW - timedelta(days=d)
+        for i in range(6):
+            db.add(EnclosureMetric(enclosure_id=enc.id, temperature=str(20.0 + i),
+                                   created_at=base + timedelta(minutes=10 * i)))
+    await db.commit()
+    return enc
+
+
+@pytest.mark.asyncio
+async def test_tiering_should_drop_raw_only_after_rollup(async_db, monkeypatch):
+    monkeypatch.setattr(settings, "METRICS_RAW_RETENTION_DAYS", 30)
+    enc = await _seed(async_db, [45, 2])
+    old_lo = NOW - timedelta(days=45, hours=1)
+    old_hi = NOW - timedelta(days=44)
+    before = [p.model_dump() for p in await metric_series(async_db, "enclosure", enc.id, "1h", start=old_lo, end=old_hi)]
+
+    result = await tier_metrics(async_db, "enclosure", now=NOW)
+
+    assert result["deleted_rows"] == 6 and result["rollup_deleted"] == 0
+    remaining = (await async_db.execute(select(func.count()).select_from(EnclosureMetric))).scalar()
+    assert remaining == 6
+    after = [p.model_dump() for p in await metric_series(async_db, "enclosure", enc.id, "1h", start=old_lo, end=old_hi)]
+    assert after == before and after[0]["metrics"]["temperature"]["avg"] == 22.5
+    # 원본이 사라진 구간은 1m 로는 비어 있다
+    assert await metric_series(async_db, "enclosure", enc.id, "1m", start=old_lo, end=old_hi) == []
+
+
+@pytest.mark.asyncio
+async def test_tiering_should_expire_rollup_after_months(async_db, monkeypatch):
+    monkeypatch.setattr(settings, "METRICS_RAW_RETENTION_DAYS", 30)
+    monkeypatch.setattr(settings, "METRICS_ROLLUP_RETENTION_MONTHS", 1)
+    await _seed(async_db, [40, 20])
+
+    result = await tier_metrics(async_db, "enclosure", now=NOW)
+
+    assert result["rollup_deleted"] == 1
+    buckets = (await async_db.execute(select(MetricRollupHourly.bucket_start))).scalars().all()
+    assert len(buckets) == 1
+
+
+def test_partition_helpers_should_use_utc_days():
+    name, ddl = _day_partition_ddl("server_metrics", date(2026, 10, 17))
+    assert name == "server_metrics_2026_10_17"
+    assert "FROM ('2026-10-17 00:00:00+00') TO ('2026-10-18 00:00:00+00')" in ddl
+
+    # 세션 TimeZone 이 KST 면 경계가 +09 로 표시된다 — 같은 순간으로 판정
+    bound = parse_partition_bound(name, "FOR VALUES FROM ('2026-10-17 09:00:00+09') TO ('2026-10-18 09:00:00+09')")
+    assert _covers(bound, date(2026, 10, 17)) and not _covers(bound, date(2026, 10, 18))
+
+    assert _months_before(date(2026, 3, 31), 1) == date(2026, 2, 28)
+    assert _months_before(date(2026, 1, 15), 12) == date(2025, 1, 15)
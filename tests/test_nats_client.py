@@ -0,0 +1,122 @@
+"""
+공용 NATS 발행 연결 테스트 — user-002
+
+로컬 stand-in NATS 서버(INFO/CONNECT/PING/PONG/PUB 텍스트 프로토콜 최소 구현)로 검증:
+- N 건 발행이 연결 1회 + 배치 flush 로 전달된다(메시지당 connect 금지).
+- 서버 부재에도 publish 는 raise 하지 않고 버퍼에 적재, 버퍼 full 은 drop-and-count.
+- 미기동(lifespan 밖) 상태는 1회성 connect 폴백.
+"""
+import asyncio
+import json
+
+import pytest
+import pytest_asyncio
+
+from app.config import settings
+from app.services import nats_client
+
+
+class _StandInNats:
+    """PUB 만 수신·기록하는 최소 NATS 서버."""
+
+    def __init__(self):
+        self.connections = 0
+        self.messages: list[tuple[str, bytes]] = []
+        self._server = None
+
+    async def start(self) -> str:
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        port = self._server.sockets[0].getsockname()[1]
+        return f"nats://127.0.0.1:{port}"
+
+    async def stop(self):
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def _handle(self, reader, writer):
+        self.connections += 1
+        info = {"server_id": "standin", "version": "2.10.0", "proto": 1, "max_payload": 1048576, "headers": True}
+        writer.write(f"INFO {json.dumps(info)}\r\n".encode())
+        await writer.drain()
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                op, _, rest = line.decode().strip().partition(" ")
+                op = op.upper()
+                if op == "PING":
+                    writer.write(b"PONG\r\n")
+                    await writer.drain()
+                elif op == "PUB":
+                    parts = rest.split()
+                    size = int(parts[-1])
+                    payload = await reader.readexactly(size + 2)
+                    self.messages.append((parts[0], payload[:-2]))
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+
+@pytest_asyncio.fixture
+async def standin(monkeypatch):
+    server = _StandInNats()
+    monkeypatch.setattr(settings, "NATS_URL", await server.start())
+    nats_client.reset_stats()
+    yield server
+    await nats_client.stop_nats_client()
+    await server.stop()
+
+
+async def _wait_for(predicate, timeout=3.0):
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while not predicate():
+        if loop.time() > deadline:
+            raise AssertionError("timeout")
+        await asyncio.sleep(0.01)
+
+
+@pytest.mark.asyncio
+async def test_should_share_one_connection_across_publishes(standin):
+    await nats_client.start_nats_client()
+    for i in range(50):
+        assert await nats_client.publish(f"t.{i}", b"x") is True
+
+    await _wait_for(lambda: len(standin.messages) == 50)
+    assert standin.connections == 1
+    assert [s for s, _ in standin.messages] == [f"t.{i}" for i in range(50)]
+    stats = nats_client.get_stats()
+    assert stats["published"] == 50 and stats["batches"] < 50
+
+
+@pytest.mark.asyncio
+async def test_should_drain_buffer_on_stop(standin):
+    await nats_client.start_nats_client()
+    await _wait_for(nats_client.is_connected)
+    for i in range(10):
+        await nats_client.publish("t.drain", str(i).encode())
+    await nats_client.stop_nats_client()
+    assert len(standin.messages) == 10
+
+
+@pytest.mark.asyncio
+async def test_should_drop_and_count_when_buffer_full(monkeypatch):
+    monkeypatch.setattr(settings, "NATS_URL", "nats://127.0.0.1:1")  # 연결 불가
+    monkeypatch.setattr(settings, "NATS_PUBLISH_BUFFER_SIZE", 3)
+    nats_client.reset_stats()
+    await nats_client.start_nats_client()
+    try:
+        results = [await nats_client.publish("t.full", b"x") for _ in range(5)]
+        assert results == [True, True, True, False, False]
+        assert nats_client.get_stats()["dropped"] == 2
+    finally:
+        await nats_client.stop_nats_client()
+
+
+@pytest.mark.asyncio
+async def test_should_fall_back_to_one_shot_when_not_started(standin):
+    assert await nats_client.publish("t.oneshot", b"x") is True
+    assert standin.messages == [("t.oneshot", b"x")]
+    assert nats_client.get_stats()["oneshot"] == 1
@@ -0,0 +1,153 @@
+"""
+보고서 PDF 상주 Chromium 풀 — 슬롯 재사용/재활용/크래시 재시작/동시성 상한 (user-008)
+
+브라우저 대신 Playwright async API 형태의 대역(_FakePlaywright)을 `_get_playwright` 에 주입한다.
+"""
+import asyncio
+
+import pytest
+import pytest_asyncio
+
+from app.config import settings
+from app.services import pdf_render_pool
+
+
+class _FakePage:
+    def __init__(self, browser):
+        self.browser = browser
+
+    async def set_content(self, html, wait_until=None, timeout=None):
+        self.html = html
+
+    async def wait_for_function(self, expr, timeout=None):
+        pass
+
+    async def evaluate(self, js):
+        pass
+
+    async def pdf(self, **options):
+        self.browser.active += 1
+        self.browser.pw.peak = max(self.browser.pw.peak, sum(b.active for b in self.browser.pw.browsers))
+        try:
+            await asyncio.sleep(0.01)
+            if self.browser.crash_next:
+                self.browser.connected = False
+                raise RuntimeError("Target closed")
+            return b"%PDF-" + self.html.encode()
+        finally:
+            self.browser.active -= 1
+
+    async def close(self):
+        pass
+
+
+class _FakeContext:
+    def __init__(self, browser):
+        self.browser = browser
+
+    async def new_page(self):
+        return _FakePage(self.browser)
+
+
+class _FakeBrowser:
+    def __init__(self, pw):
+        self.pw = pw
+        self.connected = True
+        self.closed = False
+        self.crash_next = False
+        self.active = 0
+
+    def is_connected(self):
+        return self.connected
+
+    async def new_context(self):
+        return _FakeContext(self)
+
+    async def close(self):
+        self.closed = True
+        self.connected = False
+
+
+class _FakePlaywright:
+    def __init__(self):
+        self.browsers = []
+        self.peak = 0
+        self.chromium = self
+
+    async def launch(self, headless=True, args=None):
+        browser = _FakeBrowser(self)
+        self.browsers.append(browser)
+        return browser
+
+    async def stop(self):
+        pass
+
+
+@pytest_asyncio.fixture
+async def fake_pool(monkeypatch):
+    pw = _FakePlaywright()
+
+    async def _get():
+        return pw
+
+    monkeypatch.setattr(pdf_render_pool, "_get_playwright", _get)
+    monkeypatch.setattr(settings, "PDF_RENDER_POOL_SIZE", 2)
+    monkeypatch.setattr(settings, "PDF_RENDER_RECYCLE_AFTER", 3)
+    pdf_render_pool.reset_stats()
+    await pdf_render_pool.start_pdf_render_pool()
+    yield pw
+    await pdf_render_pool.stop_pdf_render_pool()
+
+
+class TestPdfRenderPool:
+
+    @pytest.mark.asyncio
+    async def test_should_reuse_browser_and_recycle_after_n_renders(self, fake_pool):
+        for i in range(4):
+            assert await pdf_render_pool.render_pdf(f"r{i}") == f"%PDF-r{i}".encode()
+
+        stats = pdf_render_pool.get_stats()
+        # 순차 호출 → 같은 슬롯 반복 사용: 3회 후 재활용 1번
+        assert stats["renders"] == 4
+        assert stats["recycles"] == 1
+        assert stats["launches"] == 2
+        assert fake_pool.browsers[0].closed is True
+
+    @pytest.mark.asyncio
+    async def test_should_relaunch_and_retry_once_on_crash(self, fake_pool):
+        await pdf_render_pool.render_pdf("warm")
+        fake_pool.browsers[0].crash_next = True
+
+        assert await pdf_render_pool.render_pdf("again") == b"%PDF-again"
+
+        stats = pdf_render_pool.get_stats()
+        assert stats["crashes"] == 1
+        assert stats["failures"] == 0
+        assert stats["launches"] == 2
+
+    @pytest.mark.asyncio
+    async def test_should_cap_concurrency_at_pool_size(self, fake_pool):
+        out = await asyncio.gather(*(pdf_render_pool.render_pdf(f"r{i}") for i in range(6)))
+
+        assert len(out) == 6
+        assert fake_pool.peak == 2
+        assert len(fake_pool.browsers) == 2
+        assert pdf_render_pool.get_stats()["idle"] == 2
+
+    @pytest.mark.asyncio
+    async def test_should_raise_when_not_started(self):
+        with pytest.raises(RuntimeError):
+            await pdf_render_pool.render_pdf("<html></html>")
+
+    @pytest.mark.asyncio
+    async def test_stop_during_render_should_not_break_slot_return(self, fake_pool):
+        tasks = [asyncio.create_task(pdf_render_pool.render_pdf(f"r{i}")) for i in range(3)]
+        await asyncio.sleep(0.005)  # 2개 렌더 중 + 1개 슬롯 대기
+        await pdf_render_pool.stop_pdf_render_pool()
+
+        # 대기자가 정지된 큐에 갇히면 영원히 안 끝난다 — 시간 상한으로 실패시킨다
+        out = await asyncio.wait_for(asyncio.gather(*tasks, return_exceptions=True), timeout=2)
+        assert out[:2] == [b"%PDF-r0", b"%PDF-r1"]
+        assert isinstance(out[2], RuntimeError) and "stopped" in str(out[2])
+        assert not any(isinstance(r, AttributeError) for r in out)
+        assert all(b.closed for b in fake_pool.browsers)
@@ -37,3 +37,9 @@ def test_permission_map_values_are_module_verb_pairs():
         if not (isinstance(v, tuple) and len(v) == 2 and v[1] in allowed_verbs)
     ]
     assert not bad, f"잘못된 (module, verb) 값: {bad}"
+
+
+def test_event_bulk_create_routes_should_be_registered():
+    """user-022 일괄 생성 라우트도 단건 생성과 같은 events:edit 로 중앙 매트릭스에 등록돼야 한다."""
+    for kind in ("detections", "malfunctions", "connections"):
+        assert PERMISSION_MAP[("POST", f"/api/events/{kind}/bulk")] == ("events", "edit")
@@ -0,0 +1,42 @@
+"""
+보고서 마스터 빌더 — GROUPING SETS 결과 접기 단위 테스트 (DB 불요)
+user-009: app/services/report_master_builder._fold_grouping_sets / _by_count
+"""
+from app.services.report_master_builder import _by_count, _fold_grouping_sets
+
+
+class TestFoldGroupingSets:
+
+    def test_should_split_rows_per_grouping_set_and_total(self):
+        # grouping sets ((result), (h), ()) — 집계 2개(count, done)
+        rows = [
+            (0, 1, "INTRUSION", None, 5, 2),
+            (0, 1, "LOITER", None, 3, 0),
+            (1, 0, None, 9, 6, 1),
+            (1, 0, None, 23, 2, 1),
+            (1, 1, None, None, 8, 2),
+        ]
+
+        (by_result, by_hour), total = _fold_grouping_sets(rows, 2, 2)
+
+        assert by_result == [("INTRUSION", 5, 2), ("LOITER", 3, 0)]
+        assert by_hour == [(9, 6, 1), (23, 2, 1)]
+        assert total == (8, 2)
+
+    def test_should_keep_null_key_group_apart_from_total(self):
+        rows = [(0, None, 4), (0, "A", 1), (1, None, 5)]
+
+        (groups,), total = _fold_grouping_sets(rows, 1)
+
+        assert groups == [(None, 4), ("A", 1)]
+        assert total == (5,)
+
+    def test_should_default_total_to_zero_without_rows(self):
+        groups, total = _fold_grouping_sets([], 2, 2)
+
+        assert groups == [[], []]
+        assert total == (0, 0)
+
+
+def test_by_count_orders_desc_with_stable_ties():
+    assert _by_count([("b", 2), ("a", 2), ("c", 5)]) == [("c", 5), ("a", 2), ("b", 2)]
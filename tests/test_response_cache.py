@@ -0,0 +1,93 @@
+"""
+저변경 마스터 데이터 응답 캐시 — ETag / 조건부 GET (user-025)
+
+app/services/response_cache + app/middleware/response_cache: `@cached` GET 은 강한 ETag 를 달고,
+If-None-Match 일치 시 304, 적중은 핸들러(DB) 미진입. ORM 커밋이 해당 SYNC_* 태그를 무효화하고,
+gop_sync 통지 payload 도 같은 태그를 무효화한다.
+"""
+import json
+
+import pytest
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
+
+import app.models  # noqa: F401 — 모델 등록(Base.metadata) 보장
+from app.config import settings
+from app.dependencies import get_async_db
+from app.main import app
+from app.models.device import Controller
+from app.services import response_cache
+from app.utils.enums import EnumDeviceStatus, EnumDeviceType
+
+
+@pytest_asyncio.fixture
+async def http(async_db, monkeypatch):
+    monkeypatch.setattr(settings, "AUTH_MODE", "public")
+
+    async def _db():
+        yield async_db
+
+    app.dependency_overrides[get_async_db] = _db
+    try:
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+            yield ac
+    finally:
+        app.dependency_overrides.pop(get_async_db, None)
+
+
+async def _seed(db) -> Controller:
+    ctrl = Controller(
+        number_device=1, group_device=1, name_device="CTL-001", type_device=EnumDeviceType.IoController,
+        status=EnumDeviceStatus.ACTIVATED, ip_address="10.0.1.1", ip_port=9011,
+    )
+    db.add(ctrl)
+    await db.commit()
+    return ctrl
+
+
+@pytest.mark.asyncio
+async def test_get_should_emit_etag_and_answer_304_from_cache(http, async_db):
+    await _seed(async_db)
+    response_cache.reset_stats()
+
+    first = await http.get("/api/devices/controllers", params={"limit": 10})
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+    assert etag.startswith('"') and first.headers["cache-control"] == "no-cache"
+
+    # 적중 — 핸들러 미진입(같은 바이트·같은 ETag)
+    second = await http.get("/api/devices/controllers", params={"limit": 10})
+    assert second.content == first.content and second.headers["etag"] == etag
+
+    not_modified = await http.get("/api/devices/controllers", params={"limit": 10},
+                                  headers={"If-None-Match": f"W/{etag}"})
+    assert not_modified.status_code == 304 and not_modified.content == b""
+    assert not_modified.headers["etag"] == etag
+
+    # 다른 쿼리는 다른 키
+    other = await http.get("/api/devices/controllers", params={"limit": 5})
+    assert other.status_code == 200
+
+    stats = response_cache.get_stats()
+    assert (stats["hits"], stats["not_modified"], stats["misses"], stats["stores"]) == (2, 1, 2, 2)
+
+
+@pytest.mark.asyncio
+async def test_orm_commit_should_invalidate_matching_tag(http, async_db):
+    ctrl = await _seed(async_db)
+    first = await http.get("/api/devices/controllers")
+    etag = first.headers["etag"]
+
+    ctrl.name_device = "CTL-RENAMED"
+    await async_db.commit()
+
+    fresh = await http.get("/api/devices/controllers", headers={"If-None-Match": etag})
+    assert fresh.status_code == 200 and fresh.headers["etag"] != etag
+    assert fresh.json()["data"][0]["name_device"] == "CTL-RENAMED"
+
+    # 무관한 태그 통지는 장비 응답을 유지, 해당 태그 통지는 무효화
+    cached_etag = fresh.headers["etag"]
+    response_cache._on_notify(None, 0, response_cache.SYNC_CHANNEL, json.dumps({"cmd": "SYNC_SERVER"}))
+    assert (await http.get("/api/devices/controllers", headers={"If-None-Match": cached_etag})).status_code == 304
+    response_cache._on_notify(None, 0, response_cache.SYNC_CHANNEL, json.dumps({"cmd": "SYNC_DEVICE"}))
+    assert response_cache.get_stats()["entries"] == 0
@@ -0,0 +1,85 @@
+"""
+억제 게이트 메모리 구간 인덱스 (user-021)
+
+app/services/suppression_index: 첫 판정에서 1회 적재 후 DB 무접촉, 억제/그룹 쓰기 커밋 시 무효화,
+예정 창은 재적재 없이 경계 시각에 맞춰 매치, 적재 오류는 fail-open.
+"""
+from datetime import timedelta
+
+import pytest
+
+import app.models  # noqa: F401 — 모델 등록(Base.metadata) 보장
+from app.models.device_group import DeviceGroupMapping
+from app.models.event_suppression import EventSuppressionSchedule, EventSuppressionTargetDevice, EventSuppressionTargetGroup
+from app.services import event_suppression_service as svc
+from app.services import suppression_index
+from app.utils.datetime import utc_now
+from app.utils.enums import EnumDeviceCategory, EnumSuppressionEventScope, EnumSuppressionSide, EnumSuppressionTargetType
+
+
+async def _add(db, *, devices=(), groups=(), start=-1, end=1, **kw):
+    now = utc_now()
+    s = EventSuppressionSchedule(
+        name="t", target_type=kw.pop("target_type", EnumSuppressionTargetType.DEVICE),
+        target_side=kw.pop("target_side", EnumSuppressionSide.BOTH),
+        event_scope=kw.pop("event_scope", EnumSuppressionEventScope.ALL),
+        window_start=now + timedelta(hours=start), window_end=now + timedelta(hours=end), **kw,
+    )
+    s.target_devices = [EventSuppressionTargetDevice(device_id=d) for d in devices]
+    s.target_groups = [EventSuppressionTargetGroup(group_id=g) for g in groups]
+    db.add(s)
+    await db.commit()
+    return s
+
+
+@pytest.mark.asyncio
+async def test_gate_should_load_once_and_invalidate_on_commit(async_db):
+    suppression_index.reset_stats()
+    s1 = await _add(async_db, devices=[10])
+
+    for _ in range(5):
+        assert await svc.is_suppressed(async_db, 10, "sensor", "detection") == (True, s1.id)
+    assert await svc.is_suppressed(async_db, 11, "sensor", "detection") == (False, None)
+    stats = suppression_index.get_stats()
+    assert stats["loads"] == 1 and stats["hits"] == 5
+
+    # 그룹 대상 스케줄 + 매핑 추가 커밋 → 무효화 → 다음 판정에서 재적재
+    s2 = await _add(async_db, groups=[5], target_type=EnumSuppressionTargetType.GROUP,
+                    target_side=EnumSuppressionSide.DETECTION)
+    async_db.add(DeviceGroupMapping(device_id=11, category_device=EnumDeviceCategory.SENSOR, group_id=5))
+    await async_db.commit()
+    assert await svc.is_suppressed(async_db, 11, "sensor", "detection") == (True, s2.id)
+    assert await svc.is_suppressed(async_db, 11, "camera", "detection") == (False, None)  # side 불일치
+    assert suppression_index.get_stats()["loads"] == 2
+
+    # 다중 매치는 최소 id
+    await _add(async_db, devices=[11])
+    assert await svc.is_suppressed(async_db, 11, "sensor", "malfunction") == (True, s2.id)
+
+
+@pytest.mark.asyncio
+async def test_pending_window_should_match_at_boundary_without_reload(async_db):
+    s = await _add(async_db, target_type=EnumSuppressionTargetType.ALL, start=1, end=2,
+                   event_scope=EnumSuppressionEventScope.CONNECTION)
+    suppression_index.reset_stats()
+    now = utc_now()
+
+    assert await svc.is_suppressed(async_db, 1, "speaker", "connection", now=now) == (False, None)
+    assert await svc.is_suppressed(async_db, 1, "speaker", "connection",
+                                   now=now + timedelta(minutes=90)) == (True, s.id)
+    assert await svc.is_suppressed(async_db, 1, "speaker", "detection",
+                                   now=now + timedelta(minutes=90)) == (False, None)
+    assert await svc.is_suppressed(async_db, 1, "speaker", "connection",
+                                   now=now + timedelta(hours=3)) == (False, None)
+    assert suppression_index.get_stats()["loads"] == 1
+
+
+@pytest.mark.asyncio
+async def test_gate_should_fail_open_when_load_fails(async_db, monkeypatch):
+    await _add(async_db, devices=[10])
+
+    async def _boom(db, now):
+        raise RuntimeError("db down")
+
+    monkeypatch.setattr(suppression_index, "build", _boom)
+    assert await svc.is_suppressed(async_db, 10, "sensor", "detection") == (False, None)
@@ -0,0 +1,51 @@
+"""
+추적점 컬럼형 바이너리 프레임 — 인코드/디코드 왕복 단위 테스트 (DB 불요)
+user-007: app/utils/track_frames.py
+"""
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from app.utils.track_frames import decode_stream, encode_frame, end_frame, preamble
+
+BASE = datetime(2026, 2, 5, 10, 0, 0, tzinfo=timezone.utc)
+
+
+def _row(i, **kw):
+    values = dict(
+        id=i, observed_at=BASE + timedelta(seconds=i), latitude=37.5 + i * 1e-5, longitude=127.0,
+        camera_id=3, track_id=f"trk-{i % 2}", label="person", threat_level="HIGH",
+        distance_m=12.5, confidence=0.75, speed_mps=1.5,
+    )
+    values.update(kw)
+    return SimpleNamespace(**values)
+
+
+class TestTrackFrames:
+
+    def test_should_round_trip_rows_across_frames(self):
+        rows = [_row(i) for i in range(1, 6)]
+        data = preamble() + encode_frame(rows[:3]) + encode_frame(rows[3:]) + end_frame()
+
+        out = decode_stream(data)
+
+        assert [r["id"] for r in out] == [1, 2, 3, 4, 5]
+        assert [r["track_id"] for r in out] == ["trk-1", "trk-0", "trk-1", "trk-0", "trk-1"]
+        assert out[0]["observed_at"] == BASE + timedelta(seconds=1)
+        assert out[4]["latitude"] == rows[4].latitude
+        assert out[2]["label"] == "person" and out[2]["threat_level"] == "HIGH"
+
+    def test_should_restore_nulls_and_treat_naive_as_utc(self):
+        row = _row(1, observed_at=BASE.replace(tzinfo=None), label=None, threat_level=None,
+                   distance_m=None, confidence=None, speed_mps=None)
+
+        out = decode_stream(preamble() + encode_frame([row]) + end_frame())[0]
+
+        assert out["observed_at"] == BASE
+        assert out["label"] is None and out["threat_level"] is None
+        assert out["distance_m"] is None and out["confidence"] is None and out["speed_mps"] is None
+
+    def test_should_reject_foreign_payload(self):
+        with pytest.raises(ValueError):
+            decode_stream(b"{\"data\": []}\n" + end_frame())
@@ -0,0 +1,99 @@
+"""
+track_points 일별 파티션 관리 — 순수 DDL/이름 규약 단위 테스트 (DB 불요)
+user-004: app/services/track_points_partition_service.py
+user-006: 보존 회차의 track_sessions 요약 만료/재계산 — 비파티션 폴백 경로(격리 aiosqlite)
+"""
+from datetime import date, datetime, time, timedelta, timezone
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.models.tracking import TrackPoint, TrackSession
+from app.services import track_points_partition_service as tpps
+from app.services.track_points_partition_service import _day_partition_ddl, _move_from_default_sql, partition_day
+
+
+class TestDayPartitionDdl:
+
+    def test_should_bound_partition_at_display_tz_midnight(self):
+        name, ddl = _day_partition_ddl(date(2026, 10, 17))
+        assert name == "track_points_2026_10_17"
+        start = datetime(2026, 10, 17, tzinfo=settings.display_tz).isoformat()
+        end = datetime(2026, 10, 18, tzinfo=settings.display_tz).isoformat()
+        assert f"FROM ('{start}') TO ('{end}')" in ddl
+        assert ddl.startswith("CREATE TABLE IF NOT EXISTS track_points_2026_10_17 PARTITION OF track_points")
+
+    def test_should_roll_over_month_and_year(self):
+        _, ddl = _day_partition_ddl(date(2026, 12, 31))
+        assert "2027-01-01T00:00:00" in ddl
+
+    def test_should_move_default_rows_into_new_day_partition(self):
+        name, stmts = _move_from_default_sql(date(2026, 10, 17))
+        start = datetime(2026, 10, 17, tzinfo=settings.display_tz).isoformat()
+        end = datetime(2026, 10, 18, tzinfo=settings.display_tz).isoformat()
+        in_day = f"observed_at >= '{start}' AND observed_at < '{end}'"
+
+        assert name == "track_points_2026_10_17"
+        # default 를 떼어 낸 상태에서 생성해야 default 검증 스캔에 거부되지 않는다
+        assert stmts == [
+            "ALTER TABLE track_points DETACH PARTITION track_points_default",
+            _day_partition_ddl(date(2026, 10, 17))[1],
+            f"INSERT INTO track_points_2026_10_17 SELECT * FROM track_points_default WHERE {in_day}",
+            f"DELETE FROM track_points_default WHERE {in_day}",
+            "ALTER TABLE track_points ATTACH PARTITION track_points_default DEFAULT",
+        ]
+
+
+class TestPartitionDay:
+
+    def test_should_parse_day_partition_name(self):
+        assert partition_day("track_points_2026_10_17") == date(2026, 10, 17)
+
+    def test_should_ignore_default_and_foreign_names(self):
+        assert partition_day("track_points_default") is None
+        assert partition_day("track_points_v71") is None
+        assert partition_day("api_logs_2026_10") is None
+
+
+def _ts(dt: datetime) -> float:
+    """SQLite 반환 naive = UTC."""
+    return (dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)).timestamp()
+
+
+class TestRetentionSessionSummaries:
+
+    @pytest.mark.asyncio
+    async def test_should_recompute_sessions_straddling_cutoff(self, async_db, monkeypatch):
+        import app.database
+
+        cutoff = datetime.combine(tpps._today() - timedelta(days=7), time.min, tzinfo=settings.display_tz)
+        points = {
+            "old": [(-5, 38.0), (-3, 38.1)],
+            "cut": [(-2, 37.5), (1, 38.2), (3, 38.4)],
+            "new": [(2, 38.3)],
+        }
+        for track_id, pts in points.items():
+            at = [cutoff + timedelta(hours=h) for h, _ in pts]
+            lats = [lat for _, lat in pts]
+            async_db.add_all(TrackPoint(
+                camera_id=201, track_id=track_id, latitude=lat, longitude=127.5, observed_at=t,
+            ) for t, lat in zip(at, lats))
+            async_db.add(TrackSession(
+                track_id=track_id, camera_id=201, start_at=min(at), end_at=max(at), point_count=len(pts),
+                min_latitude=min(lats), max_latitude=max(lats), min_longitude=127.5, max_longitude=127.5,
+            ))
+        await async_db.commit()
+        monkeypatch.setattr(app.database, "AsyncSessionLocal", lambda: AsyncSession(bind=async_db.bind))
+
+        assert await tpps.run_track_points_retention(7) == []
+
+        async_db.expire_all()
+        sessions = {s.track_id: s for s in (await async_db.execute(select(TrackSession))).scalars()}
+        assert set(sessions) == {"cut", "new"}
+        cut = sessions["cut"]
+        assert cut.point_count == 2 and (cut.min_latitude, cut.max_latitude) == (38.2, 38.4)
+        assert _ts(cut.start_at) == (cutoff + timedelta(hours=1)).timestamp()
+        assert _ts(cut.end_at) == (cutoff + timedelta(hours=3)).timestamp()
+        assert sessions["new"].point_count == 1
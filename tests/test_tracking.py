@@ -4,9 +4,14 @@ PRD: PRD_Tracking_History_API.md v1.0
 
 대상: GET /api/tracking/points (keyset cursor), /sessions (파생 집계), /health
 """
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 
-from app.models.tracking import TrackPoint
+import pytest
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
+
+from app.config import settings
+from app.models.tracking import TrackPoint, TrackSession
 
 
 # ============================================================
@@ -30,11 +35,30 @@ def _seed(db, **kw):
     defaults.update(kw)
     row = TrackPoint(**defaults)
     db.add(row)
+    _fold_session(db, row)
     db.commit()
     db.refresh(row)
     return row
 
 
+def _fold_session(db, p):
+    """gis-ingest 병합 CTE 의 track_sessions 증분(user-006)을 ORM 으로 재현."""
+    s = db.query(TrackSession).filter_by(track_id=p.track_id, camera_id=p.camera_id).one_or_none()
+    if s is None:
+        db.add(TrackSession(
+            track_id=p.track_id, camera_id=p.camera_id, label=p.label,
+            start_at=p.observed_at, end_at=p.observed_at, point_count=1,
+            min_latitude=p.latitude, max_latitude=p.latitude,
+            min_longitude=p.longitude, max_longitude=p.longitude,
+        ))
+        return
+    s.start_at = min(s.start_at, p.observed_at)
+    s.end_at = max(s.end_at, p.observed_at)
+    s.point_count += 1
+    s.min_latitude, s.max_latitude = min(s.min_latitude, p.latitude), max(s.max_latitude, p.latitude)
+    s.min_longitude, s.max_longitude = min(s.min_longitude, p.longitude), max(s.max_longitude, p.longitude)
+
+
 # ============================================================
 # GET /api/tracking/points
 # ============================================================
@@ -114,6 +138,129 @@ class TestTrackPointsEndpoint:
         assert d["latitude"] == 38.1235
         assert d["observed_at"].endswith("+09:00")
 
+    def test_should_downsample_per_track_and_keep_endpoints_when_max_points_given(self, client, test_db):
+        for i in range(20):
+            _seed(test_db, track_id="ds", latitude=38.1 + i * 0.0001, longitude=127.5 + (i % 2) * 0.0001,
+                  observed_at=datetime(2026, 2, 5, 10, 0, i))
+
+        body = client.get("/api/tracking/points", params={"max_points": 5}).json()
+        assert len(body["data"]) == 5
+        assert body["data"][0]["observed_at"].startswith("2026-02-05T10:00:00")
+        assert body["data"][-1]["observed_at"].startswith("2026-02-05T10:00:19")
+        assert body["downsample"]["scanned"] == 20 and body["downsample"]["returned"] == 5
+        assert body["cursor"]["has_more"] is False
+
+
+# ============================================================
+# async 엔드포인트 — get_async_db 를 격리 async_db 로 오버라이드
+# ============================================================
+
+T0 = datetime(2026, 2, 5, 1, 0, 0, tzinfo=timezone.utc)
+
+
+@pytest_asyncio.fixture
+async def http(async_db, monkeypatch):
+    from app.dependencies import get_async_db
+    from app.main import app
+
+    monkeypatch.setattr(settings, "AUTH_MODE", "public")
+
+    async def _db():
+        yield async_db
+
+    app.dependency_overrides[get_async_db] = _db
+    try:
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+            yield ac
+    finally:
+        app.dependency_overrides.pop(get_async_db, None)
+
+
+async def _seed_track(db, track_id: str, n: int, camera_id: int = 201, start: datetime = T0):
+    db.add_all([
+        TrackPoint(
+            camera_id=camera_id, track_id=track_id, label="person", threat_level="NORMAL",
+            latitude=38.1 + i * 0.0001, longitude=127.5 + (i % 3) * 0.0001,
+            observed_at=start + timedelta(seconds=i), tracking_state="active",
+        )
+        for i in range(n)
+    ])
+    await db.commit()
+
+
+class TestTrackPointsDownsampleRange:
+
+    @pytest.mark.asyncio
+    async def test_should_cap_max_points_per_track_across_scan_chunks(self, http, async_db, monkeypatch):
+        monkeypatch.setattr(settings, "TRACKING_DOWNSAMPLE_SCAN_LIMIT", 7)
+        await _seed_track(async_db, "a", 40)
+        await _seed_track(async_db, "b", 25, start=T0 + timedelta(milliseconds=500))
+
+        body = (await http.get("/api/tracking/points", params={"max_points": 5})).json()
+
+        by_track: dict[str, list] = {}
+        for d in body["data"]:
+            by_track.setdefault(d["track_id"], []).append(d["observed_at"])
+        assert {k: len(v) for k, v in by_track.items()} == {"a": 5, "b": 5}  # 스캔 청크(7행)와 무관
+        assert body["downsample"]["scanned"] == 65 and body["downsample"]["tracks"] == 2
+        assert body["cursor"]["next_cursor"] is None and body["cursor"]["has_more"] is False
+
+    @pytest.mark.asyncio
+    async def test_should_reject_range_over_max_scan(self, http, async_db, monkeypatch):
+        monkeypatch.setattr(settings, "TRACKING_DOWNSAMPLE_SCAN_LIMIT", 4)
+        monkeypatch.setattr(settings, "TRACKING_DOWNSAMPLE_MAX_SCAN", 10)
+        await _seed_track(async_db, "a", 11)
+
+        resp = await http.get("/api/tracking/points", params={"max_points": 5})
+        assert resp.status_code == 400
+
+    @pytest.mark.asyncio
+    async def test_should_reject_result_over_max_return(self, http, async_db, monkeypatch):
+        monkeypatch.setattr(settings, "TRACKING_DOWNSAMPLE_MAX_RETURN", 10)
+        await _seed_track(async_db, "a", 8)
+        await _seed_track(async_db, "b", 8, start=T0 + timedelta(milliseconds=500))
+
+        # resolution 만으로는 트랙당 상한이 없다 — 전 트랙 합계(16 > 10)로 거부
+        resp = await http.get("/api/tracking/points", params={"resolution": 1e-6})
+        assert resp.status_code == 400
+
+        # max_points 로 합계를 상한 아래로 내리면 통과
+        ok = await http.get("/api/tracking/points", params={"resolution": 1e-6, "max_points": 5})
+        assert ok.status_code == 200 and ok.json()["downsample"]["returned"] == 10
+
+
+class TestTrackPointsStream:
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("fmt", ["ndjson", "binary"])
+    async def test_should_stream_full_range_on_dedicated_session(self, http, async_db, monkeypatch, fmt):
+        import json
+
+        from app.routers import tracking
+        from app.utils import track_frames
+
+        monkeypatch.setattr(tracking, "STREAM_CHUNK", 4)
+        await _seed_track(async_db, "a", 9)
+        await _seed_track(async_db, "b", 5, start=T0 + timedelta(milliseconds=500))
+
+        def _request_session_used(*args, **kwargs):
+            raise AssertionError("request-scoped session must not back the streamed body")
+
+        monkeypatch.setattr(async_db, "stream", _request_session_used)
+
+        resp = await http.get("/api/tracking/points/stream", params={"format": fmt})
+        assert resp.status_code == 200
+        if fmt == "ndjson":
+            assert resp.headers["content-type"].startswith("application/x-ndjson")
+            rows = [json.loads(line) for line in resp.text.splitlines()]
+        else:
+            assert resp.headers["content-type"].startswith(track_frames.MEDIA_TYPE)
+            rows = track_frames.decode_stream(resp.content)
+        assert len({r["id"] for r in rows}) == 14  # 청크(4행) 경계 넘어 전 구간, 중복 없음
+        observed = [r["observed_at"] for r in rows]
+        assert observed == sorted(observed)
+        assert sum(1 for r in rows if r["track_id"] == "a") == 9
+
 
 # ============================================================
 # GET /api/tracking/sessions
@@ -145,6 +292,18 @@ class TestTrackSessionsEndpoint:
         data = client.get("/api/tracking/sessions", params={"camera_id": 202}).json()["data"]
         assert len(data) == 1 and data[0]["camera_id"] == 202
 
+    def test_should_return_overlapping_session_with_bbox_when_range_cuts_it(self, client, test_db):
+        _seed(test_db, track_id="ov", latitude=38.10, longitude=127.50, observed_at=datetime(2026, 2, 5, 19, 0, 0))
+        _seed(test_db, track_id="ov", latitude=38.20, longitude=127.40, observed_at=datetime(2026, 2, 5, 21, 0, 0))
+
+        data = client.get("/api/tracking/sessions", params={
+            "from": "2026-02-05T20:00:00+09:00", "to": "2026-02-05T20:30:00+09:00",
+        }).json()["data"]
+        assert len(data) == 1
+        assert data[0]["point_count"] == 2  # 세션 전체 기준(구간 잘림 없음)
+        assert data[0]["min_latitude"] == 38.10 and data[0]["max_latitude"] == 38.20
+        assert data[0]["min_longitude"] == 127.40 and data[0]["max_longitude"] == 127.50
+
 
 # ============================================================
 # GET /api/tracking/health
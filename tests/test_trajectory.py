@@ -0,0 +1,69 @@
+"""
+궤적 다운샘플링 — 순수 numpy 알고리즘 단위 테스트 (DB 불요)
+user-005: app/utils/trajectory.py
+"""
+import numpy as np
+
+from app.utils.trajectory import douglas_peucker_sed, downsample_track, lttb, project_m
+
+
+def _line(n, seconds=1.0):
+    t = np.arange(n, dtype=float) * seconds
+    lat = 38.0 + np.arange(n) * 1e-5      # 북쪽으로 등속 직진(~1.1 m/s)
+    lng = np.full(n, 127.5)
+    return t, lat, lng
+
+
+class TestDouglasPeuckerSed:
+
+    def test_should_collapse_constant_velocity_line_to_endpoints(self):
+        t, lat, lng = _line(1000)
+        x, y = project_m(lat, lng)
+        assert douglas_peucker_sed(t, x, y, epsilon=0.5).tolist() == [0, 999]
+
+    def test_should_keep_stop_that_pure_spatial_dp_would_drop(self):
+        # 같은 직선 경로지만 중간 100초 정지 — 공간상 직선이어도 시각 보간 위치와 어긋나 유지돼야 함
+        t = np.arange(300, dtype=float)
+        pos = np.concatenate([np.arange(100), np.full(100, 100), np.arange(100, 200)]).astype(float)
+        lat = 38.0 + pos * 1e-5
+        lng = np.full(300, 127.5)
+        x, y = project_m(lat, lng)
+        assert douglas_peucker_sed(t, x, y, epsilon=1.0).tolist() == [0, 100, 200, 299]
+
+
+class TestLttb:
+
+    def test_should_return_exactly_n_out_sorted_with_endpoints(self):
+        rng = np.random.default_rng(0)
+        x, y = rng.normal(size=5000).cumsum(), rng.normal(size=5000).cumsum()
+        idx = lttb(x, y, 300)
+        assert len(idx) == 300
+        assert idx[0] == 0 and idx[-1] == 4999
+        assert np.all(np.diff(idx) > 0)
+
+    def test_should_return_all_when_n_out_not_smaller(self):
+        x = y = np.arange(10, dtype=float)
+        assert lttb(x, y, 10).tolist() == list(range(10))
+
+    def test_should_pick_spike_in_its_bucket(self):
+        x = np.arange(100, dtype=float)
+        y = np.zeros(100)
+        y[50] = 100.0
+        assert 50 in lttb(x, y, 10).tolist()
+
+
+class TestDownsampleTrack:
+
+    def test_should_cap_24h_track_to_max_points(self):
+        n = 86400
+        t = np.arange(n, dtype=float)
+        angle = t / 600.0
+        lat = 38.0 + 0.001 * np.sin(angle)
+        lng = 127.5 + 0.001 * np.cos(angle)
+        idx = downsample_track(t, lat, lng, resolution=2.0, max_points=2000)
+        assert 2 < len(idx) <= 2000
+        assert idx[0] == 0 and idx[-1] == n - 1
+
+    def test_should_keep_everything_when_no_option(self):
+        t, lat, lng = _line(50)
+        assert len(downsample_track(t, lat, lng)) == 50